@@ -41,6 +41,18 @@ Log locations
   the whole point: after a hang + power-cycle, the prior boot's trace is
   still on disk. xinitrc rotates boot.log -> boot.log.prev on each entry.
 
+Startup profiling (opt-in)
+--------------------------
+With `PURPLE_BOOT_PROFILE=1` the log also says *what startup costs*, not just
+where it is: every import is timed (cumulative and self, per module) and
+`PhaseTimer.lap()` lines time the steps of `PurpleApp.on_mount`. Import lines
+are buffered until `mark_first_render()` so file writes don't inflate the
+numbers, then written in load order with a slowest-first summary; imports
+after the first frame (deferred modules) are logged as they happen.
+scripts/bench_startup.py reads the same data to track time-to-first-render
+across releases. Without the env var nothing is installed and `lap()` is a
+no-op.
+
 See also: guides/install-partition-detection.md for the casper writable
 partition layout on the debug ISO.
 """
@@ -73,6 +85,22 @@ _first_render_lock = threading.Lock()
 # subsequent dumps.
 _fault_fd: Optional[int] = None
 
+# Monotonic time of mark_first_render(), for benchmarks (None until then).
+_first_render_mono: Optional[float] = None
+
+PROFILE_ENABLED = os.environ.get("PURPLE_BOOT_PROFILE") == "1"
+# Imports faster than this (cumulative) are counted but not listed one by one
+PROFILE_MIN_MS = 1.0
+# Modules named in the slowest-imports summary line
+PROFILE_TOP = 15
+
+# (module, cumulative ms, self ms) in the order each import finished
+_import_records: list[tuple[str, float, float]] = []
+# (label, phase, ms) from PhaseTimer.lap()
+_phase_records: list[tuple[str, str, float]] = []
+_import_stack = threading.local()
+_original_import = None
+
 
 def _open_append(path: str) -> Optional[int]:
     """Open `path` for append as a low-level fd. Returns None on failure."""
@@ -128,12 +156,130 @@ def mark_first_render() -> None:
     After this is called, the startup watchdog stops dumping. Idempotent.
     Safe to call from any thread.
     """
-    global _first_render_done
+    global _first_render_done, _first_render_mono
     with _first_render_lock:
         if _first_render_done:
             return
         _first_render_done = True
+        _first_render_mono = time.monotonic()
     heartbeat("first render reached; watchdog disarmed")
+    if PROFILE_ENABLED:
+        _write_import_profile()
+
+
+def first_render_at() -> Optional[float]:
+    """`time.monotonic()` when mark_first_render() ran, or None if not yet."""
+    return _first_render_mono
+
+
+# =============================================================================
+# STARTUP PROFILING (PURPLE_BOOT_PROFILE=1)
+# =============================================================================
+
+def _import_label(name: str, globals_: Optional[dict], level: int) -> str:
+    """Absolute module name for an __import__ call (resolves `from . import x`)."""
+    if level == 0 or not globals_:
+        return name
+    package = globals_.get("__package__") or globals_.get("__name__", "")
+    base = package.rsplit(".", level - 1)[0] if level > 1 else package
+    return f"{base}.{name}" if name else base
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """builtins.__import__ replacement: times imports that load new modules.
+
+    Self time excludes nested imports, so a package that only re-exports its
+    submodules shows up cheap and the submodules carry the cost.
+    """
+    stack = getattr(_import_stack, "frames", None)
+    if stack is None:
+        stack = _import_stack.frames = []
+    label = _import_label(name, globals, level)
+    # `from pkg import submodule`: the submodule is what gets loaded
+    if fromlist and fromlist[0] != "*" and f"{label}.{fromlist[0]}" not in sys.modules:
+        submodule = f"{label}.{fromlist[0]}"
+    else:
+        submodule = None
+    loaded_before = len(sys.modules)
+    stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        if len(sys.modules) != loaded_before:
+            try:
+                if submodule in sys.modules:
+                    label = submodule
+                record = (label, elapsed * 1000, (elapsed - nested) * 1000)
+                _import_records.append(record)
+                if _first_render_done and record[1] >= PROFILE_MIN_MS:
+                    heartbeat(_format_import(record))
+            except Exception:
+                pass
+
+
+def _format_import(record: tuple[str, float, float]) -> str:
+    module, cumulative, self_ms = record
+    return f"import {cumulative:7.1f}ms cum {self_ms:7.1f}ms self  {module}"
+
+
+def _write_import_profile() -> None:
+    """Flush the buffered pre-first-render imports to the log."""
+    try:
+        records = list(_import_records)
+        for record in records:
+            if record[1] >= PROFILE_MIN_MS:
+                heartbeat(_format_import(record))
+        total = sum(self_ms for _, _, self_ms in records)
+        slowest = sorted(records, key=lambda r: r[2], reverse=True)[:PROFILE_TOP]
+        heartbeat(f"imports before first render: {len(records)} imports, {total:.0f}ms self total")
+        heartbeat("slowest imports (self): " + ", ".join(f"{m} {ms:.1f}ms" for m, _, ms in slowest))
+    except Exception:
+        pass
+
+
+def install_import_profiler() -> None:
+    """Start timing imports. Called at module import when PURPLE_BOOT_PROFILE=1."""
+    global _original_import
+    import builtins
+    if _original_import is not None:
+        return
+    _original_import = builtins.__import__
+    builtins.__import__ = _timed_import
+
+
+class PhaseTimer:
+    """Lap timer for the steps of a long startup function.
+
+    Each lap() logs the time since the previous lap (or construction):
+        [+0.734s] [python] on_mount: room content 41.3ms
+    A no-op unless PURPLE_BOOT_PROFILE=1, so calls can stay in place.
+    """
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        if not PROFILE_ENABLED:
+            return
+        now = time.perf_counter()
+        ms = (now - self._last) * 1000
+        self._last = now
+        _phase_records.append((self.label, phase, ms))
+        heartbeat(f"{self.label}: {phase} {ms:.1f}ms")
+
+
+def profile_snapshot() -> dict:
+    """Everything profiled so far, for scripts/bench_startup.py."""
+    return {
+        "imports": [list(r) for r in _import_records],
+        "phases": [list(r) for r in _phase_records],
+    }
 
 
 def _watchdog_target(deadlines: tuple[int, ...]) -> None:
@@ -234,5 +380,8 @@ _write_line(
     f"pid={os.getpid()} python={sys.version.split()[0]} ==="
 )
 heartbeat("boot_log module imported; watchdog arming")
+if PROFILE_ENABLED:
+    install_import_profiler()
+    heartbeat("import profiler installed (PURPLE_BOOT_PROFILE=1)")
 _install_watchdog()
 heartbeat("watchdog armed")
@@ -0,0 +1,99 @@
+"""Render the Art canvas grid straight to pixels.
+
+Tools used to see the canvas by saving an SVG screenshot of the whole
+terminal, converting it with cairosvg/rsvg-convert/inkscape, and scanning
+the PNG for the gutter to crop it. ArtCanvas._grid already holds every
+cell's colors, so rasterize() paints them directly: each cell becomes a
+cell_w x cell_h block of its background, brush cells are filled with their
+paint color, and text cells get a block of ink in the middle. Only the
+drawable area is rendered (no gutter, cursor or UI chrome).
+
+The work is a few NumPy operations on a (rows, cols, 3) array, and
+encode_png() writes the result with zlib alone, so an export costs
+milliseconds and needs neither Pillow nor an SVG renderer.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+
+import numpy as np
+
+from .color_mixing import hex_to_rgb
+
+DEFAULT_CELL = (4, 8)  # pixels per cell (w, h): terminal cells are ~1:2
+
+
+def _rgb(color: str, cache: dict[str, tuple[int, int, int]]) -> tuple[int, int, int]:
+    rgb = cache.get(color)
+    if rgb is None:
+        rgb = cache[color] = hex_to_rgb(color)
+    return rgb
+
+
+def rasterize(
+    grid: dict[tuple[int, int], tuple[str, str, str]],
+    width: int,
+    height: int,
+    *,
+    background: str,
+    ink: dict[tuple[int, int], str] | None = None,
+    cell: tuple[int, int] = DEFAULT_CELL,
+    brush_char: str = "█",
+) -> np.ndarray:
+    """(height * cell_h, width * cell_w, 3) uint8 image of `grid`.
+
+    `grid` maps (x, y) to (char, fg, bg) as in ArtCanvas; cells outside
+    width x height are ignored. `ink` overrides the glyph color of text
+    cells (the canvas draws text in the theme or contrast color rather
+    than the stored fg).
+    """
+    cell_w, cell_h = cell
+    if cell_w < 1 or cell_h < 1:
+        raise ValueError(f"cell must be at least 1x1, got {cell_w}x{cell_h}")
+    colors: dict[str, tuple[int, int, int]] = {}
+    fill = np.empty((height, width, 3), dtype=np.uint8)
+    fill[:] = _rgb(background, colors)
+    glyph = np.zeros((height, width), dtype=bool)
+    glyph_rgb = np.zeros((height, width, 3), dtype=np.uint8)
+    ink = ink or {}
+
+    for (x, y), (char, fg, bg) in grid.items():
+        if not (0 <= x < width and 0 <= y < height):
+            continue
+        if char == brush_char:
+            fill[y, x] = _rgb(fg, colors)
+            continue
+        fill[y, x] = _rgb(bg, colors)
+        if char and not char.isspace():
+            glyph[y, x] = True
+            glyph_rgb[y, x] = _rgb(ink.get((x, y), fg), colors)
+
+    image = fill.repeat(cell_h, axis=0).repeat(cell_w, axis=1)
+    if glyph.any():
+        # Ink covers the middle half of the cell each way (at least 1px)
+        inner = np.zeros((cell_h, cell_w), dtype=bool)
+        inner[cell_h // 4:max(cell_h // 4 + 1, cell_h - cell_h // 4),
+              cell_w // 4:max(cell_w // 4 + 1, cell_w - cell_w // 4)] = True
+        mask = np.kron(glyph, inner).astype(bool)
+        image[mask] = glyph_rgb.repeat(cell_h, axis=0).repeat(cell_w, axis=1)[mask]
+    return image
+
+
+def encode_png(image: np.ndarray, level: int = 6) -> bytes:
+    """PNG bytes for an (h, w, 3) uint8 RGB image."""
+    height, width, channels = image.shape
+    if channels != 3 or image.dtype != np.uint8:
+        raise ValueError("expected an (h, w, 3) uint8 image")
+    # Filter type 0 (None) in front of every scanline
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(rows.tobytes(), level)) + chunk(b"IEND", b""))
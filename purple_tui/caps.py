@@ -1,45 +1,51 @@
 """All-caps render-time chokepoint.
 
-When `all_caps` is on, every Strip the app paints gets its segment
+When `all_caps` is on, every line the app paints gets its segment
 text uppercased. Stored buffers are unchanged — this is purely display.
 
-Implemented as a one-time monkey-patch on Strip.__init__. The patch
-runs unconditionally; the per-app flag decides whether to uppercase.
+Implemented as a Textual line filter, the same hook Textual uses for
+NO_COLOR. Filters run on the strips a widget's StylesCache hands out and
+each Strip memoizes its filtered copy, so a cached line (ArtCanvas,
+MusicGrid) is uppercased once, not on every repaint, and strips the app
+builds for other reasons (crops, joins) are left alone. Segment uppercasing
+is itself memoized on (text, style), and text with nothing to uppercase
+passes through as the same object.
 """
 
-from textual.strip import Strip
+from functools import lru_cache
+
 from rich.segment import Segment
+from textual.filter import LineFilter
 
-_enabled = False
-_patched = False
 
+@lru_cache(4096)
+def _upper_segment(segment: Segment) -> Segment:
+    text = segment.text
+    upper = text.upper()
+    if upper == text:
+        return segment
+    return Segment(upper, segment.style, segment.control)
 
-def set_enabled(enabled: bool) -> None:
-    global _enabled
-    _enabled = bool(enabled)
 
+class Uppercase(LineFilter):
+    """Uppercase segment text (control segments pass through)."""
 
-def is_enabled() -> bool:
-    return _enabled
+    def apply(self, segments: list[Segment], background) -> list[Segment]:
+        return [_upper_segment(s) if s.control is None else s for s in segments]
 
 
-def install() -> None:
-    """Install the Strip.__init__ patch. Idempotent."""
-    global _patched
-    if _patched:
-        return
-    _patched = True
+_filter = Uppercase(enabled=False)
 
-    original_init = Strip.__init__
 
-    def patched_init(self, segments, cell_length=None):
-        if _enabled:
-            segments = [
-                Segment(s.text.upper(), s.style, s.control) for s in segments
-            ]
-        original_init(self, segments, cell_length)
+def set_enabled(enabled: bool) -> None:
+    _filter.enabled = bool(enabled)
+
 
-    Strip.__init__ = patched_init
+def is_enabled() -> bool:
+    return _filter.enabled
 
 
-install()
+def install(app) -> None:
+    """Add the filter to `app`'s line filters. Idempotent."""
+    if _filter not in app._filters:
+        app._filters.append(_filter)
@@ -0,0 +1,80 @@
+"""Interned Rich styles and contrast colors for the cell-grid widgets.
+
+ArtCanvas and MusicGrid paint every cell through render_line(), and each cell
+used to build a fresh Style(color=..., bgcolor=...) and recompute its text
+contrast from the hex background. The palette on screen is small (key colors,
+their paint mixes, a handful of theme colors), so the same few hundred
+(fg, bg, bold) combinations repeat on every dirty line. Interning them here
+means steady-state rendering allocates no Style objects and never parses a
+hex color twice.
+
+Identical keys always return the same Style object, so callers can compare
+styles with `is`. The tables are bounded: past MAX_ENTRIES (a canvas full of
+distinct mixes) they are dropped and refilled, which costs one re-intern.
+"""
+
+from rich.style import Style
+
+MAX_ENTRIES = 8192
+
+_styles: dict[tuple[str | None, str | None, bool], Style] = {}
+_contrast: dict[str, str] = {}
+_wcag: dict[str, str] = {}
+
+
+def cell_style(fg: str | None, bg: str | None, bold: bool = False) -> Style:
+    """The shared Style for this foreground/background/bold combination."""
+    key = (fg, bg, bold)
+    style = _styles.get(key)
+    if style is None:
+        if len(_styles) >= MAX_ENTRIES:
+            _styles.clear()
+        style = _styles[key] = Style(color=fg, bgcolor=bg, bold=bold or None)
+    return style
+
+
+def contrast_text_color(bg_hex: str) -> str:
+    """Black or white text for `bg_hex` by perceived luminance (Art canvas)."""
+    color = _contrast.get(bg_hex)
+    if color is None:
+        h = bg_hex.lstrip("#")
+        r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+        color = "#000000" if luminance > 0.5 else "#FFFFFF"
+        if len(_contrast) >= MAX_ENTRIES:
+            _contrast.clear()
+        _contrast[bg_hex] = color
+    return color
+
+
+def _rel_luminance(hex_color: str) -> float:
+    h = hex_color.lstrip("#")
+    def ch(v: int) -> float:
+        s = v / 255
+        return s / 12.92 if s <= 0.03928 else ((s + 0.055) / 1.055) ** 2.4
+    r, g, b = ch(int(h[0:2], 16)), ch(int(h[2:4], 16)), ch(int(h[4:6], 16))
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def wcag_text_color(bg_hex: str) -> str:
+    """Whichever of black/white has the higher WCAG contrast ratio (Music grid)."""
+    color = _wcag.get(bg_hex)
+    if color is None:
+        l = _rel_luminance(bg_hex)
+        color = "#FFFFFF" if 1.05 / (l + 0.05) >= (l + 0.05) / 0.05 else "#000000"
+        if len(_wcag) >= MAX_ENTRIES:
+            _wcag.clear()
+        _wcag[bg_hex] = color
+    return color
+
+
+def cache_sizes() -> dict[str, int]:
+    """Entry counts per table, for tests and benchmarks."""
+    return {"styles": len(_styles), "contrast": len(_contrast), "wcag": len(_wcag)}
+
+
+def clear() -> None:
+    """Drop every interned entry."""
+    _styles.clear()
+    _contrast.clear()
+    _wcag.clear()
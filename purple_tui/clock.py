@@ -0,0 +1,102 @@
+"""One clock for the app's timers, switchable to simulated time.
+
+Everything time-driven in the app reads the running event loop's clock:
+asyncio sleeps and Textual timers directly, and the Ticker, LoopStation and
+Music room animations through loop_time(). On a normal event loop that is
+time.monotonic(), so nothing changes.
+
+VirtualClockLoop keeps simulated time instead. Whenever nothing is ready
+to run and the next timer is t seconds away, time jumps t instead of
+waiting, so a two-minute demo played through PlaybackPlayer (whose pacing
+is asyncio sleeps) finishes as fast as the app can process it, and every
+timer, animation and zoom-event timestamp lands at the same simulated
+moment on every run. Together with PURPLE_DEMO_SEED that makes headless
+demo playback and its screenshots reproducible.
+
+Time only moves when the loop would otherwise block, so work done in
+threads (run_in_executor, audio) still takes real time and its results
+arrive "late" in simulated time. Use it for scripted playback, not for
+code that races threads against timers.
+
+    from purple_tui.clock import run_virtual
+    run_virtual(main())  # main() runs app.run_test(), plays a script, ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import selectors
+import time
+from typing import Coroutine, TypeVar
+
+T = TypeVar("T")
+
+# Simulated time starts here rather than at 0 so code comparing against
+# "long ago" defaults behaves as it does on a machine that has been up a while
+DEFAULT_START = 10_000.0
+
+
+def loop_time() -> float:
+    """The running event loop's clock, or time.monotonic() outside a loop."""
+    try:
+        return asyncio.get_running_loop().time()
+    except RuntimeError:
+        return time.monotonic()
+
+
+class _JumpingSelector:
+    """Wraps the loop's selector: polls instead of blocking, and advances the
+    loop's clock by the timeout it would have blocked for."""
+
+    def __init__(self, selector: selectors.BaseSelector, loop: VirtualClockLoop) -> None:
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout: float | None = None):
+        if timeout is None:
+            # No timers at all: only I/O or another thread can wake us
+            return self._selector.select(None)
+        events = self._selector.select(0)
+        if not events and timeout > 0:
+            self._loop.advance(timeout)
+        return events
+
+    def __getattr__(self, name: str):
+        return getattr(self._selector, name)
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Event loop on simulated time (see the module docstring)."""
+
+    def __init__(self, start: float = DEFAULT_START) -> None:
+        super().__init__()
+        self._now = start
+        self._selector = _JumpingSelector(self._selector, self)
+
+    def time(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        self._now += seconds
+
+
+def run_virtual(main: Coroutine[object, object, T], start: float = DEFAULT_START) -> T:
+    """Run `main` to completion on a fresh VirtualClockLoop.
+
+    Textual's timers measure intervals with textual._time.get_time (the
+    monotonic clock) rather than the loop's clock, so it is pointed at the
+    loop for the duration of the run.
+    """
+    from textual import _time as textual_time
+
+    loop = VirtualClockLoop(start)
+    saved = textual_time.get_time
+    textual_time.get_time = loop.time
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        textual_time.get_time = saved
+        asyncio.set_event_loop(None)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
@@ -6,6 +6,7 @@ Shared syntax: inline `repeat N cmd1, cmd2` across all rooms.
 """
 
 import asyncio
+import contextlib
 import logging
 import re
 
@@ -237,12 +238,15 @@ class MusicCodeRunner:
     _KEYWORD_VOCAB = ['letters', 'choose', 'instrument', 'select', 'use', 'play', 'fast', 'slow']
 
     def __init__(self, play_key_fn, set_instrument_fn=None,
-                 color_fn=None, flash_fn=None, set_letters_fn=None):
+                 color_fn=None, flash_fn=None, set_letters_fn=None,
+                 sleep_fn=None):
         self.play_key = play_key_fn
         self.set_instrument = set_instrument_fn
         self.color_fn = color_fn
         self.flash_fn = flash_fn
         self.set_letters = set_letters_fn
+        # Awaited between notes; the offline renderer swaps in a virtual clock
+        self.sleep_fn = sleep_fn
         self.corrections: list[tuple[str, str]] = []
         self._original_text: str = ""
         self._correction_final: str = ""
@@ -299,6 +303,9 @@ class MusicCodeRunner:
             except Exception:
                 log.debug("Music command failed: %s", cmd['text'], exc_info=True)
 
+    async def _sleep(self, seconds: float) -> None:
+        await (self.sleep_fn or asyncio.sleep)(seconds)
+
     async def _run_command_table(self, text: str) -> bool:
         """Run the first matching command handler. Returns True if a command
         keyword matched, claiming the line, whether or not the handler could
@@ -383,7 +390,7 @@ class MusicCodeRunner:
             if not self._suppress_handler_corrections:
                 self.corrections.append((self._original_text, self._correction_final))
         self.set_instrument(resolved.lower())
-        await asyncio.sleep(0.1)
+        await self._sleep(0.1)
         remainder = " ".join(words[used:])
         if remainder:
             # Re-dispatch resets the per-line correction fields, so save and
@@ -404,7 +411,7 @@ class MusicCodeRunner:
                 if not self._suppress_handler_corrections:
                     self.corrections.append((self._original_text, self._correction_final))
             self.set_instrument(resolved.lower())
-            await asyncio.sleep(0.1)
+            await self._sleep(0.1)
             return True
         # Not an instrument: play as notes
         await self._play_notes(arg)
@@ -436,7 +443,7 @@ class MusicCodeRunner:
                 self.play_key(lookup, self._mode)
                 if self.flash_fn:
                     self.flash_fn(lookup)
-                await asyncio.sleep(delay)
+                await self._sleep(delay)
 
 
 # Vocabulary lists for fuzzy matching
@@ -491,19 +498,34 @@ class ArtCodeRunner:
     def __init__(self, canvas):
         self.canvas = canvas
         self.corrections: list[tuple[str, str]] = []
+        self._instant = False
 
     # ------------------------------------------------------------------
     # Main entry point
     # ------------------------------------------------------------------
 
-    async def run(self, lines: list[str], paint: bool = True) -> None:
-        """Run art code. Corrections are stored in self.corrections."""
+    async def run(self, lines: list[str], paint: bool = True, instant: bool = False) -> None:
+        """Run art code. Corrections are stored in self.corrections.
+
+        Live runs animate: a short pause after every motion and character so
+        a kid can watch the turtle draw. instant=True is the fast-forward
+        mode for replays, demos and dev tools: no pauses, and the canvas
+        repaints once when the program finishes.
+        """
         expanded = []
         for line in lines:
             expanded.extend(self._peel_color_before_repeat(line))
         self._paint_on = paint
         self._write_on = not paint
-        await self._run_lines(expanded)
+        self._instant = instant
+        batch = getattr(self.canvas, "batch_updates", None)
+        with batch() if instant and batch else contextlib.nullcontext():
+            await self._run_lines(expanded)
+
+    async def _step_pause(self, seconds: float) -> None:
+        """Animation beat between steps; skipped entirely when instant."""
+        if not self._instant:
+            await asyncio.sleep(seconds)
 
     async def _run_lines(self, lines: list[str], _resolving: bool = False) -> None:
         cmds = parse_lines(lines, split_commands=False, corrections=self.corrections)
@@ -583,7 +605,7 @@ class ArtCodeRunner:
         if hex_color:
             self._apply_color(hex_color)
             self.canvas.paint_char('█', direction=self.canvas._heading)
-            await asyncio.sleep(0.05)
+            await self._step_pause(0.05)
             return True
         await self._emit_text(arg, paint=True)
         return True
@@ -783,7 +805,7 @@ class ArtCodeRunner:
                 self.canvas.execute_logo_command(action, move_dir, distance)
             if leftover:
                 await self._emit_text(leftover, paint=self._paint_on)
-            await asyncio.sleep(0.05)
+            await self._step_pause(0.05)
 
     async def _emit_text(self, text: str, paint: bool) -> None:
         """Emit each character in the current heading direction. When painting,
@@ -794,7 +816,7 @@ class ArtCodeRunner:
                 self.canvas.paint_char(ch, direction=heading)
             else:
                 self.canvas.type_char(ch, direction=heading)
-            await asyncio.sleep(0.02)
+            await self._step_pause(0.02)
 
     # ------------------------------------------------------------------
     # Resolution pipeline (for unmatched text)
@@ -11,7 +11,9 @@ realistic pigment mixing where:
 - red + yellow = orange
 """
 
-from typing import Tuple
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, Sequence, Tuple
 import colorsys
 import math
 
@@ -191,6 +193,50 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     return f"#{r:02X}{g:02X}{b:02X}"
 
 
+# Per-color log-reflectance curves. The palette on screen is small (key
+# colors and their mixes), so each hex is converted to a spectrum once.
+_log_spectra: dict[str, tuple[float, ...]] = {}
+
+# Recent mixes, keyed by the exact color sequence. Mixing is commutative in
+# value but the per-bin float sums run in input order, so keys are not
+# reordered: a hit always returns exactly what a fresh mix would.
+MAX_MIXES = 4096
+_mixes: OrderedDict[tuple[str, ...], str] = OrderedDict()
+
+
+def _log_spectrum(hex_color: str) -> tuple[float, ...]:
+    """log() of the spectral reflectance curve for a hex color (cached)."""
+    logs = _log_spectra.get(hex_color)
+    if logs is None:
+        rgb = hex_to_rgb(hex_color)
+        lrgb = (_srgb_to_linear(rgb[0]), _srgb_to_linear(rgb[1]), _srgb_to_linear(rgb[2]))
+        logs = tuple(math.log(v) for v in _linear_rgb_to_spectrum(lrgb))
+        if len(_log_spectra) >= MAX_MIXES:
+            _log_spectra.clear()
+        _log_spectra[hex_color] = logs
+    return logs
+
+
+@lru_cache(maxsize=MAX_MIXES)
+def _saturate(r8: int, g8: int, b8: int) -> str:
+    """Final step of a mix: saturation boost in HLS, then hex.
+
+    Beer-Lambert (geometric mean) gives correct subtractive hues but
+    systematically desaturates because log-averaging compresses spectral
+    contrast. Real paint pigments scatter light, which preserves saturation.
+    A 2x saturation multiplier compensates for this, matching how opaque
+    pigment layers behave vs the pure transparent-absorption model.
+    """
+    h, li, s = colorsys.rgb_to_hls(r8 / 255, g8 / 255, b8 / 255)
+    s = min(1.0, s * 2.0)
+    r, g, b = colorsys.hls_to_rgb(h, li, s)
+    return rgb_to_hex(
+        max(0, min(255, round(r * 255))),
+        max(0, min(255, round(g * 255))),
+        max(0, min(255, round(b * 255))),
+    )
+
+
 def _mix_colors_internal(colors: list[str], weights: list[float] = None) -> str:
     """
     Internal: Mix multiple colors using Beer-Lambert spectral mixing.
@@ -212,12 +258,8 @@ def _mix_colors_internal(colors: list[str], weights: list[float] = None) -> str:
     if weights is None:
         weights = [1.0] * len(colors)
 
-    # Convert colors to spectral reflectance curves
-    spectra = []
-    for hex_color in colors:
-        rgb = hex_to_rgb(hex_color)
-        lrgb = (_srgb_to_linear(rgb[0]), _srgb_to_linear(rgb[1]), _srgb_to_linear(rgb[2]))
-        spectra.append(_linear_rgb_to_spectrum(lrgb))
+    # Convert colors to (log) spectral reflectance curves
+    spectra = [_log_spectrum(hex_color) for hex_color in colors]
 
     # Mix using weighted geometric mean of reflectance (Beer-Lambert model).
     # In log-reflectance space this is a weighted average, which naturally
@@ -228,30 +270,13 @@ def _mix_colors_internal(colors: list[str], weights: list[float] = None) -> str:
     for i in range(SIZE):
         log_r = 0.0
         for spectrum, w in zip(spectra, weights):
-            log_r += math.log(spectrum[i]) * w
+            log_r += spectrum[i] * w
         result_spectrum.append(math.exp(log_r / total_weight))
 
     # Convert spectrum to sRGB
     xyz = _spectrum_to_xyz(result_spectrum)
     lrgb = _xyz_to_linear_rgb(xyz)
-    r = _linear_to_srgb(lrgb[0]) / 255
-    g = _linear_to_srgb(lrgb[1]) / 255
-    b = _linear_to_srgb(lrgb[2]) / 255
-
-    # Beer-Lambert (geometric mean) gives correct subtractive hues but
-    # systematically desaturates because log-averaging compresses spectral
-    # contrast. Real paint pigments scatter light, which preserves saturation.
-    # A 2x saturation multiplier compensates for this, matching how opaque
-    # pigment layers behave vs the pure transparent-absorption model.
-    h, li, s = colorsys.rgb_to_hls(r, g, b)
-    s = min(1.0, s * 2.0)
-    r, g, b = colorsys.hls_to_rgb(h, li, s)
-
-    return rgb_to_hex(
-        max(0, min(255, round(r * 255))),
-        max(0, min(255, round(g * 255))),
-        max(0, min(255, round(b * 255))),
-    )
+    return _saturate(_linear_to_srgb(lrgb[0]), _linear_to_srgb(lrgb[1]), _linear_to_srgb(lrgb[2]))
 
 
 def mix_colors_paint(colors: list[str]) -> str:
@@ -272,7 +297,95 @@ def mix_colors_paint(colors: list[str]) -> str:
     if len(colors) == 1:
         return colors[0]
 
-    return _mix_colors_internal(colors)
+    key = tuple(colors)
+    result = _mixes.get(key)
+    if result is None:
+        result = _mix_colors_internal(colors)
+        _remember(key, result)
+    else:
+        _mixes.move_to_end(key)
+    return result
+
+
+def _remember(key: tuple[str, ...], result: str) -> None:
+    _mixes[key] = result
+    if len(_mixes) > MAX_MIXES:
+        _mixes.popitem(last=False)
+
+
+def mix_colors_paint_many(mixes: Iterable[Sequence[str]]) -> list[str]:
+    """mix_colors_paint() for many mixes at once (flood fills, replays).
+
+    Repeated mixes are computed once and cached ones are reused; the rest
+    go through NumPy together, one array op per spectral bin instead of a
+    Python loop per cell. Results are identical to calling
+    mix_colors_paint() on each entry.
+    """
+    mixes = [tuple(m) for m in mixes]
+    results: dict[tuple[str, ...], str] = {}
+    pending: dict[int, list[tuple[str, ...]]] = {}  # mix size -> uncached mixes
+    for key in mixes:
+        if key in results:
+            continue
+        cached = _mixes.get(key)
+        if cached is not None:
+            _mixes.move_to_end(key)
+            results[key] = cached
+        elif len(key) < 2 or all(c.upper() == key[0].upper() for c in key):
+            results[key] = mix_colors_paint(list(key))
+        else:
+            results[key] = None
+            pending.setdefault(len(key), []).append(key)
+
+    for keys in pending.values():
+        for key, result in zip(keys, _mix_batch(keys)):
+            results[key] = result
+            _remember(key, result)
+    return [results[key] for key in mixes]
+
+
+def _mix_batch(keys: list[tuple[str, ...]]) -> list[str]:
+    """Vectorized _mix_colors_internal() for equal-length, unweighted mixes.
+
+    Mirrors the scalar path operation for operation (same summation order,
+    same rounding) so both produce the same hex for every input.
+    """
+    import numpy as np  # deferred: only batch callers pay for the import
+
+    k = len(keys[0])
+    # (k, n, SIZE): log spectra of the i-th color of every mix
+    logs = np.array([[_log_spectrum(key[i]) for key in keys] for i in range(k)])
+    log_r = np.zeros(logs.shape[1:])
+    for i in range(k):
+        log_r = log_r + logs[i] * 1.0
+    spectrum = np.exp(log_r / float(k))
+
+    # Integrate bin by bin, like the scalar sum()
+    x = y = z = 0.0
+    for i in range(SIZE):
+        x = x + spectrum[:, i] * CIE_CMF_X[i]
+        y = y + spectrum[:, i] * CIE_CMF_Y[i]
+        z = z + spectrum[:, i] * CIE_CMF_Z[i]
+    m = XYZ_TO_RGB
+    channels = (
+        m[0][0] * x + m[0][1] * y + m[0][2] * z,
+        m[1][0] * x + m[1][1] * y + m[1][2] * z,
+        m[2][0] * x + m[2][1] * y + m[2][2] * z,
+    )
+
+    srgb = []
+    for c in channels:
+        c = np.clip(c, 0, 1)
+        c = np.where(c <= 0.0031308, 12.92 * c, 1.055 * (c ** (1/2.4)) - 0.055)
+        srgb.append(np.clip(np.floor(c * 255 + 0.5), 0, 255).astype(int).tolist())
+    return [_saturate(r, g, b) for r, g, b in zip(*srgb)]
+
+
+def clear_caches() -> None:
+    """Drop cached spectra and mixes (tests, benchmarks)."""
+    _log_spectra.clear()
+    _mixes.clear()
+    _saturate.cache_clear()
 
 
 COLOR_ADJECTIVES = {
@@ -29,12 +29,32 @@ from .script import (
 )
 from .player import DemoPlayer
 from .default_script import DEMO_SCRIPT, DEMO_SCRIPT_SHORT
+from ..playback.stream import SUFFIX as STREAM_SUFFIX, ActionStream
+
+_DEMO_DIR = Path(__file__).parent
+_RECORDED_STREAM = _DEMO_DIR / f"recorded_script{STREAM_SUFFIX}"
+
+
+def _load_segment(name: str) -> tuple[list, float]:
+    """A segment's actions and its own SPEED_MULTIPLIER.
+
+    Generated segments are stored as action streams (segments/NAME.actions,
+    see playback/stream.py); hand-written ones are modules. A stream wins
+    if both exist.
+    """
+    path = _DEMO_DIR / "segments" / f"{name}{STREAM_SUFFIX}"
+    if path.exists():
+        stream = ActionStream.open(path)
+        return list(stream), stream.meta.get("speed_multiplier", 1.0)
+    mod = importlib.import_module(f".segments.{name}", package="purple_tui.demo")
+    return mod.SEGMENT, getattr(mod, "SPEED_MULTIPLIER", 1.0)
 
 
 def _load_composition(path: Path) -> list:
     """Load a composed demo from demo.json.
 
-    Each entry names a segment module in purple_tui.demo.segments.
+    Each entry names a segment in purple_tui/demo/segments/ (NAME.actions
+    or NAME.py).
     A SetSpeed action is inserted before each segment.
 
     Supports "duration" field: computes speed = natural_duration / target_duration.
@@ -50,19 +70,18 @@ def _load_composition(path: Path) -> list:
 
     script: list[DemoAction] = [ClearAll()]
     for entry in entries:
-        name = entry["segment"]
-        mod = importlib.import_module(f".segments.{name}", package="purple_tui.demo")
+        actions, own_speed = _load_segment(entry["segment"])
 
         if "duration" in entry:
-            natural = segment_duration(mod.SEGMENT)
+            natural = segment_duration(actions)
             speed = natural / entry["duration"] if entry["duration"] > 0 else 1.0
         else:
             speed = entry.get("speed")
             if speed is None:
-                speed = getattr(mod, "SPEED_MULTIPLIER", 1.0)
+                speed = own_speed
 
         script.append(SetSpeed(multiplier=speed))
-        script.extend(mod.SEGMENT)
+        script.extend(actions)
     return script
 
 
@@ -73,7 +92,7 @@ def _composition_path() -> Path:
     for the ad screen footage) without disturbing the default demo.json.
     """
     name = os.environ.get("PURPLE_DEMO_COMPOSITION", "demo.json")
-    return Path(__file__).parent / name
+    return _DEMO_DIR / name
 
 
 def get_demo_script() -> list:
@@ -81,12 +100,14 @@ def get_demo_script() -> list:
 
     Priority:
     1. composition json (if it exists)
-    2. Pre-recorded script (recorded_script.py)
+    2. Pre-recorded script (recorded_script.actions, or .py)
     3. Default hand-crafted demo
     """
     demo_json = _composition_path()
     if demo_json.exists():
         return _load_composition(demo_json)
+    if _RECORDED_STREAM.exists():
+        return list(ActionStream.open(_RECORDED_STREAM))
     try:
         from .recorded_script import RECORDED_DRAWING
         return RECORDED_DRAWING
@@ -104,6 +125,8 @@ def get_speed_multiplier() -> float:
     demo_json = _composition_path()
     if demo_json.exists():
         return 1.0
+    if _RECORDED_STREAM.exists():
+        return ActionStream.open(_RECORDED_STREAM).meta.get("speed_multiplier", 1.0)
     try:
         from .recorded_script import SPEED_MULTIPLIER
         return SPEED_MULTIPLIER
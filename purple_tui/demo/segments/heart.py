@@ -1,1741 +0,0 @@
-"""Pre-recorded drawing demo, authored on a dev machine with tools/art_ai.py."""
-
-from purple_tui.demo.script import (
-    PressKey, SwitchRoom, Pause, MoveSequence, Comment, TypeText,
-    ClearArt,
-)
-
-SEGMENT = [
-    Comment("=== PRE-RECORDED DRAWING ==="),
-    SwitchRoom("art"),
-    Pause(0.3),
-
-    # Clear the canvas and reset cursor to (0,0)
-    ClearArt(),
-
-    PressKey("tab"),  # Enter paint mode
-    Pause(0.1),
-
-    # Position and draw the heart (cursor starts at 0,0 after clear)
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    PressKey('v'),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('v'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'down'], delay_per_step=0.008),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'down'], delay_per_step=0.008),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    PressKey('q'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'down', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    PressKey('p'),
-    MoveSequence(directions=['left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('p'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('q'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('q'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down'], delay_per_step=0.008),
-    PressKey('q'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('q'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-
-    Pause(0.5),
-
-    # Switch to text mode and write the message on top of the heart
-    PressKey("tab"),  # Exit paint mode, enter text mode
-    Pause(0.2),
-
-    # Move cursor to center of heart for first line of text
-    # Heart center is approximately x=57, y=12
-    # First line "This is Purple Computer." is 24 chars, so start at x=45
-    # Current position is near bottom of heart (~y=24, x~55)
-    # Move up about 12 rows and left about 10 columns to get to (45, 12)
-    MoveSequence(directions=['up'] * 12 + ['left'] * 10, delay_per_step=0.01),
-
-    # Type the first line
-    TypeText("This is Purple Computer.", delay_per_char=0.12),
-
-    # Move down one row and position for second line
-    # Second line "Coming soon to your old laptop!" is 31 chars, so start at x=41
-    # After typing 24 chars, cursor is at x=69. Move left to x=41 (28 left) and down 2
-    MoveSequence(directions=['down', 'down'] + ['left'] * 28, delay_per_step=0.01),
-
-    Pause(2.0),
-
-    # Type the second line
-    TypeText("Coming soon to your old laptop!", delay_per_char=0.12),
-
-    Pause(2.0),
-    Comment("Drawing complete!"),
-]
-
-SPEED_MULTIPLIER = 317.0655
@@ -1,1443 +0,0 @@
-"""Art room demo: intro text + palm tree drawing."""
-
-from ..script import (
-    PressKey, SwitchRoom, Pause, MoveSequence, Comment,
-    SetSpeed, TypeText, ClearArt, ZoomIn, ZoomOut,
-)
-
-# Typing speed (0.05s/char) with brief final_pause
-_TYPING = dict(delay_per_char=0.05, final_pause=0.1)
-
-SEGMENT = [
-    Comment("=== ART ROOM INTRO + PALM TREE ==="),
-    SwitchRoom("art"),
-    Pause(0.3),
-
-    SetSpeed(1.0),
-    Comment("Move to right side of canvas for intro text"),
-    MoveSequence(directions=['right'] * 65 + ['down'] * 18, delay_per_step=0.008),
-
-    Comment("Type intro in text mode (4 lines): zoom in 3x to lower right"),
-    ZoomIn(region="art-text-right", zoom=3.0, duration=0.2),
-    TypeText("This is the Art room.", **_TYPING),
-    PressKey("enter", pause_after=0.1),
-    MoveSequence(directions=['left'] * 20, delay_per_step=0.008),
-    TypeText("Write and paint!", **_TYPING),
-    PressKey("enter", pause_after=0.1),
-    MoveSequence(directions=['left'] * 16, delay_per_step=0.008),
-    TypeText("Every letter is a shade of ", **_TYPING),
-
-    Comment("Switch to paint mode for color demonstration"),
-    PressKey("tab", pause_after=0.1),
-    Comment("3 red shades (light to dark)"),
-    PressKey('q', pause_after=0.08),
-    PressKey('y', pause_after=0.08),
-    PressKey('p', pause_after=0.08),
-    MoveSequence(directions=['right'], delay_per_step=0.008),
-    Comment("3 yellow shades (light to dark)"),
-    PressKey('a', pause_after=0.08),
-    PressKey('h', pause_after=0.08),
-    PressKey(';', pause_after=0.08),
-    MoveSequence(directions=['right'], delay_per_step=0.008),
-    Comment("3 blue shades (light to dark)"),
-    PressKey('z', pause_after=0.08),
-    PressKey('n', pause_after=0.08),
-    PressKey('/', pause_after=0.08),
-
-    Comment("Switch back to text mode for final line"),
-    PressKey("tab", pause_after=0.1),
-    PressKey("enter", pause_after=0.1),
-    MoveSequence(directions=['left'] * 38, delay_per_step=0.008),
-    TypeText("Mix paint for more colors!", **_TYPING),
-    ZoomOut(duration=0.2),
-
-    Pause(2.5),
-
-    Comment("Switch to paint mode for palm tree"),
-    PressKey("tab", pause_after=0.1),
-
-    SetSpeed(83.365),
-    Comment("=== PALM TREE PAINTING (PRE-RECORDED) ==="),
-    Comment("Move from text end (91,21) to palm tree start (48,26)"),
-    MoveSequence(directions=['left'] * 43 + ['down'] * 5, delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    PressKey('t'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('y'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('r'),
-    MoveSequence(directions=['right', 'up', 'up'], delay_per_step=0.008),
-    PressKey('r'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('r'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('r'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('r'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('r'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('r'),
-    MoveSequence(directions=['up', 'up'], delay_per_step=0.008),
-    PressKey('r'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'up', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'up'], delay_per_step=0.008),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'down', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['up'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['down'], delay_per_step=0.008),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up', 'up', 'up', 'up', 'up', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'up'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'down'], delay_per_step=0.008),
-    PressKey('z'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('.'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down', 'down'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'up'], delay_per_step=0.008),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    PressKey('f'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down'], delay_per_step=0.008),
-    PressKey('s'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right'], delay_per_step=0.008),
-    PressKey('s'),
-    MoveSequence(directions=['right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'right', 'up'], delay_per_step=0.008),
-    PressKey('s'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    MoveSequence(directions=['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'left', 'down'], delay_per_step=0.008),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-    PressKey('c'),
-
-    Pause(2.0),
-
-    Comment("=== MUSIC ROOM INTRO TEXT ==="),
-    SetSpeed(1.0),
-    PressKey("tab", pause_after=0.1),  # Switch to text mode
-    MoveSequence(directions=['up'] * 3 + ['left'] * 106, delay_per_step=0.008),
-    Comment("Zoom in 3x to lower left for music room intro text"),
-    ZoomIn(region="art-text-left", zoom=3.0, duration=0.2),
-    TypeText("Now let's go to the Music room", **_TYPING),
-    PressKey("enter", pause_after=0.1),
-    MoveSequence(directions=['left'] * 25, delay_per_step=0.008),
-    TypeText("Play with music and color", **_TYPING),
-
-    Pause(2.5),
-
-    Comment("Instant zoom out so music room starts fully zoomed out (no transition)"),
-    ZoomOut(duration=0.0),
-
-    # Clear canvas now so it doesn't flash when we return to art room later
-    ClearArt(),
-
-    Comment("Drawing complete!"),
-]
-
-SPEED_MULTIPLIER = 83.3650
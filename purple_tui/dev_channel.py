@@ -0,0 +1,191 @@
+"""Dev-mode control socket: ordered, acknowledged command batches.
+
+Tools that drive the app (tools/art_ai.py) used to write a `command` file,
+wait for the app's 100ms poll to pick it up, then poll for
+`command_response`, and do the same dance with `trigger`/`latest.txt` for
+screenshots. Each step cost a polling interval. With
+PURPLE_DEV_SOCKET set (and PURPLE_DEV_MODE=1), the app also listens on a
+local Unix socket and a batch costs one round trip.
+
+Protocol: newline-delimited JSON, one request and one reply per line.
+
+    -> {"id": 1, "commands": [{"action": "mode", "value": "art"},
+                              {"action": "key", "value": "tab"},
+                              {"action": "paint_at", "x": 3, "y": 4, "color": "f"},
+                              {"action": "screenshot"}]}
+    <- {"id": 1, "ok": true, "done": 4, "results": [null, null, null, "shots/screenshot_0003.svg"]}
+
+Commands are the file protocol's (`mode`, `key`, `clear`, `set_position`,
+`paint_at`, `art_code`) plus `screenshot` (SVG of the terminal) and
+`export_canvas` (PNG of the Art canvas grid, see canvas_raster.py; pass
+"inline": true to get it back as base64). They run strictly in order, each
+awaited before the next; the reply is sent once the last has finished. If
+one raises, the batch stops there: {"ok": false, "done": k, "error": "..."}.
+
+Back-pressure: a connection's next request isn't read until its reply has
+been written, and all batches (socket and file) share one FIFO lock, so a
+fast client fills the socket buffer and blocks instead of queueing work
+without bound. Batches over MAX_BATCH commands are refused.
+
+PURPLE_DEV_SOCKET=1 puts the socket at $PURPLE_SCREENSHOT_DIR/control.sock;
+any other value is the socket path. The command/trigger files keep working.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import select
+import socket
+import time
+from typing import Awaitable, Callable
+
+MAX_BATCH = 1000
+_LINE_LIMIT = 1 << 20  # longest request line (bytes)
+SOCKET_NAME = "control.sock"
+
+
+def socket_path_from_env() -> str | None:
+    """Where to listen, or None if the channel isn't enabled."""
+    value = os.environ.get("PURPLE_DEV_SOCKET")
+    if not value or os.environ.get("PURPLE_DEV_MODE") != "1":
+        return None
+    if value == "1":
+        screenshot_dir = os.environ.get("PURPLE_SCREENSHOT_DIR")
+        return os.path.join(screenshot_dir, SOCKET_NAME) if screenshot_dir else None
+    return value
+
+
+class CommandRunner:
+    """Runs command batches one at a time, in the order they arrive.
+
+    `execute(cmd)` performs one command and returns its result (or None).
+    asyncio.Lock wakes waiters first-come first-served, so batches started
+    in order finish in order whether they came from the socket or a file.
+    """
+
+    def __init__(self, execute: Callable[[dict], Awaitable[object]]) -> None:
+        self._execute = execute
+        self._lock = asyncio.Lock()
+        self.batches = 0
+
+    async def run_batch(self, commands: list[dict]) -> dict:
+        async with self._lock:
+            self.batches += 1
+            results = []
+            for cmd in commands:
+                try:
+                    results.append(await self._execute(cmd))
+                except Exception as e:
+                    return {"ok": False, "done": len(results), "results": results,
+                            "error": f"{cmd.get('action')}: {e}"}
+            return {"ok": True, "done": len(results), "results": results}
+
+
+class DevChannel:
+    """Unix socket server feeding a CommandRunner."""
+
+    def __init__(self, runner: CommandRunner, path: str) -> None:
+        self.runner = runner
+        self.path = path
+        self._server: asyncio.AbstractServer | None = None
+        self._connections: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        try:
+            os.unlink(self.path)  # stale socket from a previous run
+        except FileNotFoundError:
+            pass
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path, limit=_LINE_LIMIT)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # longer than _LINE_LIMIT
+                    writer.write(_encode({"ok": False, "done": 0, "error": "request too long"}))
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(_encode(await self._handle(line)))
+                    await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _handle(self, line: bytes) -> dict:
+        request = None
+        try:
+            request = json.loads(line)
+            commands = request["commands"]
+            if not isinstance(commands, list):
+                raise TypeError("commands must be a list")
+        except (ValueError, KeyError, TypeError) as e:
+            reply = {"ok": False, "done": 0, "error": f"bad request: {e}"}
+            # Echo the id whenever there is one, so the client can match it
+            return {"id": request.get("id"), **reply} if isinstance(request, dict) else reply
+        if len(commands) > MAX_BATCH:
+            return {"id": request.get("id"), "ok": False, "done": 0,
+                    "error": f"batch of {len(commands)} exceeds {MAX_BATCH}"}
+        reply = await self.runner.run_batch(commands)
+        return {"id": request.get("id"), **reply}
+
+
+def _encode(reply: dict) -> bytes:
+    return (json.dumps(reply) + "\n").encode()
+
+
+class DevClient:
+    """Blocking client for tools: send(commands) returns the app's reply."""
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(path)
+        self._file = self._sock.makefile("rb")
+        self._next_id = 0
+
+    def send(self, commands: list[dict], while_waiting: Callable[[], None] | None = None) -> dict:
+        """Run `commands` and return the reply. `while_waiting` is called
+        every 50ms until it arrives (e.g. to drain the app's pty)."""
+        self._next_id += 1
+        self._sock.sendall(_encode({"id": self._next_id, "commands": commands}))
+        if while_waiting is not None:
+            deadline = time.monotonic() + (self._sock.gettimeout() or float("inf"))
+            while not select.select([self._sock], [], [], 0.05)[0]:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"no reply to batch {self._next_id}")
+                while_waiting()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("dev channel closed")
+        reply = json.loads(line)
+        if reply.get("id") is None and not reply.get("ok"):
+            # Rejected before the app could read our id (e.g. too long)
+            raise RuntimeError(f"dev channel rejected batch {self._next_id}: {reply.get('error')}")
+        if reply.get("id") != self._next_id:
+            raise RuntimeError(f"out-of-order reply {reply.get('id')} for {self._next_id}")
+        return reply
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
@@ -142,11 +142,40 @@ def device_summary_lines() -> list[str]:
     ]
 
 
-def collect_device_info() -> str:
+def wakeup_lines(ticker) -> list[str]:
+    """Timer wakeup rate and the polls behind it (app.ticker)."""
+    lines = [f"Timer wakeups: {ticker.wakeups_per_minute()}/min ({ticker.wakeups} total)"]
+    for job in ticker.jobs:
+        state = "paused" if job.paused else f"{job.runs} runs"
+        lines.append(f"  {job.name}: every {job.period:g}s, {state}")
+    return lines
+
+
+def collect_key_latency(latency) -> str:
+    """Keypress-to-paint timing for the Key latency sub-screen (app.key_latency)."""
+    lines = latency.summary_lines()
+    lines += [
+        "",
+        "kernel    key pressed -> Purple reads it",
+        "decode    keyboard state machine",
+        "dispatch  room handles the key",
+        "paint     handler done -> screen updated",
+        "total     key pressed -> screen updated",
+    ]
+    if latency.path:
+        lines += ["", f"Logging every key press to {latency.path}"]
+    return "\n".join(lines)
+
+
+def collect_device_info(ticker=None) -> str:
     """Broad device dump for the Device info sub-screen."""
     lines = device_summary_lines()
     lines.append("")
 
+    if ticker is not None:
+        lines.extend(wakeup_lines(ticker))
+        lines.append("")
+
     lines.append("Disks:")
     disks = _run("lsblk", "-d", "-n", "-o", "NAME,SIZE,TYPE,MODEL")
     if disks in ("(unavailable)", "(no output)"):
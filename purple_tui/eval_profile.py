@@ -0,0 +1,215 @@
+"""Per-stage timing for the Play room evaluator.
+
+When a kid says "it's slow when I type long sentences" we need to know which
+part of SimpleEvaluator.evaluate() is to blame: word chunking, the plus-expression
+path, adjective-group rendering, fuzzy content lookups or markup validation.
+
+EvalProfiler is opt-in and costs nothing while detached: attach() shadows the
+listed evaluator methods on that one instance with timing wrappers and swaps
+in a content proxy that times lookups, detach() removes them again. The shared
+ContentManager singleton is never patched, so other evaluators stay untimed.
+
+Each evaluate() call produces one record:
+    {"text": "2 red dogs", "total_ms": 1.84,
+     "stages": {"_chunk_words": {"ms": 0.41, "calls": 1}, ...}}
+
+Stage times are inclusive (a stage that calls another stage counts both), so
+they don't sum to total_ms. Enable in the app with PURPLE_EVAL_PROFILE=1 (dev
+log) or PURPLE_EVAL_PROFILE=/path/to/file.jsonl; scripts/profile_play_eval.py
+replays a corpus offline.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Callable
+
+# Evaluator methods worth timing: the pipeline's branches plus the helpers
+# that scale with sentence length.
+EVALUATOR_STAGES = (
+    "_normalize_and",
+    "_clean_math_expression",
+    "_eval_pattern",
+    "_eval_parens",
+    "_eval_modified_color",
+    "_eval_text_with_expr",
+    "_eval_plus_expr",
+    "_chunk_words",
+    "_render_adjective_groups",
+    "_eval_op_noun",
+    "_eval_mult",
+    "_eval_math",
+    "_lookup",
+    "_eval_auto_mix",
+    "_substitute_emojis",
+    "_format_text_as_color_blocks",
+    "_validate_markup",
+)
+
+# ContentManager lookups reached from the evaluator (exact + fuzzy paths)
+CONTENT_STAGES = (
+    "get_emoji",
+    "get_color",
+    "exact_emoji",
+    "exact_color",
+    "fuzzy_emoji",
+    "fuzzy_color",
+    "fuzzy_singularize",
+    "get_modified_color",
+    "resolve",
+)
+
+
+class _TimedContent:
+    """Stands in for evaluator.content, timing the lookup methods.
+
+    Everything else (attributes, pop_correction, ...) passes straight through
+    to the real ContentManager.
+    """
+
+    def __init__(self, content, profiler: "EvalProfiler"):
+        self._content = content
+        for name in CONTENT_STAGES:
+            if hasattr(content, name):
+                setattr(self, name, profiler._wrap(f"content.{name}", getattr(content, name)))
+
+    def __getattr__(self, name):
+        return getattr(self._content, name)
+
+
+class EvalProfiler:
+    """Records per-stage wall time and call counts for each evaluate() call.
+
+    `sink` receives every finished record (a dict); records are also kept in
+    `self.records` up to `keep` entries so a harness can read them back.
+    """
+
+    def __init__(self, sink: Callable[[dict], None] | None = None, keep: int = 1000):
+        self.sink = sink
+        self.keep = keep
+        self.records: list[dict] = []
+        self._stages: dict[str, list] = {}  # name -> [seconds, calls] for the call in flight
+        self._evaluator = None
+        self._depth = 0  # evaluate() re-enters itself for parenthesized parts
+
+    def _wrap(self, name: str, fn: Callable) -> Callable:
+        stages = self._stages
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                entry = stages.get(name)
+                if entry is None:
+                    entry = stages[name] = [0.0, 0]
+                entry[0] += time.perf_counter() - start
+                entry[1] += 1
+        return timed
+
+    def attach(self, evaluator) -> None:
+        """Start timing `evaluator`. Idempotent for the same evaluator."""
+        if self._evaluator is evaluator:
+            return
+        if self._evaluator is not None:
+            self.detach()
+        self._evaluator = evaluator
+        for name in EVALUATOR_STAGES:
+            if hasattr(evaluator, name):
+                setattr(evaluator, name, self._wrap(name, getattr(evaluator, name)))
+        evaluator.content = _TimedContent(evaluator.content, self)
+        real_evaluate = evaluator.evaluate
+
+        def evaluate(text: str) -> str:
+            if self._depth:
+                # A nested call (e.g. "(1 + 2)" inside a larger expression)
+                # belongs to the outer record
+                self._depth += 1
+                try:
+                    return real_evaluate(text)
+                finally:
+                    self._depth -= 1
+            self._stages.clear()
+            self._depth = 1
+            start = time.perf_counter()
+            try:
+                return real_evaluate(text)
+            finally:
+                self._depth = 0
+                self._finish(text, time.perf_counter() - start)
+        evaluator.evaluate = evaluate
+        evaluator.profiler = self
+
+    def detach(self) -> None:
+        """Stop timing: drop the instance shadows so class methods apply again."""
+        evaluator = self._evaluator
+        if evaluator is None:
+            return
+        self._evaluator = None
+        for name in (*EVALUATOR_STAGES, "evaluate"):
+            evaluator.__dict__.pop(name, None)
+        if isinstance(evaluator.content, _TimedContent):
+            evaluator.content = evaluator.content._content
+        evaluator.profiler = None
+
+    def _finish(self, text: str, elapsed: float) -> None:
+        record = {
+            "text": text,
+            "total_ms": round(elapsed * 1000, 3),
+            "stages": {
+                name: {"ms": round(secs * 1000, 3), "calls": calls}
+                for name, (secs, calls) in sorted(self._stages.items(), key=lambda kv: -kv[1][0])
+            },
+        }
+        self.records.append(record)
+        if len(self.records) > self.keep:
+            del self.records[:len(self.records) - self.keep]
+        if self.sink:
+            try:
+                self.sink(record)
+            except Exception:
+                pass  # instrumentation must never break evaluation
+
+    def summary(self) -> list[tuple[str, float, int]]:
+        """Totals across all kept records as (stage, ms, calls), slowest first."""
+        totals: dict[str, list] = {}
+        for record in self.records:
+            for name, stage in record["stages"].items():
+                entry = totals.setdefault(name, [0.0, 0])
+                entry[0] += stage["ms"]
+                entry[1] += stage["calls"]
+        return sorted(((n, ms, c) for n, (ms, c) in totals.items()), key=lambda t: -t[1])
+
+
+def format_record(record: dict, top: int = 5) -> str:
+    """One dev-log line: total, input, and the slowest stages."""
+    stages = " ".join(
+        f"{name}={stage['ms']:.2f}ms/{stage['calls']}"
+        for name, stage in list(record["stages"].items())[:top]
+    )
+    return f"[EvalProfile] {record['total_ms']:.2f}ms {record['text']!r} {stages}"
+
+
+def jsonl_sink(path: str) -> Callable[[dict], None]:
+    """Sink appending each record as one JSON line to `path`."""
+    def write(record: dict) -> None:
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    return write
+
+
+def profiler_from_env(dev_log: Callable[[str], None] | None = None) -> EvalProfiler | None:
+    """Build a profiler from PURPLE_EVAL_PROFILE, or None when unset.
+
+    "1" logs each record through `dev_log`; any other value is a JSONL path.
+    """
+    value = os.environ.get("PURPLE_EVAL_PROFILE")
+    if not value:
+        return None
+    if value == "1":
+        if dev_log is None:
+            return None
+        return EvalProfiler(sink=lambda record: dev_log(format_record(record)))
+    return EvalProfiler(sink=jsonl_sink(value))
@@ -0,0 +1,202 @@
+"""Keypress-to-paint latency, split by pipeline stage.
+
+Every key press from evdev is timed through the stages it passes on its
+way to the screen:
+
+    kernel    evdev timestamp -> _handle_raw_key_event starts
+              (EvdevReader's read loop plus the asyncio hop)
+    decode    KeyboardStateMachine.process and InputFloodGuard
+    dispatch  _dispatch_keyboard_action, i.e. the room's handler
+    paint     handler done -> the screen update after it has run
+    total     evdev timestamp -> paint
+
+The origin is the kernel's own timestamp on the input event, so time the
+event spent queued before Python read it counts. evdev stamps with
+CLOCK_REALTIME unless a reader switched the device to CLOCK_MONOTONIC;
+to_monotonic() accepts either.
+
+Stages feed fixed-size log-bucket histograms (about 9% resolution), so
+p50/p99 cost the same after a minute or a month of typing. Support info >
+Key latency shows them. PURPLE_KEY_LATENCY=/path/to/file.jsonl appends one
+record per key press, and the app appends a histogram snapshot on exit:
+
+    {"key": "a", "kernel_ms": 0.41, "decode_ms": 0.05, ..., "total_ms": 9.8}
+    {"time": 1760000000.0, "histograms": {"total": {"p50_ms": 9.5, ...}, ...}}
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+from typing import Callable
+
+STAGES = ("kernel", "decode", "dispatch", "paint", "total")
+
+# Bucket i holds latencies up to _MIN_MS * 2**(i / _PER_DOUBLING) ms;
+# 8 per doubling from 0.05ms covers up to ~52s in 161 buckets.
+_MIN_MS = 0.05
+_PER_DOUBLING = 8
+_BUCKETS = 20 * _PER_DOUBLING + 1
+
+
+def _bucket(ms: float) -> int:
+    if ms <= _MIN_MS:
+        return 0
+    return min(_BUCKETS - 1, math.ceil(math.log2(ms / _MIN_MS) * _PER_DOUBLING))
+
+
+def _upper_edge(index: int) -> float:
+    return _MIN_MS * 2 ** (index / _PER_DOUBLING)
+
+
+class Histogram:
+    """Latency counts in log-spaced buckets (milliseconds)."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        ms = max(0.0, ms)
+        self.counts[_bucket(ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float | None:
+        """Upper edge of the bucket holding the q-th quantile (0 < q <= 1)."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_upper_edge(index), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        def rounded(value):
+            return None if value is None else round(value, 3)
+        return {
+            "count": self.count,
+            "mean_ms": rounded(self.total_ms / self.count if self.count else None),
+            "p50_ms": rounded(self.percentile(0.50)),
+            "p90_ms": rounded(self.percentile(0.90)),
+            "p99_ms": rounded(self.percentile(0.99)),
+            "max_ms": rounded(self.max_ms if self.count else None),
+            "buckets": {f"{_upper_edge(i):.3f}": n for i, n in enumerate(self.counts) if n},
+        }
+
+
+def to_monotonic(event_ts: float, mono_now: float, wall_now: float) -> float:
+    """An evdev timestamp on the time.monotonic() clock, whichever clock
+    the kernel stamped it with (whichever of the two it is closer to)."""
+    if abs(event_ts - mono_now) <= abs(event_ts - wall_now):
+        return event_ts
+    return event_ts - wall_now + mono_now
+
+
+class KeyTrace:
+    """One key press in flight through the pipeline."""
+
+    __slots__ = ("key", "origin", "last", "stages")
+
+    def __init__(self, key: str, origin: float, now: float) -> None:
+        self.key = key
+        self.origin = origin
+        self.last = now
+        self.stages: dict[str, float] = {"kernel": (now - origin) * 1000}
+
+
+class KeyLatency:
+    """Collects KeyTraces into per-stage histograms.
+
+    The app calls start() when evdev hands it a key, mark() after each
+    stage, and finish() from call_after_refresh once the frame is out.
+    `sink` receives every finished record.
+    """
+
+    def __init__(self, sink: Callable[[dict], None] | None = None,
+                 clock: Callable[[], float] = time.monotonic, path: str | None = None) -> None:
+        self.sink = sink
+        self.path = path  # JSONL file behind the sink, if any
+        self.clock = clock
+        self.histograms = {stage: Histogram() for stage in STAGES}
+
+    def start(self, event) -> KeyTrace | None:
+        """Begin timing a RawKeyEvent. Releases and auto-repeats aren't timed."""
+        if not event.is_down or event.is_repeat:
+            return None
+        now = self.clock()
+        origin = to_monotonic(event.timestamp, now, time.time())
+        return KeyTrace(event.name, origin, now)
+
+    def mark(self, trace: KeyTrace | None, stage: str) -> None:
+        """Close `stage`: the time since the previous mark (accumulates)."""
+        if trace is None:
+            return
+        now = self.clock()
+        trace.stages[stage] = trace.stages.get(stage, 0.0) + (now - trace.last) * 1000
+        trace.last = now
+
+    def finish(self, trace: KeyTrace | None) -> None:
+        """The frame showing the key's effect is out: record the trace."""
+        if trace is None:
+            return
+        self.mark(trace, "paint")
+        trace.stages["total"] = (trace.last - trace.origin) * 1000
+        for stage, ms in trace.stages.items():
+            self.histograms[stage].add(ms)
+        if self.sink:
+            record = {"key": trace.key, **{f"{s}_ms": round(ms, 3) for s, ms in trace.stages.items()}}
+            try:
+                self.sink(record)
+            except Exception:
+                pass  # instrumentation must never break input
+
+    @property
+    def count(self) -> int:
+        return self.histograms["total"].count
+
+    def snapshot(self) -> dict:
+        return {stage: hist.to_dict() for stage, hist in self.histograms.items()}
+
+    def summary_lines(self) -> list[str]:
+        """p50/p99 per stage for the Support info screen."""
+        if not self.count:
+            return ["No key presses timed yet."]
+        lines = [f"Key presses timed: {self.count}", "",
+                 f"  {'stage':<10}{'p50':>10}{'p99':>10}{'max':>10}"]
+        for stage in STAGES:
+            hist = self.histograms[stage]
+            if not hist.count:
+                continue
+            lines.append(f"  {stage:<10}{hist.percentile(0.5):>8.1f}ms"
+                         f"{hist.percentile(0.99):>8.1f}ms{hist.max_ms:>8.1f}ms")
+        return lines
+
+    def dump_jsonl(self, path: str) -> None:
+        """Append the current histograms to `path` as one JSON line."""
+        record = {"time": time.time(), "histograms": self.snapshot()}
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+def jsonl_sink(path: str) -> Callable[[dict], None]:
+    """Sink appending each record as one JSON line to `path`."""
+    def write(record: dict) -> None:
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    return write
+
+
+def latency_from_env() -> KeyLatency:
+    """Always-on tracker; PURPLE_KEY_LATENCY=<path> also logs every press."""
+    path = os.environ.get("PURPLE_KEY_LATENCY")
+    return KeyLatency(sink=jsonl_sink(path) if path else None, path=path)
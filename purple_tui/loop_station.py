@@ -15,9 +15,13 @@ limit, the caller should auto-transition to looping.
 """
 
 import time
+from bisect import insort
+from operator import itemgetter
 
 MAX_LOOP_DURATION = 20.0  # seconds
 
+_OFFSET = itemgetter(2)
+
 # States
 IDLE = 'idle'
 RECORDING = 'recording'
@@ -35,6 +39,11 @@ class LoopStation:
     and play back on the next cycle. Each event remembers its instrument
     so layered loops preserve the sound each note was recorded with.
 
+    Loop events are kept ordered by offset (bisect insertion, ties in
+    arrival order). Every change bumps `generation`; `schedule` is an
+    immutable snapshot rebuilt only when the generation moved, so playback
+    can take it once per cycle without copying or sorting.
+
     Usage:
         loop = LoopStation()
 
@@ -58,6 +67,9 @@ class LoopStation:
         self._loop_events: list[tuple[str, str, float, int]] = []
         self._loop_duration: float = 0.0
         self._cycle_start: float = 0.0
+        self._generation = 0
+        self._schedule: tuple[tuple[str, str, float, int], ...] = ()
+        self._schedule_generation = 0
 
     @property
     def state(self) -> str:
@@ -72,6 +84,26 @@ class LoopStation:
         """Current loop events (may grow as new notes are added during looping)."""
         return list(self._loop_events)
 
+    @property
+    def generation(self) -> int:
+        """Bumped whenever the loop's events change."""
+        return self._generation
+
+    @property
+    def schedule(self) -> tuple[tuple[str, str, float, int], ...]:
+        """Loop events in playback order, as an immutable snapshot.
+
+        The same tuple is returned until the events change, so playback can
+        hold it for a whole cycle while new notes land in the next one.
+        """
+        if self._schedule_generation != self._generation:
+            self._schedule = tuple(self._loop_events)
+            self._schedule_generation = self._generation
+        return self._schedule
+
+    def _loop_changed(self) -> None:
+        self._generation += 1
+
     @property
     def max_duration(self) -> float:
         return self._max_duration
@@ -84,6 +116,7 @@ class LoopStation:
         self._recording_events.clear()
         self._loop_events.clear()
         self._loop_duration = 0.0
+        self._loop_changed()
 
     def record_event(self, key: str, mode: str, now: float | None = None,
                      instrument: int = 0) -> None:
@@ -105,8 +138,8 @@ class LoopStation:
         elif self._state == LOOPING and self._loop_duration > 0:
             elapsed = now - self._cycle_start
             cycle_offset = elapsed % self._loop_duration
-            self._loop_events.append((key, mode, cycle_offset, instrument))
-            self._loop_events.sort(key=lambda e: e[2])
+            insort(self._loop_events, (key, mode, cycle_offset, instrument), key=_OFFSET)
+            self._loop_changed()
 
     def finish_recording(self, now: float | None = None) -> tuple[list[tuple[str, str, float, int]], float]:
         """Stop recording and begin looping.
@@ -124,10 +157,11 @@ class LoopStation:
         if duration < last_offset:
             duration = last_offset
         self._loop_duration = duration
-        self._loop_events = list(self._recording_events)
+        self._loop_events = sorted(self._recording_events, key=_OFFSET)
         self._recording_events.clear()
         self._state = LOOPING
         self._cycle_start = now
+        self._loop_changed()
         return list(self._loop_events), self._loop_duration
 
     def start_new_cycle(self, now: float | None = None) -> None:
@@ -149,6 +183,7 @@ class LoopStation:
         self._recording_events.clear()
         self._loop_events.clear()
         self._loop_duration = 0.0
+        self._loop_changed()
 
     def recording_remaining(self, now: float | None = None) -> float:
         """Seconds remaining before max duration. 0 if not recording."""
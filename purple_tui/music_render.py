@@ -0,0 +1,337 @@
+"""Offline rendering of Music room events to a WAV file.
+
+The Music room only makes sound live through pygame, so capturing a loop or
+a Music code program used to take as long as the music itself. This module
+turns the same event lists into audio as fast as the CPU allows:
+
+  LoopStation.schedule    events_from_loop()     (key, mode, offset, instrument)
+  MusicSession replays    events_from_session()  (key, mode, delay)
+  Music code lines        events_from_code()     MusicCodeRunner on a virtual clock
+
+Each becomes a timeline of (seconds, key, mode, instrument) notes. voices_for()
+maps a note to the samples the app would play (same pitch_for() lookup, same
+letters-mode ducking, same 0.4 Sound volume), and render() mixes them with
+NumPy slice adds, optionally split into time segments across processes.
+
+Samples come from packs/core-sounds and are decoded with pygame (dummy audio
+driver, nothing reaches the speakers). SampleBank.from_arrays() builds a bank
+from in-memory arrays for tests and synthetic sounds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import wave
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from .music_constants import (
+    DEFAULT_ROOT_INDEX, FRIENDLY_KEYS, GRID_KEYS, INSTRUMENTS, INSTRUMENT_ALIASES,
+    pitch_filename, pitch_for,
+)
+from .music_session import MODE_LETTERS, MODE_MUSIC
+
+SAMPLE_RATE = 44100
+SOUND_VOLUME = 0.4   # MusicGrid sets every Sound to 0.4
+LETTERS_DUCK = 0.2   # instrument volume under a spoken letter (MusicMode._play_key)
+
+DEFAULT_SOUNDS = Path(__file__).parent.parent / "packs" / "core-sounds" / "content"
+
+# (seconds, key, mode, instrument index)
+Note = tuple[float, str, str, int]
+# (seconds, sample id, gain)
+Voice = tuple[float, str, float]
+
+# Melodic keys -> (row, col) for pitch_for(); row 0 is the Q-P row
+_KEY_TO_RC = {
+    key: (r - 1, c)
+    for r, row in enumerate(GRID_KEYS) for c, key in enumerate(row)
+    if not key.isdigit()
+}
+_SPEAKABLE = {key for row in GRID_KEYS for key in row if key.isalnum()}
+
+
+# ---------------------------------------------------------------------------
+# Event sources
+# ---------------------------------------------------------------------------
+
+def events_from_loop(events, duration: float, cycles: int = 1) -> list[Note]:
+    """Timeline for `cycles` passes of a loop (LoopStation.schedule or
+    loop_events: (key, mode, offset, instrument))."""
+    notes = [
+        (cycle * duration + offset, key, mode, instrument)
+        for cycle in range(cycles)
+        for key, mode, offset, instrument in events
+    ]
+    notes.sort(key=lambda n: n[0])
+    return notes
+
+
+def events_from_session(replay, instrument: int = 0) -> list[Note]:
+    """Timeline for a MusicSession replay ((key, mode, delay_from_previous))."""
+    notes = []
+    t = 0.0
+    for key, mode, delay in replay:
+        t += delay
+        notes.append((t, key, mode, instrument))
+    return notes
+
+
+def instrument_index(name: str) -> int | None:
+    """INSTRUMENTS index for a name, matching the app's set-instrument rules."""
+    name_lower = INSTRUMENT_ALIASES.get(name.lower(), name.lower())
+    for i, (inst_id, inst_name) in enumerate(INSTRUMENTS):
+        if inst_name.lower() == name_lower or inst_id.lower() == name_lower:
+            return i
+    for i, (inst_id, inst_name) in enumerate(INSTRUMENTS):
+        if inst_name.lower().startswith(name_lower) or inst_id.lower().startswith(name_lower):
+            return i
+    return None
+
+
+def events_from_code(lines: list[str], mode: str = MODE_MUSIC,
+                     instrument: int = 0) -> tuple[list[Note], float]:
+    """Run Music code on a virtual clock. Returns (timeline, end time).
+
+    MusicCodeRunner awaits its note delays through sleep_fn, which here just
+    advances the clock, so a long program "plays" instantly. Instrument and
+    letters switches apply to the notes after them, as in the room.
+    """
+    from .code_runner import MusicCodeRunner
+
+    clock = [0.0]
+    state = {"mode": mode, "instrument": instrument}
+    notes: list[Note] = []
+
+    async def advance(seconds: float) -> None:
+        clock[0] += seconds
+
+    def set_instrument(name: str) -> None:
+        index = instrument_index(name)
+        if index is not None:
+            state["instrument"] = index
+
+    def set_letters(on: bool) -> None:
+        state["mode"] = MODE_LETTERS if on else MODE_MUSIC
+
+    runner = MusicCodeRunner(
+        play_key_fn=lambda key, m: notes.append((clock[0], key, m, state["instrument"])),
+        set_instrument_fn=set_instrument,
+        set_letters_fn=set_letters,
+        sleep_fn=advance,
+    )
+    asyncio.run(runner.run(lines, mode))
+    return notes, clock[0]
+
+
+# ---------------------------------------------------------------------------
+# Notes -> sample voices
+# ---------------------------------------------------------------------------
+
+def voices_for(key: str, mode: str, instrument: int,
+               root_index: int = DEFAULT_ROOT_INDEX) -> list[tuple[str, float]]:
+    """(sample id, gain) for everything one key press sounds.
+
+    Mirrors MusicMode._play_key + MusicGrid.play_sound_with_instrument:
+    digits play percussion, melodic keys play the instrument sample for
+    their pitch under `root_index`, and in letters mode a speakable key
+    adds its letter clip over the ducked instrument.
+    """
+    letters_layer = mode == MODE_LETTERS and key in _SPEAKABLE
+    gain = SOUND_VOLUME * (LETTERS_DUCK if letters_layer else 1.0)
+    voices = []
+    if key.isdigit():
+        voices.append((key, gain))
+    elif key in _KEY_TO_RC:
+        row, col = _KEY_TO_RC[key]
+        note, octave = pitch_for(row, col, FRIENDLY_KEYS[root_index], 0)
+        inst_id = INSTRUMENTS[instrument][0]
+        voices.append((f"{inst_id}/{pitch_filename(note, octave)}", gain))
+    if letters_layer:
+        voices.append((f"letters/{key.lower()}", SOUND_VOLUME))
+    return voices
+
+
+def schedule_voices(notes: list[Note], root_index: int = DEFAULT_ROOT_INDEX) -> list[Voice]:
+    """Expand a note timeline into sample voices."""
+    return [
+        (t, sample_id, gain)
+        for t, key, mode, instrument in notes
+        for sample_id, gain in voices_for(key, mode, instrument, root_index)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Samples
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def _decoder(rate: int):
+    """A pygame mixer to decode with; opened on the dummy driver if needed."""
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame.mixer
+    import pygame.sndarray
+    owned = not pygame.mixer.get_init()
+    if owned:
+        pygame.mixer.init(frequency=rate, size=-16, channels=2)
+    try:
+        yield pygame
+    finally:
+        if owned:
+            pygame.mixer.quit()
+
+
+class SampleBank:
+    """Decoded samples as float32 (frames, 2) arrays, keyed by sample id
+    ("marimba/c4", "3", "letters/a"). Missing files stay silent, like the app.
+    """
+
+    def __init__(self, root: Path | str = DEFAULT_SOUNDS, rate: int = SAMPLE_RATE):
+        self.root = Path(root)
+        self.rate = rate
+        self._samples: dict[str, np.ndarray | None] = {}
+
+    @classmethod
+    def from_arrays(cls, samples: dict[str, np.ndarray], rate: int = SAMPLE_RATE) -> "SampleBank":
+        bank = cls(root=os.devnull, rate=rate)
+        for sample_id, data in samples.items():
+            bank._samples[sample_id] = _stereo(np.asarray(data, dtype=np.float32))
+        return bank
+
+    def _path(self, sample_id: str) -> Path | None:
+        for ext in (".ogg", ".wav"):
+            path = self.root / f"{sample_id}{ext}"
+            if path.exists():
+                return path
+        return None
+
+    def load(self, sample_ids) -> None:
+        """Decode every not-yet-loaded id in one mixer session."""
+        missing = [s for s in dict.fromkeys(sample_ids) if s not in self._samples]
+        paths = {s: self._path(s) for s in missing}
+        for s, path in paths.items():
+            if path is None:
+                self._samples[s] = None
+        todo = {s: p for s, p in paths.items() if p is not None}
+        if not todo:
+            return
+        with _decoder(self.rate) as pygame:
+            freq, size, channels = pygame.mixer.get_init()
+            if freq != self.rate:
+                raise RuntimeError(f"mixer already open at {freq} Hz, bank wants {self.rate} Hz")
+            for s, path in todo.items():
+                try:
+                    raw = pygame.sndarray.array(pygame.mixer.Sound(str(path)))
+                except pygame.error:
+                    self._samples[s] = None
+                    continue
+                scale = float(1 << (abs(size) - 1))
+                self._samples[s] = _stereo(raw.astype(np.float32) / scale)
+
+    def get(self, sample_id: str) -> np.ndarray | None:
+        if sample_id not in self._samples:
+            self.load([sample_id])
+        return self._samples[sample_id]
+
+
+def _stereo(data: np.ndarray) -> np.ndarray:
+    if data.ndim == 1:
+        data = data[:, None]
+    if data.shape[1] == 1:
+        data = np.repeat(data, 2, axis=1)
+    return np.ascontiguousarray(data[:, :2], dtype=np.float32)
+
+
+# ---------------------------------------------------------------------------
+# Mixing
+# ---------------------------------------------------------------------------
+
+def _mix_into(out: np.ndarray, placements, samples, lo: int, hi: int) -> None:
+    """Add every voice's overlap with frames [lo, hi) into `out`."""
+    for start, sample_id, gain in placements:
+        data = samples[sample_id]
+        a, b = max(start, lo), min(start + len(data), hi)
+        if b > a:
+            out[a:b] += data[a - start:b - start] * np.float32(gain)
+
+
+def _mix_segment(args) -> None:
+    """Worker: mix one time segment straight into the shared output buffer.
+    Segments never overlap, so workers need no locking."""
+    from multiprocessing.shared_memory import SharedMemory
+    shm_name, frames, lo, hi, placements, samples = args
+    shm = SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((frames, 2), dtype=np.float32, buffer=shm.buf)
+        _mix_into(out, placements, samples, lo, hi)
+        del out
+    finally:
+        shm.close()
+
+
+def _mix_parallel(frames: int, placements, bank: SampleBank, jobs: int) -> np.ndarray:
+    from multiprocessing import get_context
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(create=True, size=max(1, frames * 2 * 4))
+    try:
+        bounds = [frames * i // jobs for i in range(jobs + 1)]
+        work = []
+        for lo, hi in zip(bounds, bounds[1:]):
+            mine = [p for p in placements if p[0] < hi and p[0] + len(bank.get(p[1])) > lo]
+            work.append((shm.name, frames, lo, hi, mine, {s: bank.get(s) for _, s, _ in mine}))
+        with get_context("spawn").Pool(jobs) as pool:
+            pool.map(_mix_segment, work)
+        return np.ndarray((frames, 2), dtype=np.float32, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def render(notes: list[Note], bank: SampleBank, root_index: int = DEFAULT_ROOT_INDEX,
+           duration: float | None = None, tail: bool = True, jobs: int = 1) -> np.ndarray:
+    """Mix a note timeline to float32 stereo frames in [-1, 1].
+
+    The result spans `duration` seconds (default: the last note) plus, when
+    `tail` is set, however long the last samples ring. `jobs` > 1 splits
+    the timeline into that many segments mixed in parallel processes; the
+    output is identical to a single-process render.
+    """
+    voices = schedule_voices(notes, root_index)
+    bank.load(v[1] for v in voices)
+    rate = bank.rate
+
+    if duration is None:
+        duration = max((n[0] for n in notes), default=0.0)
+    frames = round(duration * rate)
+    placements: list[tuple[int, str, float]] = []
+    for t, sample_id, gain in voices:
+        data = bank.get(sample_id)
+        if data is None:
+            continue
+        start = round(t * rate)
+        placements.append((start, sample_id, gain))
+        if tail:
+            frames = max(frames, start + len(data))
+
+    if jobs > 1 and frames >= jobs * rate:
+        mix = _mix_parallel(frames, placements, bank, jobs)
+    else:
+        mix = np.zeros((frames, 2), dtype=np.float32)
+        _mix_into(mix, placements, {s: bank.get(s) for _, s, _ in placements}, 0, frames)
+    np.clip(mix, -1.0, 1.0, out=mix)
+    return mix
+
+
+def write_wav(path: Path | str, audio: np.ndarray, rate: int = SAMPLE_RATE) -> None:
+    """Write float frames in [-1, 1] as 16-bit stereo PCM."""
+    pcm = np.round(audio * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(pcm.shape[1])
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm.tobytes())
@@ -9,7 +9,6 @@ import asyncio
 import json
 import os
 import random
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Awaitable
 
@@ -33,6 +32,7 @@ from .script import (
     ZoomOut,
     ZoomTarget,
 )
+from ..clock import loop_time
 from ..keyboard import (
     CharacterAction,
     NavigationAction,
@@ -149,11 +149,11 @@ class PlaybackPlayer:
         # is confirmed capturing frames, so the script never runs unrecorded.
         go_file = os.environ.get("PURPLE_RECORD_GO_FILE")
         if go_file:
-            deadline = time.monotonic() + 30
-            while not Path(go_file).exists() and time.monotonic() < deadline:
+            deadline = loop_time() + 30
+            while not Path(go_file).exists() and loop_time() < deadline:
                 await asyncio.sleep(0.05)
 
-        self._start_time = time.monotonic()
+        self._start_time = loop_time()
 
         try:
             for action in script:
@@ -463,7 +463,7 @@ class PlaybackPlayer:
         if pos is None:
             return
         x_frac, y_frac = pos
-        elapsed = time.monotonic() - self._start_time
+        elapsed = loop_time() - self._start_time
         self._zoom_events.append({
             "time": round(elapsed, 3),
             "action": "cursor_at",
@@ -473,7 +473,7 @@ class PlaybackPlayer:
 
     async def _zoom_in(self, action: ZoomIn) -> None:
         """Record a zoom-in event for post-processing."""
-        elapsed = time.monotonic() - self._start_time
+        elapsed = loop_time() - self._start_time
         self._zoom_events.append({
             "time": round(elapsed, 3),
             "action": "zoom_in",
@@ -488,7 +488,7 @@ class PlaybackPlayer:
     async def _zoom_out(self, action: ZoomOut) -> None:
         """Record a zoom-out event for post-processing."""
         self._zoomed_in = False
-        elapsed = time.monotonic() - self._start_time
+        elapsed = loop_time() - self._start_time
         self._zoom_events.append({
             "time": round(elapsed, 3),
             "action": "zoom_out",
@@ -498,7 +498,7 @@ class PlaybackPlayer:
 
     async def _zoom_target(self, action: ZoomTarget) -> None:
         """Record a pan event for post-processing."""
-        elapsed = time.monotonic() - self._start_time
+        elapsed = loop_time() - self._start_time
         event: dict = {
             "time": round(elapsed, 3),
             "action": "pan_to",
@@ -0,0 +1,324 @@
+"""Compact binary format for long generated action scripts.
+
+Recorded drawings (tools/install_art_demo.py) are thousands of PressKey and
+MoveSequence actions. As Python literals they cost a full compile on first
+import and weigh in at ~55KB of source each. This format stores the same
+actions in a kilobyte or two, and decoding them is a loop over bytes.
+
+Layout:
+
+    b"PACT" | version | varint len | JSON meta | zlib(body)
+
+`meta` is a small dict (e.g. {"speed_multiplier": 8.0}). The body has
+three parts, each starting with a varint count:
+
+    strings   varint length + UTF-8 each
+    records   each distinct action once:
+                varint opcode   ACTION_TYPES[opcode]
+                varint mask     bit i set = field i is stored (not its default)
+                values          one tagged value per set bit, in field order
+    sequence  varint (index << 1) plays record `index`;
+              varint (count << 1 | 1) plays the previous record `count` more times
+
+A recorded drawing is a few dozen distinct actions (PressKey('t'), a short
+MoveSequence...) played over and over, so each is stored and decoded once.
+Values are tagged: None, False, True, int (zigzag varint), float (8 bytes),
+str (string table index), list and tuple (varint length, then values).
+
+ACTION_TYPES is append-only: opcodes are positions in it, so adding an
+action type at the end keeps old files readable, and a new field on an
+action must go after its existing ones.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .script import (
+    PlaybackAction,
+    TypeText,
+    PressKey,
+    SwitchRoom,
+    SwitchTarget,
+    Pause,
+    Clear,
+    ClearAll,
+    ClearArt,
+    PlayKeys,
+    DrawPath,
+    MoveSequence,
+    SelectMenuItem,
+    SetSpeed,
+    ZoomIn,
+    ZoomOut,
+    ZoomTarget,
+    Comment,
+)
+
+MAGIC = b"PACT"
+VERSION = 1
+SUFFIX = ".actions"
+
+ACTION_TYPES: tuple[type[PlaybackAction], ...] = (
+    TypeText, PressKey, SwitchRoom, SwitchTarget, Pause, Clear, ClearAll,
+    ClearArt, PlayKeys, DrawPath, MoveSequence, SelectMenuItem, SetSpeed,
+    ZoomIn, ZoomOut, ZoomTarget, Comment,
+)
+
+_OPCODES = {cls: i for i, cls in enumerate(ACTION_TYPES)}
+_FIELDS = {cls: tuple(dataclasses.fields(cls)) for cls in ACTION_TYPES}
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _TUPLE = range(8)
+_DOUBLE = struct.Struct("<d")
+
+
+class StreamError(ValueError):
+    """Raised for data that isn't a valid action stream."""
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def _varint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+
+    def value(self, out: bytearray, value: object) -> None:
+        if value is None:
+            out.append(_NONE)
+        elif value is True or value is False:
+            out.append(_TRUE if value else _FALSE)
+        elif isinstance(value, int):
+            out.append(_INT)
+            _varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif isinstance(value, float):
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(value)
+        elif isinstance(value, str):
+            out.append(_STR)
+            _varint(out, self.strings.setdefault(value, len(self.strings)))
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST if isinstance(value, list) else _TUPLE)
+            _varint(out, len(value))
+            for item in value:
+                self.value(out, item)
+        else:
+            raise TypeError(f"can't store {type(value).__name__} in an action stream")
+
+    def record(self, action: PlaybackAction) -> bytes:
+        cls = type(action)
+        opcode = _OPCODES.get(cls)
+        if opcode is None:
+            raise TypeError(f"{cls.__name__} has no opcode in ACTION_TYPES")
+        values = bytearray()
+        mask = 0
+        for i, field in enumerate(_FIELDS[cls]):
+            value = getattr(action, field.name)
+            # Compare types too: 0 == 0.0 == False, but each must round-trip as itself
+            if field.default is dataclasses.MISSING or not (
+                    type(value) is type(field.default) and value == field.default):
+                mask |= 1 << i
+                self.value(values, value)
+        out = bytearray()
+        _varint(out, opcode)
+        _varint(out, mask)
+        return bytes(out + values)
+
+
+def dumps(actions: Iterable[PlaybackAction], meta: dict | None = None) -> bytes:
+    """Encode actions (and a JSON-serializable meta dict) to bytes."""
+    encoder = _Encoder()
+    records: dict[bytes, int] = {}
+    sequence = bytearray()
+    previous = -1
+    repeats = 0
+    for action in actions:
+        index = records.setdefault(encoder.record(action), len(records))
+        if index == previous:
+            repeats += 1
+            continue
+        if repeats:
+            _varint(sequence, repeats << 1 | 1)
+            repeats = 0
+        _varint(sequence, index << 1)
+        previous = index
+    if repeats:
+        _varint(sequence, repeats << 1 | 1)
+
+    body = bytearray()
+    _varint(body, len(encoder.strings))
+    for text in encoder.strings:  # dicts keep insertion order = index order
+        data = text.encode()
+        _varint(body, len(data))
+        body += data
+    _varint(body, len(records))
+    for record in records:
+        body += record
+    body += sequence
+
+    header = json.dumps(meta or {}, sort_keys=True).encode()
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    _varint(out, len(header))
+    out += header
+    out += zlib.compress(bytes(body), 9)
+    return bytes(out)
+
+
+def dump(actions: Iterable[PlaybackAction], path: str | Path, meta: dict | None = None) -> None:
+    Path(path).write_bytes(dumps(actions, meta))
+
+
+# =============================================================================
+# DECODING
+# =============================================================================
+
+class _Reader:
+    def __init__(self, data: bytes, pos: int = 0) -> None:
+        self.data = data
+        self.pos = pos
+
+    def varint(self) -> int:
+        data = self.data
+        result = shift = 0
+        while True:
+            try:
+                byte = data[self.pos]
+            except IndexError:
+                raise StreamError("truncated action stream") from None
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def value(self, strings: list[str]) -> object:
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == _STR:
+            return strings[self.varint()]
+        if tag == _FLOAT:
+            (value,) = _DOUBLE.unpack_from(self.data, self.pos)
+            self.pos += 8
+            return value
+        if tag == _INT:
+            n = self.varint()
+            return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+        if tag == _LIST or tag == _TUPLE:
+            items = [self.value(strings) for _ in range(self.varint())]
+            return items if tag == _LIST else tuple(items)
+        if tag == _NONE:
+            return None
+        if tag == _FALSE or tag == _TRUE:
+            return tag == _TRUE
+        raise StreamError(f"unknown value tag {tag}")
+
+
+def _split(data: bytes) -> tuple[dict, int]:
+    """(meta, offset of the compressed body)."""
+    if data[:4] != MAGIC:
+        raise StreamError("not an action stream")
+    if data[4] != VERSION:
+        raise StreamError(f"unsupported action stream version {data[4]}")
+    reader = _Reader(data, 5)
+    length = reader.varint()
+    try:
+        meta = json.loads(data[reader.pos:reader.pos + length])
+    except ValueError as e:
+        raise StreamError(f"bad action stream header: {e}") from None
+    return meta, reader.pos + length
+
+
+def read_meta(data: bytes) -> dict:
+    return _split(data)[0]
+
+
+def iter_actions(data: bytes) -> Iterator[PlaybackAction]:
+    """Decode actions one at a time. Each is a fresh object (repeats too),
+    so callers may modify what they get."""
+    _, offset = _split(data)
+    try:
+        body = zlib.decompress(data[offset:])
+    except zlib.error as e:
+        raise StreamError(f"corrupt action stream: {e}") from None
+    reader = _Reader(body)
+    strings = []
+    for _ in range(reader.varint()):
+        length = reader.varint()
+        strings.append(body[reader.pos:reader.pos + length].decode())
+        reader.pos += length
+
+    # Each distinct action is decoded once; fields holding lists are copied
+    # per use so the actions handed out share none
+    records: list[tuple[type[PlaybackAction], dict, tuple[str, ...]]] = []
+    for _ in range(reader.varint()):
+        opcode = reader.varint()
+        try:
+            cls = ACTION_TYPES[opcode]
+        except IndexError:
+            raise StreamError(f"unknown action opcode {opcode}") from None
+        mask = reader.varint()
+        kwargs = {field.name: reader.value(strings)
+                  for i, field in enumerate(_FIELDS[cls]) if mask >> i & 1}
+        lists = tuple(name for name, value in kwargs.items() if type(value) is list)
+        records.append((cls, kwargs, lists))
+
+    def build(record: tuple[type[PlaybackAction], dict, tuple[str, ...]]) -> PlaybackAction:
+        cls, kwargs, lists = record
+        if lists:
+            kwargs = dict(kwargs)
+            for name in lists:
+                kwargs[name] = _copy_list(kwargs[name])
+        return cls(**kwargs)
+
+    record = None
+    end = len(body)
+    while reader.pos < end:
+        n = reader.varint()
+        if not n & 1:
+            try:
+                record = records[n >> 1]
+            except IndexError:
+                raise StreamError(f"unknown record {n >> 1}") from None
+            yield build(record)
+        elif record is None:
+            raise StreamError("repeat before any action")
+        else:
+            for _ in range(n >> 1):
+                yield build(record)
+
+
+def _copy_list(items: list) -> list:
+    return [_copy_list(item) if type(item) is list else item for item in items]
+
+
+class ActionStream:
+    """A stored action stream: `meta`, plus lazy iteration over its actions.
+
+    Iterating decodes from the start each time, so the stream can be walked
+    more than once (e.g. segment_duration() and then playback).
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.meta = read_meta(data)
+
+    @classmethod
+    def open(cls, path: str | Path) -> ActionStream:
+        return cls(Path(path).read_bytes())
+
+    def __iter__(self) -> Iterator[PlaybackAction]:
+        return iter_actions(self.data)
@@ -0,0 +1,96 @@
+"""Kernel power_supply uevents over a netlink socket.
+
+The kernel broadcasts a uevent whenever a power supply changes: the charger
+is plugged or pulled, the battery starts or stops charging, and (on most
+firmware) when the battery's capacity moves. Listening for those lets
+PowerManager's refresher block until something actually happens instead of
+re-reading sysfs every 5 seconds.
+
+This is the raw kernel multicast group (NETLINK_KOBJECT_UEVENT, group 1):
+no udev daemon, no subprocess, no new dependency, and it works unprivileged.
+Anything that goes wrong (no AF_NETLINK, a sandbox, a closed socket) returns
+None and the caller falls back to polling.
+
+A kernel uevent datagram is NUL-separated text:
+    change@/devices/.../power_supply/AC\\0ACTION=change\\0SUBSYSTEM=power_supply\\0
+    POWER_SUPPLY_NAME=AC\\0POWER_SUPPLY_ONLINE=1\\0...
+"""
+
+from __future__ import annotations
+
+import errno
+import select
+import socket
+from typing import Optional
+
+NETLINK_KOBJECT_UEVENT = 15
+_KERNEL_GROUP = 1
+# Room for a burst (plug-in sends a handful of events per supply)
+_RCVBUF = 256 * 1024
+_MAX_DATAGRAM = 16 * 1024
+
+
+def open_uevent_socket() -> Optional[socket.socket]:
+    """A non-blocking socket subscribed to kernel uevents, or None."""
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC,
+                             NETLINK_KOBJECT_UEVENT)
+    except (AttributeError, OSError):
+        return None
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF)
+        sock.bind((0, _KERNEL_GROUP))
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def parse_uevent(data: bytes) -> Optional[dict[str, str]]:
+    """KEY=VALUE properties of a power_supply uevent, or None for anything else.
+
+    Exposed for tests.
+    """
+    fields = data.split(b"\0")
+    if not fields or b"@" not in fields[0]:
+        return None  # libudev-format or garbage
+    props = {}
+    for field in fields[1:]:
+        key, sep, value = field.partition(b"=")
+        if sep:
+            props[key.decode("ascii", "replace")] = value.decode("utf-8", "replace")
+    if props.get("SUBSYSTEM") != "power_supply":
+        return None
+    return props
+
+
+def wait_for_events(sock, timeout: Optional[float]) -> Optional[list[dict[str, str]]]:
+    """Block up to `timeout` seconds (None = forever) for power_supply events.
+
+    Returns every power_supply event queued when it wakes (empty on timeout
+    or when only other subsystems spoke), or None if the socket is unusable.
+    """
+    try:
+        ready, _, _ = select.select([sock], [], [], timeout)
+    except (OSError, ValueError):
+        return None
+    events = []
+    if not ready:
+        return events
+    while True:
+        try:
+            data = sock.recv(_MAX_DATAGRAM)
+        except BlockingIOError:
+            return events
+        except OSError as e:
+            # ENOBUFS: the kernel dropped events while we were slow. The
+            # socket still works; report a change so state gets re-read.
+            if e.errno == errno.ENOBUFS:
+                return events + [{"SUBSYSTEM": "power_supply", "ACTION": "overflow"}]
+            return None
+        if not data:
+            return None
+        props = parse_uevent(data)
+        if props is not None:
+            events.append(props)
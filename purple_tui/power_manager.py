@@ -100,6 +100,17 @@ LOGIND_CONF_PATH = "/etc/systemd/logind.conf.d/purple-power.conf"
 # Number of consecutive reads before changing charger state (smoothing)
 _CHARGER_SMOOTH_COUNT = 2
 
+POWER_SUPPLY_DIR = "/sys/class/power_supply"
+
+# Event-driven refresher (kernel uevents): after a power_supply event the
+# charger is re-read every _CHARGER_SETTLE seconds until the smoothing agrees
+# (at most _MAX_SETTLE_READS reads), then the thread blocks again.
+_CHARGER_SETTLE = 0.5
+_MAX_SETTLE_READS = 10
+# Safety re-read of the battery while event-driven: some firmware never sends
+# a uevent for a capacity change, only for charging/discharging.
+_BATTERY_SAFETY_POLL = 120.0
+
 
 def set_logind_power_key(mode: str) -> bool:
     """Switch logind HandlePowerKey between 'ignore' and 'poweroff'.
@@ -163,8 +174,11 @@ class PowerManager:
     - Charger unknown = treated as battery (conservative)
     """
 
-    # Cadence of the background ACPI refresher. Charger/lid every tick,
-    # battery every 6th (30s), matching the old main-thread cadences.
+    # Cadence of the polling fallback (no netlink uevents). Charger/lid every
+    # tick, battery every 6th (30s), matching the old main-thread cadences.
+    # Ticks land on whole multiples of the interval on the monotonic clock,
+    # the same grid the app's Ticker uses, so this thread and the UI's 5s
+    # polls share one CPU wakeup instead of two.
     _REFRESH_INTERVAL = 5.0
 
     def __init__(self):
@@ -181,6 +195,14 @@ class PowerManager:
         self._charger_pending: Optional[bool] = None
         self._charger_pending_count = 0
 
+        # Called (from the refresher thread) when charger or battery changes
+        self._listeners: list = []
+        # True once the refresher runs on kernel uevents instead of polling
+        self.event_driven = False
+        # The /proc/acpi lid file only matters when the app has no evdev
+        # lid switch; set_lid_polling(False) lets the refresher skip it.
+        self._lid_polling = True
+
         # Probe capabilities on init
         self._probe_capabilities()
 
@@ -190,23 +212,121 @@ class PowerManager:
         # thread refreshes these caches and the getters return them.
         self._lid_open_cached = self._read_lid_raw()
         self._battery_status: Optional[tuple[int, bool]] = self._read_battery_raw()
+        # Opened here, not on the thread, so event_driven is settled before
+        # anyone asks
+        from . import power_events
+        sock = power_events.open_uevent_socket()
+        self.event_driven = sock is not None
         import threading
-        threading.Thread(target=self._refresh_loop, daemon=True,
+        threading.Thread(target=self._refresh_loop, args=(sock,), daemon=True,
                          name="power-refresh").start()
 
-    def _refresh_loop(self) -> None:
+    def add_listener(self, callback) -> None:
+        """Call `callback()` whenever the cached charger or battery state
+        changes. Runs on the refresher thread: hop to the UI thread yourself."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def set_lid_polling(self, enabled: bool) -> None:
+        """Whether the refresher keeps reading the lid file (evdev fallback)."""
+        self._lid_polling = enabled
+
+    def _notify(self) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def _refresh_loop(self, sock) -> None:
+        if sock is not None:
+            _power_log("REFRESH: power_supply uevents (event-driven)")
+            self._event_loop(sock)
+            # Socket died: fall through to polling for the rest of the session
+            self.event_driven = False
+            _power_log("REFRESH: uevent socket failed, polling every 5s")
+        self._poll_loop()
+
+    def _poll_loop(self) -> None:
         tick = 0
         while True:
-            time.sleep(self._REFRESH_INTERVAL)
+            time.sleep(self._REFRESH_INTERVAL - time.monotonic() % self._REFRESH_INTERVAL)
             tick += 1
             try:
-                self._refresh_charger()
-                self._lid_open_cached = self._read_lid_raw()
-                if tick % 6 == 0:
-                    self._battery_status = self._read_battery_raw()
+                self._refresh_all(battery=tick % 6 == 0)
             except Exception:
                 pass
 
+    def _event_loop(self, sock) -> None:
+        """Block on power_supply uevents. Wakes only for an event, a charger
+        settle read, the battery safety re-read or (without an evdev lid
+        switch) the 5s lid poll."""
+        from . import power_events
+        settle_reads = 0
+        next_battery = time.monotonic() + _BATTERY_SAFETY_POLL
+        while True:
+            now = time.monotonic()
+            timeouts = []
+            if settle_reads:
+                timeouts.append(_CHARGER_SETTLE)
+            if self._lid_polling and self._lid_path:
+                timeouts.append(self._REFRESH_INTERVAL - now % self._REFRESH_INTERVAL)
+            if self._battery_path:
+                timeouts.append(max(0.0, next_battery - now))
+            events = power_events.wait_for_events(sock, min(timeouts) if timeouts else None)
+            if events is None:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+                return
+            try:
+                battery_due = time.monotonic() >= next_battery
+                if events:
+                    settle_reads = _MAX_SETTLE_READS
+                if events or battery_due:
+                    next_battery = time.monotonic() + _BATTERY_SAFETY_POLL
+                changed = False
+                if settle_reads:
+                    changed |= self._refresh_charger()
+                    settle_reads -= 1
+                    if self._charger_settled():
+                        settle_reads = 0
+                if events or battery_due:
+                    changed |= self._refresh_battery()
+                if self._lid_polling:
+                    self._lid_open_cached = self._read_lid_raw()
+                if changed:
+                    self._notify()
+            except Exception:
+                pass
+
+    def _refresh_all(self, battery: bool) -> None:
+        changed = self._refresh_charger()
+        self._lid_open_cached = self._read_lid_raw()
+        if battery:
+            changed |= self._refresh_battery()
+        if changed:
+            self._notify()
+
+    def _refresh_battery(self) -> bool:
+        """Re-read the battery; True if the cached status changed."""
+        status = self._read_battery_raw()
+        if status == self._battery_status:
+            return False
+        self._battery_status = status
+        return True
+
+    def _charger_settled(self) -> bool:
+        """The last reads agree with each other and with the cached state."""
+        return (self._charger_pending == self._charger_state
+                and self._charger_pending_count >= _CHARGER_SMOOTH_COUNT)
+
     def _probe_capabilities(self) -> None:
         """Check what power features are available on this system."""
         # Check for lid state file
@@ -246,7 +366,7 @@ class PowerManager:
         (AC, AC0, ADP0, ADP1, ACAD, etc.).
         """
         try:
-            power_supply_path = "/sys/class/power_supply"
+            power_supply_path = POWER_SUPPLY_DIR
             if not os.path.exists(power_supply_path):
                 return
 
@@ -281,7 +401,7 @@ class PowerManager:
     def _find_battery(self) -> None:
         """Find a battery in /sys/class/power_supply/ (naming varies)."""
         try:
-            power_supply_path = "/sys/class/power_supply"
+            power_supply_path = POWER_SUPPLY_DIR
             if not os.path.exists(power_supply_path):
                 return
             for entry in os.listdir(power_supply_path):
@@ -318,7 +438,8 @@ class PowerManager:
         return self._battery_path is not None
 
     def get_battery_status(self) -> Optional[tuple[int, bool]]:
-        """Cached battery (percentage, charging); refreshed every 30s."""
+        """Cached battery (percentage, charging). Refreshed on power_supply
+        uevents (or every 30s when polling); add_listener() to hear changes."""
         return self._battery_status
 
     def record_activity(self) -> None:
@@ -334,7 +455,7 @@ class PowerManager:
 
     def get_lid_state(self) -> Optional[bool]:
         """Cached lid state: True if open, False if closed, None unknown.
-        Refreshed by the background thread every 5s."""
+        Refreshed by the background thread every 5s while lid polling is on."""
         return self._lid_open_cached
 
     def _read_lid_raw(self) -> Optional[bool]:
@@ -356,13 +477,14 @@ class PowerManager:
         unknown. Refreshed (with smoothing) by the background thread."""
         return self._charger_state
 
-    def _refresh_charger(self) -> None:
+    def _refresh_charger(self) -> bool:
         """Read mains state and apply smoothing: requires multiple
         consecutive identical reads before changing state, to avoid
-        flicker from firmware noise during plug/unplug."""
+        flicker from firmware noise during plug/unplug. True if the
+        smoothed state changed."""
         raw = self._read_mains_online()
         if raw is None:
-            return  # Keep last known state
+            return False  # Keep last known state
 
         if raw == self._charger_pending:
             self._charger_pending_count += 1
@@ -377,6 +499,8 @@ class PowerManager:
         if self._charger_state != old_state:
             _power_log(f"CHARGER CHANGE: {old_state} -> {self._charger_state} "
                         f"(raw={raw}, pending_count={self._charger_pending_count})")
+            return True
+        return False
 
     def get_idle_sleep_threshold(self) -> int:
         """Get the idle seconds threshold for showing the sleep face.
@@ -418,6 +542,10 @@ class PowerManager:
         _power_log(f"SHUTDOWN requested: idle={self.get_idle_seconds():.1f}s, "
                    f"charger={self._charger_state}")
 
+        # --force skips atexit: write any pending settings first
+        from . import settings
+        settings.flush()
+
         # In demo mode, don't actually shut down!
         if os.environ.get("PURPLE_SLEEP_DEMO"):
             _power_log("SHUTDOWN: demo mode, not shutting down")
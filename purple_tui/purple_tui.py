@@ -44,6 +44,7 @@ from textual import events
 from rich.segment import Segment
 from rich.style import Style
 from enum import Enum
+from typing import TYPE_CHECKING
 boot_log.heartbeat("textual/rich imports done; importing purple_tui.constants")
 
 from .constants import (
@@ -71,24 +72,38 @@ from .keyboard import (
     InputFloodGuard,
 )
 from .input import EvdevReader, RawKeyEvent, PowerButtonReader, PowerButtonEvent, LidSwitchReader, LidSwitchEvent, check_evdev_available
-from . import caps as _caps_chokepoint  # noqa: F401  # side-effect: installs Strip render-time uppercase patch
+from . import caps
 boot_log.heartbeat("keyboard + input imported; importing power_manager")
 from .power_manager import get_power_manager
-boot_log.heartbeat("power_manager imported; importing .demo")
-from .demo import DemoPlayer, get_demo_script, get_speed_multiplier
-boot_log.heartbeat(".demo imported; importing rooms.art_room")
+from .ticker import Ticker
+from .clock import loop_time
+from .key_latency import latency_from_env
+boot_log.heartbeat("power_manager imported; importing rooms.art_room")
+# The demo player, parent menu, room picker and the other rooms are imported
+# where they are first used (and warmed in the background after the first
+# frame, see DEFERRED_IMPORTS). Keep them out of this block: every module
+# imported here is paid for before the first frame on old hardware.
 from .rooms.art_room import ColorLegend, PaintModeChanged
-boot_log.heartbeat("rooms.art_room imported; importing rooms.parent_menu")
-from .rooms.parent_menu import apply_saved_display_settings
-boot_log.heartbeat("rooms.parent_menu imported; importing room_picker")
-from .room_picker import RoomPickerScreen
-boot_log.heartbeat("room_picker imported; importing repl_panel")
+boot_log.heartbeat("rooms.art_room imported; importing repl_panel")
 from .repl_panel import ReplCommandSubmitted, ReplPanelClosed, ReplPanelToggleRequested, ReplPanel
 from .loop_panel import LoopPanelToggleRequested
 from .timeline import RoomTimeline
 from .time_travel import TimeTravelBar
 boot_log.heartbeat("all purple_tui imports done")
 
+if TYPE_CHECKING:
+    from .demo import DemoPlayer
+    from .room_picker import RoomPickerScreen
+
+# Modules kept off the startup path, imported by a background thread shortly
+# after the first frame so the first Escape hold, room switch or picker open
+# doesn't pay for them. The demo player is dev-only and is left out.
+DEFERRED_IMPORTS = (
+    "purple_tui.room_picker",
+    "purple_tui.rooms.parent_menu",
+    "purple_tui.rooms.music_room",
+)
+
 
 def _border_bar_color(active_theme: str) -> str:
     """Hex of the viewport border colour for the active theme. Used to tint
@@ -577,13 +592,27 @@ class BatteryIndicator(Static):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._update_timer = None
+        self._listening = False
 
     def on_mount(self) -> None:
-        """Start periodic updates if a battery exists (per PowerManager)"""
+        """Push battery state now and whenever PowerManager sees it change
+        (on a uevent, or its own 30s poll without them). No timer here."""
         if get_power_manager().battery_available or os.environ.get("PURPLE_TEST_BATTERY") == "1":
             self._update_battery()  # Push initial state
-            self._update_timer = self.set_interval(30, self._update_battery)
+            get_power_manager().add_listener(self._on_power_change)
+            self._listening = True
+
+    def on_unmount(self) -> None:
+        if self._listening:
+            get_power_manager().remove_listener(self._on_power_change)
+            self._listening = False
+
+    def _on_power_change(self) -> None:
+        """PowerManager listener: runs on its refresher thread."""
+        try:
+            self.app.call_from_thread(self._update_battery)
+        except Exception:
+            pass  # App shutting down
 
     def _read_battery_status(self) -> tuple[int, bool] | None:
         """Cached battery state from PowerManager's background refresher.
@@ -607,7 +636,7 @@ class BatteryIndicator(Static):
             return ICON_BATTERY_EMPTY
 
     def _update_battery(self) -> None:
-        """Periodic update callback: push battery text to TitleBar."""
+        """Push battery text to TitleBar."""
         status = self._read_battery_status()
         if status is None:
             text = ICON_BATTERY_FULL if os.environ.get("PURPLE_TEST_BATTERY") == "1" else ""
@@ -682,6 +711,8 @@ class BootModeIndicator(Static):
         self._is_cached = False
         self._usb_removed = False
         self._blink_state = True
+        self._cache_job = None
+        self._blink_job = None
 
     def on_mount(self) -> None:
         self._is_live = is_live_boot()
@@ -689,22 +720,42 @@ class BootModeIndicator(Static):
         if not self._is_live:
             return
 
+        ticker = self.app.ticker
         if is_usb_cached():
             self._is_cached = True
             self._usb_removed = not is_usb_present()
             self._push_to_title_bar()
-            self.set_interval(5.0, self._check_usb_removed)
+            ticker.every(5.0, self._check_usb_removed, name="usb-removed")
             return
 
-        self.set_interval(5.0, self._check_cache_done)
-        self.set_interval(1.0, self._toggle_blink)
+        self._cache_job = ticker.every(5.0, self._check_cache_done, name="usb-cache")
+        self._blink_job = ticker.every(1.0, self._toggle_blink, name="usb-blink")
+        # Nobody sees the blink under the sleep screen or a menu
+        self.app.screen_change_signal.subscribe(self, self._on_screen_change)
+
+    def _on_screen_change(self, screen) -> None:
+        if self._blink_job is None:
+            return
+        if screen is self.screen:
+            self._blink_job.resume()
+        else:
+            self._blink_job.pause()
+            if not self._blink_state:
+                self._blink_state = True
+                self._push_to_title_bar()
 
     def _check_cache_done(self) -> None:
-        if is_usb_cached():
+        if not self._is_cached and is_usb_cached():
             self._is_cached = True
             self._blink_state = True
             self._push_to_title_bar()
-            self.set_interval(5.0, self._check_usb_removed)
+            # Both one-shot polls are done for good: a finished cache never
+            # un-finishes, and the icon stops blinking.
+            for job in (self._cache_job, self._blink_job):
+                if job is not None:
+                    job.stop()
+            self._cache_job = self._blink_job = None
+            self.app.ticker.every(5.0, self._check_usb_removed, name="usb-removed")
 
     def _check_usb_removed(self) -> None:
         removed = not is_usb_present()
@@ -865,6 +916,7 @@ class PurpleApp(App):
         boot_log.heartbeat("PurpleApp.__init__ begin")
         super().__init__()
         boot_log.heartbeat("PurpleApp.__init__ after App.__init__")
+        caps.install(self)  # render-time all-caps line filter (off until settings load)
         self.active_room = Room.PLAY
         self.active_view = View.SCREEN
         self.active_theme = "purple-dark"
@@ -872,6 +924,9 @@ class PurpleApp(App):
         self.volume_level = VOLUME_DEFAULT  # 0-100
         self._volume_before_mute = VOLUME_DEFAULT  # Remember level when muting
         self._brightness_hint_showing = False  # Prevent layering brightness toasts
+        # Every periodic poll (battery, USB, idle, toasts, timeline, ...)
+        # shares this one coalesced timer, see ticker.py
+        self.ticker = Ticker(self.set_timer, clock=loop_time)
         self._toast_reaper_timer = None
         self._toast_empty_ticks = 0
         self._audio_idle_timer = None
@@ -899,6 +954,14 @@ class PurpleApp(App):
         self._keyboard_state_machine = KeyboardStateMachine()
         self._keyboard_state_machine.on_sticky_shift_change(self._on_sticky_shift_change)
         self._input_flood_guard = InputFloodGuard()
+        # Read once: _handle_raw_key_event runs for every key press and release
+        self._dev_mode = os.environ.get("PURPLE_DEV_MODE") == "1"
+        self._dev_log_file = None
+        self._dev_runner = None  # dev_channel.CommandRunner, dev mode only
+        self._dev_channel = None
+        self._dev_tasks: set = set()
+        # Per-stage keypress-to-paint timing (Support info > Key latency)
+        self.key_latency = latency_from_env()
         self._sticky_shift_timer = None
         self._evdev_reader: EvdevReader | None = None
         self._escape_hold_timer = None  # Timer for detecting escape long-hold
@@ -917,7 +980,7 @@ class PurpleApp(App):
         self._music_key_switching_enabled: bool = True
 
         # Demo playback (dev mode only)
-        self._demo_player: DemoPlayer | None = None
+        self._demo_player: "DemoPlayer | None" = None
         self._demo_task = None
 
         # Time Travel: per-room history that doubles as restart persistence
@@ -1016,11 +1079,13 @@ class PurpleApp(App):
     async def on_mount(self) -> None:
         """Called when app starts"""
         boot_log.heartbeat("PurpleApp.on_mount begin")
+        phases = boot_log.PhaseTimer("on_mount")
         self._apply_theme()
         # Pin wrapper top so code/loop mode growth doesn't shift the border 1 row on odd-height terminals.
         self.query_one("#viewport-wrapper").styles.margin = (max(0, (self.size.height - WRAPPER_REFERENCE_ROWS) // 2), 0, 0, 0)
         self.call_after_refresh(self._align_footer_to_viewport)
         self.call_after_refresh(self._mark_ui_ready)
+        phases.lap("theme + layout")
 
         # Ensure logind ignores power button (TUI handles it).
         # Defensive: a previous crash or logind-mediated shutdown during a
@@ -1030,11 +1095,15 @@ class PurpleApp(App):
 
         from .settings import (get_littles_mode, get_code_panel, get_music_looping,
                                get_music_key_switching, get_all_caps, get_volume_level,
-                               get_volume_lock)
-        from . import caps as caps_module
-        caps_module.set_enabled(get_all_caps())
+                               get_volume_lock, subscribe)
+        caps.set_enabled(get_all_caps())
         self.volume_level = get_volume_level()
         self._volume_lock = get_volume_lock()
+        # Settings changed from the parent menu reach the app through these
+        self._settings_unsubscribe = [
+            subscribe("all_caps", lambda _key, value: caps.set_enabled(value)),
+            subscribe("volume_lock", self._on_volume_lock_setting),
+        ]
         saved_littles = get_littles_mode()
         if saved_littles:
             self._littles_mode = saved_littles
@@ -1047,8 +1116,10 @@ class PurpleApp(App):
             self._code_panel_enabled = get_code_panel()
             self._music_looping_enabled = get_music_looping()
             self._music_key_switching_enabled = get_music_key_switching()
+        phases.lap("logind + settings")
 
         self._load_room_content()
+        phases.lap("room content")
 
         # Set system volume to match the effective volume (0 while a silent lock is on)
         self._apply_volume_system()
@@ -1084,6 +1155,7 @@ class PurpleApp(App):
                 self.query_one("#littles-hint", Static).display = True
             except NoMatches:
                 pass
+        phases.lap("volume + chrome")
 
         # Start direct evdev keyboard reader (unless disabled for AI tools)
         # This reads keyboard events directly, bypassing the terminal
@@ -1123,6 +1195,11 @@ class PurpleApp(App):
                 await self._lid_switch_reader.start()
             except Exception:
                 self._lid_switch_reader = None
+            if self._lid_switch_reader is not None and self._lid_switch_reader._device is not None:
+                # evdev reports the lid instantly; the refresher can stop
+                # waking every 5s to read /proc/acpi for it
+                get_power_manager().set_lid_polling(False)
+        phases.lap("input devices")
 
         # Start idle detection timer (disabled in dev mode for AI training)
         # In demo mode, check every second for responsiveness
@@ -1147,7 +1224,7 @@ class PurpleApp(App):
             else:
                 check_interval = 5.0
 
-            self._idle_timer = self.set_interval(check_interval, self._check_idle_state)
+            self._idle_timer = self.ticker.every(check_interval, self._check_idle_state, name="idle")
 
         # Toast cleanup runs only while toasts exist: _on_notify starts the
         # reaper interval and _reap_stale_toasts stops it once the stack is
@@ -1204,10 +1281,23 @@ class PurpleApp(App):
 
         # In dev mode, check for screenshot and command trigger files (for AI tools)
         if os.environ.get("PURPLE_DEV_MODE") == "1":
+            from .dev_channel import CommandRunner, DevChannel, socket_path_from_env
+            self._dev_runner = CommandRunner(self._run_dev_command)
+            socket_path = socket_path_from_env()
+            if socket_path:
+                # Opt-in control socket (PURPLE_DEV_SOCKET): one round trip per batch
+                try:
+                    self._dev_channel = DevChannel(self._dev_runner, socket_path)
+                    await self._dev_channel.start()
+                    self._dev_log(f"[Mount] Dev channel listening on {socket_path}")
+                except OSError as e:
+                    self._dev_channel = None
+                    self._dev_log(f"[Mount] Dev channel failed: {e}")
             self._dev_log("[Mount] Starting dev mode timers...")
             self._screenshot_timer = self.set_interval(0.2, self._check_screenshot_trigger)
             self._command_timer = self.set_interval(0.1, self._check_command_trigger)
             self._dev_log("[Mount] Dev mode timers started")
+        phases.lap("timers + hooks")
 
         boot_log.heartbeat("PurpleApp.on_mount complete")
         boot_log.mark_first_render()
@@ -1215,7 +1305,8 @@ class PurpleApp(App):
         # Apply saved display brightness/contrast after first render so the
         # xrandr probe (~0.2-1s) doesn't delay time-to-first-frame. The
         # settings apply on the next event loop tick, imperceptible to users.
-        self.call_later(apply_saved_display_settings)
+        self.call_later(self._apply_saved_display_settings)
+        self.set_timer(1.0, self._start_import_warmup)
 
         # Background warmup: subprocess-probe + init the pygame mixer so
         # MusicRoom entry is instant (and we know early if audio is broken).
@@ -1236,6 +1327,22 @@ class PurpleApp(App):
         if not is_live_boot() and os.path.exists(LIVE_AUDIO_MARKER):
             self.set_timer(30.0, self._check_first_boot_audio)
 
+    def _apply_saved_display_settings(self) -> None:
+        from .rooms.parent_menu import apply_saved_display_settings
+        apply_saved_display_settings()
+
+    def _start_import_warmup(self) -> None:
+        import importlib
+        import threading
+        def _warm():
+            for name in DEFERRED_IMPORTS:
+                try:
+                    importlib.import_module(name)
+                except Exception as e:
+                    boot_log.heartbeat(f"import warmup {name} failed: {e!r}")
+            boot_log.heartbeat("import warmup done")
+        threading.Thread(target=_warm, daemon=True, name="import-warmup").start()
+
     def _start_mixer_warmup(self) -> None:
         import threading
         import time as _time
@@ -1310,7 +1417,7 @@ class PurpleApp(App):
 
     def _arm_audio_idle_timer(self) -> None:
         if self._audio_idle_timer is None and self.audio_ok is not False:
-            self._audio_idle_timer = self.set_interval(30.0, self._check_audio_idle)
+            self._audio_idle_timer = self.ticker.every(30.0, self._check_audio_idle, name="audio-idle")
 
     def _check_audio_idle(self) -> None:
         """Release the mixer when audio has been quiet and the user idle.
@@ -1382,6 +1489,24 @@ class PurpleApp(App):
         """Called when app is shutting down"""
         self._timeline_flush()
 
+        if self._dev_channel is not None:
+            await self._dev_channel.stop()
+            self._dev_channel = None
+        if self._dev_log_file is not None:
+            self._dev_log_file.close()
+            self._dev_log_file = None
+
+        from . import settings
+        for unsubscribe in getattr(self, "_settings_unsubscribe", ()):
+            unsubscribe()
+        settings.flush()
+
+        if self.key_latency.path and self.key_latency.count:
+            try:
+                self.key_latency.dump_jsonl(self.key_latency.path)
+            except OSError:
+                pass
+
         # Clean up evdev reader
         if self._evdev_reader:
             await self._evdev_reader.stop()
@@ -1475,8 +1600,11 @@ class PurpleApp(App):
         This is called by EvdevReader for each key press/release.
         Events are processed through KeyboardStateMachine to produce actions.
         """
+        latency = self.key_latency
+        trace = latency.start(event)
+
         # Log evdev events in dev mode to debug mode switching
-        if os.environ.get("PURPLE_DEV_MODE") == "1":
+        if self._dev_mode:
             self._dev_log(f"[Evdev] keycode={event.keycode} is_down={event.is_down}")
 
         # Mark that we've received evdev input (used by debug exit timer)
@@ -1494,14 +1622,17 @@ class PurpleApp(App):
         self._last_evdev_time = now
 
         # Process through state machine
-        actions = self._keyboard_state_machine.process(event)
+        should_drop = self._input_flood_guard.should_drop
+        actions = [a for a in self._keyboard_state_machine.process(event) if not should_drop(a)]
+        latency.mark(trace, "decode")
 
         for action in actions:
-            if self._input_flood_guard.should_drop(action):
-                continue
-            if os.environ.get("PURPLE_DEV_MODE") == "1":
+            if self._dev_mode:
                 self._dev_log(f"[Evdev] action={action} (current_room={self.active_room.name})")
             await self._dispatch_keyboard_action(action)
+        if actions and trace is not None:
+            latency.mark(trace, "dispatch")
+            self.call_after_refresh(latency.finish, trace)
 
         # Backslash hold: start a 3s timer when backslash is first pressed
         if self._keyboard_state_machine.backslash_held:
@@ -1653,6 +1784,7 @@ class PurpleApp(App):
         if self._keyboard_state_machine.check_escape_hold():
             self._escape_triggered_long_hold = True  # Prevent picker open/close on release
             self._cancel_escape_hold_timer()
+            from .room_picker import RoomPickerScreen
             if len(self.screen_stack) > 1 and isinstance(self.screen, RoomPickerScreen):
                 self.screen.dismiss(None)
             self.action_parent_menu()
@@ -1665,6 +1797,7 @@ class PurpleApp(App):
 
     def _show_room_picker(self) -> None:
         """Show the mode picker modal."""
+        from .room_picker import RoomPickerScreen
         self.clear_notifications()
         current_room = self.active_room.name.lower()
         picker = RoomPickerScreen(
@@ -1674,7 +1807,7 @@ class PurpleApp(App):
         )
         self.push_screen(picker, self._on_room_picked)
 
-    def on_room_picker_screen_room_selected(self, event: RoomPickerScreen.RoomSelected) -> None:
+    def on_room_picker_screen_room_selected(self, event: "RoomPickerScreen.RoomSelected") -> None:
         """Handle room selection from picker: switch room, then dismiss picker.
 
         By switching the room content before dismissing, we avoid a flicker
@@ -2052,7 +2185,7 @@ class PurpleApp(App):
         # grace, or the timer could stop before the toast appears.
         self._toast_empty_ticks = 0
         if self._toast_reaper_timer is None:
-            self._toast_reaper_timer = self.set_interval(1.0, self._reap_stale_toasts)
+            self._toast_reaper_timer = self.ticker.every(1.0, self._reap_stale_toasts, name="toast-reaper")
 
     def _reap_stale_toasts(self) -> None:
         """Wall-clock watchdog: kill any Toast that's been on screen longer
@@ -2562,14 +2695,14 @@ class PurpleApp(App):
         if self._time_travel is not None:
             return
         room = self._room_key()
-        now = time.monotonic()
+        now = loop_time()
         first, _ = self._timeline_pending.get(room, (now, now))
         self._timeline_pending[room] = (first, now)
         if self._timeline_timer is None:
-            self._timeline_timer = self.set_interval(1.0, self._timeline_tick)
+            self._timeline_timer = self.ticker.every(1.0, self._timeline_tick, name="timeline")
 
     def _timeline_tick(self) -> None:
-        now = time.monotonic()
+        now = loop_time()
         for room, (first, last) in list(self._timeline_pending.items()):
             if (now - last >= self.TIMELINE_DEBOUNCE_S
                     or now - first >= self.TIMELINE_MAX_WAIT_S):
@@ -2782,8 +2915,8 @@ class PurpleApp(App):
 
     _screenshot_counter = -1  # Monotonic counter, first screenshot is 0
 
-    def _do_screenshot(self) -> None:
-        """Actually take the screenshot."""
+    def _do_screenshot(self) -> str:
+        """Actually take the screenshot. Returns the SVG's path."""
         screenshot_dir = os.environ.get("PURPLE_SCREENSHOT_DIR", "screenshots")
 
         os.makedirs(screenshot_dir, exist_ok=True)
@@ -2799,6 +2932,7 @@ class PurpleApp(App):
         latest_path = os.path.join(screenshot_dir, "latest.txt")
         with open(latest_path, "w") as f:
             f.write(filename)
+        return filename
 
     def _check_screenshot_trigger(self) -> None:
         """Check for file-based screenshot trigger (for AI tools).
@@ -2838,6 +2972,10 @@ class PurpleApp(App):
         Supported actions:
             - mode: Switch to a mode (play, music, art)
             - key: Send a keypress (letters, arrows, enter, escape, space, backspace)
+            - art_code: Run Art code {"lines": [...], "instant": true}
+
+        The file's commands run as one batch, in order, queued behind any
+        batch still running (see dev_channel.CommandRunner).
         """
         import asyncio
 
@@ -2858,16 +2996,19 @@ class PurpleApp(App):
             os.unlink(command_path)
 
             import json
-            cmd_count = 0
+            commands = []
             for line in content.strip().split("\n"):
                 if not line.strip():
                     continue
                 try:
-                    cmd = json.loads(line)
-                    asyncio.create_task(self._execute_dev_command(cmd))
-                    cmd_count += 1
+                    commands.append(json.loads(line))
                 except json.JSONDecodeError:
                     pass
+            cmd_count = len(commands)
+            if commands:
+                task = asyncio.create_task(self._dev_runner.run_batch(commands))
+                self._dev_tasks.add(task)
+                task.add_done_callback(self._dev_tasks.discard)
 
             # Write response with count of commands processed
             response_path = os.path.join(screenshot_dir, "command_response")
@@ -2877,12 +3018,46 @@ class PurpleApp(App):
             pass
 
     def _dev_log(self, msg: str) -> None:
-        """Write to dev mode log file."""
-        screenshot_dir = os.environ.get("PURPLE_SCREENSHOT_DIR")
-        if screenshot_dir:
-            log_path = os.path.join(screenshot_dir, "dev_commands.log")
-            with open(log_path, "a") as f:
-                f.write(f"{msg}\n")
+        """Write to dev mode log file (opened once, line-buffered)."""
+        if self._dev_log_file is None:
+            screenshot_dir = os.environ.get("PURPLE_SCREENSHOT_DIR")
+            if not screenshot_dir:
+                return
+            self._dev_log_file = open(os.path.join(screenshot_dir, "dev_commands.log"), "a", buffering=1)
+        self._dev_log_file.write(f"{msg}\n")
+
+    async def _run_dev_command(self, cmd: dict):
+        """One command for dev_channel.CommandRunner: screenshot returns its path."""
+        if cmd.get("action") == "screenshot":
+            return self._do_screenshot()
+        if cmd.get("action") == "export_canvas":
+            return self._export_canvas(cmd)
+        await self._execute_dev_command(cmd)
+        return None
+
+    def _export_canvas(self, cmd: dict) -> str:
+        """Render the Art canvas grid to a PNG, skipping the SVG screenshot.
+
+        `cell` is [w, h] pixels per cell. Returns the PNG's path in the
+        screenshot dir, or the PNG itself as base64 with "inline": true.
+        """
+        import base64
+        from .canvas_raster import encode_png
+        from .rooms.art_room import ArtCanvas
+
+        canvas = self.query_one(ArtCanvas)
+        cell = cmd.get("cell")
+        png = encode_png(canvas.export_raster(tuple(cell) if cell else None))
+        if cmd.get("inline"):
+            return base64.standard_b64encode(png).decode("ascii")
+
+        screenshot_dir = os.environ.get("PURPLE_SCREENSHOT_DIR", "screenshots")
+        os.makedirs(screenshot_dir, exist_ok=True)
+        PurpleApp._screenshot_counter += 1
+        filename = os.path.join(screenshot_dir, f"canvas_{PurpleApp._screenshot_counter:04d}.png")
+        with open(filename, "wb") as f:
+            f.write(png)
+        return filename
 
     async def _execute_dev_command(self, cmd: dict) -> None:
         """Execute a dev command from the command file."""
@@ -2974,6 +3149,22 @@ class PurpleApp(App):
             except Exception as e:
                 self._dev_log(f"[DevCmd] ERROR: paint_at failed: {e}")
 
+        elif action == "art_code":
+            # Run Art code lines. "instant": true fast-forwards the program
+            # (no animation pauses, one repaint at the end) for replays/tools.
+            from .rooms.art_room import ArtMode, ArtCanvas
+            from .code_runner import ArtCodeRunner
+            try:
+                lines = cmd.get("lines") or [value]
+                art = self.query_one(ArtMode)
+                canvas = art.query_one(ArtCanvas)
+                runner = ArtCodeRunner(canvas)
+                await runner.run(lines, paint=canvas._paint_mode, instant=bool(cmd.get("instant")))
+                canvas._post_paint_mode_changed()
+                self._dev_log(f"[DevCmd] art_code lines={len(lines)} instant={bool(cmd.get('instant'))}")
+            except Exception as e:
+                self._dev_log(f"[DevCmd] ERROR: art_code failed: {e}")
+
     def _create_action_from_key(self, key: str):
         """Create a keyboard action from a key name."""
         key_lower = key.lower()
@@ -3045,6 +3236,9 @@ class PurpleApp(App):
         except Exception:
             pass
 
+    def _on_volume_lock_setting(self, _key: str, level: int | None) -> None:
+        self._volume_lock = level
+
     def _apply_volume(self) -> None:
         """Apply volume level to TTS, system mixer, and update UI."""
         from . import tts
@@ -3362,6 +3556,7 @@ class PurpleApp(App):
         showcasing all modes and features. Called from ParentMenu.
         """
         import asyncio
+        from .demo import DemoPlayer, get_demo_script, get_speed_multiplier
 
         # Cancel any running demo
         self.cancel_demo()
@@ -6,10 +6,24 @@ NOT user-installable.
 
 Content (emojis, definitions, sounds) comes from purplepacks, which are
 content-only and safe for parents to install.
+
+Room modules are imported on first attribute access, not with the package:
+importing one room (or parent_menu) must not pay for the other two at startup.
 """
 
-from .play_room import PlayMode
-from .music_room import MusicMode
-from .art_room import ArtMode
+import importlib
+
+_ROOM_MODULES = {
+    "PlayMode": ".play_room",
+    "MusicMode": ".music_room",
+    "ArtMode": ".art_room",
+}
 
 __all__ = ["PlayMode", "MusicMode", "ArtMode"]
+
+
+def __getattr__(name: str):
+    module = _ROOM_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
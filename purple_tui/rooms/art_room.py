@@ -12,6 +12,8 @@ which reads directly from evdev. This gives us true key release detection.
 """
 
 import colorsys
+from contextlib import contextmanager
+from typing import Iterable
 
 from textual.widgets import Static
 from textual.containers import Container
@@ -21,9 +23,9 @@ from textual.strip import Strip
 from textual.message import Message
 from textual import events
 from rich.segment import Segment
-from rich.style import Style
 
 from ..color_mixing import mix_colors_paint, hex_to_rgb
+from ..cell_styles import cell_style, contrast_text_color, wcag_text_color
 from ..constants import ICON_TAB, HOLD_OR_TAP_THRESHOLD, VIEWPORT_WIDTH, APP_BACKGROUND
 from ..keyboard import (
     CharacterAction, NavigationAction, ControlAction, HoldOrTap,
@@ -195,19 +197,9 @@ KEY_COLORS.update(generate_row_gradient(220, ZXCV_ROW))     # Blue family (botto
 KEY_COLORS["÷"] = KEY_COLORS["/"]
 KEY_COLORS["×"] = KEY_COLORS.get("*", KEY_COLORS["/"])
 
-def _rel_luminance(hex_color: str) -> float:
-    h = hex_color.lstrip("#")
-    def ch(v: int) -> float:
-        s = v / 255
-        return s / 12.92 if s <= 0.03928 else ((s + 0.055) / 1.055) ** 2.4
-    r, g, b = ch(int(h[0:2], 16)), ch(int(h[2:4], 16)), ch(int(h[4:6], 16))
-    return 0.2126 * r + 0.7152 * g + 0.0722 * b
-
-
 def text_color_for(bg_hex: str) -> str:
     """Pick whichever of black/white has the higher WCAG contrast ratio."""
-    l = _rel_luminance(bg_hex)
-    return "#FFFFFF" if 1.05 / (l + 0.05) >= (l + 0.05) / 0.05 else "#000000"
+    return wcag_text_color(bg_hex)
 
 
 def get_key_color(char: str) -> str:
@@ -370,9 +362,7 @@ class ArtCanvas(Widget, can_focus=True):
 
     def _contrast_text_color(self, bg_color: str) -> str:
         """Get black or white text for readability on the given background."""
-        r, g, b = hex_to_rgb(bg_color)
-        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        return "#000000" if luminance > 0.5 else "#FFFFFF"
+        return contrast_text_color(bg_color)
 
     def _get_gutter_bg(self, x: int, y: int) -> str:
         """Get gutter background color (checkerboard pattern based on position)."""
@@ -396,6 +386,35 @@ class ArtCanvas(Widget, can_focus=True):
         self._all_dirty = True
         self._line_cache.clear()
 
+    # Batch mode (see batch_updates): refreshes are deferred to one repaint
+    # when the outermost batch ends. Class-level so refresh() is safe to call
+    # before __init__ finishes.
+    _batch_depth = 0
+    _batch_refresh_pending = False
+
+    @contextmanager
+    def batch_updates(self):
+        """Apply many canvas mutations with a single repaint at the end.
+
+        Inside the block, plain refresh() calls only note that a repaint is
+        owed; dirty lines still accumulate as usual. Layout/recompose refreshes
+        pass straight through. Nests: the outermost block repaints.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_refresh_pending:
+                self._batch_refresh_pending = False
+                self.refresh()
+
+    def refresh(self, *regions, repaint: bool = True, layout: bool = False, recompose: bool = False):
+        if self._batch_depth and not (layout or recompose):
+            self._batch_refresh_pending = True
+            return self
+        return super().refresh(*regions, repaint=repaint, layout=layout, recompose=recompose)
+
     def _toggle_paint_mode(self) -> None:
         """Toggle between paint mode and text mode."""
         self._set_paint_mode(not self._paint_mode)
@@ -555,6 +574,8 @@ class ArtCanvas(Widget, can_focus=True):
         cursor_visible = self._cursor_visible or pen_down
         ring_chars = BOX_CHARS_PEN_DOWN if pen_down else BOX_CHARS
         last_key_color = self._last_key_color
+        style = cell_style
+        contrast = contrast_text_color
 
         for x in range(width):
             in_gutter = in_gutter_y or x < gutter_x_min or x >= gutter_x_max
@@ -593,22 +614,22 @@ class ArtCanvas(Widget, can_focus=True):
                     if cell:
                         char, fg_color, bg_color = cell
                         if char != BRUSH_CHAR:
-                            fg_color = self._contrast_text_color(bg_color) if (content_x, content_y) in painted else text_fg
-                        char_out, style_out = char, Style(color=fg_color, bgcolor=bg_color)
+                            fg_color = contrast(bg_color) if (content_x, content_y) in painted else text_fg
+                        char_out, style_out = char, style(fg_color, bg_color)
                     else:
-                        char_out, style_out = " ", Style(bgcolor=default_bg)
+                        char_out, style_out = " ", style(None, default_bg)
                 else:
                     if cursor_visible:
                         char_out = "▌"
-                        style_out = Style(color=TEXT_FG_DARK, bgcolor=CURSOR_BG_NORMAL, bold=True)
+                        style_out = style(TEXT_FG_DARK, CURSOR_BG_NORMAL, True)
                     else:
                         if cell:
                             char, fg_color, bg_color = cell
                             if char != BRUSH_CHAR:
-                                fg_color = self._contrast_text_color(bg_color) if (content_x, content_y) in painted else text_fg
-                            char_out, style_out = char, Style(color=fg_color, bgcolor=bg_color)
+                                fg_color = contrast(bg_color) if (content_x, content_y) in painted else text_fg
+                            char_out, style_out = char, style(fg_color, bg_color)
                         else:
-                            char_out, style_out = " ", Style(bgcolor=default_bg)
+                            char_out, style_out = " ", style(None, default_bg)
                 segments.append(Segment(char_out, style_out))
                 continue
 
@@ -625,7 +646,7 @@ class ArtCanvas(Widget, can_focus=True):
                     if heading_arrow:
                         bg = cell[2] if cell else (self._get_gutter_bg(x, y) if in_gutter else default_bg)
                         arrow_fg = _visible_arrow_color(last_key_color, bg)
-                        char_out, style_out = heading_arrow, Style(color=arrow_fg, bgcolor=bg, bold=True)
+                        char_out, style_out = heading_arrow, style(arrow_fg, bg, True)
                     else:
                         box_char = ring_chars.get((dx, dy), "·")
                         is_corner = (dx, dy) in CORNER_POSITIONS
@@ -634,26 +655,26 @@ class ArtCanvas(Widget, can_focus=True):
                         if cell:
                             char, fg_color, bg_color = cell
                             if char not in (" ", BRUSH_CHAR, ""):
-                                tfg = self._contrast_text_color(bg_color)
-                                char_out, style_out = char, Style(color=tfg, bgcolor=bg_color)
+                                tfg = contrast(bg_color)
+                                char_out, style_out = char, style(tfg, bg_color)
                             else:
-                                char_out, style_out = box_char, Style(color=ring_fg, bgcolor=bg_color)
+                                char_out, style_out = box_char, style(ring_fg, bg_color)
                         else:
                             bg = self._get_gutter_bg(x, y) if in_gutter else default_bg
-                            char_out, style_out = box_char, Style(color=ring_fg, bgcolor=bg)
+                            char_out, style_out = box_char, style(ring_fg, bg)
                 else:
                     if cell:
                         char, fg_color, bg_color = cell
                         if char != BRUSH_CHAR:
                             if (content_x, content_y) in painted:
-                                fg_color = self._contrast_text_color(bg_color)
+                                fg_color = contrast(bg_color)
                             else:
                                 fg_color = text_fg
                                 bg_color = default_bg
-                        char_out, style_out = char, Style(color=fg_color, bgcolor=bg_color)
+                        char_out, style_out = char, style(fg_color, bg_color)
                     else:
                         bg = self._get_gutter_bg(x, y) if in_gutter else default_bg
-                        char_out, style_out = " ", Style(bgcolor=bg)
+                        char_out, style_out = " ", style(None, bg)
                 segments.append(Segment(char_out, style_out))
                 continue
 
@@ -664,15 +685,15 @@ class ArtCanvas(Widget, can_focus=True):
                     bg = cell[2] if cell else default_bg
                     arrow_fg = _visible_arrow_color("#FFFFFF", bg)
                     char_out = arrow_char
-                    style_out = Style(color=arrow_fg, bgcolor=bg, bold=True)
+                    style_out = style(arrow_fg, bg, True)
                 else:
                     if cell:
                         char, fg_color, bg_color = cell
                         if char != BRUSH_CHAR:
-                            fg_color = self._contrast_text_color(bg_color) if (content_x, content_y) in painted else text_fg
-                        char_out, style_out = char, Style(color=fg_color, bgcolor=bg_color)
+                            fg_color = contrast(bg_color) if (content_x, content_y) in painted else text_fg
+                        char_out, style_out = char, style(fg_color, bg_color)
                     else:
-                        char_out, style_out = " ", Style(bgcolor=default_bg)
+                        char_out, style_out = " ", style(None, default_bg)
                 segments.append(Segment(char_out, style_out))
                 continue
 
@@ -682,18 +703,18 @@ class ArtCanvas(Widget, can_focus=True):
                 if char == BRUSH_CHAR:
                     pass  # keep stored colors
                 elif (content_x, content_y) in painted:
-                    fg_color = self._contrast_text_color(bg_color)
+                    fg_color = contrast(bg_color)
                 else:
                     fg_color = text_fg
-                segments.append(Segment(char, Style(color=fg_color, bgcolor=bg_color)))
+                segments.append(Segment(char, style(fg_color, bg_color)))
             else:
                 # Empty cell: batch with adjacent empty cells of same style
                 if in_gutter:
                     bg = self._get_gutter_bg(x, y)
                 else:
                     bg = default_bg
-                s = Style(bgcolor=bg)
-                if run_len > 0 and run_style == s:
+                s = style(None, bg)
+                if run_len > 0 and run_style is s:
                     run_len += 1
                 else:
                     flush_run()
@@ -769,7 +790,11 @@ class ArtCanvas(Widget, can_focus=True):
         self._post_stamp_x = stamp_x
 
     def execute_logo_command(self, action: str, direction: str, distance: int) -> None:
-        """Execute a Logo-style command: move or paint N steps in a direction."""
+        """Execute a Logo-style command: move or paint N steps in a direction.
+
+        Only the rows the stroke touched re-render: each painted cell marks
+        its own row, plus the cursor ring rows at both ends of the move.
+        """
         self._mark_cursor_dirty()
         for _ in range(distance):
             if action == "paint":
@@ -778,7 +803,6 @@ class ArtCanvas(Widget, can_focus=True):
             if not moved:
                 break
         self._mark_cursor_dirty()
-        self._invalidate_all()
         self._restart_blink()
         self.refresh()
 
@@ -832,6 +856,7 @@ class ArtCanvas(Widget, can_focus=True):
 
         self._painted_positions.add(pos)
         self._last_paint_pos = pos
+        self._dirty_lines.add(self._cursor_y + GUTTER)
 
         # If cell has a text character, keep it and just paint the background
         if cell and cell[0] not in ("", " ", BRUSH_CHAR):
@@ -928,6 +953,20 @@ class ArtCanvas(Widget, can_focus=True):
         """Check if the canvas has any content."""
         return len(self._grid) > 0
 
+    def export_raster(self, cell: tuple[int, int] | None = None):
+        """The drawable area as an RGB array (for dev/AI tools), colored as
+        render_line draws it, without the gutter or cursor."""
+        from ..canvas_raster import DEFAULT_CELL, rasterize  # deferred: pulls in NumPy
+        text_fg = self._get_text_fg()
+        ink = {
+            pos: contrast_text_color(bg) if pos in self._painted_positions else text_fg
+            for pos, (char, _fg, bg) in self._grid.items()
+            if char != BRUSH_CHAR
+        }
+        return rasterize(self._grid, self.canvas_width, self.canvas_height,
+                         background=self._get_default_bg(), ink=ink, cell=cell or DEFAULT_CELL,
+                         brush_char=BRUSH_CHAR)
+
     def set_cursor_position(self, x: int, y: int) -> None:
         """Set cursor position directly (for dev/AI tools)."""
         self._mark_cursor_dirty()  # Old position
@@ -954,20 +993,97 @@ class ArtCanvas(Widget, can_focus=True):
         self._cursor_y = y
 
         # Determine color from key (same logic as keyboard input)
+        char, color = self._resolve_color_key(color_key)
+        if char is not None:
+            self._last_key_char = char
+        if color is not None:
+            self._last_key_color = color
+
+        # Paint
+        self._paint_at_cursor()
+
+    @staticmethod
+    def _resolve_color_key(color_key: str) -> tuple[str | None, str | None]:
+        """(key char to remember, brush color) for a paint_at color key.
+
+        Either is None when the key leaves it unchanged: hex colors keep the
+        last key char, and unmapped keys paint with the current color.
+        """
         key_lower = color_key.lower()
         if key_lower.startswith("#"):
-            self._last_key_color = key_lower
-        elif key_lower in GRAYSCALE:
-            self._last_key_char = key_lower
-            self._last_key_color = GRAYSCALE[key_lower]
-        elif key_lower.isalpha() or key_lower in KEY_COLORS:
+            return None, key_lower
+        if key_lower in GRAYSCALE:
+            return key_lower, GRAYSCALE[key_lower]
+        if key_lower.isalpha() or key_lower in KEY_COLORS:
             color = get_key_color(key_lower)
             if color != "#AAAAAA":  # Only if it's a mapped color
-                self._last_key_char = key_lower
-                self._last_key_color = color
+                return key_lower, color
+        return None, None
 
-        # Paint
-        self._paint_at_cursor()
+    def apply_ops(self, ops: Iterable[tuple[int, int, str]]) -> int:
+        """Paint many (x, y, color_key) ops in one pass (replays, saved pictures).
+
+        The canvas ends up as if paint_at ran for each op in order (same
+        clamping, mixing over earlier paint, and final cursor and brush
+        color), but each distinct key is resolved once, cells are written
+        straight into the grid, and only the touched rows are redrawn, in a
+        single refresh. Returns the number of ops applied.
+        """
+        max_x = self.canvas_width - 1
+        max_y = self.canvas_height - 1
+        grid = self._grid
+        painted = self._painted_positions
+        default_bg = self._get_default_bg()
+        keys: dict[str, tuple[str | None, str | None]] = {}
+        mixes: dict[tuple[str, str], str] = {}
+        contrast: dict[str, str] = {}
+        rows: set[int] = set()
+        last_char = self._last_key_char
+        color = self._last_key_color
+        pos = None
+        count = 0
+
+        self._mark_cursor_dirty()  # Old position
+        for x, y, color_key in ops:
+            resolved = keys.get(color_key)
+            if resolved is None:
+                resolved = keys[color_key] = self._resolve_color_key(color_key)
+            if resolved[0] is not None:
+                last_char = resolved[0]
+            if resolved[1] is not None:
+                color = resolved[1]
+
+            pos = (max(0, min(x, max_x)), max(0, min(y, max_y)))
+            cell = grid.get(pos)
+            new_color = color
+            if pos in painted:
+                under = cell[2] if cell else default_bg
+                new_color = mixes.get((under, color))
+                if new_color is None:
+                    new_color = mixes[(under, color)] = mix_colors_paint([under, color])
+            else:
+                painted.add(pos)
+
+            if cell and cell[0] not in ("", " ", BRUSH_CHAR):
+                text_fg = contrast.get(new_color)
+                if text_fg is None:
+                    text_fg = contrast[new_color] = self._contrast_text_color(new_color)
+                grid[pos] = (cell[0], text_fg, new_color)
+            else:
+                grid[pos] = (BRUSH_CHAR, new_color, new_color)
+            rows.add(pos[1])
+            count += 1
+
+        if pos is None:
+            return 0
+        self._cursor_x, self._cursor_y = pos
+        self._last_paint_pos = pos
+        self._last_key_char = last_char
+        self._last_key_color = color
+        self._dirty_lines.update(y + GUTTER for y in rows)
+        self._mark_cursor_dirty()  # New position
+        self.refresh()
+        return count
 
     def _on_edge_hit(self) -> None:
         """Provide feedback when cursor hits an edge."""
@@ -1246,7 +1362,7 @@ class ColorLegend(Widget):
 
         if not self._visible or y >= len(ROW_LEGEND_COLORS):
             # Hidden or beyond legend rows: render as app background
-            return Strip([Segment(" " * width, Style(bgcolor=app_bg))])
+            return Strip([Segment(" " * width, cell_style(None, app_bg))])
 
         # Reserve 1 char for arrow on the right
         color_width = width - 1
@@ -1264,15 +1380,15 @@ class ColorLegend(Widget):
                 seg_width += 1
             if i == 0 and remainder > 2:
                 seg_width += 1
-            segments.append(Segment(" " * seg_width, Style(bgcolor=color)))
+            segments.append(Segment(" " * seg_width, cell_style(None, color)))
 
         # Add arrow for active row, space for others
         if y == self._active_row:
             # Use contrasting color for arrow visibility
             arrow_fg = TEXT_FG_DARK if "dark" in str(self.app.theme) else TEXT_FG_LIGHT
-            segments.append(Segment(self.ARROW, Style(color=arrow_fg, bgcolor=app_bg)))
+            segments.append(Segment(self.ARROW, cell_style(arrow_fg, app_bg)))
         else:
-            segments.append(Segment(" ", Style(bgcolor=app_bg)))
+            segments.append(Segment(" ", cell_style(None, app_bg)))
 
         return Strip(segments)
 
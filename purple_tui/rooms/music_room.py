@@ -15,14 +15,13 @@ from textual.containers import Container
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.strip import Strip
+from textual.geometry import Region
 from rich.segment import Segment
-from rich.style import Style
 from pathlib import Path
 import asyncio
 import os
 import subprocess
 import sys
-import time
 from ..keyboard import CharacterAction, ControlAction, NavigationAction, HoldOrTap
 from ..music_constants import (
     GRID_KEYS, ALL_KEYS, COLORS, COLOR_KEYCAP,
@@ -31,8 +30,10 @@ from ..music_constants import (
     pitch_for, pitch_filename,
 )
 from .art_room import KEY_COLORS, text_color_for
+from ..cell_styles import cell_style
 from ..music_session import MODE_MUSIC, MODE_LETTERS
 from ..loop_station import LoopStation, IDLE, RECORDING, LOOPING
+from ..clock import loop_time
 from ..loop_panel import LoopPanel, LoopPanelToggleRequested
 from ..constants import ICON_MUSIC, ICON_MUSIC_NOTE, ICON_TAB, HOLD_OR_TAP_THRESHOLD
 
@@ -460,6 +461,9 @@ _KEY_TO_RC: dict[str, tuple[int, int]] = {
     if not GRID_KEYS[r][c].isdigit()
 }
 
+# Grid row (0 = percussion digits) for every key, for row-level repaints
+_KEY_GRID_ROW: dict[str, int] = {key: r for r, row in enumerate(GRID_KEYS) for key in row}
+
 class MusicRoomHeader(Static):
     """Shows current mode with both options visible, current highlighted.
 
@@ -556,7 +560,18 @@ class MusicRoomHeader(Static):
 
 
 class MusicGrid(Widget):
-    """Single widget that renders the entire 10x4 grid manually."""
+    """Single widget that renders the entire 10x4 grid manually.
+
+    Rendering is cached at two levels. Finished lines live in _line_cache
+    until their grid row is marked dirty; a key flash or color cycle marks
+    only that key's row and refreshes only its screen region. Cell segments
+    live in _cell_cache keyed by (key, background, label, cell width, line
+    kind), so re-rendering a dirty row is mostly dict lookups.
+
+    A bare refresh() (theme switch, labels toggle, restored state) still
+    invalidates everything, so code that mutates grid state directly and
+    then calls refresh() stays correct.
+    """
 
     DEFAULT_CSS = """
     MusicGrid {
@@ -599,6 +614,34 @@ class MusicGrid(Widget):
         self._layout_ready = False
         self._pending_ready_timer: asyncio.TimerHandle | None = None
         self._cached_layout: tuple[int, int, int, int, int, int] | None = None  # (cell_w, cell_h, margin_l, margin_t, grid_w, grid_h)
+        self._line_cache: dict[int, Strip] = {}
+        self._dirty_lines: set[int] = set()
+        self._frame_key: tuple | None = None  # layout + theme the line cache was built for
+        self._cell_cache: dict[tuple, tuple[Segment, ...]] = {}
+
+    # Class-level so refresh() during Widget.__init__ is safe
+    _all_dirty = True
+
+    CELL_CACHE_MAX = 4096
+
+    def refresh(self, *regions, repaint: bool = True, layout: bool = False, recompose: bool = False):
+        # A region refresh comes from _refresh_key, which already marked its
+        # lines. Anything else may have changed any cell.
+        if not regions:
+            self._all_dirty = True
+        return super().refresh(*regions, repaint=repaint, layout=layout, recompose=recompose)
+
+    def _refresh_key(self, key: str) -> None:
+        """Repaint only the grid row holding `key`."""
+        row = _KEY_GRID_ROW.get(key)
+        layout = self._cached_layout
+        if row is None or layout is None or not self._layout_ready:
+            self.refresh()
+            return
+        cell_width, cell_height, margin_left, margin_top, grid_width, _ = layout
+        top = margin_top + row * cell_height
+        self._dirty_lines.update(range(top, top + cell_height))
+        self.refresh(Region(0, top, max(self.size.width, margin_left + grid_width), cell_height))
 
     def on_resize(self, event) -> None:
         """Mark layout ready after size stabilizes (debounced)."""
@@ -750,7 +793,7 @@ class MusicGrid(Widget):
         prev = self._root_index
         self._root_index = new_root_index
         self._pitch_transition = {
-            "start": time.monotonic(),
+            "start": loop_time(),
             "direction": direction,  # +1 = right (right arrow), -1 = left
             "prev_root_index": prev,
         }
@@ -768,7 +811,7 @@ class MusicGrid(Widget):
                 self._pitch_transition_timer.stop()
                 self._pitch_transition_timer = None
             return
-        elapsed = time.monotonic() - self._pitch_transition["start"]
+        elapsed = loop_time() - self._pitch_transition["start"]
         if elapsed >= self.PITCH_TRANSITION_DURATION:
             self._pitch_transition = None
             if self._pitch_transition_timer is not None:
@@ -787,7 +830,7 @@ class MusicGrid(Widget):
         t = self._pitch_transition
         if t is None:
             return self._root_index, False
-        elapsed = time.monotonic() - t["start"]
+        elapsed = loop_time() - t["start"]
         progress = max(0.0, min(1.0, elapsed / self.PITCH_TRANSITION_DURATION))
         # Wave position in column space (0..10).
         wavefront = progress * 10.0
@@ -806,12 +849,12 @@ class MusicGrid(Widget):
         if key in self._note_timers:
             self._note_timers[key].cancel()
         self._note_labels.add(key)
-        self.refresh()
+        self._refresh_key(key)
 
         def _clear(k: str = key) -> None:
             self._note_labels.discard(k)
             self._note_timers.pop(k, None)
-            self.refresh()
+            self._refresh_key(k)
 
         try:
             loop = asyncio.get_running_loop()
@@ -893,7 +936,7 @@ class MusicGrid(Widget):
         """Cycle color for a key."""
         self.color_state[key] = (self.color_state[key] + 1) % len(COLORS)
         if refresh:
-            self.refresh()
+            self._refresh_key(key)
 
     def set_color_index(self, key: str, index: int) -> None:
         """Set a key's color to a specific index.
@@ -907,7 +950,7 @@ class MusicGrid(Widget):
         """
         if key in self.color_state:
             self.color_state[key] = index
-            self.refresh()
+            self._refresh_key(key)
 
     def _get_default_bg(self) -> str:
         """Get default background based on current theme."""
@@ -919,14 +962,17 @@ class MusicGrid(Widget):
 
     def get_color(self, key: str) -> str:
         """Get current color for a key, resolving the keycap sentinel."""
+        return self._resolve_color(key, self._get_default_bg())
+
+    def _resolve_color(self, key: str, default_bg: str) -> str:
         idx = self.color_state[key]
         if idx < 0:
-            return self._get_default_bg()
+            return default_bg
         state = COLORS[idx]
         if state is None:
-            return self._get_default_bg()
+            return default_bg
         if state == COLOR_KEYCAP:
-            return KEY_COLORS.get(key.lower(), self._get_default_bg())
+            return KEY_COLORS.get(key.lower(), default_bg)
         return state
 
     def render_line(self, y: int) -> Strip:
@@ -936,7 +982,7 @@ class MusicGrid(Widget):
 
         # First mount: no cached layout yet, show blank until ready
         if not self._layout_ready and self._cached_layout is None:
-            return Strip([Segment(" " * max(width, 0), Style(bgcolor=self._get_default_bg()))])
+            return Strip([Segment(" " * max(width, 0), cell_style(None, self._get_default_bg()))])
 
         if self._layout_ready and width >= 10 and height >= 4:
             # Calculate and cache cell dimensions
@@ -954,10 +1000,35 @@ class MusicGrid(Widget):
             # Reflow in progress: reuse last good layout
             cell_width, cell_height, margin_left, margin_top, grid_width, grid_height = self._cached_layout
         else:
-            return Strip([Segment(" " * max(width, 0), Style(bgcolor=self._get_default_bg()))])
+            return Strip([Segment(" " * max(width, 0), cell_style(None, self._get_default_bg()))])
 
         default_bg = self._get_default_bg()
-        bg_style = Style(bgcolor=default_bg)
+
+        # Line cache: valid until the layout, theme or the line's row changes.
+        # Skipped while a key-shift slide animates (every melodic cell moves).
+        frame_key = (width, self._cached_layout, default_bg, self._show_labels)
+        if self._all_dirty or frame_key != self._frame_key:
+            self._all_dirty = False
+            self._frame_key = frame_key
+            self._line_cache.clear()
+            self._dirty_lines.clear()
+        elif y not in self._dirty_lines and self._pitch_transition is None:
+            cached = self._line_cache.get(y)
+            if cached is not None:
+                return cached
+
+        strip = self._render_grid_line(
+            y, width, default_bg,
+            cell_width, cell_height, margin_left, margin_top, grid_width, grid_height,
+        )
+        self._line_cache[y] = strip
+        self._dirty_lines.discard(y)
+        return strip
+
+    def _render_grid_line(self, y: int, width: int, default_bg: str,
+                          cell_width: int, cell_height: int, margin_left: int,
+                          margin_top: int, grid_width: int, grid_height: int) -> Strip:
+        bg_style = cell_style(None, default_bg)
 
         # Above or below the grid?
         if y < margin_top or y >= margin_top + grid_height:
@@ -972,6 +1043,12 @@ class MusicGrid(Widget):
         # Which line within the cell?
         line_in_cell = grid_y % cell_height if cell_height > 0 else 0
         mid_line = cell_height // 2
+        if line_in_cell == mid_line:
+            line_kind = "key"
+        elif line_in_cell in (mid_line - 1, mid_line + 1):
+            line_kind = "label"
+        else:
+            line_kind = "blank"
 
         segments = []
 
@@ -984,73 +1061,40 @@ class MusicGrid(Widget):
         # rows 1..3 are the three melodic rows (Q-P, A-;, Z-/).
         is_melodic_row = row_idx >= 1
         melodic_row = row_idx - 1 if is_melodic_row else None
+        sliding = is_melodic_row and self._pitch_transition is not None
+        all_labels = sliding or (is_melodic_row and self._show_labels)
 
         # Grid cells. All equal width
+        cell_cache = self._cell_cache
         for col_idx in range(10):
             key = GRID_KEYS[row_idx][col_idx]
-            bg_color = self.get_color(key)
-            cell_note_name: str | None = None
-            at_wavefront = False
-            if is_melodic_row:
+            bg_color = self._resolve_color(key, default_bg)
+            if sliding:
                 effective_root_idx, at_wavefront = self._transition_state_for_col(col_idx)
-                effective_root = FRIENDLY_KEYS[effective_root_idx]
-                cell_note_name, _ = pitch_for(
-                    melodic_row, col_idx, effective_root, 0,
-                )
                 # Wave-front pulse: brighten cells the slide is currently
                 # passing through. Visual scaffolding for the key shift.
                 if at_wavefront:
                     bg_color = "#5a3875"
+            else:
+                effective_root_idx = self._root_index
 
-            # Determine text color via WCAG black-or-white contrast against bg.
-            text_color = text_color_for(bg_color)
-            on_light_bg = text_color == "#000000"
-
-            cell_bg_style = Style(bgcolor=bg_color)
-            text_style = Style(bgcolor=bg_color, color=text_color, bold=True)
-
-            letter_line = mid_line
-            note_above = mid_line - 1
-            note_below = mid_line + 1
-            if line_in_cell == letter_line:
-                # Center the key character
-                display_key = _KID_MATH_DISPLAY.get(key, key)
-                pad_left = (cell_width - 1) // 2
-                pad_right = cell_width - pad_left - 1
-                segments.append(Segment(" " * pad_left, cell_bg_style))
-                segments.append(Segment(display_key, text_style))
-                segments.append(Segment(" " * pad_right, cell_bg_style))
-            elif line_in_cell in (note_above, note_below) and (
-                key in self._note_labels
-                or (is_melodic_row and self._pitch_transition is not None)
-                or (is_melodic_row and self._show_labels)
-            ):
-                # Flash note/percussion name, centered in cell. During a key
-                # shift, all melodic cells show their note name so the swap
-                # is visible as the wave passes through.
+            # Flash note/percussion name, centered in cell. During a key
+            # shift, all melodic cells show their note name so the swap
+            # is visible as the wave passes through.
+            label = None
+            if line_kind == "label" and (all_labels or key in self._note_labels):
                 if key.isdigit():
                     label = PERCUSSION_NAMES.get(key, "")
                 else:
-                    label = cell_note_name or ""
-                if label:
-                    decorated = f"{ICON_MUSIC_NOTE} {label} {ICON_MUSIC_NOTE}"
-                    decorated_width = len(decorated)
-                    muted_color = "#6a5a7a" if on_light_bg else "#887799"
-                    dim_style = Style(bgcolor=bg_color, color=muted_color)
-                    pad_left = (cell_width - decorated_width) // 2
-                    if pad_left < 0:
-                        pad_left = 0
-                    pad_right = cell_width - pad_left - decorated_width
-                    if pad_right < 0:
-                        pad_right = 0
-                    segments.append(Segment(" " * pad_left, cell_bg_style))
-                    segments.append(Segment(decorated[:cell_width], dim_style))
-                    if pad_right > 0:
-                        segments.append(Segment(" " * pad_right, cell_bg_style))
-                else:
-                    segments.append(Segment(" " * cell_width, cell_bg_style))
-            else:
-                segments.append(Segment(" " * cell_width, cell_bg_style))
+                    label, _ = pitch_for(melodic_row, col_idx, FRIENDLY_KEYS[effective_root_idx], 0)
+
+            cache_key = (key, bg_color, label, cell_width, line_kind)
+            cell = cell_cache.get(cache_key)
+            if cell is None:
+                if len(cell_cache) >= self.CELL_CACHE_MAX:
+                    cell_cache.clear()
+                cell = cell_cache[cache_key] = self._cell_segments(key, bg_color, label, cell_width, line_kind)
+            segments.extend(cell)
 
         # Right margin
         margin_right = width - margin_left - grid_width
@@ -1059,6 +1103,41 @@ class MusicGrid(Widget):
 
         return Strip(segments)
 
+    @staticmethod
+    def _cell_segments(key: str, bg_color: str, label: str | None,
+                       cell_width: int, line_kind: str) -> tuple[Segment, ...]:
+        """Segments for one line of one cell."""
+        # Determine text color via WCAG black-or-white contrast against bg.
+        text_color = text_color_for(bg_color)
+        on_light_bg = text_color == "#000000"
+        cell_bg_style = cell_style(None, bg_color)
+
+        if line_kind == "key":
+            # Center the key character
+            display_key = _KID_MATH_DISPLAY.get(key, key)
+            pad_left = (cell_width - 1) // 2
+            pad_right = cell_width - pad_left - 1
+            return (
+                Segment(" " * pad_left, cell_bg_style),
+                Segment(display_key, cell_style(text_color, bg_color, True)),
+                Segment(" " * pad_right, cell_bg_style),
+            )
+        if not label:
+            return (Segment(" " * cell_width, cell_bg_style),)
+
+        decorated = f"{ICON_MUSIC_NOTE} {label} {ICON_MUSIC_NOTE}"
+        decorated_width = len(decorated)
+        muted_color = "#6a5a7a" if on_light_bg else "#887799"
+        pad_left = max(0, (cell_width - decorated_width) // 2)
+        pad_right = max(0, cell_width - pad_left - decorated_width)
+        segments = [
+            Segment(" " * pad_left, cell_bg_style),
+            Segment(decorated[:cell_width], cell_style(muted_color, bg_color)),
+        ]
+        if pad_right > 0:
+            segments.append(Segment(" " * pad_right, cell_bg_style))
+        return tuple(segments)
+
 
 PROGRESS_BLOCKS = 20  # number of blocks in the recording progress bar
 
@@ -1139,7 +1218,7 @@ class MusicMode(Container, can_focus=True):
         super().__init__(**kwargs)
         self.grid: MusicGrid | None = None
         self._header: MusicRoomHeader | None = None
-        self._loop = LoopStation()
+        self._loop = LoopStation(time_fn=loop_time)
         self._letters_mode = False
         self._last_letter_key: str | None = None
         self._last_letter_press_t: float = float("-inf")
@@ -1348,7 +1427,9 @@ class MusicMode(Container, can_focus=True):
         """Continuously play the loop until stopped."""
         try:
             while self._loop.state == LOOPING:
-                events = self._loop.loop_events
+                # Immutable and already in offset order; notes added while
+                # this cycle plays land in the next cycle's schedule
+                events = self._loop.schedule
                 duration = self._loop.loop_duration
                 if not events or duration <= 0:
                     break
@@ -1356,8 +1437,7 @@ class MusicMode(Container, can_focus=True):
                 cycle_start = asyncio.get_event_loop().time()
                 self._loop.start_new_cycle()
 
-                sorted_events = sorted(events, key=lambda e: e[2])
-                for key, mode, offset, instrument in sorted_events:
+                for key, mode, offset, instrument in events:
                     if self._loop.state != LOOPING:
                         return
                     now = asyncio.get_event_loop().time()
@@ -1781,7 +1861,7 @@ class MusicMode(Container, can_focus=True):
             # the kid is hammering one key or mashing many. Music mode stays
             # un-debounced (piano semantics).
             if self._letters_mode and lookup in ALL_KEYS:
-                if self._letters_debounce_drop(lookup, time.monotonic()):
+                if self._letters_debounce_drop(lookup, loop_time()):
                     return
 
             if lookup in ALL_KEYS:
@@ -665,8 +665,7 @@ class ParentVolumeModal(PurpleModal):
 
     def _write_lock(self, level) -> None:
         from ..settings import set_volume_lock
-        set_volume_lock(level)
-        self.app._volume_lock = level
+        set_volume_lock(level)  # the app's subscription updates _volume_lock
 
     def _play_test_sound(self) -> None:
         """Play the glockenspiel test tone at the slider's current level.
@@ -2352,10 +2351,8 @@ class ParentMenu(PurpleModal):
 
     def _apply_all_caps(self, new_value: bool) -> None:
         from ..settings import set_all_caps
-        from .. import caps as caps_module
-        set_all_caps(new_value)
-        caps_module.set_enabled(new_value)
-        # Force a full repaint so already-rendered Strips get reissued through the patched ctor.
+        set_all_caps(new_value)  # the app's subscription flips the caps filter
+        # Force a full repaint so every line goes back through the caps filter.
         try:
             for screen in list(self.app.screen_stack):
                 for widget in screen.query("*"):
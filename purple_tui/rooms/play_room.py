@@ -51,6 +51,7 @@ from ..keyboard import (
 )
 from ..color_mixing import mix_colors_paint, get_color_name_approximation
 from ..scrolling import scroll_widget
+from ..eval_profile import profiler_from_env
 from .art_room import get_key_color, PaintModeChanged
 
 
@@ -655,6 +656,9 @@ class PlayMode(Vertical):
     def on_mount(self) -> None:
         """Focus the input when mode loads"""
         self.query_one("#play-input").focus()
+        profiler = profiler_from_env(getattr(self.app, "_dev_log", None))
+        if profiler:
+            profiler.attach(self.evaluator)
         restore = getattr(self.app, "timeline_restore", None)
         if restore:
             restore("play", self)
@@ -1188,6 +1192,8 @@ class SimpleEvaluator:
         # True when the last evaluate() actually did arithmetic (merged counts,
         # evaluated an expression, mixed colors), not just rendered the input.
         self._last_computed = False
+        # Set by EvalProfiler.attach() while per-stage timing is on
+        self.profiler = None
 
     def evaluate(self, text: str) -> str:
         """Evaluate input and return result string.
@@ -1210,13 +1216,18 @@ class SimpleEvaluator:
                 result = '\n'.join(lines[:-1]) if len(lines) > 1 else lines[0]
             # Validate Rich markup so broken tags never reach the renderer
             if result and not result.startswith("COLOR_RESULT:"):
-                from rich.text import Text
-                Text.from_markup(result)
+                self._validate_markup(result)
             return result
         except Exception:
             self._last_computed = False
             return self._format_text_as_color_blocks(text)
 
+    @staticmethod
+    def _validate_markup(result: str) -> None:
+        """Raise if `result` is not valid Rich markup."""
+        from rich.text import Text
+        Text.from_markup(result)
+
     # "and"/"&" → "+" only when between digits, colors, or known emoji words
     _AND_PATTERN = re.compile(r'(?<=\S)\s+(?:and|&)\s+(?=\S)', re.IGNORECASE)
 
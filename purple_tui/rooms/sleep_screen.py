@@ -98,7 +98,7 @@ class SleepScreen(Screen):
     def on_mount(self) -> None:
         """Start update timer when screen is shown."""
         self._update_status()
-        self._status_timer = self.set_interval(5.0, self._tick)
+        self._status_timer = self.app.ticker.every(5.0, self._tick, name="sleep-status")
 
     def on_unmount(self) -> None:
         """Clean up timer when screen is hidden."""
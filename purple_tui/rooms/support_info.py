@@ -78,7 +78,17 @@ class DeviceInfoScreen(_ScrollablePage):
     TITLE = "Device info"
 
     def _collect_text(self) -> str:
-        return diagnostics.collect_device_info()
+        return diagnostics.collect_device_info(getattr(self.app, "ticker", None))
+
+
+class KeyLatencyScreen(_ScrollablePage):
+    TITLE = "Key latency"
+
+    def _collect_text(self) -> str:
+        latency = getattr(self.app, "key_latency", None)
+        if latency is None:
+            return "(unavailable)"
+        return diagnostics.collect_key_latency(latency)
 
 
 class AudioInfoScreen(_ScrollablePage):
@@ -93,6 +103,7 @@ class AudioInfoScreen(_ScrollablePage):
 _SUB_SCREENS = [
     ("btn-device-info", "Device info", DeviceInfoScreen),
     ("btn-audio-info", "Audio info", AudioInfoScreen),
+    ("btn-key-latency", "Key latency", KeyLatencyScreen),
 ]
 
 
@@ -127,10 +127,7 @@ def paint_ops(app, ops: list[tuple[int, int, str]]) -> None:
                 app.call_after_refresh(_paint, attempts_left - 1)
             return
         art.clear_canvas()
-        for x, y, k in ops:
-            canvas.paint_at(x, y, k)
-        canvas._invalidate_all()
-        canvas.refresh()
+        canvas.apply_ops(ops)
 
     app.call_after_refresh(_paint)
 
@@ -3,15 +3,33 @@ Purple Computer - Persistent Settings
 
 Settings that survive across app restarts (Littles Mode, etc.).
 Stored in ~/.config/purple/settings.json alongside display.json.
+
+One process-wide SettingsStore holds them in memory: the file is read once,
+getters never touch the disk, and setters mark the store dirty and schedule
+a single write-behind WRITE_DELAY seconds later on a background thread, so a
+burst of changes (holding a volume key) costs one write. Writes go to a temp
+file that is fsynced and renamed over settings.json: a crash or power cut
+leaves either the old file or the new one, never a torn one. flush() writes
+immediately; the app calls it on exit and before powering off.
+
+subscribe(key, callback) runs callback(key, value) on the setter's thread
+whenever that setting actually changes.
 """
 
+import atexit
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
+from typing import Any, Callable
 
 from .constants import VOLUME_DEFAULT
 
 SETTINGS_FILE = Path.home() / ".config" / "purple" / "settings.json"
 
+# Seconds a change waits for more changes before the file is rewritten
+WRITE_DELAY = 0.5
 _defaults = {
     "littles_mode": None,        # None = off, "music", "music_noscreen", or "art"
     "code_panel": True,          # Whether the code panel can be opened (space hold)
@@ -26,16 +44,16 @@ _defaults = {
 }
 
 
-def load_settings() -> dict:
-    """Load settings from disk, falling back to defaults.
+def _read(path: Path) -> dict:
+    """Settings from `path`, falling back to defaults.
 
     Migrates the legacy `silent_mode: True` field to `volume_lock: 0`,
     since silence is just a lock pinned at zero in the unified model.
     """
     settings = dict(_defaults)
     try:
-        if SETTINGS_FILE.exists():
-            data = json.loads(SETTINGS_FILE.read_text())
+        if path.exists():
+            data = json.loads(path.read_text())
             for key in _defaults:
                 if key in data:
                     settings[key] = data[key]
@@ -46,125 +64,236 @@ def load_settings() -> dict:
     return settings
 
 
-def save_settings(settings: dict) -> bool:
-    """Save settings to disk."""
+def _write_atomic(path: Path, text: str) -> None:
+    """Replace `path` with `text` so readers see the old or new file, whole."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
     try:
-        SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        SETTINGS_FILE.write_text(json.dumps(settings, indent=2))
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)  # make the rename itself durable
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass
+
+
+class SettingsStore:
+    """In-memory settings with write-behind persistence.
+
+    Follows the module's SETTINGS_FILE (tests point it at a temp dir): if the
+    path changes, the next read loads from the new one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._values: dict | None = None
+        self._path: Path | None = None
+        self._dirty = False
+        self._timer: threading.Timer | None = None
+        self._subscribers: dict[str, list[Callable[[str, Any], None]]] = {}
+        self.writes = 0
+
+    def _loaded(self) -> dict:
+        with self._lock:
+            if self._values is None or self._path != SETTINGS_FILE:
+                if self._dirty:
+                    self._write()
+                self._path = SETTINGS_FILE
+                self._values = _read(SETTINGS_FILE)
+            return self._values
+
+    def get(self, key: str) -> Any:
+        return self._loaded()[key]
+
+    def snapshot(self) -> dict:
+        return dict(self._loaded())
+
+    def set(self, key: str, value: Any) -> None:
+        self.update({key: value})
+
+    def update(self, values: dict) -> None:
+        """Change several settings at once; one write, then notify."""
+        with self._lock:
+            current = self._loaded()
+            changed = {k: v for k, v in values.items() if k in _defaults and current.get(k) != v}
+            if not changed:
+                return
+            current.update(changed)
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(WRITE_DELAY, self._write_behind)
+                self._timer.daemon = True
+                self._timer.start()
+        for key, value in changed.items():
+            for callback in list(self._subscribers.get(key, ())):
+                try:
+                    callback(key, value)
+                except Exception:
+                    pass
+
+    def subscribe(self, key: str, callback: Callable[[str, Any], None]) -> Callable[[], None]:
+        """Call `callback(key, value)` when `key` changes. Returns an unsubscribe function."""
+        self._subscribers.setdefault(key, []).append(callback)
+
+        def unsubscribe() -> None:
+            try:
+                self._subscribers[key].remove(callback)
+            except (KeyError, ValueError):
+                pass
+        return unsubscribe
+
+    def flush(self) -> bool:
+        """Write pending changes now. False if the write failed."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return True
+            return self._write()
+
+    def _write_behind(self) -> None:
+        with self._lock:
+            self._timer = None
+            if self._dirty:
+                self._write()
+
+    def _write(self) -> bool:
+        try:
+            _write_atomic(self._path, json.dumps(self._values, indent=2))
+        except Exception:
+            return False  # stays dirty: the next flush or change retries
+        self._dirty = False
+        self.writes += 1
         return True
-    except Exception:
-        return False
 
 
+store = SettingsStore()
+atexit.register(store.flush)
+
+
+def load_settings() -> dict:
+    """A copy of the current settings (defaults filled in)."""
+    return store.snapshot()
+
+
+def save_settings(settings: dict) -> bool:
+    """Replace settings and write them to disk now."""
+    store.update(settings)
+    return store.flush()
+
+
+def subscribe(key: str, callback: Callable[[str, Any], None]) -> Callable[[], None]:
+    """See SettingsStore.subscribe."""
+    return store.subscribe(key, callback)
+
+
+def flush() -> bool:
+    """Write any pending setting changes to disk now."""
+    return store.flush()
+
 
 def get_littles_mode() -> str | None:
     """Get current Littles Mode setting. None = off, 'music' or 'art'."""
-    return load_settings()["littles_mode"]
+    return store.get("littles_mode")
 
 
 def set_littles_mode(mode: str | None) -> None:
     """Set Littles Mode. None to disable, 'music' or 'art' to enable."""
-    settings = load_settings()
-    settings["littles_mode"] = mode
-    save_settings(settings)
+    store.set("littles_mode", mode)
 
 
 def get_code_panel() -> bool:
     """Whether the code panel is enabled."""
-    return load_settings()["code_panel"]
+    return store.get("code_panel")
 
 
 def set_code_panel(enabled: bool) -> None:
-    settings = load_settings()
-    settings["code_panel"] = enabled
-    save_settings(settings)
+    store.set("code_panel", enabled)
 
 
 def get_music_looping() -> bool:
     """Whether music room looping is enabled."""
-    return load_settings()["music_looping"]
+    return store.get("music_looping")
 
 
 def set_music_looping(enabled: bool) -> None:
-    settings = load_settings()
-    settings["music_looping"] = enabled
-    save_settings(settings)
+    store.set("music_looping", enabled)
 
 
 def get_music_key_switching() -> bool:
     """Whether music room key switching (arrows) is enabled."""
-    return load_settings()["music_key_switching"]
+    return store.get("music_key_switching")
 
 
 def set_music_key_switching(enabled: bool) -> None:
-    settings = load_settings()
-    settings["music_key_switching"] = enabled
-    save_settings(settings)
+    store.set("music_key_switching", enabled)
 
 
 def get_all_caps() -> bool:
     """Whether all rendered text is uppercased."""
-    return load_settings()["all_caps"]
+    return store.get("all_caps")
 
 
 def set_all_caps(enabled: bool) -> None:
-    settings = load_settings()
-    settings["all_caps"] = enabled
-    save_settings(settings)
+    store.set("all_caps", enabled)
 
 
 def get_volume_level() -> int:
     """Last volume level the kid set (0-100)."""
-    return load_settings()["volume_level"]
+    return store.get("volume_level")
 
 
 def set_volume_level(level: int) -> None:
-    settings = load_settings()
-    settings["volume_level"] = level
-    save_settings(settings)
+    store.set("volume_level", level)
 
 
 def get_volume_lock() -> int | None:
     """Locked playback volume (0-100), or None if not locked. 0 means Silent."""
-    return load_settings()["volume_lock"]
+    return store.get("volume_lock")
 
 
 def set_volume_lock(level: int | None) -> None:
-    settings = load_settings()
-    settings["volume_lock"] = level
-    save_settings(settings)
+    store.set("volume_lock", level)
 
 
 def get_kid_letters() -> bool:
     """Whether the recorded kid-voice clips are used for A-Z letter names."""
-    return load_settings()["kid_letters"]
+    return store.get("kid_letters")
 
 
 def set_kid_letters(enabled: bool) -> None:
-    settings = load_settings()
-    settings["kid_letters"] = enabled
-    save_settings(settings)
+    store.set("kid_letters", enabled)
 
 
 def get_secret_unlocked() -> bool:
     """Whether the family secret menu has been unlocked."""
-    return load_settings()["secret_unlocked"]
+    return store.get("secret_unlocked")
 
 
 def set_secret_unlocked(enabled: bool) -> None:
-    settings = load_settings()
-    settings["secret_unlocked"] = enabled
-    save_settings(settings)
+    store.set("secret_unlocked", enabled)
 
 
 def get_parent_pin() -> str | None:
     """Optional 4-digit parent menu PIN, or None if unset."""
-    return load_settings()["parent_pin"]
+    return store.get("parent_pin")
 
 
 def set_parent_pin(pin: str | None) -> None:
-    settings = load_settings()
-    settings["parent_pin"] = pin
-    save_settings(settings)
+    store.set("parent_pin", pin)
 
 
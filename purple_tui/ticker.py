@@ -0,0 +1,165 @@
+"""One coalesced, tickless timer for the app's periodic polls.
+
+Every Textual set_interval is its own asyncio task with its own wakeup, so the
+battery poll (30s), USB checks (5s), idle check (5s), boot-mode blink (1s) and
+friends each woke the CPU on their own phase. On an old laptop on battery,
+wakeups are what cost power, not the few microseconds of work.
+
+Ticker runs all of them off a single one-shot timer:
+
+- Aligned: a job with period P is due at whole multiples of P on the
+  monotonic clock, so the 5s and 30s polls land on the same instant, and
+  PowerManager's refresh thread sleeps to the same 5s grid.
+- Coalesced: jobs due within COALESCE_SLACK of a wakeup run in it.
+- Tickless: the timer is armed for the earliest due job only. Paused and
+  stopped jobs don't count, so with nothing to do there is no timer at all.
+
+Missed ticks (a slow frame, a suspended laptop) are skipped, not replayed.
+`wakeups_per_minute()` feeds the Device info screen so the reduction can be
+checked on real hardware.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from typing import Callable
+
+# Jobs due this close after a wakeup run in it instead of waking again
+COALESCE_SLACK = 0.25
+
+# Window for wakeups_per_minute()
+_RATE_WINDOW = 60.0
+
+
+class TickJob:
+    """Handle for one periodic callback. stop() matches Textual's Timer, so
+    code that keeps a timer attribute and stops it works with either."""
+
+    def __init__(self, ticker: "Ticker", period: float, callback: Callable[[], object], name: str) -> None:
+        self._ticker = ticker
+        self.period = period
+        self.callback = callback
+        self.name = name
+        self.paused = False
+        self.stopped = False
+        self.runs = 0
+        self.due = ticker._next_aligned(period, ticker.clock())
+
+    @property
+    def active(self) -> bool:
+        return not (self.paused or self.stopped)
+
+    def pause(self) -> None:
+        """Stop waking for this job until resume()."""
+        if self.active:
+            self.paused = True
+            self._ticker._rearm()
+
+    def resume(self) -> None:
+        """Start ticking again from the next aligned slot."""
+        if self.paused and not self.stopped:
+            self.paused = False
+            self.due = self._ticker._next_aligned(self.period, self._ticker.clock())
+            self._ticker._rearm()
+
+    def stop(self) -> None:
+        if not self.stopped:
+            self.stopped = True
+            self._ticker._remove(self)
+
+    def __repr__(self) -> str:
+        state = "stopped" if self.stopped else "paused" if self.paused else "active"
+        return f"<TickJob {self.name} every {self.period:g}s {state}>"
+
+
+class Ticker:
+    """Schedules TickJobs on one re-armed timer from `set_timer`.
+
+    `set_timer(delay, callback)` must return an object with stop(); in the
+    app it is App.set_timer, so callbacks run in the app's context exactly
+    like set_interval callbacks.
+    """
+
+    def __init__(self, set_timer: Callable, clock: Callable[[], float] = time.monotonic) -> None:
+        self._set_timer = set_timer
+        self.clock = clock
+        self._jobs: list[TickJob] = []
+        self._timer = None
+        self._timer_at: float | None = None
+        self._waking = False
+        self.wakeups = 0
+        self._recent: deque[float] = deque()
+
+    @staticmethod
+    def _next_aligned(period: float, now: float) -> float:
+        return (math.floor(now / period) + 1) * period
+
+    def every(self, period: float, callback: Callable[[], object], name: str | None = None) -> TickJob:
+        """Call `callback` every `period` seconds, aligned to the shared grid."""
+        if period <= 0:
+            raise ValueError("period must be positive")
+        job = TickJob(self, period, callback, name or getattr(callback, "__name__", "job"))
+        self._jobs.append(job)
+        self._rearm()
+        return job
+
+    @property
+    def jobs(self) -> list[TickJob]:
+        return list(self._jobs)
+
+    def _remove(self, job: TickJob) -> None:
+        try:
+            self._jobs.remove(job)
+        except ValueError:
+            pass
+        self._rearm()
+
+    def _rearm(self) -> None:
+        """Point the timer at the earliest active job (or at nothing)."""
+        if self._waking:
+            return  # _wake re-arms once every due job has run
+        due = min((job.due for job in self._jobs if job.active), default=None)
+        if due == self._timer_at:
+            return
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        self._timer_at = due
+        if due is not None:
+            self._timer = self._set_timer(max(0.0, due - self.clock()), self._wake, name="ticker")
+
+    def _wake(self) -> None:
+        now = self.clock()
+        self._timer = None
+        self._timer_at = None
+        self.wakeups += 1
+        self._recent.append(now)
+        self._trim(now)
+        horizon = now + COALESCE_SLACK
+        self._waking = True
+        try:
+            for job in [j for j in self._jobs if j.active and j.due <= horizon]:
+                job.due = self._next_aligned(job.period, horizon)
+                if not job.active:  # an earlier job in this wakeup stopped it
+                    continue
+                job.runs += 1
+                job.callback()
+        finally:
+            self._waking = False
+            self._rearm()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - _RATE_WINDOW
+        while self._recent and self._recent[0] < cutoff:
+            self._recent.popleft()
+
+    def wakeups_per_minute(self) -> int:
+        """Wakeups in the last minute."""
+        self._trim(self.clock())
+        return len(self._recent)
+
+    def stop_all(self) -> None:
+        for job in list(self._jobs):
+            job.stop()
@@ -5,9 +5,17 @@ Reads zoom events from a JSON sidecar file and applies smooth zoom/pan
 transitions via a single FFmpeg command. Uses the zoompan filter with
 per-frame expressions and smoothstep easing.
 
+zoompan evaluates the whole nested expression every frame, so a long
+recording with many keyframes is slow, and one libx264 pass uses only part
+of the machine. With --jobs, the video is cut where the camera holds still,
+each segment is rendered by its own FFmpeg with an expression holding only
+that segment's keyframes, and the segments are joined by stream copy (no
+second encode). Audio is taken from the input once, at the end.
+
 Usage:
     python apply_zoom.py input.mp4 zoom_events.json output.mp4
     python apply_zoom.py input.mp4 zoom_events.json output.mp4 --debug-keyframes
+    python apply_zoom.py input.mp4 zoom_events.json output.mp4 --jobs 0   # one per CPU
 
 The zoom events JSON format:
     [
@@ -22,6 +30,8 @@ import json
 import os
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -31,6 +41,11 @@ import numpy as np
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from purple_tui.constants import ZOOM_REGIONS
 
+# Segmented mode: aim for this many segments per worker (uneven segment
+# costs then still balance), none shorter than MIN_SEGMENT_SECONDS
+SEGMENTS_PER_JOB = 3
+MIN_SEGMENT_SECONDS = 2.0
+
 
 def get_video_info(video_path: Path) -> tuple[int, int, float, float, str]:
     """Get video dimensions, duration, framerate, and raw fps string."""
@@ -303,6 +318,175 @@ def build_zoompan_expr(
     return expr
 
 
+def zoompan_filter(
+    zoom_keyframes: list[ZoomKeyframe],
+    output_width: int,
+    output_height: int,
+    fps_str: str,
+) -> str:
+    """The zoompan filter for these keyframes.
+
+    d=1 means 1 output frame per input frame (video passthrough); s=WxH
+    sets output resolution, fps uses exact fraction to avoid audio drift.
+    """
+    z_expr = build_zoompan_expr(zoom_keyframes, "z")
+    x_expr = build_zoompan_expr(zoom_keyframes, "x")
+    y_expr = build_zoompan_expr(zoom_keyframes, "y")
+    return (
+        f"zoompan=z='{z_expr}'"
+        f":x='{x_expr}'"
+        f":y='{y_expr}'"
+        f":d=1"
+        f":s={output_width}x{output_height}"
+        f":fps={fps_str}"
+    )
+
+
+def hold_intervals(zoom_keyframes: list[ZoomKeyframe]) -> list[tuple[float, float]]:
+    """Time spans between consecutive keyframes where the camera is still."""
+    holds = []
+    for (t0, z0, x0, y0), (t1, z1, x1, y1) in zip(zoom_keyframes, zoom_keyframes[1:]):
+        if abs(z0 - z1) < 0.001 and x0 == x1 and y0 == y1 and t1 > t0:
+            holds.append((t0, t1))
+    return holds
+
+
+def plan_segments(
+    zoom_keyframes: list[ZoomKeyframe],
+    duration: float,
+    fps: float,
+    jobs: int,
+    min_segment: float = MIN_SEGMENT_SECONDS,
+) -> list[tuple[int, int]]:
+    """Split the video into frame ranges [start, end) for parallel rendering.
+
+    Cuts go only strictly inside hold intervals, so no transition spans two
+    segments and each segment's camera state at its cut is a constant.
+    Cuts are placed as close as holds allow to evenly spaced targets.
+    """
+    total = max(1, round(duration * fps))
+    count = max(1, min(jobs * SEGMENTS_PER_JOB, int(duration // min_segment)))
+    min_frames = max(1, round(min_segment * fps))
+    # Frames whose time lies strictly inside a hold
+    holds = []
+    for t0, t1 in hold_intervals(zoom_keyframes):
+        first, last = int(t0 * fps) + 1, int(t1 * fps - 1e-9)
+        if first <= last:
+            holds.append((first, last))
+
+    cuts = []
+    for j in range(1, count):
+        target = round(total * j / count)
+        candidates = [min(max(target, first), last) for first, last in holds]
+        if not candidates:
+            break
+        cut = min(candidates, key=lambda f: abs(f - target))
+        if cut - (cuts[-1] if cuts else 0) >= min_frames and total - cut >= min_frames:
+            cuts.append(cut)
+    bounds = [0, *cuts, total]
+    return list(zip(bounds, bounds[1:]))
+
+
+def segment_keyframes(
+    zoom_keyframes: list[ZoomKeyframe],
+    start: float,
+    end: float | None,
+) -> list[ZoomKeyframe]:
+    """Keyframes for the segment [start, end), on a clock starting at `start`.
+
+    start/end must lie in holds (see plan_segments); end=None is the last
+    segment, which keeps every later keyframe.
+    """
+    def state_at(t: float) -> tuple[float, int, int]:
+        current = zoom_keyframes[0][1:]
+        for kf in zoom_keyframes:
+            if kf[0] > t:
+                break
+            current = kf[1:]
+        return current
+
+    inside = [kf for kf in zoom_keyframes if start <= kf[0] and (end is None or kf[0] < end)]
+    local = [(t - start, z, x, y) for t, z, x, y in inside]
+    if not local or local[0][0] > 0:
+        local.insert(0, (0.0, *state_at(start)))
+    if end is not None:
+        local.append((end - start, *state_at(end)))
+    return local
+
+
+def _run_segment(cmd: list[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(cmd, capture_output=True, text=True)
+
+
+def render_segmented(
+    input_video: Path,
+    output_video: Path,
+    zoom_keyframes: list[ZoomKeyframe],
+    duration: float,
+    fps: float,
+    fps_str: str,
+    output_width: int,
+    output_height: int,
+    jobs: int,
+    log,
+) -> bool:
+    """Render segments in parallel FFmpeg processes and join them losslessly."""
+    segments = plan_segments(zoom_keyframes, duration, fps, jobs)
+    threads = max(1, (os.cpu_count() or 1) // jobs)
+    log(f"\nApplying zoom ({len(segments)} segments, {jobs} jobs, {threads} x264 threads each)...")
+
+    with tempfile.TemporaryDirectory(prefix="apply_zoom_", dir=output_video.parent) as tmp:
+        tmp_dir = Path(tmp)
+        commands = []
+        for i, (first, last) in enumerate(segments):
+            # Seek half a frame early so float rounding can never drop the
+            # first frame; zoompan's in_time then counts from the seek point
+            seek = max(0.0, (first - 0.5) / fps)
+            end = last / fps if last < segments[-1][1] else None
+            lead = first / fps - seek
+            local = [(t + lead, z, x, y)
+                     for t, z, x, y in segment_keyframes(zoom_keyframes, first / fps, end)]
+            zoompan = zoompan_filter(local, output_width, output_height, fps_str)
+            out = tmp_dir / f"segment_{i:04d}.mp4"
+            log(f"  Segment {i}: frames {first}-{last - 1} ({first / fps:.2f}-{last / fps:.2f}s), "
+                f"{len(local)} keyframes, filter {len(zoompan)} chars")
+            commands.append([
+                "ffmpeg", "-y", "-v", "error",
+                "-ss", f"{seek:.6f}", "-i", str(input_video),
+                "-frames:v", str(last - first), "-an",
+                "-vf", f"{zoompan},setpts=PTS-STARTPTS",
+                "-c:v", "libx264", "-crf", "18", "-preset", "fast",
+                "-threads", str(threads),
+                str(out),
+            ])
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:  # each job is its own ffmpeg process
+            results = list(pool.map(_run_segment, commands))
+        for i, result in enumerate(results):
+            if result.returncode != 0:
+                log(f"Segment {i} FAILED (exit code {result.returncode}):\n{result.stderr[:2000]}")
+                return False
+
+        concat_list = tmp_dir / "segments.txt"
+        concat_list.write_text("".join(f"file '{cmd[-1]}'\n" for cmd in commands))
+        join = [
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "concat", "-safe", "0", "-i", str(concat_list),
+            "-i", str(input_video),
+            "-map", "0:v", "-map", "1:a?",
+            "-c:v", "copy",
+            "-c:a", "aac", "-b:a", "192k",
+            "-movflags", "+faststart",
+            str(output_video),
+        ]
+        result = subprocess.run(join, capture_output=True, text=True)
+        if result.returncode != 0:
+            log(f"Concat FAILED (exit code {result.returncode}):\n{result.stderr[:2000]}")
+            return False
+    log("FFmpeg completed successfully")
+    return True
+
+
 # Keep old build_crop_expr for tests (it's still correct math, just not for crop w/h)
 def build_crop_expr(keyframes: list[Keyframe], param_index: int) -> str:
     """Generate a nested if(lt(t,...)) FFmpeg expression for one crop parameter.
@@ -506,12 +690,16 @@ def apply_zoom(
     output_width: int | None = None,
     output_height: int | None = None,
     debug_keyframes: bool = False,
+    jobs: int = 1,
 ) -> bool:
     """Apply zoom effects to video using zoompan filter.
 
     Output defaults to input video dimensions (preserving aspect ratio).
+    jobs > 1 renders segments in parallel (0 = one job per CPU).
     Writes detailed debug info to apply_zoom_debug.log next to output.
     """
+    if jobs < 0:
+        raise ValueError(f"jobs must be >= 0, got {jobs}")
     # Set up debug log next to output file
     log_path = output_video.parent / "apply_zoom_debug.log"
     log_lines: list[str] = []
@@ -592,6 +780,17 @@ def apply_zoom(
     for t, z, x, y in zoom_keyframes:
         log(f"{t:8.3f}  {z:8.3f}  {x:6d}  {y:6d}")
 
+    if jobs != 1:
+        jobs = jobs or os.cpu_count() or 1
+        ok = render_segmented(
+            input_video, output_video, zoom_keyframes, duration, fps, fps_str,
+            output_width, output_height, jobs, log,
+        )
+        if ok:
+            _log_output_info(output_video, log)
+        write_log()
+        return ok
+
     # Build zoompan expressions
     z_expr = build_zoompan_expr(zoom_keyframes, "z")
     x_expr = build_zoompan_expr(zoom_keyframes, "x")
@@ -603,16 +802,7 @@ def apply_zoom(
     log(f"  y: {y_expr[:200]}{'...' if len(y_expr) > 200 else ''}")
     log(f"  Lengths: z={len(z_expr)} x={len(x_expr)} y={len(y_expr)}")
 
-    # zoompan: d=1 means 1 output frame per input frame (video passthrough)
-    # s=WxH sets output resolution, fps uses exact fraction to avoid audio drift
-    zoompan = (
-        f"zoompan=z='{z_expr}'"
-        f":x='{x_expr}'"
-        f":y='{y_expr}'"
-        f":d=1"
-        f":s={output_width}x{output_height}"
-        f":fps={fps_str}"
-    )
+    zoompan = zoompan_filter(zoom_keyframes, output_width, output_height, fps_str)
 
     cmd = [
         "ffmpeg", "-y",
@@ -674,7 +864,12 @@ def apply_zoom(
         write_log()
         return False
 
-    # Check output
+    _log_output_info(output_video, log)
+    write_log()
+    return True
+
+
+def _log_output_info(output_video: Path, log) -> None:
     if output_video.exists():
         size_mb = output_video.stat().st_size / (1024 * 1024)
         log(f"Output created: {output_video} ({size_mb:.1f} MB)")
@@ -686,8 +881,13 @@ def apply_zoom(
     else:
         log(f"ERROR: output file was not created!")
 
-    write_log()
-    return True
+
+def job_count(value: str) -> int:
+    """argparse type for --jobs: a count of 0 (one per CPU) or more."""
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 (one per CPU) or more, got {jobs}")
+    return jobs
 
 
 def main():
@@ -709,6 +909,10 @@ def main():
         "--debug-keyframes", action="store_true",
         help="Print computed keyframes table"
     )
+    parser.add_argument(
+        "--jobs", type=job_count, default=1,
+        help="Render segments in N parallel FFmpeg processes (0 = one per CPU, default: 1 = single pass)"
+    )
 
     args = parser.parse_args()
 
@@ -724,6 +928,7 @@ def main():
         args.input, args.events, args.output,
         args.width, args.height,
         debug_keyframes=args.debug_keyframes,
+        jobs=args.jobs,
     )
 
     sys.exit(0 if success else 1)
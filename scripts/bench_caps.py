@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark full-screen repaints with all-caps on vs off.
+
+Mounts the app under Textual's headless harness, switches to each room and
+times the compositor's full-screen update two ways:
+
+  cached   nothing changed since the last frame (every widget's line cache
+           hits; with all-caps on, each line's uppercase copy is reused)
+  dirty    every widget's StylesCache dropped first, so each visible line is
+           rebuilt from render_line and goes through the caps filter again
+
+Usage:
+    python scripts/bench_caps.py                 # 200 frames per room
+    python scripts/bench_caps.py --frames 500 --rooms art
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("PURPLE_NO_EVDEV", "1")
+os.environ.setdefault("PURPLE_NO_AUDIO", "1")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from purple_tui import caps  # noqa: E402
+from purple_tui.constants import REQUIRED_TERMINAL_ROWS  # noqa: E402
+from purple_tui.purple_tui import PurpleApp  # noqa: E402
+
+ROOMS = ("play", "music", "art")
+
+
+def time_frames(compositor, frames: int, before=None) -> list[float]:
+    samples = []
+    for _ in range(frames):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        compositor.render_update(full=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def measure(rooms: list[str], frames: int) -> dict:
+    results = {}
+    app = PurpleApp()
+    async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+        for room in rooms:
+            app.action_switch_room(room)
+            await pilot.pause()
+            screen = app.screen
+            widgets = list(screen.query("*"))
+
+            def invalidate():
+                for widget in widgets:
+                    widget._styles_cache.clear()
+
+            for enabled in (False, True):
+                caps.set_enabled(enabled)
+                compositor = screen._compositor
+                compositor.render_update(full=True)  # warm caches
+                results[(room, enabled, "cached")] = time_frames(compositor, frames)
+                results[(room, enabled, "dirty")] = time_frames(compositor, frames, invalidate)
+            caps.set_enabled(False)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--frames", type=int, default=200, help="Repaints per case (default: 200)")
+    parser.add_argument("--rooms", nargs="+", choices=ROOMS, default=list(ROOMS))
+    args = parser.parse_args()
+
+    results = asyncio.run(measure(args.rooms, args.frames))
+    print(f"{'room':<7}{'frame':<8}{'caps off':>12}{'caps on':>12}{'overhead':>11}")
+    for room in args.rooms:
+        for kind in ("cached", "dirty"):
+            off = statistics.median(results[(room, False, kind)]) * 1000
+            on = statistics.median(results[(room, True, kind)]) * 1000
+            print(f"{room:<7}{kind:<8}{off:10.3f}ms{on:10.3f}ms{(on - off) / off:+10.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
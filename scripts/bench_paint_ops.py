@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark painting saved pictures: per-op paint_at vs ArtCanvas.apply_ops.
+
+Mounts the app under Textual's headless harness, switches to the Art room
+and paints each op list onto a cleared canvas two ways, timing the paint
+plus the first full-screen frame after it:
+
+  paint_at   one ArtCanvas.paint_at call per op, then a full invalidate and
+             refresh (how replay_paint and the Secret Menu used to paint)
+  apply_ops  one apply_ops call: keys resolved once, cells written straight
+             into the grid, only the touched rows redrawn
+
+The resulting grids are compared, so a run also checks the two agree.
+
+Op lists:
+  full    a synthetic photo covering every canvas cell with its own hex color
+  photo   the Secret Menu photo (purple_tui/secret_photo.py)
+  doodle  the Secret Menu doodle (color keys with paint mixing)
+  PATH    an OPS module written by tools/photo_to_art.py
+
+Usage:
+    python scripts/bench_paint_ops.py                 # full, photo, doodle; 5 runs each
+    python scripts/bench_paint_ops.py --runs 20 full /tmp/beach.py
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("PURPLE_NO_EVDEV", "1")
+os.environ.setdefault("PURPLE_NO_AUDIO", "1")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from purple_tui.art_config import CANVAS_WIDTH, CANVAS_HEIGHT  # noqa: E402
+from purple_tui.constants import REQUIRED_TERMINAL_ROWS  # noqa: E402
+from purple_tui.purple_tui import PurpleApp  # noqa: E402
+from purple_tui.rooms.art_room import ArtCanvas, ArtMode  # noqa: E402
+
+
+def full_canvas_ops() -> list[tuple[int, int, str]]:
+    """A gradient with a distinct color in every cell, in photo_to_art's format."""
+    return [
+        (x, y, f"#{x * 255 // CANVAS_WIDTH:02x}{y * 255 // CANVAS_HEIGHT:02x}{(x * 7 + y * 13) % 256:02x}")
+        for y in range(CANVAS_HEIGHT) for x in range(CANVAS_WIDTH)
+    ]
+
+
+def load_ops(name: str) -> list[tuple[int, int, str]]:
+    if name == "full":
+        return full_canvas_ops()
+    if name == "photo":
+        from purple_tui.secret_photo import OPS
+        return OPS
+    if name == "doodle":
+        from purple_tui.secret_doodle import build_ops
+        return build_ops()
+    spec = importlib.util.spec_from_file_location("bench_ops", name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.OPS
+
+
+def paint_each(canvas: ArtCanvas, ops) -> None:
+    for x, y, key in ops:
+        canvas.paint_at(x, y, key)
+    canvas._invalidate_all()
+    canvas.refresh()
+
+
+def paint_bulk(canvas: ArtCanvas, ops) -> None:
+    canvas.apply_ops(ops)
+
+
+async def measure(cases: dict[str, list], runs: int) -> dict:
+    results = {}
+    app = PurpleApp()
+    async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+        app.action_switch_room("art")
+        await pilot.pause()
+        art = app.query_one(ArtMode)
+        canvas = art.query_one(ArtCanvas)
+        compositor = app.screen._compositor
+
+        for name, ops in cases.items():
+            grids = {}
+            for label, paint in (("paint_at", paint_each), ("apply_ops", paint_bulk)):
+                samples = []
+                for _ in range(runs):
+                    art.clear_canvas()
+                    compositor.render_update(full=True)
+                    start = time.perf_counter()
+                    paint(canvas, ops)
+                    painted = time.perf_counter()
+                    compositor.render_update(full=True)
+                    samples.append((painted - start, time.perf_counter() - start))
+                grids[label] = (dict(canvas._grid), set(canvas._painted_positions))
+                results[(name, label)] = samples
+            results[(name, "same")] = grids["paint_at"] == grids["apply_ops"]
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("ops", nargs="*", default=["full", "photo", "doodle"],
+                        help="full, photo, doodle, or a photo_to_art OPS module path")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per case (default: 5)")
+    args = parser.parse_args()
+
+    cases = {name: load_ops(name) for name in args.ops}
+    results = asyncio.run(measure(cases, args.runs))
+    print(f"{'ops':<10}{'count':>7}{'paint_at':>12}{'apply_ops':>12}{'speedup':>9}"
+          f"{'+frame':>12}{'+frame':>12}  same")
+    for name, ops in cases.items():
+        each = [statistics.median(s[i] for s in results[(name, "paint_at")]) * 1000 for i in (0, 1)]
+        bulk = [statistics.median(s[i] for s in results[(name, "apply_ops")]) * 1000 for i in (0, 1)]
+        print(f"{Path(name).stem:<10}{len(ops):>7}{each[0]:10.2f}ms{bulk[0]:10.2f}ms"
+              f"{each[0] / bulk[0]:8.1f}x{each[1]:10.2f}ms{bulk[1]:10.2f}ms  "
+              f"{'yes' if results[(name, 'same')] else 'NO'}")
+    return 0 if all(results[(name, "same")] for name in cases) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
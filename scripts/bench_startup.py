@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Benchmark Purple's time-to-first-render under Textual's headless harness.
+
+Each run is a fresh interpreter (so imports are paid every time, like a real
+boot) that imports the app, mounts it with App.run_test() and reports how long
+it took to reach boot_log.mark_first_render(). Prints median/min/max over the
+runs; --json appends one line per invocation so numbers can be tracked across
+releases.
+
+Usage:
+    python scripts/bench_startup.py                    # 5 runs
+    python scripts/bench_startup.py --runs 15 --json startup.jsonl
+    python scripts/bench_startup.py --profile          # + on_mount phases, slowest imports
+
+--profile sets PURPLE_BOOT_PROFILE=1 in the children (see purple_tui/boot_log.py);
+the timings include the profiler's own overhead, so compare profiled runs only
+with other profiled runs.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD_ENV = {
+    "PURPLE_NO_EVDEV": "1",
+    "PURPLE_NO_AUDIO": "1",
+    "SDL_AUDIODRIVER": "dummy",
+    "PYGAME_HIDE_SUPPORT_PROMPT": "1",
+}
+
+
+def child() -> None:
+    """One measured startup. Prints a JSON result on the last stdout line."""
+    start = time.monotonic()
+    sys.path.insert(0, str(ROOT))
+    from purple_tui import boot_log
+    from purple_tui.constants import REQUIRED_TERMINAL_ROWS
+    from purple_tui.purple_tui import PurpleApp
+    imported = time.monotonic()
+
+    async def run():
+        app = PurpleApp()
+        async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+            await pilot.pause()
+
+    asyncio.run(run())
+    rendered = boot_log.first_render_at()
+    result = {
+        "import_s": imported - start,
+        "first_render_s": None if rendered is None else rendered - start,
+    }
+    if boot_log.PROFILE_ENABLED:
+        result.update(boot_log.profile_snapshot())
+    print(json.dumps(result))
+
+
+def run_once(profile: bool) -> dict:
+    env = {**os.environ, **CHILD_ENV}
+    if profile:
+        env["PURPLE_BOOT_PROFILE"] = "1"
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child"],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"startup run failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def summarize(values: list[float]) -> str:
+    ms = [v * 1000 for v in values]
+    return f"median {statistics.median(ms):7.1f}ms   min {min(ms):7.1f}ms   max {max(ms):7.1f}ms"
+
+
+def print_profile(results: list[dict], top: int) -> None:
+    phases = defaultdict(list)
+    for r in results:
+        for label, phase, ms in r.get("phases", []):
+            phases[f"{label}: {phase}"].append(ms)
+    if phases:
+        print("\nMedian on_mount phases:")
+        for name, values in phases.items():
+            print(f"  {statistics.median(values):7.1f}ms  {name}")
+
+    self_ms = defaultdict(list)
+    for r in results:
+        for module, _cumulative, ms in r.get("imports", []):
+            self_ms[module].append(ms)
+    slowest = sorted(self_ms.items(), key=lambda kv: statistics.median(kv[1]), reverse=True)[:top]
+    if slowest:
+        print(f"\nSlowest imports (median self time, top {top}):")
+        for module, values in slowest:
+            print(f"  {statistics.median(values):7.1f}ms  {module}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh-process startups to time (default: 5)")
+    parser.add_argument("--profile", action="store_true", help="Enable PURPLE_BOOT_PROFILE and report phases/imports")
+    parser.add_argument("--top", type=int, default=15, help="Imports to list with --profile (default: 15)")
+    parser.add_argument("--json", help="Append a summary line to this .jsonl file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return 0
+
+    results = []
+    for i in range(args.runs):
+        result = run_once(args.profile)
+        results.append(result)
+        print(f"run {i + 1}/{args.runs}: import {result['import_s'] * 1000:.0f}ms, "
+              f"first render {result['first_render_s'] * 1000:.0f}ms", flush=True)
+
+    imports = [r["import_s"] for r in results]
+    renders = [r["first_render_s"] for r in results]
+    print(f"\nimport purple_tui.purple_tui   {summarize(imports)}")
+    print(f"time to first render          {summarize(renders)}")
+    if args.profile:
+        print_profile(results, args.top)
+
+    if args.json:
+        record = {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "runs": args.runs,
+            "profiled": args.profile,
+            "median_import_ms": round(statistics.median(imports) * 1000, 1),
+            "median_first_render_ms": round(statistics.median(renders) * 1000, 1),
+            "min_first_render_ms": round(min(renders) * 1000, 1),
+        }
+        with open(args.json, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"\nappended to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark apply_zoom: single pass vs parallel segments.
+
+Generates a synthetic recording with FFmpeg's lavfi sources (testsrc2
+video plus a sine tone), a zoom script that zooms, pans and zooms out every
+few seconds, then times recording-setup/apply_zoom.py both ways and checks
+the outputs have the same frame count and duration.
+
+Usage:
+    python scripts/bench_zoom.py                       # 60s 1080p30, one job per CPU
+    python scripts/bench_zoom.py --duration 300 --jobs 4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "recording-setup"))
+
+from apply_zoom import apply_zoom  # noqa: E402
+
+
+def make_video(path: Path, duration: float, size: str, rate: int) -> None:
+    subprocess.run([
+        "ffmpeg", "-y", "-v", "error",
+        "-f", "lavfi", "-i", f"testsrc2=size={size}:rate={rate}:duration={duration}",
+        "-f", "lavfi", "-i", f"sine=frequency=440:duration={duration}",
+        "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p",
+        "-c:a", "aac", "-shortest",
+        str(path),
+    ], check=True)
+
+
+def make_events(duration: float, period: float = 6.0) -> list[dict]:
+    """Zoom in, pan down, pan back, zoom out: one cycle per `period` seconds."""
+    events = []
+    t = 1.0
+    while t + period <= duration:
+        events += [
+            {"time": t, "action": "zoom_in", "region": "viewport", "zoom": 1.8, "duration": 0.4},
+            {"time": t + 1.5, "action": "pan_to", "y": 0.65, "duration": 0.3},
+            {"time": t + 3.0, "action": "pan_to", "y": 0.4, "duration": 0.3},
+            {"time": t + 4.5, "action": "zoom_out", "duration": 0.4},
+        ]
+        t += period
+    return events
+
+
+def count_frames(path: Path) -> tuple[int, float]:
+    result = subprocess.run([
+        "ffprobe", "-v", "error", "-count_frames", "-select_streams", "v:0",
+        "-show_entries", "stream=nb_read_frames:format=duration", "-of", "json", str(path),
+    ], capture_output=True, text=True, check=True)
+    data = json.loads(result.stdout)
+    return int(data["streams"][0]["nb_read_frames"]), float(data["format"]["duration"])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--duration", type=float, default=60.0, help="Test video length (default: 60s)")
+    parser.add_argument("--size", default="1920x1080", help="Test video size (default: 1920x1080)")
+    parser.add_argument("--rate", type=int, default=30, help="Test video fps (default: 30)")
+    parser.add_argument("--jobs", type=int, default=0, help="Parallel jobs (default: 0 = one per CPU)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_zoom_") as tmp:
+        tmp_dir = Path(tmp)
+        source = tmp_dir / "source.mp4"
+        events_file = tmp_dir / "events.json"
+        make_video(source, args.duration, args.size, args.rate)
+        events = make_events(args.duration)
+        events_file.write_text(json.dumps(events))
+        print(f"{args.duration:.0f}s {args.size}@{args.rate}, {len(events)} zoom events")
+
+        timings = {}
+        for label, jobs in (("single pass", 1), ("segmented", args.jobs)):
+            output = tmp_dir / f"out_{jobs}.mp4"
+            start = time.perf_counter()
+            if not apply_zoom(source, events_file, output, jobs=jobs):
+                print(f"{label}: FAILED", file=sys.stderr)
+                return 1
+            timings[label] = (time.perf_counter() - start, *count_frames(output))
+
+        jobs = args.jobs or os.cpu_count() or 1
+        print(f"\n{'mode':<14}{'time':>9}{'frames':>9}{'duration':>10}")
+        for label, (seconds, frames, duration) in timings.items():
+            print(f"{label:<14}{seconds:8.1f}s{frames:>9}{duration:9.2f}s")
+        single, segmented = timings["single pass"][0], timings["segmented"][0]
+        print(f"\nSpeedup with {jobs} jobs: {single / segmented:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Convert generated demo scripts from Python modules to action streams.
+
+Segments written by tools/install_art_demo.py used to be Python modules of
+literal PressKey/MoveSequence constructors (SEGMENT or RECORDED_DRAWING,
+plus SPEED_MULTIPLIER). This writes each as a .actions file next to the
+module (see purple_tui/playback/stream.py), checks that it decodes to the
+same actions, and prints what loading each form costs:
+
+    compile   cold import: parse and compile the source, then run it
+    cached    warm import: unmarshal the .pyc bytecode, then run it
+    stream    decode every action from the .actions bytes
+
+The demo loader prefers the .actions file when both exist; --remove
+deletes the module once its stream is verified.
+
+Usage:
+    python scripts/convert_demo_segments.py purple_tui/demo/segments/heart.py
+    python scripts/convert_demo_segments.py --remove purple_tui/demo/recorded_script.py
+    python scripts/convert_demo_segments.py --compare-only purple_tui/demo/segments/*.py
+"""
+
+import argparse
+import importlib
+import marshal
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from purple_tui.playback import stream  # noqa: E402
+
+
+def module_name(path: Path) -> str:
+    return ".".join(path.resolve().relative_to(ROOT).with_suffix("").parts)
+
+
+def best_of(runs: int, fn) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_costs(path: Path, name: str, data: bytes, runs: int) -> tuple[int, float, float, float]:
+    """(.pyc size, compile, cached and stream load times)."""
+    source = path.read_text()
+    namespace = {"__name__": name, "__package__": name.rpartition(".")[0]}
+    compiled = marshal.dumps(compile(source, str(path), "exec"))
+    return (
+        len(compiled),
+        best_of(runs, lambda: exec(compile(source, str(path), "exec"), dict(namespace))),
+        best_of(runs, lambda: exec(marshal.loads(compiled), dict(namespace))),
+        best_of(runs, lambda: list(stream.iter_actions(data))),
+    )
+
+
+def convert(path: Path, write: bool) -> tuple[str, list, bytes]:
+    name = module_name(path)
+    mod = importlib.import_module(name)
+    actions = getattr(mod, "SEGMENT", None) or getattr(mod, "RECORDED_DRAWING", None)
+    if actions is None:
+        raise SystemExit(f"{path}: defines neither SEGMENT nor RECORDED_DRAWING")
+    meta = {"speed_multiplier": getattr(mod, "SPEED_MULTIPLIER", 1.0)}
+    data = stream.dumps(actions, meta)
+    if list(stream.iter_actions(data)) != actions:
+        raise SystemExit(f"{path}: stream doesn't decode to the same actions")
+    if write:
+        path.with_suffix(stream.SUFFIX).write_bytes(data)
+    return name, actions, data
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("modules", nargs="+", type=Path, help="Segment or recorded_script .py files")
+    parser.add_argument("--remove", action="store_true", help="Delete each module after converting it")
+    parser.add_argument("--compare-only", action="store_true", help="Report costs without writing anything")
+    parser.add_argument("--runs", type=int, default=5, help="Timing runs per measurement, best kept (default: 5)")
+    args = parser.parse_args()
+
+    print(f"{'module':<32}{'actions':>8}{'source':>9}{'pyc':>8}{'stream':>8}"
+          f"{'compile':>10}{'cached':>9}{'stream':>9}")
+    for path in args.modules:
+        name, actions, data = convert(path, write=not args.compare_only)
+        pyc, cold, cached, decode = load_costs(path, name, data, args.runs)
+        print(f"{path.stem:<32}{len(actions):>8}{path.stat().st_size / 1024:8.1f}K{pyc / 1024:7.1f}K"
+              f"{len(data) / 1024:7.1f}K"
+              f"{cold * 1000:8.1f}ms{cached * 1000:7.1f}ms{decode * 1000:7.1f}ms")
+        if args.remove and not args.compare_only:
+            path.unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Play the demo headlessly on a virtual clock and screenshot it.
+
+Boots the app under Textual's headless driver on purple_tui/clock.py's
+VirtualClockLoop, plays the active composition (or one segment) to the
+end, and saves an SVG screenshot every --every seconds of demo time plus
+one at the end. Simulated time jumps over every pause, so a minute of demo
+takes a few seconds, and with the same PURPLE_DEMO_SEED two runs produce
+identical screenshots (diff them to review a script change).
+
+Usage:
+    python scripts/demo_check.py                          # demo.json, final shot only
+    python scripts/demo_check.py --segment tune_updated --every 2
+    python scripts/demo_check.py --composition ad.json --out /tmp/ad
+    python scripts/demo_check.py --realtime               # same, at real speed
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Set environment before any app imports
+os.environ['PURPLE_NO_EVDEV'] = '1'
+os.environ['PURPLE_DEV_MODE'] = '1'
+os.environ['PURPLE_NO_AUDIO'] = '1'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from purple_tui.clock import loop_time, run_virtual  # noqa: E402
+from purple_tui.constants import REQUIRED_TERMINAL_ROWS  # noqa: E402
+from purple_tui.purple_tui import PurpleApp  # noqa: E402
+
+
+async def play(out_dir: Path, every: float | None) -> tuple[float, list[Path]]:
+    """Play the demo to the end. Returns (demo seconds, screenshots)."""
+    shots: list[Path] = []
+
+    def shot(app: PurpleApp, label: str) -> None:
+        path = out_dir / f"demo_{len(shots):03d}_{label}.svg"
+        app.save_screenshot(str(path))
+        shots.append(path)
+
+    app = PurpleApp()
+    async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+        await pilot.pause()
+        start = loop_time()
+        app.start_demo()
+        demo = app._demo_task
+        while every and not demo.done():
+            await asyncio.wait([demo], timeout=every)
+            if not demo.done():
+                shot(app, f"t{loop_time() - start:06.1f}")
+        await demo
+        elapsed = loop_time() - start
+        await pilot.pause()
+        shot(app, "end")
+    return elapsed, shots
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--segment", help="Play only this segment of the composition")
+    parser.add_argument("--composition", help="Composition json in purple_tui/demo/ (default: demo.json)")
+    parser.add_argument("--every", type=float, help="Also screenshot every N seconds of demo time")
+    parser.add_argument("--out", type=Path, default=Path(os.environ.get("PURPLE_SCREENSHOT_DIR", "/tmp/screenshots")),
+                        help="Screenshot directory (default: $PURPLE_SCREENSHOT_DIR or /tmp/screenshots)")
+    parser.add_argument("--realtime", action="store_true", help="Run on the real clock, for comparison")
+    args = parser.parse_args()
+
+    if args.segment:
+        os.environ["PURPLE_DEMO_SEGMENT"] = args.segment
+    if args.composition:
+        os.environ["PURPLE_DEMO_COMPOSITION"] = args.composition
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    wall = time.perf_counter()
+    if args.realtime:
+        elapsed, shots = asyncio.run(play(args.out, args.every))
+    else:
+        elapsed, shots = run_virtual(play(args.out, args.every))
+    wall = time.perf_counter() - wall
+
+    for path in shots:
+        print(path)
+    clock = "real" if args.realtime else "virtual"
+    print(f"\n{elapsed:.1f}s of demo in {wall:.1f}s wall ({clock} clock, "
+          f"seed {os.environ.get('PURPLE_DEMO_SEED', '42')})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
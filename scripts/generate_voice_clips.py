@@ -275,9 +275,10 @@ def _stub_ui_modules():
 
 def _collect_all_actions() -> list:
     """Collect all demo actions from composition segments and fallback script."""
-    import importlib
     import json
 
+    from purple_tui.demo import _load_segment
+
     actions = []
 
     # Scan the active composition (PURPLE_DEMO_COMPOSITION selects ad.json etc.)
@@ -286,11 +287,9 @@ def _collect_all_actions() -> list:
     if demo_json.exists():
         entries = json.loads(demo_json.read_text())
         for entry in entries:
-            name = entry["segment"]
-            mod = importlib.import_module(
-                f"purple_tui.demo.segments.{name}"
-            )
-            actions.extend(mod.SEGMENT)
+            # Generated segments are .actions streams, hand-written ones modules
+            segment, _ = _load_segment(entry["segment"])
+            actions.extend(segment)
 
     # Also scan the default script as fallback
     from purple_tui.demo.default_script import DEMO_SCRIPT
@@ -26,6 +26,9 @@ Usage:
     # Combine everything
     just preview art code_panel type:print key:enter
 
+    # Play one demo segment to the end on the virtual clock (seconds, not minutes)
+    PURPLE_DEMO_SEGMENT=tune_updated just preview --virtual-clock demo
+
 Actions (processed left to right):
     code_panel       Toggle the code panel on
     parent_menu      Open the parent menu
@@ -38,15 +41,35 @@ Actions (processed left to right):
     photo            Paint the Secret Menu photo onto the Art canvas
     time_travel      Open the Time Travel scrubber in the current room
     first_boot       Show the first-boot power-cycle screen
+    demo             Play the demo (PURPLE_DEMO_SEGMENT/_COMPOSITION apply) to the end
+
+--virtual-clock runs on simulated time (purple_tui/clock.py): waits and
+timers complete without real sleeping, and results are reproducible.
 
 Output: path to the PNG (or SVG if PNG conversion unavailable).
+
+Batch mode renders many previews from one app boot:
+
+    just preview --batch previews.json [--themes purple-dark,purple-light] [--workers 8]
+
+previews.json is a list of {"name": ..., "room": ..., "actions": [...],
+"theme": ...} entries, every field optional. Between sequences the app is
+put back into a just-started state (modals, panels and Time Travel
+closed, room widgets and the color legend remounted, default theme), and
+each screenshot's SVG is written and converted to PNG in a worker pool
+while the next sequence runs. --themes renders every sequence once per
+theme. Prints one path per preview and the wall time.
 """
 
+import argparse
 import asyncio
+import json
 import os
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Set environment before any app imports
 os.environ['PURPLE_NO_EVDEV'] = '1'
@@ -66,8 +89,11 @@ sys.stderr = io.StringIO()
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from purple_tui.purple_tui import PurpleApp  # noqa: E402
+from purple_tui.purple_tui import PurpleApp, Room  # noqa: E402
 from purple_tui.constants import ROOM_PLAY, ROOM_MUSIC, ROOM_ART  # noqa: E402
+from purple_tui.clock import run_virtual  # noqa: E402
+from purple_tui.rooms.art_room import ColorLegend  # noqa: E402
+from purple_tui.timeline import RoomTimeline  # noqa: E402
 
 # Restore
 sys.stdout = _real_stdout
@@ -81,6 +107,13 @@ ROOM_MAP = {
 }
 
 
+def write_and_convert(svg: str, svg_path: str, png_path: str) -> str:
+    """Worker-pool job: write an exported SVG, convert it, return the output path."""
+    with open(svg_path, "w", encoding="utf-8") as f:
+        f.write(svg)
+    return png_path if svg_to_png(svg_path, png_path) else svg_path
+
+
 def svg_to_png(svg_path: str, png_path: str) -> bool:
     """Convert SVG to PNG using rsvg-convert (via nix-shell if needed)."""
     rsvg = shutil.which("rsvg-convert")
@@ -146,6 +179,10 @@ async def run_action(app, action_str: str) -> None:
         (paint_doodle if action_str == "doodle" else paint_photo)(app)
         await asyncio.sleep(1.0)
 
+    elif action_str == "demo":
+        app.start_demo()
+        await app._demo_task
+
     elif action_str == "clear":
         await app._execute_dev_command({"action": "clear"})
         await asyncio.sleep(0.1)
@@ -221,8 +258,121 @@ async def preview(room_name: str, actions: list[str]) -> str:
     return svg_path
 
 
+async def reset_app(app, pilot) -> None:
+    """Put a booted app back into a just-started state between batch previews.
+
+    The room widgets and the color legend are remounted rather than reset
+    field by field, so nothing a sequence did (paint mode, the legend's
+    active row, the Try hint, the music grid...) leaks into the next one.
+    """
+    app.cancel_demo()
+    while len(app.screen_stack) > 1:
+        app.pop_screen()
+    if app._time_travel is not None:
+        app._cancel_time_travel()
+    if app._code_panel_active:
+        app._close_repl_panel()
+    app._silence_music()
+    app.clear_notifications()
+
+    # Fresh (RAM-only in dev mode) timelines, so remounted rooms start blank
+    app._timeline_pending.clear()
+    app._timelines = {room: RoomTimeline(room) for room in app._timelines}
+    app._timeline_restored.clear()
+
+    app.active_theme = "purple-dark"
+    app._apply_theme()
+    await app.query_one("#content-area").remove_children()
+    await app.query_one("#paint-legend", ColorLegend).remove()
+    await app.query_one("#viewport-row").mount(ColorLegend(id="paint-legend"), after="#viewport")
+
+    # Mounts a new Play room and sets the title, indicators and legend the
+    # way on_mount does. The new room has not composed yet, so the switch
+    # cannot advance its Try hint the way a real switch back to Play would.
+    app._complete_room_switch(Room.PLAY)
+    # Settle as long as a fresh boot does, so timers such as the Art cursor
+    # blink are in the same phase as in a single preview
+    await pilot.pause()
+    await asyncio.sleep(0.5)
+    await pilot.pause()
+
+
+def load_batch(path: str, themes: list[str]) -> list[dict]:
+    """Batch specs from a JSON file, with defaults filled in and one copy
+    per theme when `themes` is given."""
+    with open(path) as f:
+        specs = json.load(f)
+    result = []
+    for spec in specs:
+        room = spec.get("room", "play")
+        actions = spec.get("actions", [])
+        base = {"name": spec.get("name") or build_filename(room, actions), "room": room,
+                "actions": actions, "theme": spec.get("theme")}
+        if not themes:
+            result.append(base)
+        for theme in themes:
+            result.append({**base, "name": f"{base['name']}_{theme}", "theme": theme})
+    return result
+
+
+async def preview_batch(specs: list[dict], workers: int) -> list[str]:
+    """Run every spec against one app; returns output paths in spec order."""
+    os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+    start = time.perf_counter()
+    jobs: list[Future] = []
+    app = PurpleApp()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        async with app.run_test(size=(146, 38)) as pilot:
+            await pilot.pause()
+            await asyncio.sleep(0.5)
+            await pilot.pause()
+            booted = time.perf_counter()
+
+            for spec in specs:
+                await reset_app(app, pilot)
+                if spec["theme"]:
+                    app.active_theme = spec["theme"]
+                    app._apply_theme()
+                room_id = ROOM_MAP.get(spec["room"], ROOM_PLAY[0])
+                if room_id != ROOM_PLAY[0]:
+                    app.action_switch_room(room_id)
+                    await pilot.pause()
+                    await asyncio.sleep(0.3)
+                    await pilot.pause()
+                for action_str in spec["actions"]:
+                    await run_action(app, action_str)
+                    await pilot.pause()
+                stem = os.path.join(SCREENSHOT_DIR, spec["name"])
+                jobs.append(pool.submit(write_and_convert, app.export_screenshot(),
+                                        f"{stem}.svg", f"{stem}.png"))
+            ran = time.perf_counter()
+        paths = [job.result() for job in jobs]
+    done = time.perf_counter()
+
+    print(f"{len(specs)} previews in {done - start:.1f}s: boot {booted - start:.1f}s, "
+          f"sequences {ran - booted:.1f}s, conversion tail {done - ran:.1f}s "
+          f"({workers} workers)", file=sys.stderr)
+    return paths
+
+
 def main():
-    args = sys.argv[1:]
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--virtual-clock", action="store_true")
+    parser.add_argument("--batch")
+    parser.add_argument("--themes", default="")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-h", "--help", action="store_true")
+    opts, args = parser.parse_known_args()
+    if opts.help:
+        print(__doc__)
+        return
+    run = run_virtual if opts.virtual_clock else asyncio.run
+
+    if opts.batch:
+        themes = [t for t in opts.themes.split(",") if t]
+        for path in run(preview_batch(load_batch(opts.batch, themes), max(1, opts.workers))):
+            print(path)
+        return
 
     # First arg is room (or default to play)
     if args and args[0] in ROOM_MAP:
@@ -232,8 +382,7 @@ def main():
         room = "play"
         actions = args
 
-    result = asyncio.run(preview(room, actions))
-    print(result)
+    print(run(preview(room, actions)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Replay Play room inputs through the evaluator and report the slowest stages.
+
+By default the corpus is every string literal passed to .evaluate(...) in the
+Play room tests, so it covers the same sentences the suite pins down.
+
+Usage:
+    python scripts/profile_play_eval.py                    # test corpus
+    python scripts/profile_play_eval.py inputs.txt         # one input per line
+    python scripts/profile_play_eval.py -e "i love 3 big red dinosuars"
+    python scripts/profile_play_eval.py --repeat 20 --top 15 --jsonl eval.jsonl
+
+Prints per-stage totals (inclusive wall time and call counts) across the run,
+then the slowest individual inputs with their top stages.
+"""
+
+import argparse
+import ast
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('PURPLE_NO_EVDEV', '1')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from purple_tui.eval_profile import EvalProfiler, format_record, jsonl_sink  # noqa: E402
+from purple_tui.rooms.play_room import SimpleEvaluator  # noqa: E402
+
+DEFAULT_CORPUS = (
+    ROOT / "tests" / "test_play_mode.py",
+    ROOT / "tests" / "test_play_kid_sentences.py",
+)
+
+
+def inputs_from_tests(path: Path) -> list[str]:
+    """String literals passed as the first argument to any .evaluate() call."""
+    found = []
+    for node in ast.walk(ast.parse(path.read_text())):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "evaluate" and node.args
+                and isinstance(node.args[0], ast.Constant)
+                and isinstance(node.args[0].value, str)):
+            found.append(node.args[0].value)
+    return found
+
+
+def load_corpus(paths: list[str], exprs: list[str]) -> list[str]:
+    corpus = list(exprs)
+    for p in paths:
+        path = Path(p)
+        if path.suffix == ".py":
+            corpus.extend(inputs_from_tests(path))
+        else:
+            corpus.extend(line for line in path.read_text().splitlines() if line.strip())
+    if not corpus:
+        for path in DEFAULT_CORPUS:
+            if path.exists():
+                corpus.extend(inputs_from_tests(path))
+    # Keep first-seen order, drop duplicates
+    return list(dict.fromkeys(corpus))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("files", nargs="*", help="Input files (.py test modules or one input per line)")
+    parser.add_argument("-e", "--expr", action="append", default=[], help="Input to evaluate (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the corpus (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="Stages and inputs to show (default: 10)")
+    parser.add_argument("--jsonl", help="Also append every record to this JSONL file")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.files, args.expr)
+    if not corpus:
+        print("No inputs found.", file=sys.stderr)
+        return 1
+
+    evaluator = SimpleEvaluator()
+    for text in corpus:  # warm content tables and fuzzy memos untimed
+        evaluator.evaluate(text)
+
+    profiler = EvalProfiler(sink=jsonl_sink(args.jsonl) if args.jsonl else None,
+                            keep=len(corpus) * args.repeat)
+    profiler.attach(evaluator)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for text in corpus:
+            evaluator.evaluate(text)
+    wall = time.perf_counter() - start
+    profiler.detach()
+
+    n = len(profiler.records)
+    print(f"{len(corpus)} inputs x {args.repeat} passes = {n} evaluations "
+          f"in {wall * 1000:.1f}ms ({wall * 1e6 / n:.0f}us each)\n")
+
+    print(f"{'stage':<34} {'total ms':>10} {'calls':>8} {'us/call':>9}")
+    for name, ms, calls in profiler.summary()[:args.top]:
+        print(f"{name:<34} {ms:>10.2f} {calls:>8} {ms * 1000 / calls:>9.1f}")
+
+    # Slowest inputs: best-of-repeats, so one GC pause doesn't crown a winner
+    best: dict[str, dict] = {}
+    for record in profiler.records:
+        if record["text"] not in best or record["total_ms"] < best[record["text"]]["total_ms"]:
+            best[record["text"]] = record
+    print(f"\nslowest {args.top} inputs (best of {args.repeat}):")
+    for record in sorted(best.values(), key=lambda r: -r["total_ms"])[:args.top]:
+        print("  " + format_record(record, top=3).removeprefix("[EvalProfile] "))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
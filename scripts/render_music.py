@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Render Music room loops, replays and Music code to a WAV, faster than real time.
+
+Usage:
+    python scripts/render_music.py -e "play ukulele" -e "fast qwerty" -o song.wav
+    python scripts/render_music.py --code song.txt -o song.wav      # one line per REPL entry
+    python scripts/render_music.py --loop loop.json --cycles 4 -o loop.wav
+    python scripts/render_music.py --session replay.json -o replay.wav
+
+loop.json:    {"duration": 4.0, "events": [["A", "music", 0.5, 0], ...]}
+              (LoopStation.schedule: key, mode, offset, instrument index)
+replay.json:  {"events": [["A", "music", 0.0], ["S", "music", 0.25], ...]}
+              (MusicSession.get_replay: key, mode, delay from previous)
+
+Samples come from packs/core-sounds; nothing plays through the speakers.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from purple_tui.music_constants import DEFAULT_ROOT_INDEX, FRIENDLY_KEY_NAMES  # noqa: E402
+from purple_tui.music_render import (  # noqa: E402
+    DEFAULT_SOUNDS, SampleBank, events_from_code, events_from_loop,
+    events_from_session, instrument_index, render, write_wav,
+)
+from purple_tui.music_session import MODE_LETTERS, MODE_MUSIC  # noqa: E402
+
+
+def parse_root(value: str) -> int:
+    """Root key by name ("C", "G", "Bb") or FRIENDLY_KEYS index."""
+    if value.isdigit():
+        return int(value)
+    names = {name.lower().replace("♭", "b").replace("♯", "#"): i
+             for i, name in enumerate(FRIENDLY_KEY_NAMES)}
+    try:
+        return names[value.lower()]
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"unknown key {value!r}, pick one of {', '.join(FRIENDLY_KEY_NAMES)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("-e", "--expr", action="append", help="Music code line (repeatable)")
+    src.add_argument("--code", help="File of Music code, one line per entry")
+    src.add_argument("--loop", help="Loop JSON (duration + schedule)")
+    src.add_argument("--session", help="Replay JSON (key, mode, delay triples)")
+    parser.add_argument("-o", "--output", required=True, help="WAV file to write")
+    parser.add_argument("--cycles", type=int, default=1, help="Loop passes to render (default: 1)")
+    parser.add_argument("--instrument", default="marimba", help="Starting instrument (default: marimba)")
+    parser.add_argument("--letters", action="store_true", help="Start in letters mode")
+    parser.add_argument("--root", type=parse_root, default=DEFAULT_ROOT_INDEX,
+                        help="Key the grid is in, e.g. C, G, Bb (default: C)")
+    parser.add_argument("--no-tail", action="store_true", help="Cut at the last beat instead of letting notes ring")
+    parser.add_argument("--jobs", type=int, default=1, help="Mixing processes (default: 1)")
+    parser.add_argument("--sounds", default=str(DEFAULT_SOUNDS), help="Sound pack content directory")
+    args = parser.parse_args()
+
+    instrument = instrument_index(args.instrument)
+    if instrument is None:
+        parser.error(f"unknown instrument {args.instrument!r}")
+    mode = MODE_LETTERS if args.letters else MODE_MUSIC
+
+    duration = None
+    if args.expr or args.code:
+        lines = args.expr or [ln for ln in Path(args.code).read_text().splitlines() if ln.strip()]
+        notes, duration = events_from_code(lines, mode=mode, instrument=instrument)
+    elif args.loop:
+        data = json.loads(Path(args.loop).read_text())
+        notes = events_from_loop(data["events"], data["duration"], cycles=args.cycles)
+        duration = data["duration"] * args.cycles
+    else:
+        data = json.loads(Path(args.session).read_text())
+        notes = events_from_session(data["events"], instrument=data.get("instrument", instrument))
+
+    if not notes:
+        print("Nothing to play.", file=sys.stderr)
+        return 1
+
+    bank = SampleBank(args.sounds)
+    start = time.perf_counter()
+    audio = render(notes, bank, root_index=args.root, duration=duration,
+                   tail=not args.no_tail, jobs=args.jobs)
+    write_wav(args.output, audio, bank.rate)
+    wall = time.perf_counter() - start
+    seconds = len(audio) / bank.rate
+    print(f"{len(notes)} notes, {seconds:.1f}s of audio in key of "
+          f"{FRIENDLY_KEY_NAMES[args.root]} "
+          f"rendered in {wall:.2f}s ({seconds / max(wall, 1e-9):.0f}x real time) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
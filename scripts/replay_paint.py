@@ -49,10 +49,7 @@ async def replay(ops: list[dict]) -> str:
         await pilot.pause()
 
         canvas = app.query_one(ArtMode).query_one(ArtCanvas)
-        for op in ops:
-            canvas.paint_at(int(op["x"]), int(op["y"]), op["color"])
-        canvas._invalidate_all()
-        canvas.refresh()
+        canvas.apply_ops((int(op["x"]), int(op["y"]), op["color"]) for op in ops)
         await pilot.pause()
         await asyncio.sleep(0.2)
         await pilot.pause()
@@ -1,8 +1,11 @@
 """Tests for recording-setup/apply_zoom.py keyframe and expression math."""
 
+import argparse
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add recording-setup to path so we can import apply_zoom
 sys.path.insert(0, str(Path(__file__).parent.parent / "recording-setup"))
 
@@ -12,7 +15,11 @@ from apply_zoom import (
     build_zoompan_expr,
     cursor_events_to_pans,
     get_crop_rect,
+    hold_intervals,
+    job_count,
     keyframes_to_zoom,
+    plan_segments,
+    segment_keyframes,
 )
 
 
@@ -368,3 +375,75 @@ class TestCursorEventsToPans:
         assert len(result) == 0
 
 
+
+
+def _evaluate(zoom_keyframes, t, idx):
+    """What build_zoompan_expr's expression yields at in_time t."""
+    for (t0, *v0), (t1, *v1) in zip(zoom_keyframes, zoom_keyframes[1:]):
+        if t < t1:
+            a, b = v0[idx - 1], v1[idx - 1]
+            if (abs(a - b) < 0.001) if idx == 1 else a == b:
+                return a
+            p = min(max((t - t0) / (t1 - t0), 0), 1)
+            value = a + (b - a) * p * p * (3 - 2 * p)
+            return value if idx == 1 else int(value)
+    return zoom_keyframes[-1][idx]
+
+
+class TestSegments:
+    FPS = 30.0
+    EVENTS = [
+        {"time": 2.0, "action": "zoom_in", "region": "viewport", "zoom": 2.0, "duration": 0.5},
+        {"time": 6.0, "action": "pan_to", "y": 0.3, "duration": 0.3},
+        {"time": 11.0, "action": "zoom_out", "duration": 0.4},
+        {"time": 15.0, "action": "zoom_in", "region": "viewport", "zoom": 1.5, "duration": 0},
+    ]
+
+    def _zkf(self, duration=20.0):
+        return keyframes_to_zoom(build_keyframes(self.EVENTS, VW, VH, duration), VW)
+
+    def test_hold_intervals_skip_transitions(self):
+        holds = hold_intervals(self._zkf())
+        assert (2.5, 6.0) in holds
+        assert all(not (t0 < 2.2 < t1) for t0, t1 in holds)
+
+    def test_segments_cover_video_and_cut_only_in_holds(self):
+        zkf = self._zkf()
+        segments = plan_segments(zkf, 20.0, self.FPS, jobs=4)
+        assert segments[0][0] == 0 and segments[-1][1] == 600
+        assert all(a[1] == b[0] for a, b in zip(segments, segments[1:]))
+        assert len(segments) > 2
+        holds = hold_intervals(zkf)
+        for _, cut in segments[:-1]:
+            assert any(t0 < cut / self.FPS < t1 for t0, t1 in holds)
+
+    def test_no_holds_means_one_segment(self):
+        zkf = [(0.0, 1.0, 0, 0), (10.0, 2.0, 100, 100)]
+        assert plan_segments(zkf, 10.0, self.FPS, jobs=8) == [(0, 300)]
+
+    def test_short_video_not_split(self):
+        assert len(plan_segments(self._zkf(3.0), 3.0, self.FPS, jobs=8)) == 1
+
+    def test_segment_expressions_match_the_whole(self):
+        """Every frame gets the same camera from its segment's keyframes."""
+        zkf = self._zkf()
+        segments = plan_segments(zkf, 20.0, self.FPS, jobs=4)
+        for first, last in segments:
+            end = last / self.FPS if last < 600 else None
+            local = segment_keyframes(zkf, first / self.FPS, end)
+            assert len(local) <= len(zkf)
+            for frame in range(first, last):
+                for idx in (1, 2, 3):
+                    whole = _evaluate(zkf, frame / self.FPS, idx)
+                    part = _evaluate(local, (frame - first) / self.FPS, idx)
+                    assert abs(whole - part) <= (1e-6 if idx == 1 else 1), (frame, idx)
+
+
+class TestJobCount:
+    def test_accepts_zero_and_positive(self):
+        assert job_count("0") == 0
+        assert job_count("4") == 4
+
+    def test_rejects_negative(self):
+        with pytest.raises(argparse.ArgumentTypeError):
+            job_count("-1")
@@ -10,6 +10,8 @@ import sys
 import os
 from pathlib import Path
 
+import pytest
+
 # Add tools dir to path for imports
 TOOLS_DIR = Path(__file__).parent.parent / "tools"
 sys.path.insert(0, str(TOOLS_DIR.parent))
@@ -491,6 +493,10 @@ class TestReferenceImage:
 class TestImagesAreSimilar:
     """Test the _images_are_similar pixel comparison function."""
 
+    @pytest.fixture(autouse=True)
+    def _needs_pil(self):
+        pytest.importorskip("PIL")
+
     def _make_image(self, width, height, color):
         """Create a solid-color PIL Image."""
         try:
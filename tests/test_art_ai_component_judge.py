@@ -0,0 +1,85 @@
+"""Tests for art_ai's per-component judge skipping unchanged components.
+
+Component crops are cached by region content, so a candidate component
+whose pixels equal the library's best version comes back as the same
+base64 string. judge_components_batch keeps the library version for those
+without asking the judge, and only sends the components that changed.
+"""
+
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from art_ai import ComponentLibrary, ComponentVersion, judge_components_batch
+
+COMPOSITION = {
+    "sky": {"x_range": [0, 132], "y_range": [0, 10]},
+    "tree": {"x_range": [10, 30], "y_range": [5, 25]},
+    "sun": {"x_range": [100, 120], "y_range": [1, 6]},
+}
+
+
+class FakeClient:
+    """anthropic.Anthropic stand-in that records each messages.create call."""
+
+    calls: list[dict] = []
+
+    def __init__(self, api_key=None):
+        self.messages = self
+
+    def create(self, **kwargs):
+        FakeClient.calls.append(kwargs)
+        reply = {"components": {"sky": {"winner": "A", "reasoning": "brighter",
+                                        "scores_a": {"shape_accuracy": 5},
+                                        "scores_b": {"shape_accuracy": 2}}}}
+        return types.SimpleNamespace(content=[types.SimpleNamespace(text=json.dumps(reply))])
+
+
+@pytest.fixture(autouse=True)
+def fake_anthropic(monkeypatch):
+    FakeClient.calls = []
+    monkeypatch.setitem(sys.modules, "anthropic", types.SimpleNamespace(Anthropic=FakeClient))
+
+
+def _library(**crops):
+    library = ComponentLibrary(composition=COMPOSITION)
+    for name, crop in crops.items():
+        library.best[name] = ComponentVersion(iteration="1a", actions_text="", actions=[],
+                                              image_base64=crop)
+    return library
+
+
+def _images(call):
+    return [part["source"]["data"] for part in call["messages"][0]["content"]
+            if part["type"] == "image"]
+
+
+def test_unchanged_components_skip_the_judge():
+    library = _library(sky="SKY", tree="TREE")
+    results = judge_components_batch({"sky": "SKY", "tree": "TREE"}, library, "a tree", "key")
+
+    assert FakeClient.calls == []
+    assert {name: r["winner"] for name, r in results.items()} == {"sky": "library", "tree": "library"}
+    assert results["tree"]["scores_candidate"] is None
+
+
+def test_only_changed_components_are_sent():
+    library = _library(sky="SKY", tree="TREE")
+    candidate = {"sky": "SKY-2", "tree": "TREE", "sun": "SUN"}
+    results = judge_components_batch(candidate, library, "a tree", "key")
+
+    (call,) = FakeClient.calls
+    assert sorted(_images(call)) == ["SKY", "SKY-2"]
+    assert "tree" not in call["system"].split("The components are:")[1].split("\n")[0]
+
+    assert results["tree"]["winner"] == "library"
+    assert results["tree"]["reasoning"] == "Unchanged from library version"
+    # The judge picked A; which side that was depends on the random swap
+    swapped = _images(call)[0] == "SKY"
+    assert results["sky"]["winner"] == ("library" if swapped else "candidate")
+    assert results["sun"]["winner"] == "candidate"  # nothing in the library yet
@@ -0,0 +1,122 @@
+"""ArtCanvas.apply_ops must leave the canvas exactly as paint_at per op would.
+
+apply_ops is the bulk path for replays and saved pictures: it resolves each
+color key once and writes cells straight into the grid. These tests paint
+the same ops both ways and compare grid, painted cells, cursor and brush,
+covering mixing over earlier paint, letters under paint, hex colors,
+unmapped keys and out-of-range coordinates.
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+os.environ['PURPLE_NO_EVDEV'] = '1'
+os.environ['PURPLE_DEV_MODE'] = '1'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+os.environ.setdefault('ORT_LOGGING_LEVEL', '3')
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+
+from purple_tui.purple_tui import PurpleApp
+from purple_tui.constants import REQUIRED_TERMINAL_ROWS
+from purple_tui.rooms.art_room import ArtCanvas, ArtMode, GUTTER
+from purple_tui.secret_doodle import build_ops, paint_photo
+from purple_tui.secret_photo import OPS as PHOTO_OPS
+
+APP_SIZE = (146, REQUIRED_TERMINAL_ROWS)
+SETTLE = 0.4
+
+OPS = [
+    (3, 2, 'f'), (4, 2, 'f'), (3, 2, 'c'),     # yellow, then blue over it
+    (5, 2, '#12ab34'), (5, 2, 'r'),            # hex, then a key over it
+    (6, 2, '?'),                               # unmapped: current color
+    (7, 2, '1'), (7, 2, '1'),                  # grayscale twice
+    (-4, 500, 'z'), (9999, -1, 'Q'),           # clamped to the edges
+    (10, 4, 'f'), (10, 4, 'F'),
+]
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@asynccontextmanager
+async def _app():
+    app = PurpleApp()
+    async with app.run_test(size=APP_SIZE) as pilot:
+        await pilot.pause()
+        await asyncio.sleep(SETTLE)
+        await pilot.pause()
+        app.action_switch_room("art")
+        await pilot.pause()
+        await asyncio.sleep(SETTLE)
+        await pilot.pause()
+        yield app, pilot
+
+
+def _state(canvas: ArtCanvas):
+    return (dict(canvas._grid), set(canvas._painted_positions),
+            (canvas._cursor_x, canvas._cursor_y), canvas._last_paint_pos,
+            canvas._last_key_color, canvas._last_key_char)
+
+
+def _reset(app, canvas: ArtCanvas, letters: str = "") -> None:
+    app.query_one(ArtMode).clear_canvas()
+    # A letter under (3, 2) and (10, 4): painting keeps the glyph
+    for i, char in enumerate(letters):
+        canvas._grid[(3 + 7 * i, 2 + 2 * i)] = (char, "#FFFFFF", canvas._get_default_bg())
+
+
+def test_apply_ops_matches_paint_at():
+    async def check():
+        async with _app() as (app, _):
+            canvas = app.query_one("#art-canvas", ArtCanvas)
+            for ops in (OPS, build_ops()):
+                _reset(app, canvas, "Hi")
+                for x, y, key in ops:
+                    canvas.paint_at(x, y, key)
+                expected = _state(canvas)
+
+                _reset(app, canvas, "Hi")
+                assert canvas.apply_ops(iter(ops)) == len(ops)
+                assert _state(canvas) == expected
+
+    _run(check())
+
+
+def test_apply_ops_redraws_only_touched_rows():
+    async def check():
+        async with _app() as (app, pilot):
+            canvas = app.query_one("#art-canvas", ArtCanvas)
+            _reset(app, canvas)
+            await pilot.pause()
+            canvas._cursor_x = canvas._cursor_y = 0
+            canvas._dirty_lines.clear()
+            canvas.apply_ops([(5, 7, 'f'), (6, 7, 'f'), (2, 12, 'c')])
+            painted_rows = {7, 12}
+            cursor_rings = {-1, 0, 1, 11, 12, 13}  # 3 lines around the old and new cursor
+            assert canvas._dirty_lines == {y + GUTTER for y in painted_rows | cursor_rings}
+            assert canvas.apply_ops([]) == 0
+
+    _run(check())
+
+
+def test_secret_photo_paints_in_one_pass():
+    async def check():
+        async with _app() as (app, pilot):
+            paint_photo(app)
+            await pilot.pause()
+            await pilot.pause()
+            canvas = app.query_one("#art-canvas", ArtCanvas)
+            x, y, color = PHOTO_OPS[len(PHOTO_OPS) // 2]
+            assert canvas._grid[(x, y)][2] == color
+            cells = {(min(x, canvas.canvas_width - 1), min(y, canvas.canvas_height - 1))
+                     for x, y, _ in PHOTO_OPS}
+            assert canvas._painted_positions == cells
+
+    _run(check())
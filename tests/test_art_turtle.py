@@ -827,3 +827,60 @@ class TestEdgeStop:
         c._cursor_y = 7
         c.execute_logo_command("move", "down", 5)
         assert c._cursor_y == 9
+
+
+# ---------------------------------------------------------------------------
+# Dirty-row tracking: a stroke re-renders only the rows it touched
+# ---------------------------------------------------------------------------
+
+class TestLogoDirtyRows:
+    """execute_logo_command must not invalidate the whole canvas: a
+    `forward 5` repaints the stroke's rows plus the cursor ring rows."""
+
+    @pytest.fixture
+    def canvas(self):
+        from textual.geometry import Size
+        from purple_tui.rooms.art_room import GUTTER
+
+        class SizedCanvas(ArtCanvas):
+            @property
+            def size(self):
+                return Size(40 + 2 * GUTTER, 30 + 2 * GUTTER)
+
+        c = SizedCanvas()
+        c._cursor_x, c._cursor_y = 10, 10
+        c._last_key_color = "#FF0000"
+        return c
+
+    @staticmethod
+    def _frame(c):
+        return [c.render_line(y) for y in range(c.size.height)]
+
+    def _rerendered_rows(self, c, action, direction, distance):
+        before = self._frame(c)
+        c.execute_logo_command(action, direction, distance)
+        after = self._frame(c)
+        return [y for y, (a, b) in enumerate(zip(before, after)) if a is not b]
+
+    def test_horizontal_stroke_repaints_only_the_cursor_rows(self, canvas):
+        rows = self._rerendered_rows(canvas, "paint", "right", 5)
+        # Content row 10 is screen row 11; the ring covers 10..12
+        assert rows == [10, 11, 12]
+
+    def test_vertical_stroke_repaints_stroke_and_both_rings(self, canvas):
+        rows = self._rerendered_rows(canvas, "paint", "down", 5)
+        # Old ring 10..12, painted rows 11..15, new ring (cursor at 15) 15..17
+        assert rows == list(range(10, 18))
+
+    def test_move_without_paint_repaints_both_rings_only(self, canvas):
+        rows = self._rerendered_rows(canvas, "move", "down", 10)
+        assert rows == [10, 11, 12, 20, 21, 22]
+
+    def test_repainted_rows_show_the_stroke(self, canvas):
+        self._frame(canvas)
+        canvas.execute_logo_command("paint", "down", 5)
+        canvas.execute_logo_command("move", "right", 5)  # ring off the stroke
+        frame = self._frame(canvas)
+        for content_y in range(10, 15):
+            text = "".join(seg.text for seg in frame[content_y + 1])
+            assert text[11] == "█", f"stroke missing on content row {content_y}"
@@ -364,7 +364,7 @@ def test_audio_idle_timer_rearm_respects_audio_ok():
     app = SimpleNamespace(
         _audio_idle_timer=None, audio_ok=True,
         _check_audio_idle=lambda: None,
-        set_interval=lambda *a, **k: "timer",
+        ticker=SimpleNamespace(every=lambda *a, **k: "timer"),
     )
     PurpleApp._arm_audio_idle_timer(app)
     assert app._audio_idle_timer == "timer"
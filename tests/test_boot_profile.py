@@ -0,0 +1,74 @@
+"""Tests for the PURPLE_BOOT_PROFILE startup profiler in boot_log."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from purple_tui import boot_log
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _profiled(code: str) -> dict:
+    """Run `code` in a fresh interpreter with profiling on; it prints JSON."""
+    env = {**os.environ, "PURPLE_BOOT_PROFILE": "1"}
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_imports_are_timed_with_self_and_cumulative():
+    snap = _profiled(
+        "import json\n"
+        "from purple_tui import boot_log\n"
+        "import purple_tui.keyboard\n"
+        "print(json.dumps(boot_log.profile_snapshot()))\n"
+    )
+    records = {module: (cum, self_ms) for module, cum, self_ms in snap["imports"]}
+    cum, self_ms = records["purple_tui.keyboard"]
+    assert 0 < self_ms <= cum
+    # keyboard's own dependencies are attributed to themselves, not the parent
+    assert "purple_tui.constants" in records
+
+
+def test_relative_from_import_names_the_submodule():
+    snap = _profiled(
+        "import json\n"
+        "from purple_tui import boot_log\n"
+        "from purple_tui.rooms import art_room\n"
+        "print(json.dumps(boot_log.profile_snapshot()))\n"
+    )
+    modules = [module for module, _, _ in snap["imports"]]
+    # art_room does `from ..color_mixing import ...` and `from .. import ...`
+    assert "purple_tui.color_mixing" in modules
+    assert "purple_tui.rooms.art_room" in modules
+
+
+def test_phase_timer_records_laps_when_profiling():
+    snap = _profiled(
+        "import json, time\n"
+        "from purple_tui import boot_log\n"
+        "phases = boot_log.PhaseTimer('on_mount')\n"
+        "time.sleep(0.02)\n"
+        "phases.lap('settings')\n"
+        "phases.lap('room content')\n"
+        "boot_log.mark_first_render()\n"
+        "print(json.dumps({**boot_log.profile_snapshot(), 'at': boot_log.first_render_at()}))\n"
+    )
+    (label, phase, ms), (_, phase2, ms2) = snap["phases"]
+    assert (label, phase, phase2) == ("on_mount", "settings", "room content")
+    assert ms >= 15 and ms2 < ms
+    assert snap["at"] is not None
+
+
+def test_profiling_off_installs_nothing(monkeypatch):
+    if boot_log.PROFILE_ENABLED:
+        return
+    import builtins
+    assert builtins.__import__ is not boot_log._timed_import
+    before = list(boot_log._phase_records)
+    boot_log.PhaseTimer("on_mount").lap("anything")
+    assert boot_log._phase_records == before
@@ -0,0 +1,96 @@
+"""Tests for direct raster export of the Art canvas (purple_tui/canvas_raster.py)."""
+
+import asyncio
+import base64
+import os
+import struct
+import zlib
+
+os.environ.setdefault("PURPLE_NO_EVDEV", "1")
+os.environ.setdefault("PURPLE_NO_AUDIO", "1")
+
+import numpy as np
+import pytest
+
+from purple_tui.canvas_raster import encode_png, rasterize
+
+BG = "#102030"
+
+
+def _decode_png(data: bytes) -> np.ndarray:
+    """Minimal reader for encode_png's output (8-bit RGB, filter 0, one IDAT)."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, chunks = 8, {}
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos:pos + 4])
+        kind = data[pos + 4:pos + 8]
+        body = data[pos + 8:pos + 8 + length]
+        assert struct.unpack(">I", data[pos + 8 + length:pos + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks[kind] = body
+        pos += 12 + length
+    width, height = struct.unpack(">II", chunks[b"IHDR"][:8])
+    rows = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, width * 3 + 1)
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+def test_cells_become_blocks():
+    grid = {(0, 0): ("█", "#FF0000", BG), (2, 1): (" ", "#000000", "#00FF00")}
+    image = rasterize(grid, 3, 2, background=BG, cell=(2, 3))
+    assert image.shape == (6, 6, 3)
+    assert (image[0:3, 0:2] == (255, 0, 0)).all()      # brush: paint color
+    assert (image[3:6, 4:6] == (0, 255, 0)).all()      # tinted space: its bg
+    assert (image[0:3, 2:6] == (0x10, 0x20, 0x30)).all()  # empty: canvas bg
+
+
+def test_text_cells_get_ink_in_the_middle():
+    grid = {(0, 0): ("a", "#FFFFFF", BG), (1, 0): ("b", "#FFFFFF", BG)}
+    image = rasterize(grid, 2, 1, background=BG, ink={(1, 0): "#000000"}, cell=(4, 8))
+    assert (image[2:6, 1:3] == 255).all()
+    assert (image[0, 0:4] == (0x10, 0x20, 0x30)).all()  # border stays bg
+    assert (image[2:6, 5:7] == 0).all()                 # ink override
+
+
+def test_cells_outside_the_canvas_are_ignored():
+    grid = {(-1, 0): ("█", "#FFFFFF", BG), (5, 5): ("█", "#FFFFFF", BG)}
+    image = rasterize(grid, 2, 2, background=BG, cell=(1, 1))
+    assert (image == (0x10, 0x20, 0x30)).all()
+
+
+def test_bad_cell_size():
+    with pytest.raises(ValueError):
+        rasterize({}, 2, 2, background=BG, cell=(0, 2))
+
+
+def test_png_round_trip():
+    image = np.random.default_rng(1).integers(0, 256, (7, 5, 3), dtype=np.uint8)
+    assert (_decode_png(encode_png(image)) == image).all()
+
+
+def test_app_exports_canvas_over_dev_command(tmp_path, monkeypatch):
+    monkeypatch.setenv("PURPLE_SCREENSHOT_DIR", str(tmp_path))
+    from purple_tui.constants import REQUIRED_TERMINAL_ROWS
+    from purple_tui.purple_tui import PurpleApp
+    from purple_tui.rooms.art_room import ArtCanvas
+
+    async def scenario():
+        app = PurpleApp()
+        async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+            await app._run_dev_command({"action": "mode", "value": "art"})
+            await pilot.pause()
+            await app._run_dev_command({"action": "paint_at", "x": 3, "y": 2, "color": "1"})
+            canvas = app.query_one(ArtCanvas)
+            size = (canvas.canvas_width, canvas.canvas_height)
+            inline = await app._run_dev_command({"action": "export_canvas", "inline": True, "cell": [2, 4]})
+            path = await app._run_dev_command({"action": "export_canvas"})
+            return size, inline, path
+
+    loop = asyncio.new_event_loop()
+    try:
+        (width, height), inline, path = loop.run_until_complete(scenario())
+    finally:
+        loop.close()
+    image = _decode_png(base64.standard_b64decode(inline))
+    assert image.shape == (height * 4, width * 2, 3)
+    assert tuple(image[2 * 4, 3 * 2]) == (255, 255, 255)  # "1" paints white
+    assert path.endswith(".png") and _decode_png(open(path, "rb").read()).shape == (height * 8, width * 4, 3)
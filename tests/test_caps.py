@@ -0,0 +1,82 @@
+"""Tests for the all-caps line filter (purple_tui/caps.py)."""
+
+import asyncio
+import os
+
+os.environ.setdefault("PURPLE_NO_EVDEV", "1")
+os.environ.setdefault("PURPLE_NO_AUDIO", "1")
+
+import pytest
+from rich.segment import Segment
+from rich.style import Style
+from textual.color import Color
+from textual.strip import Strip
+
+from purple_tui import caps
+
+BLACK = Color(0, 0, 0)
+
+
+@pytest.fixture
+def caps_on():
+    caps.set_enabled(True)
+    yield
+    caps.set_enabled(False)
+
+
+def test_uppercases_text_keeps_style():
+    bold = Style(bold=True)
+    out = caps.Uppercase().apply([Segment("hello ", bold), Segment("World")], BLACK)
+    assert out == [Segment("HELLO ", bold), Segment("WORLD")]
+
+
+def test_uppercase_text_passes_through_as_same_segment():
+    segment = Segment("ABC 123 ▶", Style(color="red"))
+    assert caps.Uppercase().apply([segment], BLACK)[0] is segment
+
+
+def test_segments_memoized():
+    first = caps.Uppercase().apply([Segment("purple")], BLACK)[0]
+    second = caps.Uppercase().apply([Segment("purple")], BLACK)[0]
+    assert first is second
+
+
+def test_control_segments_untouched():
+    control = Segment("", None, [(1,)])
+    assert caps.Uppercase().apply([control], BLACK) == [control]
+
+
+def test_strip_filters_once():
+    """Each Strip memoizes its filtered copy, so a cached line pays once."""
+    strip = Strip([Segment("abc")])
+    first = strip.apply_filter(caps._filter, BLACK)
+    assert first.text == "ABC"
+    assert strip.apply_filter(caps._filter, BLACK) is first
+
+
+def test_building_strips_does_not_uppercase(caps_on):
+    assert Strip([Segment("abc")]).text == "abc"
+
+
+def test_app_paints_in_caps(caps_on):
+    from purple_tui.constants import REQUIRED_TERMINAL_ROWS
+    from purple_tui.purple_tui import PurpleApp
+
+    async def scenario():
+        app = PurpleApp()
+        async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+            await pilot.pause()
+            caps.set_enabled(True)  # on_mount loaded the saved setting
+            assert caps._filter in app.get_line_filters()
+            for widget in app.screen.query("*"):
+                widget.refresh()
+            await pilot.pause()
+            return "".join(strip.text for strip in app.screen._compositor.render_strips())
+
+    loop = asyncio.new_event_loop()
+    try:
+        text = loop.run_until_complete(scenario())
+    finally:
+        loop.close()
+    assert any(c.isalpha() for c in text)
+    assert text == text.upper()
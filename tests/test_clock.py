@@ -0,0 +1,108 @@
+"""Tests for the virtual clock (purple_tui/clock.py)."""
+
+import asyncio
+import json
+import time
+
+from textual import _time as textual_time
+from textual.app import App
+
+from purple_tui.clock import DEFAULT_START, loop_time, run_virtual
+from purple_tui.loop_station import LoopStation
+from purple_tui.playback import PlaybackPlayer
+from purple_tui.playback.script import Pause, PressKey, TypeText, ZoomIn, ZoomOut
+
+
+def test_sleeps_jump_in_order():
+    async def main():
+        order = []
+
+        async def nap(name, seconds):
+            await asyncio.sleep(seconds)
+            order.append((name, loop_time()))
+
+        await asyncio.gather(nap("hour", 3600), nap("minute", 60), nap("second", 1))
+        return order
+
+    wall = time.perf_counter()
+    order = run_virtual(main())
+    assert time.perf_counter() - wall < 1.0
+    assert order == [("second", DEFAULT_START + 1), ("minute", DEFAULT_START + 60),
+                     ("hour", DEFAULT_START + 3600)]
+
+
+def test_loop_time_outside_a_loop_is_monotonic():
+    before = time.monotonic()
+    assert before <= loop_time() <= time.monotonic()
+
+
+def test_loop_station_follows_the_loop_clock():
+    async def main():
+        station = LoopStation(time_fn=loop_time)
+        station.start_recording()
+        await asyncio.sleep(0.5)
+        station.record_event("A", "music")
+        await asyncio.sleep(1.25)
+        station.record_event("B", "music")
+        return station.finish_recording()
+
+    events, duration = run_virtual(main())
+    assert [e[2] for e in events] == [0.5, 1.75]
+    assert duration == 1.75
+
+
+def test_textual_timers_tick_on_virtual_time():
+    ticks = []
+
+    class Ticking(App):
+        def on_mount(self):
+            self.set_interval(10.0, lambda: ticks.append(loop_time()))
+
+    async def main():
+        app = Ticking()
+        async with app.run_test():
+            start = loop_time()
+            await asyncio.sleep(35.0)
+        return start
+
+    saved = textual_time.get_time
+    start = run_virtual(main())
+    assert textual_time.get_time is saved
+    assert len(ticks) == 3
+    assert all(abs(t - start - 10 * (i + 1)) < 0.5 for i, t in enumerate(ticks))
+
+
+def test_demo_playback_is_fast_and_deterministic(tmp_path, monkeypatch):
+    monkeypatch.setenv("PURPLE_DEMO_SEED", "7")
+    script = [
+        TypeText("hello world"),
+        ZoomIn(region="input"),
+        PressKey("enter", pause_after=2.0),
+        Pause(30.0),
+        TypeText("2+3"),
+        ZoomOut(),
+    ]
+
+    def play(run):
+        dispatched = []
+
+        async def dispatch(action):
+            dispatched.append((loop_time(), action))
+
+        events = tmp_path / f"zoom_{run}.json"
+        player = PlaybackPlayer(dispatch_action=dispatch, zoom_events_file=events,
+                                get_cursor_position=lambda: (0.5, 0.5))
+
+        async def main():
+            start = loop_time()
+            await player.play(script)
+            return loop_time() - start
+
+        elapsed = run_virtual(main())
+        return elapsed, [(round(t, 9), a) for t, a in dispatched], json.loads(events.read_text())
+
+    wall = time.perf_counter()
+    first = play(1)
+    assert time.perf_counter() - wall < 2.0
+    assert first[0] > 33.0
+    assert play(2) == first
@@ -514,3 +514,82 @@ class TestArtFuzzyVerbResolution:
         canvas, runner = self._run_art(["blue 4"])
         assert canvas._painted_positions == control._painted_positions
         assert canvas._last_key_color == control._last_key_color
+
+
+class TestArtInstantMode:
+    """run(instant=True) fast-forwards: no animation pauses, one repaint."""
+
+    @staticmethod
+    def _canvas():
+        from textual.geometry import Size
+        from purple_tui.rooms.art_room import ArtCanvas, GUTTER
+
+        class SizedCanvas(ArtCanvas):
+            refreshes = 0
+
+            @property
+            def size(self):
+                return Size(100 + 2 * GUTTER, 40 + 2 * GUTTER)
+
+            def refresh(self, *regions, **kwargs):
+                if not self._batch_depth:
+                    SizedCanvas.refreshes += 1
+                return super().refresh(*regions, **kwargs)
+
+        return SizedCanvas()
+
+    # 20 rows x 100 cells: a boustrophedon fill of 2,000 painted cells
+    LINES = ["red"] + [
+        line for row in range(20)
+        for line in (("right 99" if row % 2 == 0 else "left 99"), "down 1")
+    ]
+
+    def test_two_thousand_cells_without_waiting(self):
+        import time
+        from purple_tui.code_runner import ArtCodeRunner
+        canvas = self._canvas()
+        type(canvas).refreshes = 0
+        start = time.perf_counter()
+        asyncio.run(ArtCodeRunner(canvas).run(self.LINES, instant=True))
+        elapsed = time.perf_counter() - start
+        assert len(canvas._painted_positions) >= 2000
+        # Animated, the 41 motion plans alone sleep 2s
+        assert elapsed < 1.0, f"instant run took {elapsed:.2f}s"
+        assert type(canvas).refreshes == 1
+
+    def test_instant_matches_animated_result(self, monkeypatch):
+        from purple_tui.code_runner import ArtCodeRunner
+        lines = ["blue", "forward 5", "turn down", "paint hi", "write ok", "red 3"]
+
+        animated = self._canvas()
+        real_sleep = asyncio.sleep
+        monkeypatch.setattr(asyncio, "sleep", lambda s: real_sleep(0))
+        asyncio.run(ArtCodeRunner(animated).run(lines))
+        monkeypatch.undo()
+
+        instant = self._canvas()
+        asyncio.run(ArtCodeRunner(instant).run(lines, instant=True))
+        assert instant._grid == animated._grid
+        assert (instant._cursor_x, instant._cursor_y) == (animated._cursor_x, animated._cursor_y)
+
+    def test_instant_never_awaits_a_sleep(self, monkeypatch):
+        from purple_tui.code_runner import ArtCodeRunner
+        slept = []
+
+        async def fake_sleep(s):
+            slept.append(s)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        asyncio.run(ArtCodeRunner(_FakeCanvas()).run(["forward 3", "paint abc"], instant=True))
+        assert slept == []
+
+    def test_animated_is_still_the_default(self, monkeypatch):
+        from purple_tui.code_runner import ArtCodeRunner
+        slept = []
+
+        async def fake_sleep(s):
+            slept.append(s)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        asyncio.run(ArtCodeRunner(_FakeCanvas()).run(["forward 3", "paint abc"]))
+        assert slept == [0.05, 0.02, 0.02, 0.02]
@@ -5,10 +5,14 @@ The color mixing implementation is based on spectral.js by Ronald van Wijnen:
 https://github.com/rvanwijnen/spectral.js (MIT License)
 """
 
+import random
+
 import pytest
+from purple_tui import color_mixing
 from purple_tui.color_mixing import (
     get_color_name_approximation,
     mix_colors_paint,
+    mix_colors_paint_many,
     hex_to_rgb,
     rgb_to_hex,
     SIZE,
@@ -319,5 +323,75 @@ class TestColorConversion:
             assert back.upper() == color.upper()
 
 
+class TestMixCaches:
+    """Cached and batched mixing must return exactly what a fresh mix does."""
+
+    RED = "#ED1C24"
+    YELLOW = "#FFEB00"
+    BLUE = "#1F75FE"
+
+    # Outputs of the uncached implementation, pinned before caching landed
+    PINNED = [
+        ([RED, BLUE], "#982C88"),
+        ([RED, YELLOW], "#FF651C"),
+        ([YELLOW, BLUE], "#48D370"),
+        ([RED, RED, BLUE], "#CA0C45"),
+        ([RED, YELLOW, BLUE], "#C16139"),
+    ]
+
+    @pytest.fixture(autouse=True)
+    def _fresh_caches(self):
+        color_mixing.clear_caches()
+        yield
+        color_mixing.clear_caches()
+
+    def test_pinned_results_cold_and_warm(self):
+        for colors, expected in self.PINNED:
+            assert mix_colors_paint(colors) == expected
+        for colors, expected in self.PINNED:
+            assert mix_colors_paint(colors) == expected
+        assert mix_colors_paint_many([c for c, _ in self.PINNED]) == [e for _, e in self.PINNED]
+
+    def test_batch_matches_scalar(self):
+        from purple_tui.rooms.art_room import KEY_COLORS
+        rnd = random.Random(7)
+        palette = sorted(set(KEY_COLORS.values()))
+        rand = lambda: f"#{rnd.randrange(1 << 24):06X}"  # noqa: E731
+        mixes = [[a, b] for a in palette for b in palette]
+        mixes += [[rand(), rand()] for _ in range(500)]
+        mixes += [[rand(), rand(), rand()] for _ in range(200)]
+        mixes += [[self.RED], [], [self.BLUE, self.BLUE.lower()]]
+
+        batched = mix_colors_paint_many(mixes)
+        color_mixing.clear_caches()
+        assert batched == [mix_colors_paint(m) for m in mixes]
+
+    def test_spectrum_computed_once_per_color(self, monkeypatch):
+        calls = []
+        real = color_mixing._linear_rgb_to_spectrum
+        monkeypatch.setattr(color_mixing, "_linear_rgb_to_spectrum",
+                            lambda lrgb: calls.append(lrgb) or real(lrgb))
+        mix_colors_paint([self.RED, self.BLUE])
+        mix_colors_paint([self.BLUE, self.YELLOW])
+        mix_colors_paint([self.RED, self.BLUE, self.YELLOW])
+        assert len(calls) == 3
+
+    def test_repeat_mix_is_a_cache_hit(self, monkeypatch):
+        mix_colors_paint([self.RED, self.BLUE])
+        monkeypatch.setattr(color_mixing, "_mix_colors_internal",
+                            lambda *a, **k: pytest.fail("recomputed a cached mix"))
+        assert mix_colors_paint([self.RED, self.BLUE]) == "#982C88"
+        assert mix_colors_paint_many([[self.RED, self.BLUE]] * 3) == ["#982C88"] * 3
+
+    def test_mix_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(color_mixing, "MAX_MIXES", 4)
+        for i in range(10):
+            mix_colors_paint([self.RED, f"#0000{i:02X}"])
+        assert len(color_mixing._mixes) == 4
+        # Least recently used went first
+        assert (self.RED, "#000009") in color_mixing._mixes
+        assert (self.RED, "#000000") not in color_mixing._mixes
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
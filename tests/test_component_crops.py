@@ -0,0 +1,105 @@
+"""Tests for tools/component_crops.py (cached art_ai component crops)."""
+
+import base64
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from component_crops import (
+    ComponentCropCache,
+    cell_box,
+    component_ranges,
+    decode_png,
+    _decode_unfiltered,
+)
+from purple_tui.art_config import CANVAS_WIDTH, CANVAS_HEIGHT
+from purple_tui.canvas_raster import encode_png
+
+CELL = (3, 6)
+COMPOSITION = {
+    "left": {"x_range": [0, 20], "y_range": [0, 10]},
+    "right": {"x_range": [80, 120], "y_range": [5, 20]},
+    "notes": "not a component",
+    "unbounded": {"description": "no ranges"},
+}
+
+
+def _canvas(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (CANVAS_HEIGHT * CELL[1], CANVAS_WIDTH * CELL[0], 3), dtype=np.uint8)
+
+
+def _b64(image):
+    return base64.b64encode(encode_png(image)).decode("ascii")
+
+
+def _crop_pixels(crop_b64):
+    return decode_png(base64.b64decode(crop_b64))
+
+
+def test_decode_reads_encode_png_output():
+    image = _canvas()
+    assert (decode_png(encode_png(image)) == image).all()
+
+
+def test_filtered_png_is_left_to_pillow():
+    rows = np.zeros((2, 7), dtype=np.uint8)
+    rows[:, 0] = 1  # Sub filter
+    header = struct.pack(">IIBBBBB", 2, 2, 8, 2, 0, 0, 0)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    png = (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+           + chunk(b"IDAT", zlib.compress(rows.tobytes())) + chunk(b"IEND", b""))
+    assert _decode_unfiltered(png) is None
+    assert _decode_unfiltered(b"GIF89a") is None
+
+
+def test_cell_box_pads_and_clamps():
+    size = (CANVAS_WIDTH * 3, CANVAS_HEIGHT * 6)
+    assert cell_box(size, [10, 20], [5, 8]) == (8 * 3, 3 * 6, 22 * 3, 10 * 6)
+    assert cell_box(size, [0, CANVAS_WIDTH], [0, CANVAS_HEIGHT]) == (0, 0) + size
+
+
+def test_component_ranges_skips_entries_without_bounds():
+    assert list(component_ranges(COMPOSITION)) == ["left", "right"]
+
+
+def test_crops_match_the_canvas_region():
+    image = _canvas()
+    cache = ComponentCropCache(workers=2)
+    crops = cache.crop_all(_b64(image), COMPOSITION)
+    assert set(crops) == {"left", "right"}
+    left, top, right, bottom = cell_box((image.shape[1], image.shape[0]), [80, 120], [5, 20])
+    assert (_crop_pixels(crops["right"]) == image[top:bottom, left:right]).all()
+    assert cache.crop(_b64(image), [80, 120], [5, 20]) == crops["right"]
+    cache.close()
+
+
+def test_only_changed_regions_are_rendered_again():
+    cache = ComponentCropCache(workers=1)
+    first = _canvas()
+    before = cache.crop_all(_b64(first), COMPOSITION)
+    assert (cache.reused, cache.rendered) == (0, 2)
+
+    second = first.copy()
+    second[12 * CELL[1], 100 * CELL[0]] = (1, 2, 3)  # a cell inside "right" only
+    after = cache.crop_all(_b64(second), COMPOSITION)
+    assert after["left"] == before["left"]
+    assert after["right"] != before["right"]
+    assert (cache.reused, cache.rendered) == (1, 3)
+    assert cache.stats() == "1 reused, 3 rendered"
+
+
+def test_cache_is_bounded():
+    cache = ComponentCropCache(workers=1, max_crops=2, max_canvases=1)
+    for seed in range(3):
+        cache.crop_all(_b64(_canvas(seed)), COMPOSITION)
+    assert len(cache._crops) == 2
+    assert len(cache._canvases) == 1
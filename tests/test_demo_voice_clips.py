@@ -73,3 +73,20 @@ def test_everything_demo_generates_every_clip_it_speaks(monkeypatch):
     generated = set(_generated_phrases("everything.json"))
     assert "i love pizza" in spoken
     assert not spoken - generated
+
+
+def test_stream_segments_are_collected(monkeypatch, tmp_path):
+    """Generated segments ship as NAME.actions streams, not modules."""
+    from purple_tui.demo import _load_segment
+    assert (PROJECT_ROOT / "purple_tui" / "demo" / "segments" / "heart.actions").exists()
+    composition = tmp_path / "hearts.json"
+    composition.write_text(json.dumps([{"segment": "heart"}, {"segment": "greeting"}]))
+    monkeypatch.setenv("PURPLE_DEMO_COMPOSITION", str(composition))
+    sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+    from generate_voice_clips import _collect_all_actions
+
+    heart, _ = _load_segment("heart")
+    greeting, _ = _load_segment("greeting")
+    actions = _collect_all_actions()
+    assert heart and actions[:len(heart)] == heart
+    assert actions[len(heart):len(heart) + len(greeting)] == greeting
@@ -0,0 +1,166 @@
+"""Tests for the dev-mode control socket (purple_tui/dev_channel.py)."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from purple_tui.dev_channel import MAX_BATCH, CommandRunner, DevChannel, DevClient
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class Recorder:
+    """execute() stand-in: logs commands, sleeps on request, fails on 'boom'."""
+
+    def __init__(self):
+        self.log = []
+
+    async def __call__(self, cmd):
+        await asyncio.sleep(cmd.get("sleep", 0))
+        if cmd.get("action") == "boom":
+            raise RuntimeError("exploded")
+        self.log.append(cmd["value"])
+        return cmd["value"].upper()
+
+
+def test_batches_run_in_arrival_order():
+    async def scenario():
+        rec = Recorder()
+        runner = CommandRunner(rec)
+        slow = [{"action": "key", "value": "a", "sleep": 0.05}, {"action": "key", "value": "b"}]
+        fast = [{"action": "key", "value": "c"}]
+        replies = await asyncio.gather(runner.run_batch(slow), runner.run_batch(fast))
+        return rec.log, replies
+
+    log, (first, second) = _run(scenario())
+    assert log == ["a", "b", "c"]
+    assert first == {"ok": True, "done": 2, "results": ["A", "B"]}
+    assert second["results"] == ["C"]
+
+
+def test_failure_stops_the_batch():
+    rec = Recorder()
+    cmds = [{"action": "key", "value": "a"}, {"action": "boom"}, {"action": "key", "value": "b"}]
+    reply = _run(CommandRunner(rec).run_batch(cmds))
+    assert reply["ok"] is False and reply["done"] == 1
+    assert "exploded" in reply["error"]
+    assert rec.log == ["a"]
+
+
+def test_socket_round_trip(tmp_path):
+    path = str(tmp_path / "control.sock")
+
+    async def scenario():
+        rec = Recorder()
+        channel = DevChannel(CommandRunner(rec), path)
+        await channel.start()
+        loop = asyncio.get_running_loop()
+        client = await loop.run_in_executor(None, DevClient, path)
+        try:
+            first = await loop.run_in_executor(None, client.send, [{"action": "key", "value": "x"}])
+            second = await loop.run_in_executor(None, client.send, [{"action": "key", "value": "y"}] * 3)
+            too_big = await loop.run_in_executor(None, client.send, [{"action": "key", "value": "z"}] * (MAX_BATCH + 1))
+        finally:
+            client.close()
+            await channel.stop()
+        return rec.log, first, second, too_big
+
+    log, first, second, too_big = _run(scenario())
+    assert first == {"id": 1, "ok": True, "done": 1, "results": ["X"]}
+    assert second["id"] == 2 and second["done"] == 3
+    assert too_big["ok"] is False and "exceeds" in too_big["error"]
+    assert log == ["x", "y", "y", "y"]
+    assert not os.path.exists(path)
+
+
+def test_bad_request_gets_error_reply(tmp_path):
+    path = str(tmp_path / "control.sock")
+
+    async def scenario():
+        channel = DevChannel(CommandRunner(Recorder()), path)
+        await channel.start()
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b"not json\n")
+        await writer.drain()
+        reply = json.loads(await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+        await channel.stop()
+        return reply
+
+    reply = _run(scenario())
+    assert reply["ok"] is False and reply["error"].startswith("bad request")
+
+
+def test_bad_request_echoes_the_id(tmp_path):
+    path = str(tmp_path / "control.sock")
+
+    async def scenario():
+        channel = DevChannel(CommandRunner(Recorder()), path)
+        await channel.start()
+        loop = asyncio.get_running_loop()
+        reader, writer = await asyncio.open_unix_connection(path)
+        replies = []
+        for request in ({"id": 7}, {"id": 8, "commands": "key x"}, [1, 2]):
+            writer.write((json.dumps(request) + "\n").encode())
+            await writer.drain()
+            replies.append(json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+
+        client = await loop.run_in_executor(None, DevClient, path)
+        try:
+            wrong_type = await loop.run_in_executor(None, client.send, "key x")
+            with pytest.raises(RuntimeError, match="request too long"):
+                await loop.run_in_executor(None, client.send, [{"value": "x" * (1 << 20)}])
+        finally:
+            client.close()
+            await channel.stop()
+        return replies, wrong_type
+
+    (missing, not_list, not_dict), wrong_type = _run(scenario())
+    assert missing["id"] == 7 and missing["error"].startswith("bad request")
+    assert not_list["id"] == 8 and "must be a list" in not_list["error"]
+    assert "id" not in not_dict and not_dict["ok"] is False
+    assert wrong_type["id"] == 1 and "must be a list" in wrong_type["error"]
+
+
+def test_app_serves_commands_and_screenshots(tmp_path, monkeypatch):
+    monkeypatch.setenv("PURPLE_DEV_MODE", "1")
+    monkeypatch.setenv("PURPLE_NO_EVDEV", "1")
+    monkeypatch.setenv("PURPLE_SCREENSHOT_DIR", str(tmp_path))
+    monkeypatch.setenv("PURPLE_DEV_SOCKET", "1")
+    from purple_tui.constants import REQUIRED_TERMINAL_ROWS
+    from purple_tui.purple_tui import PurpleApp
+
+    async def scenario():
+        app = PurpleApp()
+        async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+            await pilot.pause()
+            reader, writer = await asyncio.open_unix_connection(str(tmp_path / "control.sock"))
+            request = {"id": 9, "commands": [{"action": "mode", "value": "art"}, {"action": "screenshot"}]}
+            writer.write((json.dumps(request) + "\n").encode())
+            await writer.drain()
+            reply = json.loads(await asyncio.wait_for(reader.readline(), 10))
+            writer.close()
+            await writer.wait_closed()
+            return reply, app.active_room.name
+
+    reply, room = _run(scenario())
+    assert reply["id"] == 9 and reply["ok"] is True and reply["done"] == 2
+    assert room == "ART"
+    screenshot = reply["results"][1]
+    assert screenshot.endswith(".svg") and os.path.exists(screenshot)
+    assert not (tmp_path / "control.sock").exists()  # removed on exit
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
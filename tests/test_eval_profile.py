@@ -0,0 +1,131 @@
+"""Tests for the opt-in Play room evaluator profiler."""
+
+import json
+
+from purple_tui.eval_profile import EvalProfiler, format_record, profiler_from_env
+from purple_tui.rooms.play_room import SimpleEvaluator
+
+
+def test_records_stage_times_and_counts():
+    ev = SimpleEvaluator()
+    profiler = EvalProfiler()
+    profiler.attach(ev)
+    ev.evaluate("2 bright red dogs + 3 cats")
+
+    (record,) = profiler.records
+    assert record["text"] == "2 bright red dogs + 3 cats"
+    assert record["total_ms"] > 0
+    stages = record["stages"]
+    assert stages["_eval_plus_expr"]["calls"] == 1
+    assert stages["_validate_markup"]["calls"] == 1
+    assert stages["content.get_emoji"]["calls"] >= 1
+    # Inclusive stages never exceed the whole call
+    assert all(s["ms"] <= record["total_ms"] for s in stages.values())
+
+
+def test_each_evaluate_gets_a_fresh_record():
+    ev = SimpleEvaluator()
+    profiler = EvalProfiler()
+    profiler.attach(ev)
+    ev.evaluate("2 + 3")
+    ev.evaluate("cat")
+    first, second = profiler.records
+    assert "_eval_plus_expr" in first["stages"]
+    assert "_eval_plus_expr" not in second["stages"]
+
+
+def test_parenthesized_parts_stay_in_one_record():
+    ev = SimpleEvaluator()
+    profiler = EvalProfiler()
+    profiler.attach(ev)
+    ev.evaluate("(1 + 2) + 3")
+
+    # The nested evaluate("1 + 2") neither emits its own record nor wipes
+    # the stages the outer call timed before it
+    (record,) = profiler.records
+    assert record["text"] == "(1 + 2) + 3"
+    stages = record["stages"]
+    assert stages["_eval_parens"]["calls"] == 2  # outer + nested
+    assert stages["_validate_markup"]["calls"] == 2
+    assert stages["_eval_parens"]["ms"] <= record["total_ms"]
+
+    ev.evaluate("cat")
+    assert profiler.records[-1]["text"] == "cat"
+    assert "_eval_plus_expr" not in profiler.records[-1]["stages"]
+
+
+def test_profiling_does_not_change_results():
+    inputs = ["2 + 3", "3 cats", "red + blue", "i love the big red dinosuar", "((1 + 2) + 3)"]
+    plain = SimpleEvaluator()
+    expected = [plain.evaluate(t) for t in inputs]
+
+    ev = SimpleEvaluator()
+    EvalProfiler().attach(ev)
+    assert [ev.evaluate(t) for t in inputs] == expected
+
+
+def test_detach_removes_every_shadow():
+    ev = SimpleEvaluator()
+    content = ev.content
+    profiler = EvalProfiler()
+    profiler.attach(ev)
+    profiler.detach()
+    assert ev.content is content
+    assert ev.profiler is None
+    assert "evaluate" not in vars(ev)
+    assert "_chunk_words" not in vars(ev)
+    ev.evaluate("2 + 3")
+    assert profiler.records == []
+
+
+def test_keep_bounds_memory():
+    ev = SimpleEvaluator()
+    profiler = EvalProfiler(keep=3)
+    profiler.attach(ev)
+    for i in range(10):
+        ev.evaluate(str(i))
+    assert [r["text"] for r in profiler.records] == ["7", "8", "9"]
+
+
+def test_sink_errors_never_reach_the_kid():
+    def broken(record):
+        raise OSError("disk full")
+
+    ev = SimpleEvaluator()
+    EvalProfiler(sink=broken).attach(ev)
+    assert ev.evaluate("2 + 3") == SimpleEvaluator().evaluate("2 + 3")
+
+
+def test_env_unset_means_off(monkeypatch):
+    monkeypatch.delenv("PURPLE_EVAL_PROFILE", raising=False)
+    assert profiler_from_env(lambda msg: None) is None
+
+
+def test_env_one_logs_to_dev_log(monkeypatch):
+    monkeypatch.setenv("PURPLE_EVAL_PROFILE", "1")
+    lines = []
+    profiler = profiler_from_env(lines.append)
+    ev = SimpleEvaluator()
+    profiler.attach(ev)
+    ev.evaluate("3 cats")
+    assert len(lines) == 1
+    assert lines[0].startswith("[EvalProfile] ")
+    assert "'3 cats'" in lines[0]
+
+
+def test_env_path_writes_jsonl(monkeypatch, tmp_path):
+    path = tmp_path / "eval.jsonl"
+    monkeypatch.setenv("PURPLE_EVAL_PROFILE", str(path))
+    profiler = profiler_from_env()
+    ev = SimpleEvaluator()
+    profiler.attach(ev)
+    ev.evaluate("2 + 3")
+    ev.evaluate("cat")
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["text"] for r in records] == ["2 + 3", "cat"]
+
+
+def test_format_record_lists_slowest_first():
+    record = {"text": "x", "total_ms": 3.0, "stages": {
+        "a": {"ms": 2.0, "calls": 1}, "b": {"ms": 0.5, "calls": 4}}}
+    assert format_record(record) == "[EvalProfile] 3.00ms 'x' a=2.00ms/1 b=0.50ms/4"
@@ -0,0 +1,145 @@
+"""Tests for tools/frame_analysis.py (vectorized frame scanning)."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from frame_analysis import (
+    color_mask,
+    drawable_bounds,
+    find_border_bounds,
+    longest_runs,
+    read_frames,
+    resize_nearest,
+    row_bounds,
+    similarity,
+)
+
+BORDER = (0x9B, 0x7B, 0xC4)
+
+
+def _naive_row(mask_row):
+    """Per-pixel reference: (min_x, max_x, longest run) of one row."""
+    xs = [x for x, v in enumerate(mask_row) if v]
+    best = run = 0
+    for v in mask_row:
+        run = run + 1 if v else 0
+        best = max(best, run)
+    return (xs[0], xs[-1], best) if xs else (len(mask_row), 0, 0)
+
+
+def _naive_drawable_bounds(frame, threshold=30):
+    """The per-pixel scan drawable_bounds replaces (from art_ai.py)."""
+    height, width = frame.shape[:2]
+
+    def dark(samples):
+        total = [0, 0, 0]
+        for y, x in samples:
+            if 0 <= y < height and 0 <= x < width:
+                for c in range(3):
+                    total[c] += int(frame[y, x, c])
+        return all(t // 11 < threshold for t in total)
+
+    mid_y = height // 2
+    left = 0
+    for x in range(0, width // 2, 5):
+        if dark([(mid_y + d, x) for d in range(-5, 6)]):
+            left = x + 10
+        elif left > 0:
+            break
+    right = width
+    for x in range(width - 1, width // 2, -5):
+        if dark([(mid_y + d, x) for d in range(-5, 6)]):
+            right = x - 5
+        elif right < width:
+            break
+    mid_x = (left + right) // 2
+    top = 0
+    for y in range(0, height // 2, 5):
+        if dark([(y, mid_x + d) for d in range(-5, 6)]):
+            top = y + 10
+        elif top > 0:
+            break
+    bottom = height
+    for y in range(height - 1, height // 2, -5):
+        if dark([(y, mid_x + d) for d in range(-5, 6)]):
+            bottom = y - 5
+        elif bottom < height:
+            break
+    return left, top, right, bottom
+
+
+def test_row_bounds_match_per_pixel_scan():
+    mask = np.random.default_rng(3).random((40, 57)) < 0.6
+    mask[5] = False
+    mask[6] = True
+    min_x, max_x, runs = row_bounds(mask)
+    for y in range(mask.shape[0]):
+        assert (min_x[y], max_x[y], runs[y]) == _naive_row(list(mask[y]))
+
+
+def test_longest_runs_edges():
+    mask = np.array([[1, 1, 0, 1, 1, 1], [0, 0, 0, 0, 0, 0], [1, 1, 1, 1, 1, 1]], dtype=bool)
+    assert list(longest_runs(mask)) == [3, 0, 6]
+
+
+def test_color_mask_tolerance():
+    frame = np.array([[BORDER, (BORDER[0] + 30, BORDER[1], BORDER[2]), (BORDER[0] - 31, BORDER[1], BORDER[2])]],
+                     dtype=np.uint8)
+    assert list(color_mask(frame, BORDER, 30)[0]) == [True, True, False]
+    edges = np.array([[(0, 0, 0), (255, 255, 255), (219, 250, 250)]], dtype=np.uint8)
+    assert list(color_mask(edges, (250, 250, 250), 30)[0]) == [False, True, False]
+
+
+def test_find_border_bounds_skips_hint_text():
+    frame = np.zeros((300, 400, 3), dtype=np.uint8)
+    frame[40:42, 50:350] = BORDER     # top edge
+    frame[240:242, 50:350] = BORDER   # bottom edge
+    frame[41:241, 50] = BORDER        # sides
+    frame[41:241, 349] = BORDER
+    frame[270, 150:260] = BORDER      # hint text underline: narrower, offset
+    assert find_border_bounds(frame, BORDER, 30) == (50, 40, 349, 241)
+
+
+def test_find_border_bounds_none():
+    frame = np.zeros((50, 200, 3), dtype=np.uint8)
+    assert find_border_bounds(frame, BORDER, 30) == (200, 50, 0, 0)
+
+
+@pytest.mark.parametrize("box", [(37, 22, 361, 171), (0, 0, 400, 200), (12, 80, 388, 120)])
+def test_drawable_bounds_match_per_pixel_scan(box):
+    frame = np.full((200, 400, 3), (10, 8, 12), dtype=np.uint8)  # dark gutter
+    left, top, right, bottom = box
+    frame[top:bottom, left:right] = (42, 24, 69)                 # canvas
+    assert drawable_bounds(frame) == _naive_drawable_bounds(frame)
+
+
+def test_similarity():
+    rng = np.random.default_rng(5)
+    a = rng.integers(0, 256, (32, 32, 3), dtype=np.uint8)
+    assert similarity(a, a.copy()) == 1.0
+    black = np.zeros((8, 8, 3), dtype=np.uint8)
+    assert similarity(black, black + 255) == 0.0
+    assert similarity(np.full((16, 16, 3), 80, np.uint8), np.full((64, 64, 3), 80, np.uint8)) == 1.0
+
+
+def test_resize_nearest():
+    frame = np.arange(16, dtype=np.uint8).reshape(4, 4, 1)
+    assert resize_nearest(frame, 2, 2)[:, :, 0].tolist() == [[0, 2], [8, 10]]
+
+
+@pytest.mark.skipif(not shutil.which("ffmpeg"), reason="ffmpeg not installed")
+def test_read_frames_from_lavfi_video(tmp_path):
+    video = tmp_path / "color.mp4"
+    subprocess.run(["ffmpeg", "-v", "error", "-f", "lavfi", "-i", "color=c=red:size=64x48:rate=10:duration=2",
+                    "-pix_fmt", "yuv444p", "-c:v", "libx264", "-qp", "0", str(video)], check=True)
+    frames = list(read_frames(str(video), 64, 48, sample_fps=2))
+    assert len(frames) == 4
+    assert frames[0].shape == (48, 64, 3)
+    assert abs(int(frames[0][10, 10, 0]) - 255) < 8
@@ -0,0 +1,126 @@
+"""Tests for keypress-to-paint latency tracking (purple_tui/key_latency.py)."""
+
+import asyncio
+import json
+import os
+import time
+
+os.environ["PURPLE_NO_EVDEV"] = "1"
+os.environ["PURPLE_NO_AUDIO"] = "1"
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+from purple_tui.input import KeyCode, RawKeyEvent
+from purple_tui.key_latency import STAGES, Histogram, KeyLatency, to_monotonic
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _press(timestamp, keycode=KeyCode.KEY_A, is_down=True, is_repeat=False):
+    return RawKeyEvent(keycode=keycode, is_down=is_down, timestamp=timestamp, is_repeat=is_repeat)
+
+
+class TestHistogram:
+    def test_percentiles_within_bucket_resolution(self):
+        hist = Histogram()
+        for ms in range(1, 101):
+            hist.add(float(ms))
+        assert hist.count == 100
+        assert hist.percentile(0.5) == pytest.approx(50, rel=0.1)
+        assert hist.percentile(0.99) == pytest.approx(99, rel=0.1)
+        assert hist.percentile(1.0) == 100
+
+    def test_outlier_only_moves_the_tail(self):
+        hist = Histogram()
+        for _ in range(99):
+            hist.add(5.0)
+        hist.add(4000.0)
+        assert hist.percentile(0.5) == pytest.approx(5, rel=0.1)
+        assert hist.percentile(1.0) == 4000.0
+
+    def test_empty(self):
+        hist = Histogram()
+        assert hist.percentile(0.5) is None
+        assert hist.to_dict()["p99_ms"] is None
+
+
+class TestTraces:
+    def test_stages_split_and_total_from_kernel_timestamp(self):
+        clock = FakeClock(100.0)
+        records = []
+        latency = KeyLatency(sink=records.append, clock=clock)
+        trace = latency.start(_press(99.996))  # pressed 4ms before we read it
+        clock.now += 0.0005
+        latency.mark(trace, "decode")
+        clock.now += 0.003
+        latency.mark(trace, "dispatch")
+        clock.now += 0.010
+        latency.finish(trace)
+        (record,) = records
+        assert record["kernel_ms"] == pytest.approx(4.0)
+        assert record["decode_ms"] == pytest.approx(0.5)
+        assert record["dispatch_ms"] == pytest.approx(3.0)
+        assert record["paint_ms"] == pytest.approx(10.0)
+        assert record["total_ms"] == pytest.approx(17.5)
+        assert all(latency.histograms[s].count == 1 for s in STAGES)
+
+    def test_releases_and_repeats_not_timed(self):
+        latency = KeyLatency()
+        assert latency.start(_press(time.monotonic(), is_down=False)) is None
+        assert latency.start(_press(time.monotonic(), is_repeat=True)) is None
+
+    def test_realtime_stamps_are_converted(self):
+        mono, wall = 500.0, 1_760_000_000.0
+        assert to_monotonic(wall - 0.002, mono, wall) == pytest.approx(mono - 0.002)
+        assert to_monotonic(mono - 0.002, mono, wall) == mono - 0.002
+
+    def test_dump_and_summary(self, tmp_path):
+        latency = KeyLatency()
+        assert latency.summary_lines() == ["No key presses timed yet."]
+        trace = latency.start(_press(time.monotonic()))
+        latency.mark(trace, "decode")
+        latency.finish(trace)
+        assert "total" in "\n".join(latency.summary_lines())
+        path = tmp_path / "latency.jsonl"
+        latency.dump_jsonl(str(path))
+        snapshot = json.loads(path.read_text())["histograms"]
+        assert snapshot["total"]["count"] == 1
+
+
+def test_app_times_evdev_keys_through_paint(tmp_path, monkeypatch):
+    """A key press fed through the evdev path produces one full trace."""
+    monkeypatch.setenv("PURPLE_KEY_LATENCY", str(tmp_path / "keys.jsonl"))
+    from purple_tui.constants import REQUIRED_TERMINAL_ROWS
+    from purple_tui.purple_tui import PurpleApp
+
+    async def scenario():
+        app = PurpleApp()
+        async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+            await pilot.pause()
+            await app._handle_raw_key_event(_press(time.monotonic()))
+            await app._handle_raw_key_event(_press(time.monotonic(), is_down=False))
+            for _ in range(20):
+                await pilot.pause()
+                if app.key_latency.count:
+                    break
+            return app.key_latency
+
+    loop = asyncio.new_event_loop()
+    try:
+        latency = loop.run_until_complete(scenario())
+    finally:
+        loop.close()
+    assert latency.count == 1
+    lines = (tmp_path / "keys.jsonl").read_text().splitlines()
+    record = json.loads(lines[0])
+    assert record["key"] == "a"
+    assert set(record) == {"key", *(f"{s}_ms" for s in STAGES)}
+    assert record["total_ms"] >= record["paint_ms"] >= 0
+    assert "histograms" in json.loads(lines[-1])  # snapshot appended on exit
@@ -375,6 +375,96 @@ class TestProperties:
         assert loop.max_duration == MAX_LOOP_DURATION
 
 
+# =============================================================================
+# Ordered storage and cached schedule
+# =============================================================================
+
+class TestSchedule:
+    def _looping(self, duration=4.0):
+        loop = LoopStation()
+        loop.start_recording(now=0.0)
+        loop.record_event('A', MODE_MUSIC, now=0.5)
+        loop.finish_recording(now=duration)
+        return loop
+
+    def test_schedule_is_cached_until_events_change(self):
+        loop = self._looping()
+        first = loop.schedule
+        assert isinstance(first, tuple)
+        assert loop.schedule is first
+        gen = loop.generation
+        loop.record_event('B', MODE_MUSIC, now=5.0)
+        assert loop.generation == gen + 1
+        second = loop.schedule
+        assert second is not first
+        assert [e[0] for e in second] == ['A', 'B']
+        assert [e[0] for e in first] == ['A']  # old snapshot untouched
+
+    def test_schedule_survives_into_next_cycle_unchanged(self):
+        """A cycle holding the schedule doesn't see notes added mid-cycle."""
+        loop = self._looping()
+        playing = loop.schedule
+        loop.record_event('C', MODE_MUSIC, now=4.1)
+        assert [e[0] for e in playing] == ['A']
+        assert [e[0] for e in loop.schedule] == ['C', 'A']
+
+    def test_equal_offsets_keep_arrival_order(self):
+        loop = self._looping()
+        loop.record_event('B', MODE_MUSIC, now=5.0)
+        loop.record_event('C', MODE_MUSIC, now=9.0)  # same cycle offset 1.0
+        loop.record_event('D', MODE_MUSIC, now=13.0)
+        assert [e[0] for e in loop.schedule] == ['A', 'B', 'C', 'D']
+
+    def test_finish_recording_orders_by_offset(self):
+        loop = LoopStation()
+        loop.start_recording(now=0.0)
+        loop.record_event('B', MODE_MUSIC, now=2.0)
+        loop.record_event('A', MODE_MUSIC, now=1.0)  # caller-supplied times out of order
+        events, _ = loop.finish_recording(now=3.0)
+        assert [e[0] for e in events] == ['A', 'B']
+
+    def test_stop_and_restart_bump_generation(self):
+        loop = self._looping()
+        gen = loop.generation
+        loop.stop()
+        assert loop.generation > gen
+        assert loop.schedule == ()
+        gen = loop.generation
+        loop.start_recording(now=10.0)
+        assert loop.generation > gen
+
+    def test_thousands_of_layered_events(self):
+        """Layer 5,000 notes over a 20 s loop: the schedule stays sorted
+        and matches a stable sort of everything recorded, and recording
+        plus one schedule per cycle stays far from quadratic."""
+        import random
+        import time
+
+        rnd = random.Random(11)
+        loop = LoopStation()
+        loop.start_recording(now=0.0)
+        loop.record_event('A', MODE_MUSIC, now=0.25)
+        loop.finish_recording(now=20.0)
+
+        expected = [('A', MODE_MUSIC, 0.25, 0)]
+        now = 20.0
+        start = time.perf_counter()
+        for i in range(5000):
+            now += rnd.random() * 0.05
+            key = rnd.choice('QWERTYASDF')
+            loop.record_event(key, MODE_MUSIC, now=now, instrument=i % 4)
+            expected.append((key, MODE_MUSIC, (now - 20.0) % 20.0, i % 4))
+            if i % 50 == 0:
+                loop.schedule  # playback takes a snapshot each cycle
+        elapsed = time.perf_counter() - start
+
+        schedule = loop.schedule
+        assert len(schedule) == 5001
+        assert list(schedule) == sorted(expected, key=lambda e: e[2])
+        assert all(a[2] <= b[2] for a, b in zip(schedule, schedule[1:]))
+        assert elapsed < 1.0, f"layering 5000 notes took {elapsed:.2f}s"
+
+
 # =============================================================================
 # Time function injection
 # =============================================================================
@@ -0,0 +1,151 @@
+"""Tests for the offline Music renderer (purple_tui/music_render.py)."""
+
+import os
+import wave
+
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+import numpy as np
+import pytest
+
+from purple_tui.loop_station import LoopStation
+from purple_tui.music_constants import DEFAULT_ROOT_INDEX, FRIENDLY_KEYS, pitch_filename, pitch_for
+from purple_tui.music_render import (
+    DEFAULT_SOUNDS, LETTERS_DUCK, SAMPLE_RATE, SOUND_VOLUME, SampleBank,
+    events_from_code, events_from_loop, events_from_session, render,
+    schedule_voices, voices_for, write_wav,
+)
+from purple_tui.music_session import MODE_LETTERS, MODE_MUSIC, MusicSession
+
+RATE = 8000  # small synthetic bank: fast, still sample-accurate
+
+
+def _click_bank(notes, length=40):
+    """Every sample the notes need is a `length`-frame block of 1.0."""
+    ids = {sample_id for _, sample_id, _ in schedule_voices(notes)}
+    return SampleBank.from_arrays({i: np.ones(length) for i in ids}, rate=RATE)
+
+
+def _onsets(audio):
+    """Frames where the signal goes from silent to sounding."""
+    loud = np.abs(audio[:, 0]) > 0
+    return list(np.flatnonzero(loud & ~np.concatenate(([False], loud[:-1]))))
+
+
+class TestEventSources:
+    def test_loop_cycles_repeat_at_loop_duration(self):
+        loop = LoopStation()
+        loop.start_recording(now=0.0)
+        loop.record_event('A', MODE_MUSIC, now=0.5)
+        loop.record_event('1', MODE_MUSIC, now=1.25, instrument=2)
+        loop.finish_recording(now=2.0)
+        notes = events_from_loop(loop.schedule, loop.loop_duration, cycles=3)
+        assert [(t, k) for t, k, _, _ in notes] == [
+            (0.5, 'A'), (1.25, '1'), (2.5, 'A'), (3.25, '1'), (4.5, 'A'), (5.25, '1')]
+        assert notes[1][3] == 2
+
+    def test_session_delays_accumulate(self):
+        session = MusicSession()
+        for key, t in (('A', 10.0), ('S', 10.25), ('D', 11.0)):
+            session.record(key, MODE_MUSIC, now=t)
+        notes = events_from_session(session.get_replay(), instrument=1)
+        assert [(t, k, i) for t, k, _, i in notes] == [(0.0, 'A', 1), (0.25, 'S', 1), (1.0, 'D', 1)]
+
+    def test_code_runs_on_a_virtual_clock(self):
+        notes, end = events_from_code(["fast qwe", "play ukulele", "zx"])
+        times = [round(t, 6) for t, *_ in notes]
+        # fast = 0.04s per note, instrument switch pauses 0.1s, normal = 0.2s
+        assert times == [0.0, 0.04, 0.08, 0.22, 0.42]
+        assert [n[3] for n in notes] == [0, 0, 0, 1, 1]
+        assert end == pytest.approx(0.62)
+
+    def test_code_letters_switch_changes_mode(self):
+        notes, _ = events_from_code(["a", "letters on", "b"])
+        assert [n[2] for n in notes] == [MODE_MUSIC, MODE_LETTERS]
+
+
+class TestVoices:
+    def test_melodic_key_uses_the_grids_pitch(self):
+        note, octave = pitch_for(1, 0, FRIENDLY_KEYS[DEFAULT_ROOT_INDEX], 0)  # 'A' key
+        assert voices_for('A', MODE_MUSIC, 0) == [(f"marimba/{pitch_filename(note, octave)}", SOUND_VOLUME)]
+
+    def test_root_changes_the_sample(self):
+        assert voices_for('A', MODE_MUSIC, 0, root_index=0) != voices_for('A', MODE_MUSIC, 0)
+
+    def test_digits_are_percussion(self):
+        assert voices_for('3', MODE_MUSIC, 2) == [('3', SOUND_VOLUME)]
+
+    def test_letters_mode_ducks_instrument_under_letter(self):
+        (inst, inst_gain), (letter, letter_gain) = voices_for('B', MODE_LETTERS, 1)
+        assert inst.startswith("ukulele/")
+        assert inst_gain == pytest.approx(SOUND_VOLUME * LETTERS_DUCK)
+        assert (letter, letter_gain) == ("letters/b", SOUND_VOLUME)
+
+    def test_punctuation_keys_are_not_spoken(self):
+        assert len(voices_for(';', MODE_LETTERS, 0)) == 1
+
+
+class TestRender:
+    def test_rendered_onsets_match_event_offsets(self):
+        schedule = [('A', MODE_MUSIC, 0.0, 0), ('1', MODE_MUSIC, 0.3, 0),
+                    ('Q', MODE_MUSIC, 0.65, 2), ('Z', MODE_MUSIC, 1.2, 3)]
+        notes = events_from_loop(schedule, 1.5, cycles=4)
+        audio = render(notes, _click_bank(notes), duration=6.0)
+        assert len(audio) == 6 * RATE
+        assert _onsets(audio) == [round(t * RATE) for t, *_ in notes]
+        # Each click is a 0.4-gain block
+        assert audio[:, 0].max() == pytest.approx(SOUND_VOLUME)
+
+    def test_code_render_onsets(self):
+        notes, end = events_from_code(["qwerty", "fast asdf"])
+        audio = render(notes, _click_bank(notes), duration=end, tail=False)
+        assert len(audio) == round(end * RATE)
+        assert _onsets(audio) == [round(t * RATE) for t, *_ in notes]
+
+    def test_tail_lets_last_note_ring(self):
+        notes = [(1.0, 'A', MODE_MUSIC, 0)]
+        bank = _click_bank(notes, length=RATE // 2)
+        assert len(render(notes, bank, duration=1.0)) == RATE + RATE // 2
+        assert len(render(notes, bank, duration=1.0, tail=False)) == RATE
+
+    def test_overlaps_sum_and_clip(self):
+        notes = [(0.0, k, MODE_MUSIC, 0) for k in 'QWERTYUIOP']
+        audio = render(notes, _click_bank(notes))
+        assert audio.max() == 1.0  # 10 x 0.4 clipped
+
+    def test_missing_samples_stay_silent(self):
+        notes = [(0.0, 'A', MODE_MUSIC, 0), (0.5, '1', MODE_MUSIC, 0)]
+        bank = SampleBank.from_arrays({'1': np.ones(10)}, rate=RATE)
+        bank._samples[schedule_voices(notes)[0][1]] = None
+        assert _onsets(render(notes, bank)) == [RATE // 2]
+
+    def test_parallel_mix_is_identical(self):
+        rnd = np.random.default_rng(3)
+        notes = sorted((float(t), k, MODE_MUSIC, int(i)) for t, k, i in zip(
+            rnd.uniform(0, 4, 300), rnd.choice(list('QWERASDFZXCV1234'), 300), rnd.integers(0, 4, 300)))
+        ids = {s for _, s, _ in schedule_voices(notes)}
+        bank = SampleBank.from_arrays({s: rnd.uniform(-1, 1, 900) for s in ids}, rate=RATE)
+        serial = render(notes, bank)
+        assert np.array_equal(render(notes, bank, jobs=2), serial)
+
+    def test_write_wav(self, tmp_path):
+        audio = np.array([[0.0, 0.5], [-0.5, 1.0], [-1.0, 0.25]], dtype=np.float32)
+        path = tmp_path / "out.wav"
+        write_wav(path, audio, RATE)
+        with wave.open(str(path)) as w:
+            assert (w.getnchannels(), w.getsampwidth(), w.getframerate(), w.getnframes()) == (2, 2, RATE, 3)
+            pcm = np.frombuffer(w.readframes(3), dtype="<i2").reshape(3, 2)
+        assert pcm.tolist() == [[0, 16384], [-16384, 32767], [-32767, 8192]]
+
+
+@pytest.mark.skipif(not (DEFAULT_SOUNDS / "marimba").exists(), reason="core-sounds pack not present")
+def test_decodes_core_sound_pack():
+    bank = SampleBank()
+    notes = [(0.0, 'A', MODE_MUSIC, 0), (0.1, '1', MODE_MUSIC, 0)]
+    audio = render(notes, bank)
+    assert bank.rate == SAMPLE_RATE
+    assert audio.shape[1] == 2
+    first = bank.get(schedule_voices(notes)[0][1])
+    assert first is not None and np.abs(first).max() > 0.05
+    assert len(audio) == max(round(0.1 * SAMPLE_RATE) + len(bank.get('1')), len(first))
@@ -114,12 +114,15 @@ def test_line_validation_absolute_budget(content):
 
 
 def _running_timers(app):
-    """All unpaused Textual timers in the app, as (interval, owner) pairs."""
+    """All unpaused Textual timers in the app, as (interval, owner) pairs.
+    The shared ticker's one-shot wakeup is reported as its active jobs: its
+    own delay is just the time left to the next aligned slot."""
     found = []
     for node in [app, *app.screen_stack, *app.query("*")]:
         for timer in getattr(node, "_timers", ()):
-            if timer._active.is_set():
+            if timer._active.is_set() and timer.name != "ticker":
                 found.append((timer._interval, repr(node)))
+    found.extend((job.period, job.name) for job in app.ticker.jobs if job.active)
     return found
 
 
@@ -201,3 +204,248 @@ def test_typing_never_triggers_layout_pass():
         loop.run_until_complete(scenario())
     finally:
         loop.close()
+
+
+# ---------------------------------------------------------------------------
+# Grid widget rendering: interned styles (purple_tui/cell_styles.py)
+# ---------------------------------------------------------------------------
+
+CANVAS_W, CANVAS_H = 100, 40
+
+
+def _sized(cls, width, height):
+    """A widget subclass with a fixed size, so render_line runs unmounted."""
+    from textual.geometry import Size
+
+    class Sized(cls):
+        @property
+        def size(self):
+            return Size(width, height)
+    return Sized
+
+
+def _painted_canvas():
+    """A fully painted 100x40 canvas: every row-family key, some mixes, some text."""
+    from purple_tui.color_mixing import mix_colors_paint
+    from purple_tui.rooms.art_room import ArtCanvas, BRUSH_CHAR, GUTTER, KEY_COLORS
+
+    canvas = _sized(ArtCanvas, CANVAS_W + 2 * GUTTER, CANVAS_H + 2 * GUTTER)()
+    keys = sorted(KEY_COLORS)
+    mixes = [mix_colors_paint([KEY_COLORS[a], KEY_COLORS[b]]) for a, b in zip(keys, keys[5:])]
+    for y in range(CANVAS_H):
+        for x in range(CANVAS_W):
+            color = (mixes if (x // 10) % 2 else [KEY_COLORS[k] for k in keys])[(x + y) % len(mixes)]
+            char = "A" if (x + y) % 7 == 0 else BRUSH_CHAR
+            canvas._grid[(x, y)] = (char, color, color)
+            canvas._painted_positions.add((x, y))
+    return canvas
+
+
+def _full_frame(widget, height):
+    widget._invalidate_all()
+    return [widget.render_line(y) for y in range(height)]
+
+
+def _count_style_inits(monkeypatch):
+    from rich.style import Style
+    calls = {"n": 0}
+    real = Style.__init__
+
+    def counting(self, *args, **kwargs):
+        calls["n"] += 1
+        real(self, *args, **kwargs)
+
+    monkeypatch.setattr(Style, "__init__", counting)
+    return calls
+
+
+def test_canvas_steady_state_allocates_no_styles(monkeypatch):
+    """Once a frame has been drawn, redrawing the same painting (blink,
+    dirty-line repaints, full invalidation) must reuse interned styles."""
+    canvas = _painted_canvas()
+    height = CANVAS_H + 2
+    _full_frame(canvas, height)
+    canvas._cursor_visible = False
+    _full_frame(canvas, height)  # both blink phases seen once
+
+    calls = _count_style_inits(monkeypatch)
+    for visible in (True, False, True):
+        canvas._cursor_visible = visible
+        _full_frame(canvas, height)
+    assert calls["n"] == 0, f"{calls['n']} Style objects built re-rendering an unchanged canvas"
+
+
+def test_music_grid_steady_state_allocates_no_styles(monkeypatch):
+    from purple_tui.rooms.music_room import MusicGrid
+    grid = _sized(MusicGrid, 100, 22)()
+    grid._layout_ready = True
+    grid._show_labels = True
+    for i, key in enumerate(grid.color_state):
+        grid.color_state[key] = i % 3 - 1
+    frame = lambda: [grid.render_line(y) for y in range(22)]  # noqa: E731
+    frame()
+
+    calls = _count_style_inits(monkeypatch)
+    frame()
+    assert calls["n"] == 0, f"{calls['n']} Style objects built re-rendering an unchanged grid"
+
+
+def test_interned_styles_match_fresh_styles():
+    """Interning must not change what reaches the terminal."""
+    from rich.style import Style
+    from purple_tui.cell_styles import cell_style
+    assert cell_style("#FF0000", "#000000") == Style(color="#FF0000", bgcolor="#000000")
+    assert cell_style(None, "#2a1845") == Style(bgcolor="#2a1845")
+    assert cell_style("#FFFFFF", "#6633AA", True) == Style(color="#FFFFFF", bgcolor="#6633AA", bold=True)
+    assert cell_style("#FF0000", "#000000") is cell_style("#FF0000", "#000000")
+
+
+def test_full_canvas_render_budget():
+    """Micro-benchmark: a full repaint of a fully painted 100x40 canvas.
+    Measured ~12ms/frame on a dev laptop after interning (~32ms before);
+    the budget is several times looser so it only trips on a regression."""
+    canvas = _painted_canvas()
+    height = CANVAS_H + 2
+    _full_frame(canvas, height)
+    frames = 20
+    start = time.perf_counter()
+    for _ in range(frames):
+        _full_frame(canvas, height)
+    per_frame = (time.perf_counter() - start) / frames
+    print(f"\nArtCanvas full 100x40 repaint: {per_frame * 1000:.2f}ms/frame")
+    assert per_frame < 0.1, f"full canvas repaint took {per_frame * 1000:.1f}ms"
+
+
+# ---------------------------------------------------------------------------
+# MusicGrid line/cell caches: a key flash repaints only that key's row
+# ---------------------------------------------------------------------------
+
+GRID_W, GRID_H = 134, 22  # cell_height 5, top margin 1
+
+
+def _music_grid():
+    from purple_tui.rooms.music_room import MusicGrid
+    grid = _sized(MusicGrid, GRID_W, GRID_H)()
+    grid._layout_ready = True
+    return grid
+
+
+def _compositor_pass(grid):
+    """Render what Textual would ask for: every line after a bare refresh,
+    otherwise only the lines a region refresh marked dirty."""
+    lines = range(GRID_H) if grid._all_dirty else sorted(grid._dirty_lines)
+    return {y: grid.render_line(y) for y in lines}
+
+
+def test_music_grid_flash_repaints_only_that_keys_row():
+    grid = _music_grid()
+    before = [grid.render_line(y) for y in range(GRID_H)]
+    grid.flash_note("A")  # no running loop: the label stays up
+    assert not grid._all_dirty
+    assert sorted(grid._dirty_lines) == list(range(11, 16))  # row 2 of 4
+    after = [grid.render_line(y) for y in range(GRID_H)]
+    changed = [y for y, (a, b) in enumerate(zip(before, after)) if a is not b]
+    assert changed == list(range(11, 16))
+    assert any("A" in seg.text for seg in after[13])
+    # The note label sits above and below the key letter
+    from purple_tui.constants import ICON_MUSIC_NOTE
+    assert any(ICON_MUSIC_NOTE in seg.text for seg in after[12])
+    assert any(ICON_MUSIC_NOTE in seg.text for seg in after[14])
+
+
+def test_music_grid_bare_refresh_still_repaints_everything():
+    grid = _music_grid()
+    before = [grid.render_line(y) for y in range(GRID_H)]
+    grid.color_state["Q"] = 0  # direct mutation, as restore paths do
+    grid.refresh()
+    after = [grid.render_line(y) for y in range(GRID_H)]
+    assert all(a is not b for a, b in zip(before, after))
+
+
+def test_music_grid_notes_per_second():
+    """Sustained note rate: each note cycles a key's color and flashes its
+    label, then the label clears (loop playback does this for every event).
+    Rendering that must fit between frames bounds how many notes per second
+    play before frames drop. Measured ~5k notes/s with row repaints vs
+    ~1.3k with a full repaint per change; the budget is far looser."""
+    from purple_tui.music_constants import ALL_KEYS
+    keys = list(ALL_KEYS)
+    notes = 400
+
+    def play(grid, refresh_key):
+        _compositor_pass(grid)
+        start = time.perf_counter()
+        for i in range(notes):
+            key = keys[i % len(keys)]
+            grid.next_color(key, refresh=False)
+            grid._note_labels.add(key)
+            refresh_key(grid, key)
+            _compositor_pass(grid)
+            grid._note_labels.discard(key)
+            refresh_key(grid, key)
+            _compositor_pass(grid)
+        return notes / (time.perf_counter() - start)
+
+    rows = play(_music_grid(), lambda g, k: g._refresh_key(k))
+    full = play(_music_grid(), lambda g, k: g.refresh())
+    print(f"\nMusicGrid sustained: {rows:.0f} notes/s (row repaint) vs {full:.0f} notes/s (full repaint)")
+    assert rows > 2 * full
+    assert rows > 500, f"only {rows:.0f} notes/s before frames drop"
+
+
+# Modules that must stay off the startup import path: loaded on first use or
+# by the post-first-frame warmup (PurpleApp._start_import_warmup).
+DEFERRED_AT_STARTUP = (
+    "purple_tui.demo",
+    "purple_tui.room_picker",
+    "purple_tui.rooms.parent_menu",
+    "purple_tui.rooms.play_room",
+    "purple_tui.rooms.music_room",
+)
+
+
+def _startup_import_times():
+    """{module: self-time in ms} for a fresh `import purple_tui.purple_tui`."""
+    import subprocess
+    import sys
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import purple_tui.purple_tui"],
+        cwd=root, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us) / 1000
+    return times
+
+
+def test_startup_import_budget():
+    """The app module must import without the demo player, parent menu, room
+    picker or room widgets: they cost ~250ms of our own import time before
+    the first frame. Purple's own modules measured ~300ms self time here
+    (~530ms before deferring); the budget only catches large regressions."""
+    times = _startup_import_times()
+    from purple_tui.purple_tui import DEFERRED_IMPORTS
+    loaded = [name for name in (*DEFERRED_AT_STARTUP, *DEFERRED_IMPORTS) if name in times]
+    assert loaded == [], f"imported before the first frame: {loaded}"
+    own = sum(ms for name, ms in times.items() if name.startswith("purple_tui"))
+    print(f"\npurple_tui startup imports: {own:.0f}ms self time")
+    assert own < 1500, f"purple_tui modules took {own:.0f}ms to import"
+
+
+def test_deferred_imports_resolve():
+    """Everything the warmup thread imports must exist, and the lazy rooms
+    package still hands out the room widgets."""
+    import importlib
+    from purple_tui.purple_tui import DEFERRED_IMPORTS
+    for name in DEFERRED_IMPORTS:
+        importlib.import_module(name)
+    from purple_tui.rooms import ArtMode, MusicMode, PlayMode
+    assert [c.__name__ for c in (PlayMode, MusicMode, ArtMode)] == ["PlayMode", "MusicMode", "ArtMode"]
+    import purple_tui.rooms
+    with pytest.raises(AttributeError):
+        purple_tui.rooms.NoSuchRoom
@@ -0,0 +1,135 @@
+"""Tests for tools/photo_to_art.py (photo -> Art room paint ops)."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from photo_to_art import (
+    convert_array,
+    convert_directory,
+    downscale,
+    fit_to_canvas,
+    key_palette,
+    module_name,
+    quantize,
+    srgb_to_oklab,
+    write_module,
+)
+from purple_tui.art_config import CANVAS_WIDTH, CANVAS_HEIGHT
+from purple_tui.rooms.art_room import get_key_color
+
+
+def _gradient(height=200, width=600):
+    ramp = np.linspace(0, 255, width).astype(np.uint8)
+    return np.tile(ramp[None, :, None], (height, 1, 3))
+
+
+def test_downscale_averages_each_cell():
+    image = np.arange(48, dtype=np.uint8).reshape(4, 4, 3)
+    cells = downscale(image, 2, 2)
+    assert cells.shape == (2, 2, 3)
+    assert cells[0, 0, 0] == image[:2, :2, 0].mean()
+    assert cells[1, 1, 2] == image[2:, 2:, 2].mean()
+
+
+def test_downscale_repeats_tiny_images():
+    cells = downscale(np.full((1, 2, 3), 9, dtype=np.uint8), 5, 3)
+    assert cells.shape == (3, 5, 3)
+    assert (cells == 9).all()
+
+
+def test_oklab_lightness_tracks_gray():
+    lab = srgb_to_oklab(np.array([[0, 0, 0], [128, 128, 128], [255, 255, 255]]))
+    assert lab[0, 0] == pytest.approx(0, abs=1e-4)
+    assert lab[2, 0] == pytest.approx(1, abs=1e-3)
+    assert np.abs(lab[:, 1:]).max() < 1e-3  # grays have no hue
+
+
+def test_key_palette_has_one_key_per_color():
+    keys, rgb = key_palette()
+    assert len(set(map(tuple, rgb))) == len(keys)
+    assert all(get_key_color(k).lower() == "#%02x%02x%02x" % tuple(c) for k, c in zip(keys, rgb))
+
+
+@pytest.mark.parametrize("dither", ["none", "ordered", "floyd"])
+def test_quantize_picks_palette_entries(dither):
+    _, rgb = key_palette()
+    cells = downscale(_gradient(), 60, 10)
+    indices = quantize(cells, rgb, dither)
+    assert indices.shape == (10, 60)
+    assert indices.min() >= 0 and indices.max() < len(rgb)
+    # Every palette color maps back to itself
+    assert (quantize(rgb[None].astype(np.float32), rgb, "none")[0] == np.arange(len(rgb))).all()
+
+
+def test_floyd_keeps_the_average_shade():
+    grays = np.array([[0, 0, 0], [255, 255, 255]], dtype=np.uint8)
+    cells = np.full((20, 20, 3), 128, dtype=np.float32)
+    assert quantize(cells, grays, "none").mean() in (0, 1)  # one flat color
+    share = quantize(cells, grays, "floyd").mean()
+    assert 0.3 < share < 0.7
+
+
+def test_unknown_options_are_rejected():
+    with pytest.raises(ValueError):
+        convert_array(_gradient(), palette="rainbow")
+    with pytest.raises(ValueError):
+        convert_array(_gradient(), palette="keys", dither="random")
+    with pytest.raises(ValueError, match="palette"):
+        convert_array(_gradient(), dither="floyd")  # nothing to dither to
+
+
+def test_ops_are_centered_hex_cells():
+    image = _gradient()
+    ops, cells = convert_array(image)
+    cols, rows = fit_to_canvas(image.shape[1], image.shape[0])
+    assert len(ops) == cols * rows
+    assert (len(cells), len(cells[0])) == (rows, cols)
+    xs = [x for x, _, _ in ops]
+    ys = [y for _, y, _ in ops]
+    assert min(xs) == (CANVAS_WIDTH - cols) // 2 and max(xs) < CANVAS_WIDTH
+    assert min(ys) == (CANVAS_HEIGHT - rows) // 2 and max(ys) < CANVAS_HEIGHT
+    assert ops[0][2] == cells[0][0] == "#000000"
+    last = round(float(image[:, -(image.shape[1] // cols):, 0].mean()))
+    assert ops[cols - 1][2] == "#" + f"{last:02x}" * 3
+
+
+def test_key_palette_ops_use_keys():
+    ops, cells = convert_array(_gradient(), palette="keys", dither="floyd")
+    keys, _ = key_palette()
+    assert {color for _, _, color in ops} <= set(keys)
+    x, y, key = ops[len(ops) // 2]
+    x0, y0 = ops[0][:2]
+    assert cells[y - y0][x - x0] == get_key_color(key).lower()
+
+
+def test_written_module_round_trips(tmp_path):
+    ops, _ = convert_array(_gradient(40, 90), palette="keys", dither="ordered")
+    out = tmp_path / "picture.py"
+    write_module(ops, str(out), "picture.jpg")
+    spec = importlib.util.spec_from_file_location("picture", out)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.OPS == ops
+
+
+def test_module_names_are_importable():
+    assert module_name(Path("Beach Day.JPG")) == "beach_day.py"
+    assert module_name(Path("2024-07-01.png")) == "photo_2024_07_01.py"
+
+
+def test_convert_directory(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    photos = tmp_path / "photos"
+    photos.mkdir()
+    for name in ("a.png", "b.jpg"):
+        Image.fromarray(_gradient(120, 160)).save(photos / name)
+    (photos / "notes.txt").write_text("not a photo")
+    lines = convert_directory(str(photos), str(tmp_path / "out"), "keys", "floyd", jobs=2)
+    assert len(lines) == 2
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["a.png", "a.py", "b.png", "b.py"]
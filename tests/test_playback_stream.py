@@ -0,0 +1,120 @@
+"""Tests for the compact action stream format (purple_tui/playback/stream.py)."""
+
+import json
+
+import pytest
+
+from purple_tui import demo
+from purple_tui.playback import stream
+from purple_tui.playback.script import (
+    Comment, DrawPath, MoveSequence, Pause, PlayKeys, PressKey, SelectMenuItem,
+    SetSpeed, SwitchRoom, TypeText, ZoomIn, ZoomTarget, segment_duration,
+)
+
+
+ACTIONS = [
+    Comment("=== héllo ==="),
+    SwitchRoom("art"),
+    TypeText("2+3", delay_per_char=0.05, jitter=0),
+    PressKey("tab"),
+    PressKey("f", hold_duration=1, is_repeat=True),
+    PressKey("f", hold_duration=1, is_repeat=True),
+    PressKey("f", hold_duration=1, is_repeat=True),
+    PressKey("f"),
+    PlayKeys(["q", ["q", "p"], None, "a"], seconds_between=0.25),
+    DrawPath(["right+down", "up"], steps_per_direction=3, color_key="r"),
+    MoveSequence(["left"] * 40 + ["up"], char_held="g"),
+    MoveSequence(["left"] * 40 + ["up"], char_held="g"),
+    SelectMenuItem("Volume", activate=True),
+    SetSpeed(12.5),
+    ZoomIn(region=(10, 20, 300, 200), zoom=2.0),
+    ZoomTarget(y=0.65),
+    Pause(-1.5),
+    PressKey("f"),
+]
+
+
+def test_round_trip_keeps_values_and_types():
+    decoded = list(stream.iter_actions(stream.dumps(ACTIONS)))
+    assert decoded == ACTIONS
+    for original, copy in zip(ACTIONS, decoded):
+        for name, value in vars(original).items():
+            assert type(getattr(copy, name)) is type(value), (original, name)
+
+
+def test_meta_round_trips():
+    data = stream.dumps(ACTIONS, {"speed_multiplier": 8.0})
+    assert stream.read_meta(data) == {"speed_multiplier": 8.0}
+    assert stream.read_meta(stream.dumps([])) == {}
+    assert list(stream.iter_actions(stream.dumps([]))) == []
+
+
+def test_repeated_actions_share_no_lists():
+    moves = list(stream.iter_actions(stream.dumps(ACTIONS)))[10:12]
+    moves[0].directions.append("down")
+    assert moves[1].directions == ["left"] * 40 + ["up"]
+    chords = [a for a in stream.iter_actions(stream.dumps([ACTIONS[8]] * 2))]
+    chords[0].sequence[1].append("z")
+    assert chords[1].sequence[1] == ["q", "p"]
+
+
+def test_repeats_are_stored_once():
+    one = len(stream.dumps([PressKey("t")]))
+    many = len(stream.dumps([PressKey("t")] * 5000 + [PressKey("u")] * 5000))
+    assert many < one + 16
+
+
+def test_decoding_is_lazy():
+    actions = stream.iter_actions(stream.dumps(ACTIONS))
+    assert next(actions) == ACTIONS[0]
+    assert next(actions) == ACTIONS[1]
+
+
+def test_rejects_bad_data():
+    data = stream.dumps(ACTIONS)
+    with pytest.raises(stream.StreamError):
+        list(stream.iter_actions(b"nope" + data[4:]))
+    with pytest.raises(stream.StreamError):
+        list(stream.iter_actions(data[:4] + b"\x09" + data[5:]))  # version
+    with pytest.raises(stream.StreamError):
+        stream.read_meta(data[:5] + b"\x00" + data[6:])  # header length
+    with pytest.raises(stream.StreamError):
+        list(stream.iter_actions(data[:-4]))
+    with pytest.raises(TypeError):
+        stream.dumps([Comment(object())])
+
+
+def test_shipped_generated_segments_load():
+    heart, heart_speed = demo._load_segment("heart")
+    assert len(heart) == 1706
+    assert heart[:2] == [Comment("=== PRE-RECORDED DRAWING ==="), SwitchRoom("art")]
+    assert heart_speed == pytest.approx(317.0655)
+    palm, _ = demo._load_segment("palm_tree")
+    assert len(palm) == 1415
+    assert any(isinstance(a, ZoomIn) for a in palm)
+
+
+def test_composition_reads_stream_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr(demo, "_DEMO_DIR", tmp_path)
+    (tmp_path / "segments").mkdir()
+    stream.dump(ACTIONS, tmp_path / "segments" / "generated.actions", {"speed_multiplier": 3.0})
+    composition = tmp_path / "demo.json"
+    composition.write_text(json.dumps([
+        {"segment": "generated"},
+        {"segment": "generated", "duration": segment_duration(ACTIONS) / 2},
+    ]))
+
+    script = demo._load_composition(composition)
+    n = len(ACTIONS)
+    assert script[1] == SetSpeed(3.0)
+    assert script[2:2 + n] == ACTIONS
+    assert script[2 + n].multiplier == pytest.approx(2.0)
+    assert script[3 + n:] == ACTIONS
+
+
+def test_recorded_stream_is_used_without_composition(tmp_path, monkeypatch):
+    monkeypatch.setattr(demo, "_composition_path", lambda: tmp_path / "missing.json")
+    monkeypatch.setattr(demo, "_RECORDED_STREAM", tmp_path / "recorded_script.actions")
+    stream.dump(ACTIONS, tmp_path / "recorded_script.actions", {"speed_multiplier": 4.5})
+    assert demo.get_demo_script() == ACTIONS
+    assert demo.get_speed_multiplier() == 4.5
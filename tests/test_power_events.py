@@ -0,0 +1,168 @@
+"""Tests for event-driven power state (purple_tui/power_events.py).
+
+PowerManager runs against a fake /sys/class/power_supply in tmp_path, and the
+kernel's netlink socket is replaced by one end of a datagram socketpair, so
+the test plays the kernel: edit the sysfs files, send a uevent, and watch the
+refresher pick it up.
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+import purple_tui.power_events as power_events
+import purple_tui.power_manager as power_manager
+from purple_tui.power_events import parse_uevent, wait_for_events
+from purple_tui.power_manager import PowerManager
+
+
+def _uevent(action="change", name="AC", **props):
+    fields = [f"{action}@/devices/LNXSYSTM:00/ACPI0003:00/power_supply/{name}",
+              f"ACTION={action}", "SUBSYSTEM=power_supply", f"POWER_SUPPLY_NAME={name}"]
+    fields += [f"POWER_SUPPLY_{k.upper()}={v}" for k, v in props.items()]
+    return "\0".join(fields).encode() + b"\0"
+
+
+class FakeSysfs:
+    def __init__(self, root):
+        self.root = root
+        self.ac = root / "AC"
+        self.bat = root / "BAT0"
+        self.ac.mkdir()
+        self.bat.mkdir()
+        (self.ac / "type").write_text("Mains\n")
+        (self.bat / "type").write_text("Battery\n")
+        self.set(online=False, capacity=80, status="Discharging")
+
+    def set(self, online=None, capacity=None, status=None):
+        if online is not None:
+            (self.ac / "online").write_text("1\n" if online else "0\n")
+        if capacity is not None:
+            (self.bat / "capacity").write_text(f"{capacity}\n")
+        if status is not None:
+            (self.bat / "status").write_text(f"{status}\n")
+
+
+def _wait_until(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def sysfs(tmp_path, monkeypatch):
+    monkeypatch.setattr(power_manager, "POWER_SUPPLY_DIR", str(tmp_path))
+    return FakeSysfs(tmp_path)
+
+
+@pytest.fixture
+def kernel(monkeypatch):
+    """The 'kernel' end of a fake uevent socket handed to PowerManager."""
+    ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    theirs.setblocking(False)
+    monkeypatch.setattr(power_events, "open_uevent_socket", lambda: theirs)
+    yield ours
+    ours.close()
+
+
+class TestParse:
+    def test_power_supply_event(self):
+        props = parse_uevent(_uevent(online=1))
+        assert props["ACTION"] == "change"
+        assert props["POWER_SUPPLY_NAME"] == "AC"
+        assert props["POWER_SUPPLY_ONLINE"] == "1"
+
+    def test_other_subsystems_ignored(self):
+        data = b"add@/devices/pci0000:00/usb1\0ACTION=add\0SUBSYSTEM=usb\0"
+        assert parse_uevent(data) is None
+
+    def test_libudev_format_ignored(self):
+        assert parse_uevent(b"libudev\0\xfe\xed\xca\xfeSUBSYSTEM=power_supply\0") is None
+
+    def test_wait_drains_burst_and_filters(self):
+        a, b = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        b.setblocking(False)
+        a.send(_uevent(online=1))
+        a.send(b"add@/devices/usb1\0ACTION=add\0SUBSYSTEM=usb\0")
+        a.send(_uevent(name="BAT0", status="Charging"))
+        events = wait_for_events(b, 1.0)
+        assert [e["POWER_SUPPLY_NAME"] for e in events] == ["AC", "BAT0"]
+        assert wait_for_events(b, 0) == []
+        a.close()
+        b.close()
+
+    def test_wait_on_closed_socket(self):
+        a, b = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        b.close()
+        assert wait_for_events(b, 0) is None
+        a.close()
+
+
+class TestEventDriven:
+    def test_plug_in_updates_state_and_notifies(self, sysfs, kernel):
+        pm = PowerManager()
+        pm.set_lid_polling(False)
+        assert pm.event_driven
+        assert pm.is_on_charger() is False
+        assert pm.get_battery_status() == (80, False)
+        fired = threading.Event()
+        pm.add_listener(fired.set)
+
+        start = time.monotonic()
+        sysfs.set(online=True, status="Charging")
+        kernel.send(_uevent(online=1))
+        kernel.send(_uevent(name="BAT0", status="Charging"))
+
+        assert fired.wait(3.0)
+        assert _wait_until(lambda: pm.is_on_charger() is True)
+        # Smoothing needs two agreeing reads: one on the event, one settle read
+        assert time.monotonic() - start < 1.5
+        assert pm.get_battery_status() == (80, True)
+
+    def test_unplug(self, sysfs, kernel):
+        sysfs.set(online=True, status="Charging")
+        pm = PowerManager()
+        pm.set_lid_polling(False)
+        assert pm.is_on_charger() is True
+        sysfs.set(online=False, capacity=79, status="Discharging")
+        kernel.send(_uevent(online=0))
+        assert _wait_until(lambda: pm.is_on_charger() is False)
+        assert _wait_until(lambda: pm.get_battery_status() == (79, False))
+
+    def test_quiet_without_events(self, sysfs, kernel):
+        """No uevent, no re-read: the refresher is blocked, not polling."""
+        pm = PowerManager()
+        pm.set_lid_polling(False)
+        calls = []
+        pm._read_mains_online = lambda: calls.append(1)
+        time.sleep(0.8)
+        assert calls == []
+
+    def test_removed_listener_not_called(self, sysfs, kernel):
+        pm = PowerManager()
+        pm.set_lid_polling(False)
+        calls = []
+        listener = lambda: calls.append(1)  # noqa: E731
+        pm.add_listener(listener)
+        pm.remove_listener(listener)
+        sysfs.set(status="Charging")
+        kernel.send(_uevent(name="BAT0", status="Charging"))
+        assert _wait_until(lambda: pm.get_battery_status() == (80, True))
+        assert calls == []
+
+
+def test_falls_back_to_polling(sysfs, monkeypatch):
+    monkeypatch.setattr(power_events, "open_uevent_socket", lambda: None)
+    monkeypatch.setattr(PowerManager, "_REFRESH_INTERVAL", 0.05)
+    pm = PowerManager()
+    assert not pm.event_driven
+    fired = threading.Event()
+    pm.add_listener(fired.set)
+    sysfs.set(online=True)
+    assert fired.wait(3.0)
+    assert pm.is_on_charger() is True
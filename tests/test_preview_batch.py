@@ -0,0 +1,39 @@
+"""Batch previews must match single `just preview` runs, entry after entry.
+
+Runs scripts/preview.py on the virtual clock (so screenshots do not depend
+on how fast this machine is) once per room and once as a batch that visits
+each room twice. Anything a sequence leaves behind (the Art legend's
+active-row arrow, the Play room's Try hint...) shows up as a byte difference.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PREVIEW = ROOT / "scripts" / "preview.py"
+
+
+def _preview(out_dir: Path, *args: str) -> None:
+    env = {**os.environ, "PURPLE_SCREENSHOT_DIR": str(out_dir)}
+    subprocess.run([sys.executable, str(PREVIEW), "--virtual-clock", *args],
+                   cwd=ROOT, env=env, check=True, capture_output=True, timeout=120)
+
+
+def test_batch_entries_match_single_runs(tmp_path):
+    single = tmp_path / "single"
+    for room in ("art", "play"):
+        _preview(single, room)
+
+    specs = [{"name": f"{room}{i}", "room": room}
+             for i, room in enumerate(("art", "art", "play", "art", "play"))]
+    spec_path = tmp_path / "batch.json"
+    spec_path.write_text(json.dumps(specs))
+    batch = tmp_path / "batch"
+    _preview(batch, "--batch", str(spec_path))
+
+    for spec in specs:
+        expected = (single / f"{spec['room']}.svg").read_bytes()
+        assert (batch / f"{spec['name']}.svg").read_bytes() == expected, spec["name"]
@@ -1,6 +1,8 @@
-"""Tests for settings: round-trip + legacy migration."""
+"""Tests for settings: round-trip, legacy migration, the in-memory store and crash-safe writes."""
 
 import json
+import time
+
 import pytest
 from purple_tui import settings
 
@@ -39,3 +41,82 @@ def test_legacy_silent_mode_does_not_override_existing_lock(temp_settings):
     temp_settings.SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
     temp_settings.SETTINGS_FILE.write_text(json.dumps({"silent_mode": True, "volume_lock": 60}))
     assert temp_settings.get_volume_lock() == 60
+
+
+def test_reads_come_from_memory(temp_settings, monkeypatch):
+    temp_settings.set_all_caps(True)
+    temp_settings.flush()
+    monkeypatch.setattr(temp_settings, "_read", lambda path: pytest.fail("re-read settings.json"))
+    for _ in range(5):
+        assert temp_settings.get_all_caps() is True
+        assert temp_settings.get_volume_level() == settings._defaults["volume_level"]
+
+
+def test_burst_of_changes_is_one_write(temp_settings, monkeypatch):
+    monkeypatch.setattr(temp_settings, "WRITE_DELAY", 0.05)
+    temp_settings.get_volume_level()
+    before = temp_settings.store.writes
+    for level in range(10, 60, 5):
+        temp_settings.set_volume_level(level)
+    assert not temp_settings.SETTINGS_FILE.exists()  # written behind, not inline
+    deadline = time.monotonic() + 3
+    while temp_settings.store.writes == before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert temp_settings.store.writes == before + 1
+    assert json.loads(temp_settings.SETTINGS_FILE.read_text())["volume_level"] == 55
+
+
+def test_flush_writes_now(temp_settings):
+    temp_settings.set_parent_pin("4321")
+    assert temp_settings.flush()
+    assert json.loads(temp_settings.SETTINGS_FILE.read_text())["parent_pin"] == "4321"
+
+
+def test_subscribers_hear_changes_only(temp_settings):
+    heard = []
+    unsubscribe = temp_settings.subscribe("volume_lock", lambda key, value: heard.append((key, value)))
+    temp_settings.set_volume_lock(30)
+    temp_settings.set_volume_lock(30)
+    temp_settings.set_all_caps(True)
+    unsubscribe()
+    temp_settings.set_volume_lock(None)
+    assert heard == [("volume_lock", 30)]
+
+
+def test_failed_write_keeps_old_file_and_no_temp(temp_settings, monkeypatch):
+    """A crash between writing the temp file and renaming it leaves the old settings intact."""
+    temp_settings.set_volume_lock(40)
+    assert temp_settings.flush()
+    original = temp_settings.SETTINGS_FILE.read_text()
+    real_replace = settings.os.replace
+
+    def crash(src, dst):
+        raise OSError("power cut")
+    monkeypatch.setattr(settings.os, "replace", crash)
+    temp_settings.set_volume_lock(70)
+    assert temp_settings.flush() is False
+    assert temp_settings.SETTINGS_FILE.read_text() == original
+    assert [p.name for p in temp_settings.SETTINGS_FILE.parent.iterdir()] == ["settings.json"]
+
+    # Still dirty: the next flush retries and lands the new value
+    monkeypatch.setattr(settings.os, "replace", real_replace)
+    assert temp_settings.flush()
+    assert json.loads(temp_settings.SETTINGS_FILE.read_text())["volume_lock"] == 70
+
+
+def test_write_failure_mid_file_keeps_old_file(temp_settings, monkeypatch):
+    temp_settings.set_parent_pin("1111")
+    assert temp_settings.flush()
+    original = temp_settings.SETTINGS_FILE.read_text()
+    monkeypatch.setattr(settings.json, "dumps", lambda *a, **k: "{\"parent_pin\": \"22")
+    monkeypatch.setattr(settings.os, "fsync", lambda fd: (_ for _ in ()).throw(OSError("disk gone")))
+    temp_settings.set_parent_pin("2222")
+    assert temp_settings.flush() is False
+    assert temp_settings.SETTINGS_FILE.read_text() == original
+
+
+def test_torn_or_corrupt_file_falls_back_to_defaults(temp_settings):
+    temp_settings.SETTINGS_FILE.write_text('{"volume_lock": 3')
+    assert temp_settings.get_volume_lock() is None
+    assert temp_settings.load_settings() == settings._defaults
@@ -0,0 +1,188 @@
+"""Tests for the coalesced app timer (purple_tui/ticker.py)."""
+
+import asyncio
+import os
+
+os.environ['PURPLE_NO_EVDEV'] = '1'
+os.environ['PURPLE_DEV_MODE'] = '1'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+import pytest
+
+from purple_tui.ticker import COALESCE_SLACK, Ticker
+
+
+class _Loop:
+    """Fake clock + set_timer: one pending one-shot at a time, like the app."""
+
+    def __init__(self, now=1000.3):
+        self.now = now
+        self.pending = None  # (fire_at, callback, handle)
+        self.armed = 0
+
+    def set_timer(self, delay, callback, name=None):
+        loop = self
+
+        class Handle:
+            def stop(self):
+                if loop.pending and loop.pending[2] is self:
+                    loop.pending = None
+
+        handle = Handle()
+        self.pending = (self.now + delay, callback, handle)
+        self.armed += 1
+        return handle
+
+    def run_until(self, t):
+        while self.pending and self.pending[0] <= t:
+            fire_at, callback, _ = self.pending
+            self.pending = None
+            self.now = fire_at
+            callback()
+        self.now = t
+
+
+def _ticker(now=1000.3):
+    loop = _Loop(now)
+    return loop, Ticker(loop.set_timer, clock=lambda: loop.now)
+
+
+def test_jobs_fire_on_aligned_multiples():
+    loop, ticker = _ticker()
+    fired = []
+    ticker.every(5.0, lambda: fired.append(loop.now))
+    loop.run_until(1016)
+    assert fired == [1005.0, 1010.0, 1015.0]
+
+
+def test_different_periods_share_wakeups():
+    loop, ticker = _ticker()
+    ticker.every(5.0, lambda: None, name="usb")
+    ticker.every(30.0, lambda: None, name="battery")
+    ticker.every(5.0, lambda: None, name="idle")
+    loop.run_until(1000.3 + 600)
+    # 120 five-second slots; the 30s and second 5s job ride along
+    assert ticker.wakeups == 120
+    runs = {job.name: job.runs for job in ticker.jobs}
+    assert runs == {"usb": 120, "battery": 20, "idle": 120}
+
+
+def test_coalescing_slack_merges_near_deadlines():
+    loop, ticker = _ticker(now=0.0)
+    fired = []
+    ticker.every(2.0, lambda: fired.append(("a", loop.now)))
+    ticker.every(2.0 + COALESCE_SLACK / 2, lambda: fired.append(("b", loop.now)))
+    loop.run_until(2.01)
+    assert fired == [("a", 2.0), ("b", 2.0)]
+    assert ticker.wakeups == 1
+
+
+def test_tickless_when_everything_is_paused_or_stopped():
+    loop, ticker = _ticker()
+    fired = []
+    job = ticker.every(1.0, lambda: fired.append(loop.now))
+    loop.run_until(1002.5)
+    assert len(fired) == 2
+    job.pause()
+    assert loop.pending is None
+    loop.run_until(1010)
+    assert len(fired) == 2
+    job.resume()
+    loop.run_until(1011.5)
+    assert fired[2:] == [1011.0]
+    job.stop()
+    assert loop.pending is None and ticker.jobs == []
+
+
+def test_job_can_stop_itself_and_start_another():
+    """The boot-mode pattern: the cache poll stops itself once done and
+    hands over to the USB-removed poll."""
+    loop, ticker = _ticker(now=0.0)
+    fired = []
+
+    def cache_done():
+        fired.append(("cache", loop.now))
+        if loop.now >= 10:
+            cache.stop()
+            ticker.every(5.0, lambda: fired.append(("usb", loop.now)))
+
+    cache = ticker.every(5.0, cache_done)
+    loop.run_until(21)
+    assert fired == [("cache", 5.0), ("cache", 10.0), ("usb", 15.0), ("usb", 20.0)]
+
+
+def test_missed_ticks_are_skipped_not_replayed():
+    loop, ticker = _ticker(now=0.0)
+    fired = []
+    ticker.every(1.0, lambda: fired.append(loop.now))
+    # The loop stalls for 10s (suspend, slow frame): the late wakeup runs once
+    fired_at, callback, _ = loop.pending
+    loop.pending = None
+    loop.now = 10.4
+    callback()
+    assert fired == [10.4]
+    assert loop.pending[0] == 11.0
+
+
+def test_wakeups_per_minute_window():
+    loop, ticker = _ticker(now=0.0)
+    ticker.every(1.0, lambda: None)
+    loop.run_until(120.5)
+    assert ticker.wakeups == 120
+    assert ticker.wakeups_per_minute() == 60
+
+
+def test_rejects_non_positive_period():
+    _, ticker = _ticker()
+    with pytest.raises(ValueError):
+        ticker.every(0, lambda: None)
+
+
+def test_fewer_wakeups_than_independent_intervals():
+    """The old independent set_interval polls (battery 30s, USB cache + USB
+    removed 5s, idle 5s, each on its own phase) vs the same jobs on the
+    ticker, over ten minutes."""
+    periods = [30.0, 5.0, 5.0, 5.0]
+    phases = [0.37, 1.91, 3.05, 4.42]
+    independent = sum(int(600 // p) for p in periods)
+    wake_times = {round(ph + k * p, 6) for p, ph in zip(periods, phases) for k in range(1, int(600 // p) + 1)}
+    assert len(wake_times) == independent
+
+    loop, ticker = _ticker(now=0.0)
+    for p in periods:
+        ticker.every(p, lambda: None)
+    loop.run_until(600.0)
+    print(f"\nwakeups over 10 min: {independent} independent vs {ticker.wakeups} coalesced")
+    assert ticker.wakeups * 3 <= independent
+
+
+def test_live_usb_polls_hand_over_once_cached(monkeypatch):
+    """Caching finishing must stop the cache poll and the blink, and start
+    exactly one USB-removed poll (it used to add one per 5s tick, forever)."""
+    from purple_tui import purple_tui as pt_mod
+    from purple_tui.constants import REQUIRED_TERMINAL_ROWS
+
+    cached = [False]
+    monkeypatch.setattr(pt_mod, "is_live_boot", lambda: True)
+    monkeypatch.setattr(pt_mod, "is_usb_cached", lambda: cached[0])
+    monkeypatch.setattr(pt_mod, "is_usb_present", lambda: True)
+
+    async def scenario():
+        app = pt_mod.PurpleApp()
+        async with app.run_test(size=(146, REQUIRED_TERMINAL_ROWS)) as pilot:
+            await pilot.pause()
+            names = lambda: sorted(job.name for job in app.ticker.jobs if job.active)  # noqa: E731
+            assert {"usb-cache", "usb-blink"} <= set(names())
+            indicator = app.query_one(pt_mod.BootModeIndicator)
+            cached[0] = True
+            for _ in range(3):
+                indicator._check_cache_done()
+            assert "usb-cache" not in names() and "usb-blink" not in names()
+            assert names().count("usb-removed") == 1
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(scenario())
+    finally:
+        loop.close()
@@ -41,18 +41,32 @@ import termios
 import fcntl
 import time
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from purple_tui.dev_channel import DevClient, SOCKET_NAME
 from purple_tui.art_config import (
     CANVAS_WIDTH, CANVAS_HEIGHT,
     describe_canvas, describe_colors, describe_colors_brief,
 )
 
+# Pixels per cell for export_canvas: 132x25 cells -> 396x150, within the
+# 400x160 the SVG path shrinks its crops to (keeps image token costs down)
+CANVAS_EXPORT_CELL = (3, 6)
+
 from ai_utils import load_env_file, parse_json_robust
+from frame_analysis import drawable_bounds, similarity
+from component_crops import ComponentCropCache, cell_box, component_ranges, decode_png, png_base64
+
+# Component crops are shared by the whole run: a region whose pixels were
+# cropped before (in any candidate or composite) is not encoded again
+COMPONENT_CROPS = ComponentCropCache()
 
 
 # =============================================================================
@@ -704,100 +718,13 @@ def svg_to_png_base64(svg_path: str, crop_to_canvas: bool = True) -> str:
     return base64.standard_b64encode(png_data).decode('utf-8')
 
 
-def _is_dark_pixel(r: int, g: int, b: int, threshold: int = 30) -> bool:
-    """Check if a pixel is dark (part of gutter)."""
-    return r < threshold and g < threshold and b < threshold
-
-
 def _find_drawable_bounds(img) -> tuple[int, int, int, int]:
     """Find the drawable canvas area by detecting gutter boundaries.
 
     Scans for transitions between dark (gutter) and light (canvas) regions.
     Returns (left, top, right, bottom) pixel coordinates.
     """
-    width, height = img.size
-
-    # Sample the middle of the image to find vertical gutter positions
-    # (gutters are black, canvas is purple)
-    mid_y = height // 2
-
-    # Find left boundary: scan right until we exit the dark gutter
-    left = 0
-    for x in range(0, width // 2, 5):
-        # Sample a small vertical strip
-        r, g, b = 0, 0, 0
-        for dy in range(-5, 6):
-            y = mid_y + dy
-            if 0 <= y < height:
-                px = img.getpixel((x, y))
-                r += px[0]
-                g += px[1]
-                b += px[2]
-        r, g, b = r // 11, g // 11, b // 11
-
-        if _is_dark_pixel(r, g, b):
-            # Found dark region, continue
-            left = x + 10  # Move past gutter
-        elif left > 0:
-            # Transitioned from dark to light
-            break
-
-    # Find right boundary: scan left from right edge
-    right = width
-    for x in range(width - 1, width // 2, -5):
-        r, g, b = 0, 0, 0
-        for dy in range(-5, 6):
-            y = mid_y + dy
-            if 0 <= y < height:
-                px = img.getpixel((x, y))
-                r += px[0]
-                g += px[1]
-                b += px[2]
-        r, g, b = r // 11, g // 11, b // 11
-
-        if _is_dark_pixel(r, g, b):
-            right = x - 5
-        elif right < width:
-            break
-
-    # Find top boundary: scan down from middle-x
-    mid_x = (left + right) // 2
-    top = 0
-    for y in range(0, height // 2, 5):
-        r, g, b = 0, 0, 0
-        for dx in range(-5, 6):
-            x = mid_x + dx
-            if 0 <= x < width:
-                px = img.getpixel((x, y))
-                r += px[0]
-                g += px[1]
-                b += px[2]
-        r, g, b = r // 11, g // 11, b // 11
-
-        if _is_dark_pixel(r, g, b):
-            top = y + 10
-        elif top > 0:
-            break
-
-    # Find bottom boundary: scan up from bottom
-    bottom = height
-    for y in range(height - 1, height // 2, -5):
-        r, g, b = 0, 0, 0
-        for dx in range(-5, 6):
-            x = mid_x + dx
-            if 0 <= x < width:
-                px = img.getpixel((x, y))
-                r += px[0]
-                g += px[1]
-                b += px[2]
-        r, g, b = r // 11, g // 11, b // 11
-
-        if _is_dark_pixel(r, g, b):
-            bottom = y - 5
-        elif bottom < height:
-            break
-
-    return left, top, right, bottom
+    return drawable_bounds(np.asarray(img.convert("RGB")))
 
 
 def crop_to_canvas_area(png_data: bytes) -> bytes:
@@ -880,12 +807,12 @@ def crop_component_from_canvas(
 ) -> str | None:
     """Crop a component's region from the canvas image.
 
-    The canvas image from crop_to_canvas_area() is 400x160px mapped to
-    CANVAS_WIDTH x CANVAS_HEIGHT cells. Converts cell coordinates to pixel
-    coordinates and crops.
+    The canvas image maps to CANVAS_WIDTH x CANVAS_HEIGHT cells at any
+    pixel size. Converts cell coordinates to pixel coordinates and crops
+    (through COMPONENT_CROPS, so an unchanged region is not re-encoded).
 
     Args:
-        canvas_png_base64: Base64 PNG of the cropped canvas (400x160)
+        canvas_png_base64: Base64 PNG of the cropped canvas
         x_range: [start_x, end_x] in cell coordinates
         y_range: [start_y, end_y] in cell coordinates
         padding: Extra cells of padding around the component
@@ -894,31 +821,7 @@ def crop_component_from_canvas(
         Base64 PNG of the cropped component, or None on failure
     """
     try:
-        from PIL import Image
-
-        img_bytes = base64.b64decode(canvas_png_base64)
-        img = Image.open(io.BytesIO(img_bytes))
-        img_w, img_h = img.size
-
-        # Map cell coordinates to pixel coordinates
-        px_per_cell_x = img_w / CANVAS_WIDTH
-        px_per_cell_y = img_h / CANVAS_HEIGHT
-
-        x_start = max(0, x_range[0] - padding)
-        x_end = min(CANVAS_WIDTH, x_range[1] + padding)
-        y_start = max(0, y_range[0] - padding)
-        y_end = min(CANVAS_HEIGHT, y_range[1] + padding)
-
-        left = int(x_start * px_per_cell_x)
-        top = int(y_start * px_per_cell_y)
-        right = int(x_end * px_per_cell_x)
-        bottom = int(y_end * px_per_cell_y)
-
-        cropped = img.crop((left, top, right, bottom))
-        buf = io.BytesIO()
-        cropped.save(buf, format='PNG')
-        return base64.b64encode(buf.getvalue()).decode('utf-8')
-
+        return COMPONENT_CROPS.crop(canvas_png_base64, x_range, y_range, padding=padding)
     except Exception as e:
         print(f"[Component Crop] Failed: {e}")
         return None
@@ -930,6 +833,10 @@ def extract_all_components(
 ) -> dict[str, str]:
     """Extract cropped images for all components from a canvas image.
 
+    The canvas is decoded once; components whose region is pixel-identical
+    to one cropped earlier reuse that crop, and the rest are encoded in
+    parallel.
+
     Args:
         canvas_png_base64: Base64 PNG of the cropped canvas
         composition: Plan composition dict mapping name -> {x_range, y_range, ...}
@@ -937,18 +844,11 @@ def extract_all_components(
     Returns:
         Dict mapping component name -> base64 PNG of that component's region
     """
-    crops = {}
-    for name, info in composition.items():
-        if not isinstance(info, dict):
-            continue
-        x_range = info.get('x_range')
-        y_range = info.get('y_range')
-        if not x_range or not y_range:
-            continue
-        crop = crop_component_from_canvas(canvas_png_base64, x_range, y_range)
-        if crop:
-            crops[name] = crop
-    return crops
+    try:
+        return COMPONENT_CROPS.crop_all(canvas_png_base64, composition)
+    except Exception as e:
+        print(f"[Component Crop] Failed: {e}")
+        return {}
 
 
 # =============================================================================
@@ -957,10 +857,13 @@ def extract_all_components(
 
 class PurpleController:
     """
-    Controls the real Purple Computer app via file-based commands.
-    Sends commands and captures screenshots through the dev mode API.
+    Controls the real Purple Computer app through the dev mode API.
+    Sends commands and captures screenshots.
 
-    The app runs in dev mode (PURPLE_DEV_MODE=1) which enables:
+    The app runs in dev mode (PURPLE_DEV_MODE=1) with PURPLE_DEV_SOCKET=1,
+    so commands and screenshots go over its control socket, one round trip
+    per batch (see purple_tui/dev_channel.py). If the socket never comes
+    up, this falls back to the file protocol:
     - Screenshot trigger via 'trigger' file
     - Command execution via 'command' file (JSON commands)
 
@@ -974,6 +877,7 @@ class PurpleController:
         self.pty_master = None
         self.screenshot_dir = None
         self.screenshot_count = 0
+        self.client: DevClient | None = None
         # Track cursor position for paint_line starting position
         self._cursor_x = 0
         self._cursor_y = 0
@@ -996,7 +900,8 @@ class PurpleController:
         env['TERM'] = 'xterm-256color'
         env['PURPLE_DEV_MODE'] = '1'
         env['PURPLE_SCREENSHOT_DIR'] = screenshot_dir
-        env['PURPLE_NO_EVDEV'] = '1'  # Disable real keyboard, use file commands only
+        env['PURPLE_NO_EVDEV'] = '1'  # Disable real keyboard, use dev commands only
+        env['PURPLE_DEV_SOCKET'] = '1'  # control.sock in the screenshot dir
         env.pop('PURPLE_DEMO_AUTOSTART', None)  # Ensure demo doesn't auto-start
         # Add project root to PYTHONPATH so purple_tui can be found
         project_root = str(Path(__file__).parent.parent)
@@ -1016,8 +921,12 @@ class PurpleController:
 
         os.close(pty_slave)
 
-        # Wait for app to fully start and initialize timers
-        time.sleep(3)
+        # Wait for the app's control socket (it opens at the end of on_mount);
+        # without one, give the file-polling timers time to start instead
+        self.client = self._connect(timeout=10.0)
+        if self.client is None:
+            print("[App] No control socket, using file commands")
+            time.sleep(3)
         self._drain_output()
 
         print(f"[App] Purple Computer started (PID: {self.process.pid})")
@@ -1030,8 +939,24 @@ class PurpleController:
         else:
             print("[App] Warning: App may not be fully initialized")
 
+    def _connect(self, timeout: float) -> DevClient | None:
+        path = os.path.join(self.screenshot_dir, SOCKET_NAME)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                return None
+            try:
+                return DevClient(path)
+            except OSError:
+                self._drain_output()
+                time.sleep(0.05)
+        return None
+
     def stop(self) -> None:
         """Stop the app."""
+        if self.client:
+            self.client.close()
+            self.client = None
         if self.process:
             try:
                 self.process.terminate()
@@ -1048,10 +973,10 @@ class PurpleController:
         print(f"[App] Debug log: {self.screenshot_dir}/dev_commands.log")
         print("[App] Purple Computer stopped")
 
-    def _drain_output(self) -> None:
-        """Drain any pending output from the PTY."""
+    def _drain_output(self, wait: float = 0.1) -> None:
+        """Drain any pending output from the PTY (until `wait`s of quiet)."""
         while True:
-            r, _, _ = select.select([self.pty_master], [], [], 0.1)
+            r, _, _ = select.select([self.pty_master], [], [], wait)
             if not r:
                 break
             try:
@@ -1063,12 +988,21 @@ class PurpleController:
         """Send a command to the app via the command file."""
         self.send_commands([{"action": action, "value": value}])
 
-    def send_commands(self, commands: list[dict]) -> None:
+    def send_commands(self, commands: list[dict]) -> list:
         """Send multiple commands to the app in a single batch.
 
-        Uses atomic file writes (tmp + rename) and waits for the app to consume
-        and verify the command batch before returning.
+        Over the socket, returns once every command has run (with their
+        results). The file fallback uses atomic writes (tmp + rename) and
+        returns once the app has consumed and counted the batch.
         """
+        if self.client:
+            # Keep reading the pty meanwhile: a full pty blocks the app's renders
+            reply = self.client.send(commands, while_waiting=lambda: self._drain_output(wait=0))
+            if not reply.get("ok"):
+                raise RuntimeError(f"Command batch failed after {reply.get('done')} of "
+                                   f"{len(commands)}: {reply.get('error')}")
+            return reply["results"]
+
         command_path = os.path.join(self.screenshot_dir, 'command')
         tmp_path = command_path + '.tmp'
         response_path = os.path.join(self.screenshot_dir, 'command_response')
@@ -1102,7 +1036,7 @@ class PurpleController:
                         f"Command loss! Sent {len(commands)}, app processed {processed}. "
                         f"Lost {len(commands) - processed} commands."
                     )
-                return
+                return [None] * len(commands)
             time.sleep(0.1)
 
         raise RuntimeError(f"No command_response after consumption ({len(commands)} commands)")
@@ -1124,10 +1058,18 @@ class PurpleController:
 
     def take_screenshot(self) -> str | None:
         """
-        Take a screenshot via file-based trigger.
+        Take a screenshot (socket command, or the file-based trigger).
         Returns path to the SVG file, or None if failed.
         """
         self._drain_output()
+        if self.client:
+            try:
+                (path,) = self.send_commands([{"action": "screenshot"}])
+            except (OSError, RuntimeError) as e:
+                print(f"[Screenshot] FAILED - {e}")
+                return None
+            self.screenshot_count += 1
+            return path
 
         # Get current screenshot count to detect new one
         latest_file = os.path.join(self.screenshot_dir, 'latest.txt')
@@ -1160,6 +1102,36 @@ class PurpleController:
         print(f"[Screenshot] FAILED - trigger_exists={os.path.exists(trigger_path)}")
         return None
 
+    def capture_canvas(self, stem: str) -> str | None:
+        """Capture the drawable canvas as a base64 PNG and save it to
+        `{stem}_cropped.png`. Returns the base64 PNG, or None if failed.
+
+        Over the socket the app renders its grid directly (export_canvas).
+        Otherwise this takes an SVG screenshot (kept as `{stem}.svg`),
+        converts it and crops it to the canvas.
+        """
+        png_path = f"{stem}_cropped.png"
+        if self.client:
+            self._drain_output()
+            try:
+                (png,) = self.send_commands([{"action": "export_canvas", "inline": True,
+                                              "cell": list(CANVAS_EXPORT_CELL)}])
+            except (OSError, RuntimeError) as e:
+                print(f"[Capture] FAILED - {e}")
+                return None
+            self.screenshot_count += 1
+        else:
+            svg_path = self.take_screenshot()
+            if not svg_path:
+                return None
+            os.rename(svg_path, f"{stem}.svg")
+            png = svg_to_png_base64(f"{stem}.svg")
+            if not png:
+                return None
+        with open(png_path, 'wb') as f:
+            f.write(base64.standard_b64decode(png))
+        return png
+
     def switch_to_art(self) -> None:
         """Switch to Art mode."""
         self.send_command("mode", "art")
@@ -2960,20 +2932,33 @@ def judge_components_batch(
 
     # Build pairs: only judge components that exist in both candidate and library
     pairs = []
+    unchanged = {}
     for name in library.component_order:
         if name in candidate_crops and name in library.best and library.best[name].image_base64:
-            pairs.append(name)
+            if candidate_crops[name] == library.best[name].image_base64:
+                # Same pixels as the library version (crops are cached by
+                # content, so equal regions give equal strings): nothing to judge
+                unchanged[name] = {
+                    "winner": "library",
+                    "reasoning": "Unchanged from library version",
+                    "scores_candidate": None,
+                    "scores_library": None,
+                }
+                print(f"[Component Judge] {name}: unchanged, skipped")
+            else:
+                pairs.append(name)
 
     if not pairs:
-        # If no pairs (first iteration), all candidate components win by default
-        results = {}
+        # Nothing left to judge: unchanged components keep the library
+        # version, the rest (first iteration) win by default
+        results = dict(unchanged)
         for name in candidate_crops:
-            results[name] = {
+            results.setdefault(name, {
                 "winner": "candidate",
                 "reasoning": "No library version to compare against",
                 "scores_candidate": None,
                 "scores_library": None,
-            }
+            })
         return results
 
     # Build a single judge call with all component pairs
@@ -3040,7 +3025,7 @@ For each component pair, score on these criteria (1-5):
     text = response.content[0].text
     data = parse_json_robust(text)
 
-    results = {}
+    results = dict(unchanged)
     if data and isinstance(data, dict):
         components_data = data.get("components", data)
         for name in pairs:
@@ -3119,15 +3104,9 @@ def _highlight_component_on_canvas(
 
 def _images_are_similar(img_a, img_b, threshold=0.98):
     """Return True if two images are nearly identical (pixel-level comparison)."""
-    from PIL import ImageChops, ImageStat, Image
-    if img_a.size != img_b.size:
-        img_b = img_b.resize(img_a.size, Image.NEAREST)
-    diff = ImageChops.difference(img_a, img_b)
-    stat = ImageStat.Stat(diff)
-    # Mean difference across all channels (0 = identical, 255 = max difference)
-    mean_diff = sum(stat.mean) / len(stat.mean)
-    similarity = 1.0 - (mean_diff / 255.0)
-    return similarity >= threshold
+    if img_b.mode != img_a.mode:
+        img_b = img_b.convert(img_a.mode)
+    return similarity(np.asarray(img_a), np.asarray(img_b)) >= threshold
 
 
 def _build_side_by_side(images_and_labels, font):
@@ -3754,7 +3733,7 @@ def _execute_and_screenshot(
     screenshot_dir_path: str,
     canvas_shows_attempt,
 ) -> tuple[str | None, str | None]:
-    """Clear canvas, execute actions, take screenshot, return (svg_path, png_base64).
+    """Clear canvas, execute actions, capture it, return (png_path, png_base64).
 
     Returns (None, None) on failure.
     """
@@ -3773,25 +3752,13 @@ def _execute_and_screenshot(
     controller.execute_actions(actions)
     time.sleep(0.5)
 
-    # Take screenshot
-    c_svg = controller.take_screenshot()
-    if not c_svg:
-        print(f"[Error] Failed to capture screenshot for candidate {label}")
-        return None, None
-
-    c_svg_new = os.path.join(screenshot_dir_path, f"iteration_{attempt_label}_{label}.svg")
-    os.rename(c_svg, c_svg_new)
-    c_png = svg_to_png_base64(c_svg_new)
+    stem = os.path.join(screenshot_dir_path, f"iteration_{attempt_label}_{label}")
+    c_png = controller.capture_canvas(stem)
     if not c_png:
-        print(f"[Error] Failed to convert candidate {label} SVG to PNG")
-        return c_svg_new, None
-
-    # Save cropped PNG
-    c_png_path = c_svg_new.replace('.svg', '_cropped.png')
-    with open(c_png_path, 'wb') as f:
-        f.write(base64.standard_b64decode(c_png))
+        print(f"[Error] Failed to capture canvas for candidate {label}")
+        return None, None
 
-    return c_svg_new, c_png
+    return f"{stem}_cropped.png", c_png
 
 
 def run_visual_feedback_loop(
@@ -3851,6 +3818,7 @@ def run_visual_feedback_loop(
 
     # Start the app
     controller = PurpleController()
+    crop_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="candidate-crops")
 
     try:
         controller.start(screenshot_dir)
@@ -3902,20 +3870,9 @@ def run_visual_feedback_loop(
         last_judge_feedback = None
         canvas_shows_attempt = None
 
-        # Take initial blank screenshot
-        blank_png = None
-        svg_path = controller.take_screenshot()
-        if svg_path:
-            screenshot_dir_path = os.path.dirname(svg_path)
-            new_svg_path = os.path.join(screenshot_dir_path, "iteration_0_blank.svg")
-            os.rename(svg_path, new_svg_path)
-            blank_png = svg_to_png_base64(new_svg_path)
-            if blank_png:
-                png_path = new_svg_path.replace('.svg', '_cropped.png')
-                with open(png_path, 'wb') as f:
-                    f.write(base64.standard_b64decode(blank_png))
-        else:
-            screenshot_dir_path = screenshot_dir
+        # Capture the initial blank canvas
+        screenshot_dir_path = screenshot_dir
+        blank_png = controller.capture_canvas(os.path.join(screenshot_dir_path, "iteration_0_blank"))
 
         # If resuming with a pre-populated library, draw its composite on canvas
         # so we have a composite_image_base64 for refinement candidates
@@ -3925,17 +3882,11 @@ def run_visual_feedback_loop(
             if composite_actions:
                 controller.execute_actions(composite_actions)
                 time.sleep(0.5)
-                resume_svg = controller.take_screenshot()
-                if resume_svg:
-                    resume_svg_path = os.path.join(screenshot_dir_path, "iteration_0_resumed.svg")
-                    os.rename(resume_svg, resume_svg_path)
-                    composite_image_base64 = svg_to_png_base64(resume_svg_path)
-                    if composite_image_base64:
-                        resume_png_path = resume_svg_path.replace('.svg', '_cropped.png')
-                        with open(resume_png_path, 'wb') as f:
-                            f.write(base64.standard_b64decode(composite_image_base64))
-                        print(f"[Resume] Initial composite rendered: {resume_png_path}")
-                    canvas_shows_attempt = "resumed"
+                resume_stem = os.path.join(screenshot_dir_path, "iteration_0_resumed")
+                composite_image_base64 = controller.capture_canvas(resume_stem)
+                if composite_image_base64:
+                    print(f"[Resume] Initial composite rendered: {resume_stem}_cropped.png")
+                canvas_shows_attempt = "resumed"
 
         for i in range(iterations):
             print(f"\n{'='*50}")
@@ -4096,6 +4047,8 @@ def run_visual_feedback_loop(
 
             # === PHASE 1: Execute all candidates and collect screenshots ===
             executed_candidates = []  # (label, attempt_label, result, compact_text, png_base64, component_crops)
+            # Each candidate is cropped in the background while the app draws the next
+            crop_jobs = []
 
             for c_idx, (label, c_result) in enumerate(candidates):
                 attempt_label = f"{i + 1}{chr(ord('a') + c_idx)}"
@@ -4117,11 +4070,14 @@ def run_visual_feedback_loop(
                 with open(scripts_path, 'w') as f:
                     json.dump(iteration_scripts, f, indent=2)
 
-                # Extract component crops
-                component_crops = extract_all_components(c_png, library.composition)
-                print(f"[Crops] Extracted {len(component_crops)} component crops from {label}")
+                crop_jobs.append(((label, attempt_label, c_result, c_compact, c_png),
+                                  crop_pool.submit(extract_all_components, c_png, library.composition)))
 
-                executed_candidates.append((label, attempt_label, c_result, c_compact, c_png, component_crops))
+            for candidate, job in crop_jobs:
+                component_crops = job.result()
+                print(f"[Crops] Extracted {len(component_crops)} component crops from {candidate[0]}")
+                executed_candidates.append((*candidate, component_crops))
+            print(f"[Crops] {COMPONENT_CROPS.stats()} so far")
 
             if not executed_candidates:
                 print(f"[Error] No candidates executed successfully for iteration {i + 1}")
@@ -4396,21 +4352,11 @@ def run_visual_feedback_loop(
 
         # === FINAL OUTPUTS ===
         # Take final screenshot
-        print("\n[Final] Taking final screenshot...")
-        final_svg = controller.take_screenshot()
-        if final_svg:
-            screenshot_dir_path = os.path.dirname(final_svg)
-            final_name = f"iteration_{canvas_shows_attempt}.svg" if canvas_shows_attempt else "iteration_final.svg"
-            new_final_path = os.path.join(screenshot_dir_path, final_name)
-            os.rename(final_svg, new_final_path)
-            final_svg = new_final_path
-            print(f"[Final] {final_svg}")
-            final_png_base64 = svg_to_png_base64(final_svg)
-            if final_png_base64:
-                final_png_path = final_svg.replace('.svg', '_cropped.png')
-                with open(final_png_path, 'wb') as f:
-                    f.write(base64.standard_b64decode(final_png_base64))
-                print(f"[Final Cropped PNG] {final_png_path}")
+        print("\n[Final] Capturing final canvas...")
+        final_name = f"iteration_{canvas_shows_attempt}" if canvas_shows_attempt else "iteration_final"
+        final_stem = os.path.join(screenshot_dir_path, final_name)
+        if controller.capture_canvas(final_stem):
+            print(f"[Final Cropped PNG] {final_stem}_cropped.png")
 
         # Save results
         if all_results:
@@ -4457,6 +4403,7 @@ def run_visual_feedback_loop(
             print(f"[Saved] Demo script (fallback): {script_path}")
 
     finally:
+        crop_pool.shutdown(wait=False, cancel_futures=True)
         controller.stop()
 
     print("\n" + "="*50)
@@ -4609,6 +4556,116 @@ def generate_demo_script(actions: list[dict], canvas_width: int = CANVAS_WIDTH,
 # MAIN
 # =============================================================================
 
+# =============================================================================
+# DRY RUN (LOCAL PIPELINE BENCHMARK)
+# =============================================================================
+
+# Used when --dry-run has no plan from --from: four components across the canvas
+DRY_RUN_COMPOSITION = {
+    "sky": {"x_range": [0, CANVAS_WIDTH], "y_range": [0, CANVAS_HEIGHT // 3]},
+    "sun": {"x_range": [CANVAS_WIDTH - 24, CANVAS_WIDTH - 8], "y_range": [2, 9]},
+    "hill": {"x_range": [0, CANVAS_WIDTH], "y_range": [CANVAS_HEIGHT * 2 // 3, CANVAS_HEIGHT]},
+    "tree": {"x_range": [30, 50], "y_range": [6, CANVAS_HEIGHT - 4]},
+}
+
+
+def _dry_run_component(rng: random.Random, name: str, x_range: list[int], y_range: list[int]) -> list[dict]:
+    """A few random lines inside a component's bounds, tagged with its name."""
+    keys = "qwertyuiopasdfghjklzxcvbnm1234567890"
+    x_hi = max(x_range[0], min(x_range[1], CANVAS_WIDTH) - 1)
+    y_hi = max(y_range[0], min(y_range[1], CANVAS_HEIGHT) - 1)
+    actions = []
+    for _ in range(rng.randint(4, 12)):
+        raw = {"type": "paint_line_raw", "color": rng.choice(keys),
+               "x1": rng.randint(x_range[0], x_hi), "y1": rng.randint(y_range[0], y_hi),
+               "x2": rng.randint(x_range[0], x_hi), "y2": rng.randint(y_range[0], y_hi)}
+        actions.extend(dict(a, component=name) for a in _expand_line_action(raw))
+    return actions
+
+
+def _dry_run_canvas(actions: list[dict]) -> str:
+    """Base64 PNG of paint_at actions, rendered the way export_canvas does
+    (key colors without paint mixing)."""
+    from purple_tui.canvas_raster import encode_png, rasterize
+    from purple_tui.rooms.art_room import BRUSH_CHAR, DEFAULT_BG_DARK, GRAYSCALE, get_key_color
+
+    grid = {}
+    for a in actions:
+        key = a["color"].lower()
+        color = key if key.startswith("#") else GRAYSCALE.get(key) or get_key_color(key)
+        grid[(a["x"], a["y"])] = (BRUSH_CHAR, color, DEFAULT_BG_DARK)
+    image = rasterize(grid, CANVAS_WIDTH, CANVAS_HEIGHT, background=DEFAULT_BG_DARK,
+                      cell=CANVAS_EXPORT_CELL, brush_char=BRUSH_CHAR)
+    return base64.standard_b64encode(encode_png(image)).decode("ascii")
+
+
+def benchmark_local_pipeline(
+    plan: dict | None = None,
+    iterations: int = 5,
+    candidates: int = 3,
+    seed: int = 0,
+) -> dict:
+    """Time the loop's local image work on synthetic candidates, no API calls.
+
+    Each candidate redraws one or two components at random and keeps the
+    library's version of the rest, as informed regens and refinements do.
+    Canvases are rendered with the app's own rasterizer (the app itself is
+    not started), then cropped two ways: per component with a full decode
+    each time (the old path), and through a fresh ComponentCropCache.
+    Returns the timings and counts it prints.
+    """
+    composition = (plan or {}).get("composition") or DRY_RUN_COMPOSITION
+    ranges = component_ranges(composition)
+    rng = random.Random(seed)
+    cache = ComponentCropCache()
+    library_actions = {name: _dry_run_component(rng, name, *r) for name, r in ranges.items()}
+    library_crops: dict[str, str] = {}
+    totals = {"render": 0.0, "uncached": 0.0, "cached": 0.0}
+    judged = skipped = 0
+
+    for _ in range(iterations):
+        for _ in range(candidates):
+            redrawn = set(rng.sample(sorted(ranges), k=min(len(ranges), rng.randint(1, 2))))
+            component_actions = {
+                name: _dry_run_component(rng, name, *ranges[name]) if name in redrawn else library_actions[name]
+                for name in ranges
+            }
+            start = time.perf_counter()
+            canvas = _dry_run_canvas([a for name in ranges for a in component_actions[name]])
+            rendered = time.perf_counter()
+            crops = cache.crop_all(canvas, composition)
+            cropped = time.perf_counter()
+            # The old path: decode the canvas, crop and encode, per component
+            for x_range, y_range in ranges.values():
+                image = decode_png(base64.b64decode(canvas))
+                left, top, right, bottom = cell_box((image.shape[1], image.shape[0]), x_range, y_range)
+                png_base64(image[top:bottom, left:right])
+            totals["render"] += rendered - start
+            totals["cached"] += cropped - rendered
+            totals["uncached"] += time.perf_counter() - cropped
+
+            for name, crop in crops.items():
+                if name not in library_crops:
+                    library_crops[name] = crop
+                elif crop == library_crops[name]:
+                    skipped += 1
+                else:
+                    judged += 1
+                    if rng.random() < 0.5:  # candidate wins half the time
+                        library_crops[name] = crop
+                        library_actions[name] = component_actions[name]
+
+    runs = iterations * candidates
+    print(f"[Dry run] {runs} candidates x {len(ranges)} components, no API calls")
+    print(f"[Dry run] Render canvases:        {totals['render'] * 1000:8.1f} ms")
+    print(f"[Dry run] Crop, per component:    {totals['uncached'] * 1000:8.1f} ms")
+    print(f"[Dry run] Crop, cached/parallel:  {totals['cached'] * 1000:8.1f} ms ({cache.stats()})")
+    print(f"[Dry run] Judge pairs: {judged} sent, {skipped} skipped as unchanged")
+    cache.close()
+    return {**totals, "reused": cache.reused, "rendered": cache.rendered,
+            "judged": judged, "skipped": skipped}
+
+
 def generate_output_dir(base_dir: str = "art_ai_output") -> str:
     """Generate a unique output directory with timestamp."""
     from datetime import datetime
@@ -4636,6 +4693,9 @@ Examples:
     # Resume from final state of a run
     python tools/art_ai.py --from art_ai_output/TIMESTAMP --instruction "add more shading"
 
+    # Time the local crop pipeline without API calls (optionally on a run's plan)
+    python tools/art_ai.py --dry-run --iterations 10
+
 Requirements:
     - ANTHROPIC_API_KEY environment variable
     - cairosvg for SVG to PNG conversion: pip install cairosvg
@@ -4671,6 +4731,10 @@ Output (auto-generated timestamped folder):
     parser.add_argument("--max-demo-actions", type=int, default=None, metavar="N",
                         help="Limit demo script to N paint actions (downsamples if exceeded). "
                              "Recommended: ~100 per target second of playback.")
+    parser.add_argument("--dry-run", action="store_true", default=False,
+                        help="Benchmark the local image pipeline (render, crop, cache) on synthetic "
+                             "candidates for --iterations x --max-candidates, without API calls or "
+                             "the app. Uses the plan from --from if given.")
 
     args = parser.parse_args()
 
@@ -4710,7 +4774,7 @@ Output (auto-generated timestamped folder):
         existing_plan = plan
 
         # If --instruction provided, refine the plan
-        if args.instruction:
+        if args.instruction and not args.dry_run:
             load_env_file()
             api_key = os.environ.get('ANTHROPIC_API_KEY')
             if not api_key:
@@ -4732,9 +4796,13 @@ Output (auto-generated timestamped folder):
                     print("[Warning] Plan refinement changed components despite constraint. Forcing original component names.")
                     existing_plan['composition'] = plan['composition']
 
-    elif not goal:
+    elif not goal and not args.dry_run:
         parser.error("--goal is required (unless using --from)")
 
+    if args.dry_run:
+        benchmark_local_pipeline(existing_plan, args.iterations, args.max_candidates)
+        return
+
     if args.reference and not os.path.exists(args.reference):
         parser.error(f"Reference image not found: {args.reference}")
 
@@ -0,0 +1,246 @@
+"""Cached, parallel component crops for the art_ai feedback loop.
+
+Every candidate art_ai renders is cut into one crop per plan component
+(tree, sky, sun...) for the judge. Doing that with PIL per component means
+decoding the whole canvas PNG once per component, every time, even when a
+candidate only redrew one component and the others are pixel-for-pixel what
+the previous candidate or the library already had.
+
+ComponentCropCache decodes each canvas once, slices every component's
+region out of the array, and keys the region by a hash of its pixels. A
+region seen before (same pixels, same size) reuses its encoded PNG; only
+regions whose cells changed are encoded again, on a thread pool (zlib
+releases the GIL). Identical regions therefore also come back as identical
+base64 strings, which lets the judge skip them without an API call.
+
+The canvas from the dev socket's export_canvas is encode_png() output
+(8-bit RGB, no row filters), which is read with zlib and NumPy alone; any
+other PNG goes through Pillow.
+
+    crops = ComponentCropCache()
+    images = crops.crop_all(canvas_png_base64, plan["composition"])
+    print(crops.stats())  # "3 reused, 1 rendered"
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from purple_tui.art_config import CANVAS_WIDTH, CANVAS_HEIGHT
+from purple_tui.canvas_raster import encode_png
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+# =============================================================================
+# PNG <-> ARRAYS
+# =============================================================================
+
+def decode_png(data: bytes) -> np.ndarray:
+    """(h, w, 3) uint8 RGB array for PNG bytes."""
+    image = _decode_unfiltered(data)
+    if image is not None:
+        return image
+    from PIL import Image
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGB"))
+
+
+def _decode_unfiltered(data: bytes) -> np.ndarray | None:
+    """Fast path for encode_png()'s output; None for anything else."""
+    if data[:8] != PNG_SIGNATURE:
+        return None
+    pos = 8
+    header = None
+    idat = []
+    while pos + 8 <= len(data):
+        (length,) = struct.unpack_from(">I", data, pos)
+        kind = data[pos + 4:pos + 8]
+        body = data[pos + 8:pos + 8 + length]
+        if kind == b"IHDR":
+            header = body
+        elif kind == b"IDAT":
+            idat.append(body)
+        elif kind == b"IEND":
+            break
+        pos += 12 + length
+    if header is None or len(header) < 13:
+        return None
+    width, height, depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", header[:13])
+    if depth != 8 or color_type != 2 or interlace:
+        return None
+    try:
+        raw = zlib.decompress(b"".join(idat))
+    except zlib.error:
+        return None
+    if len(raw) != height * (width * 3 + 1):
+        return None
+    rows = np.frombuffer(raw, dtype=np.uint8).reshape(height, width * 3 + 1)
+    if rows[:, 0].any():
+        return None  # row filters in use: let Pillow undo them
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+def png_base64(image: np.ndarray) -> str:
+    return base64.b64encode(encode_png(np.ascontiguousarray(image))).decode("ascii")
+
+
+# =============================================================================
+# REGIONS
+# =============================================================================
+
+def cell_box(
+    image_size: tuple[int, int],
+    x_range: list[int],
+    y_range: list[int],
+    padding: int = 2,
+) -> tuple[int, int, int, int]:
+    """Pixel (left, top, right, bottom) of a component's cells plus
+    `padding` cells, for a canvas image of `image_size` (w, h)."""
+    img_w, img_h = image_size
+    px_per_cell_x = img_w / CANVAS_WIDTH
+    px_per_cell_y = img_h / CANVAS_HEIGHT
+    x_start = max(0, x_range[0] - padding)
+    x_end = min(CANVAS_WIDTH, x_range[1] + padding)
+    y_start = max(0, y_range[0] - padding)
+    y_end = min(CANVAS_HEIGHT, y_range[1] + padding)
+    return (int(x_start * px_per_cell_x), int(y_start * px_per_cell_y),
+            int(x_end * px_per_cell_x), int(y_end * px_per_cell_y))
+
+
+def region_digest(region: np.ndarray) -> bytes:
+    """Content hash of an image region (its pixels and its size)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(struct.pack(">II", *region.shape[:2]))
+    digest.update(np.ascontiguousarray(region).data)
+    return digest.digest()
+
+
+def component_ranges(composition: dict) -> dict[str, tuple[list[int], list[int]]]:
+    """name -> (x_range, y_range) for the plan components that have bounds."""
+    ranges = {}
+    for name, info in composition.items():
+        if not isinstance(info, dict):
+            continue
+        x_range = info.get("x_range")
+        y_range = info.get("y_range")
+        if x_range and y_range:
+            ranges[name] = (x_range, y_range)
+    return ranges
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class ComponentCropCache:
+    """Component crops keyed by the content hash of their canvas region.
+
+    Safe to call from several threads (art_ai crops one candidate in the
+    background while the app draws the next).
+    """
+
+    def __init__(self, workers: int | None = None, max_crops: int = 512, max_canvases: int = 4) -> None:
+        # Threads only pay off with cores to run them: on one core the
+        # hand-off costs more than it saves, so encoding stays inline
+        self.workers = max(1, workers if workers is not None else min(4, os.cpu_count() or 1))
+        self.max_crops = max_crops
+        self.max_canvases = max_canvases
+        self._crops: OrderedDict[bytes, str] = OrderedDict()
+        self._canvases: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self.reused = 0
+        self.rendered = 0
+
+    def canvas(self, canvas_png_base64: str) -> np.ndarray:
+        """The decoded canvas (decoded once per distinct image)."""
+        key = hashlib.blake2b(canvas_png_base64.encode("ascii"), digest_size=16).digest()
+        with self._lock:
+            image = self._canvases.get(key)
+            if image is not None:
+                self._canvases.move_to_end(key)
+                return image
+        image = decode_png(base64.b64decode(canvas_png_base64))
+        with self._lock:
+            self._canvases[key] = image
+            while len(self._canvases) > self.max_canvases:
+                self._canvases.popitem(last=False)
+        return image
+
+    def crop(self, canvas_png_base64: str, x_range: list[int], y_range: list[int],
+             padding: int = 2) -> str | None:
+        crops = self.crop_all(canvas_png_base64, {"_": {"x_range": x_range, "y_range": y_range}},
+                              padding=padding)
+        return crops.get("_")
+
+    def crop_all(self, canvas_png_base64: str, composition: dict, padding: int = 2) -> dict[str, str]:
+        """name -> base64 PNG crop for every component with bounds.
+
+        Regions whose pixels were cropped before come from the cache; the
+        rest are encoded in parallel.
+        """
+        image = self.canvas(canvas_png_base64)
+        height, width = image.shape[:2]
+        regions: dict[str, tuple[bytes, np.ndarray]] = {}
+        for name, (x_range, y_range) in component_ranges(composition).items():
+            left, top, right, bottom = cell_box((width, height), x_range, y_range, padding)
+            if right <= left or bottom <= top:
+                continue
+            region = image[top:bottom, left:right]
+            regions[name] = (region_digest(region), region)
+
+        crops: dict[str, str] = {}
+        missing: dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for name, (key, region) in regions.items():
+                cached = self._crops.get(key)
+                if cached is None:
+                    missing[key] = region
+                else:
+                    self._crops.move_to_end(key)
+                    crops[name] = cached
+                    self.reused += 1
+
+        if missing:
+            keys = list(missing)
+            if len(keys) > 1 and self.workers > 1:
+                encoded = list(self._executor().map(png_base64, (missing[k] for k in keys)))
+            else:
+                encoded = [png_base64(missing[k]) for k in keys]
+            fresh = dict(zip(keys, encoded))
+            with self._lock:
+                self._crops.update(fresh)
+                while len(self._crops) > self.max_crops:
+                    self._crops.popitem(last=False)
+                for name, (key, _) in regions.items():
+                    if name not in crops:
+                        crops[name] = fresh[key]
+                        self.rendered += 1
+        return crops
+
+    def stats(self) -> str:
+        return f"{self.reused} reused, {self.rendered} rendered"
+
+    def reset_stats(self) -> None:
+        self.reused = self.rendered = 0
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="component-crops")
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -0,0 +1,224 @@
+"""Vectorized frame analysis shared by the recording and AI tool scripts.
+
+Frames are (height, width, 3) uint8 RGB NumPy arrays: read_frames() streams
+them from an ffmpeg rawvideo pipe, and PIL images convert with
+np.asarray(img.convert("RGB")). Everything here works on whole rows or
+columns at once instead of looping over pixels in Python, so a 1080p
+frame is scanned in tens of milliseconds rather than seconds and crop
+detection can afford to sample the whole video rather than one frame.
+
+Used by:
+- recording-setup/detect_crop.py (viewport border detection)
+- tools/art_ai.py (drawable canvas bounds, screenshot similarity)
+"""
+
+from __future__ import annotations
+
+import subprocess
+from typing import Iterator
+
+import numpy as np
+
+
+# =============================================================================
+# READING FRAMES
+# =============================================================================
+
+def read_frames(
+    video_path: str,
+    width: int,
+    height: int,
+    sample_fps: float | None = None,
+    start: float | None = None,
+    count: int | None = None,
+) -> Iterator[np.ndarray]:
+    """Decode frames from a video as RGB arrays, streaming through a pipe.
+
+    sample_fps picks frames at that rate (e.g. 0.5 = one every 2s) instead
+    of every frame; start seeks first; count stops after that many.
+    """
+    cmd = ["ffmpeg", "-v", "error"]
+    if start is not None:
+        cmd += ["-ss", str(start)]
+    cmd += ["-i", video_path]
+    if sample_fps is not None:
+        cmd += ["-vf", f"fps={sample_fps}"]
+    if count is not None:
+        cmd += ["-frames:v", str(count)]
+    cmd += ["-f", "rawvideo", "-pix_fmt", "rgb24", "-"]
+
+    frame_size = width * height * 3
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            data = proc.stdout.read(frame_size)
+            if len(data) < frame_size:
+                break
+            yield np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+    finally:
+        proc.stdout.close()
+        proc.kill()
+        proc.wait()
+
+
+# =============================================================================
+# COLOR MASKS AND RUNS
+# =============================================================================
+
+def color_mask(frame: np.ndarray, color: tuple[int, int, int], tolerance: int) -> np.ndarray:
+    """(h, w) bool: pixels within `tolerance` of `color` on every channel."""
+    mask = None
+    for channel, value in enumerate(color):
+        low = max(0, value - tolerance)
+        span = min(255, value + tolerance) - low
+        # uint8 subtraction wraps below `low`, so one compare checks both ends
+        inside = (frame[..., channel] - np.uint8(low)) <= span
+        mask = inside if mask is None else mask & inside
+    return mask
+
+
+def longest_runs(mask: np.ndarray) -> np.ndarray:
+    """Length of the longest run of True in each row of a 2D bool mask."""
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)  # row-major, so pairs line up with starts
+    runs = np.zeros(height, dtype=np.int64)
+    np.maximum.at(runs, rows, ends - starts)
+    return runs
+
+
+def row_bounds(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per row: (min_x, max_x, longest run) of True pixels.
+
+    Rows without any get min_x = width and max_x = 0.
+    """
+    width = mask.shape[1]
+    any_set = mask.any(axis=1)
+    min_x = np.where(any_set, mask.argmax(axis=1), width)
+    max_x = np.where(any_set, width - 1 - mask[:, ::-1].argmax(axis=1), 0)
+    return min_x, max_x, longest_runs(mask)
+
+
+# =============================================================================
+# VIEWPORT BORDER (recording crop detection)
+# =============================================================================
+
+def find_border_bounds(
+    frame: np.ndarray,
+    color: tuple[int, int, int],
+    tolerance: int,
+    min_line_length: int = 100,
+) -> tuple[int, int, int, int]:
+    """Find a rectangle drawn in `color` by its top and bottom edges.
+
+    Rows holding a horizontal run of at least min_line_length pixels are
+    grouped into clusters (consecutive rows, small gaps allowed). The first
+    cluster is the top edge; the bottom edge is the last later cluster with
+    a similar left edge and width, which skips narrower lines such as hint
+    text. Returns (min_x, top_y, max_x, bottom_y), or (width, height, 0, 0)
+    when no edge is found.
+    """
+    height, width = frame.shape[:2]
+    mask = color_mask(frame, color, tolerance)
+    # Only rows with enough matching pixels can hold a long enough run
+    candidates = np.flatnonzero(mask.sum(axis=1) >= min_line_length)
+    min_xs, max_xs, runs = row_bounds(mask[candidates])
+    border_rows = [(int(y), int(min_xs[i]), int(max_xs[i]))
+                   for i, y in enumerate(candidates) if runs[i] >= min_line_length]
+    if not border_rows:
+        return width, height, 0, 0
+
+    clusters = [[border_rows[0]]]
+    for row in border_rows[1:]:
+        if row[0] <= clusters[-1][-1][0] + 3:  # Allow small gaps
+            clusters[-1].append(row)
+        else:
+            clusters.append([row])
+
+    top_cluster = clusters[0]
+    top_min_x = min(r[1] for r in top_cluster)
+    top_max_x = max(r[2] for r in top_cluster)
+    top_y = top_cluster[0][0]
+    top_width = top_max_x - top_min_x
+
+    bottom_y = top_cluster[-1][0]  # Default to top cluster if only one
+    bottom_min_x, bottom_max_x = top_min_x, top_max_x
+    for cluster in clusters[1:]:
+        cluster_min_x = min(r[1] for r in cluster)
+        cluster_max_x = max(r[2] for r in cluster)
+        width_match = abs((cluster_max_x - cluster_min_x) - top_width) < top_width * 0.2
+        left_match = abs(cluster_min_x - top_min_x) < top_width * 0.1
+        if width_match and left_match:
+            bottom_y = cluster[-1][0]
+            bottom_min_x, bottom_max_x = cluster_min_x, cluster_max_x
+
+    return min(top_min_x, bottom_min_x), top_y, max(top_max_x, bottom_max_x), bottom_y
+
+
+# =============================================================================
+# DRAWABLE BOUNDS (Art canvas inside its dark gutter)
+# =============================================================================
+
+def _band_is_dark(band: np.ndarray, threshold: int) -> np.ndarray:
+    """Per position along a band (sum over 11 pixels across it, // 11):
+    True where every channel's average is below threshold."""
+    average = band.astype(np.int64).sum(axis=0) // 11
+    return (average < threshold).all(axis=-1)
+
+
+def _scan_past_dark(dark: np.ndarray, positions: range, offset: int, default: int) -> int:
+    """Walk `positions`; while in a dark run the edge is position + offset,
+    and the first light position after one ends the scan."""
+    edge = default
+    seen_dark = False
+    for position in positions:
+        if dark[position]:
+            edge, seen_dark = position + offset, True
+        elif seen_dark:
+            break
+    return edge
+
+
+def drawable_bounds(frame: np.ndarray, threshold: int = 30) -> tuple[int, int, int, int]:
+    """Find the drawable area inside a dark gutter.
+
+    Samples an 11-pixel band through the middle row (then middle column)
+    and steps in from each edge 5 pixels at a time, past the dark gutter.
+    Returns (left, top, right, bottom); each is the frame edge when no
+    gutter is found on that side.
+    """
+    height, width = frame.shape[:2]
+    mid_y = height // 2
+    dark_cols = _band_is_dark(frame[max(0, mid_y - 5):mid_y + 6], threshold)
+    left = _scan_past_dark(dark_cols, range(0, width // 2, 5), 10, 0)
+    right = _scan_past_dark(dark_cols, range(width - 1, width // 2, -5), -5, width)
+
+    mid_x = (left + right) // 2
+    dark_rows = _band_is_dark(frame[:, max(0, mid_x - 5):mid_x + 6].swapaxes(0, 1), threshold)
+    top = _scan_past_dark(dark_rows, range(0, height // 2, 5), 10, 0)
+    bottom = _scan_past_dark(dark_rows, range(height - 1, height // 2, -5), -5, height)
+    return left, top, right, bottom
+
+
+# =============================================================================
+# SIMILARITY
+# =============================================================================
+
+def resize_nearest(frame: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Nearest-neighbor resize (by index, no interpolation)."""
+    rows = np.arange(height) * frame.shape[0] // height
+    cols = np.arange(width) * frame.shape[1] // width
+    return frame[rows[:, None], cols]
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """1.0 for identical frames down to 0.0 for maximally different ones:
+    one minus the mean absolute difference over all pixels and channels.
+    `b` is resized to `a` first if their sizes differ."""
+    if a.shape[:2] != b.shape[:2]:
+        b = resize_nearest(b, *a.shape[:2])
+    diff = np.abs(a.astype(np.int16) - b.astype(np.int16))
+    return 1.0 - float(diff.mean()) / 255.0
@@ -2,7 +2,9 @@
 """Install a generated art demo into Purple Computer as a fixed action script.
 
 Reads training output from art_ai.py and generates a demo script
-that can be played back with PURPLE_DEMO_AUTOSTART=1.
+that can be played back with PURPLE_DEMO_AUTOSTART=1. The script is stored
+as a compact action stream (.actions, see purple_tui/playback/stream.py);
+--python writes the equivalent Python module instead, for hand editing.
 
 Usage:
     ./tools/install-art-demo --from art_ai_output/20260202_143022
@@ -60,6 +62,31 @@ def estimate_duration(actions: list[dict]) -> float:
     return total
 
 
+def write_script(base_path: str, code: str, speed_multiplier: float, as_python: bool) -> str:
+    """Write generated script `code` to base_path + .actions (or .py).
+
+    The demo loader prefers .actions when both exist, so the other form is
+    removed rather than left behind stale. Returns the path written.
+    """
+    from purple_tui.playback import stream
+
+    stream_path, module_path = base_path + stream.SUFFIX, base_path + ".py"
+    if as_python:
+        path, stale = module_path, stream_path
+        with open(path, 'w') as f:
+            f.write(code + "\n\n" + f"SPEED_MULTIPLIER = {speed_multiplier:.4f}\n")
+    else:
+        path, stale = stream_path, module_path
+        namespace = {}
+        exec(code, namespace)
+        actions = namespace.get("SEGMENT") or namespace["RECORDED_DRAWING"]
+        stream.dump(actions, path, {"speed_multiplier": round(speed_multiplier, 4)})
+    if os.path.exists(stale):
+        os.remove(stale)
+        print(f"Removed {stale} (replaced by {path})")
+    return path
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Install a generated art demo into Purple Computer as a fixed action script",
@@ -87,6 +114,8 @@ After installing, run:
                         help="Target playback duration in seconds (default: 10)")
     parser.add_argument("--save", metavar="NAME",
                         help="Save as a named demo segment (e.g., --save palm_tree)")
+    parser.add_argument("--python", action="store_true",
+                        help="Write a Python module instead of an .actions stream")
 
     args = parser.parse_args()
 
@@ -174,12 +203,8 @@ After installing, run:
         # The generated demo_code defines RECORDED_DRAWING. We need to transform it
         # to export SEGMENT instead, and add SPEED_MULTIPLIER.
         segment_code = demo_code.replace("RECORDED_DRAWING = [", "SEGMENT = [")
-        segment_content = segment_code + "\n\n"
-        segment_content += f"SPEED_MULTIPLIER = {speed_multiplier:.4f}\n"
-
-        segment_path = os.path.join(segments_dir, f"{args.save}.py")
-        with open(segment_path, 'w') as f:
-            f.write(segment_content)
+        segment_path = write_script(os.path.join(segments_dir, args.save), segment_code,
+                                    speed_multiplier, args.python)
 
         speed_arg = speed_multiplier if speed_multiplier != 1.0 else None
         append_to_demo_json(args.save, speed=speed_arg)
@@ -187,13 +212,9 @@ After installing, run:
         print(f"\nSaved segment: {segment_path}")
         print("  Added to demo.json")
     else:
-        # Legacy behavior: write to recorded_script.py
-        output_content = demo_code + "\n\n"
-        output_content += f"SPEED_MULTIPLIER = {speed_multiplier:.4f}\n"
-
-        dest_path = os.path.join(PROJECT_ROOT, "purple_tui", "demo", "recorded_script.py")
-        with open(dest_path, 'w') as f:
-            f.write(output_content)
+        # Legacy behavior: write to recorded_script
+        dest_path = write_script(os.path.join(PROJECT_ROOT, "purple_tui", "demo", "recorded_script"),
+                                 demo_code, speed_multiplier, args.python)
 
         print(f"\nInstalled demo script: {dest_path}")
 
@@ -2,31 +2,56 @@
 """Convert a photo into Art room paint ops.
 
 Downsamples the photo to canvas cells (cells are twice as tall as wide) and
-emits one (x, y, "#rrggbb") paint op per cell, written as a generated data
+emits one (x, y, color) paint op per cell, written as a generated data
 module plus a PNG preview of the expected canvas.
 
+The cell colors are exact "#rrggbb" hex by default. --palette keys instead
+snaps every cell to the nearest Art room key color, measured in OKLab so
+"nearest" means nearest to the eye rather than in raw RGB, and writes the
+key itself (e.g. 'f'), so the picture is one a kid could paint by hand.
+--dither ordered (4x4 Bayer) or floyd (Floyd-Steinberg error diffusion)
+trades flat bands for a speckle that reads as the in-between shades.
+
+All the pixel work is NumPy on whole arrays: the photo is averaged down to
+cells in one pass (JPEGs are decoded at reduced size to begin with), so a
+full-size photo converts in milliseconds after decoding. Give a directory
+instead of a photo to convert every image in it in parallel, one module
+and preview per photo.
+
 Usage:
     just python tools/photo_to_art.py PHOTO [--out purple_tui/secret_photo.py]
+    just python tools/photo_to_art.py PHOTO --palette keys --dither floyd
+    just python tools/photo_to_art.py photos/ --out /tmp/photo_ops [--jobs 4]
 """
 
 import argparse
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
 
-from PIL import Image
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from purple_tui.art_config import CANVAS_WIDTH, CANVAS_HEIGHT
-from purple_tui.rooms.art_room import DEFAULT_BG_DARK
+from purple_tui.canvas_raster import encode_png, rasterize
+from purple_tui.rooms.art_room import (
+    ASDF_ROW, BRUSH_CHAR, DEFAULT_BG_DARK, GRAYSCALE, QWERTY_ROW, ZXCV_ROW, get_key_color,
+)
 
 CELL_ASPECT = 2  # a canvas cell is twice as tall as it is wide
 PREVIEW_CELL_PX = 10
+PHOTO_SUFFIXES = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tif", ".tiff"}
+PALETTES = ("none", "keys")
+DITHERS = ("none", "ordered", "floyd")
 
-
-def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    h = hex_color.lstrip("#")
-    return tuple(int(h[i:i + 2], 16) for i in (0, 2, 4))
+# 4x4 Bayer matrix as thresholds in [-0.5, 0.5)
+BAYER_4 = (np.array([[0, 8, 2, 10],
+                     [12, 4, 14, 6],
+                     [3, 11, 1, 9],
+                     [15, 7, 13, 5]], dtype=np.float32) + 0.5) / 16 - 0.5
 
 
 def fit_to_canvas(width: int, height: int) -> tuple[int, int]:
@@ -37,24 +62,170 @@ def fit_to_canvas(width: int, height: int) -> tuple[int, int]:
     return cols, rows
 
 
-def convert(photo_path: str) -> tuple[list[tuple[int, int, str]], list[list[str]]]:
-    """Return paint ops and the per-cell hex grid (for the preview render)."""
-    image = Image.open(photo_path).convert("RGB")
+# =============================================================================
+# PIXELS
+# =============================================================================
+
+def load_photo(photo_path: str) -> np.ndarray:
+    """(h, w, 3) uint8 RGB. JPEGs decode straight to a reduced size (DCT
+    scaling) that still leaves several pixels per canvas cell."""
+    from PIL import Image
+
+    image = Image.open(photo_path)
     cols, rows = fit_to_canvas(*image.size)
-    small = image.resize((cols, rows), Image.LANCZOS)
+    image.draft("RGB", (cols * 4, rows * CELL_ASPECT * 4))
+    return np.asarray(image.convert("RGB"))
+
+
+def downscale(image: np.ndarray, cols: int, rows: int) -> np.ndarray:
+    """(rows, cols, 3) float32: the mean color of each cell's block of pixels."""
+    height, width = image.shape[:2]
+    if rows > height or cols > width:
+        # Smaller than the grid: repeat pixels until every cell has one
+        image = image.repeat(-(-rows // height), axis=0).repeat(-(-cols // width), axis=1)
+        height, width = image.shape[:2]
+    y_edges = np.linspace(0, height, rows + 1).astype(np.intp)
+    x_edges = np.linspace(0, width, cols + 1).astype(np.intp)
+    # Sum rows then columns without first copying the photo to floats
+    sums = np.add.reduceat(np.add.reduceat(image, y_edges[:-1], axis=0, dtype=np.uint32),
+                           x_edges[:-1], axis=1)
+    counts = np.outer(np.diff(y_edges), np.diff(x_edges)).astype(np.float32)
+    return sums.astype(np.float32) / counts[..., None]
+
+
+def srgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """OKLab coordinates for sRGB colors (0-255, any leading shape)."""
+    c = np.asarray(rgb, dtype=np.float32) / 255.0
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    lms = linear @ np.array([[0.4122214708, 0.2119034982, 0.0883024619],
+                             [0.5363325363, 0.6806995451, 0.2817188376],
+                             [0.0514459929, 0.1073969566, 0.6299787005]], dtype=np.float32)
+    return np.cbrt(lms) @ np.array([[0.2104542553, 1.9779984951, 0.0259040371],
+                                    [0.7936177850, -2.4285922050, 0.7827717662],
+                                    [-0.0040720468, 0.4505937099, -0.8086757660]], dtype=np.float32)
+
+
+def key_palette() -> tuple[list[str], np.ndarray]:
+    """(keys, (n, 3) uint8 RGB) for the Art room's typeable color keys,
+    one key per distinct color."""
+    keys: list[str] = []
+    seen: set[str] = set()
+    for key in [*GRAYSCALE, *QWERTY_ROW, *ASDF_ROW, *ZXCV_ROW]:
+        color = get_key_color(key).lower()
+        if color not in seen:
+            seen.add(color)
+            keys.append(key)
+    rgb = np.array([_hex_to_rgb(get_key_color(k)) for k in keys], dtype=np.uint8)
+    return keys, rgb
+
+
+def quantize(cells: np.ndarray, palette_rgb: np.ndarray, dither: str = "none") -> np.ndarray:
+    """(rows, cols) palette indices for (rows, cols, 3) RGB cells, nearest
+    in OKLab, optionally dithered."""
+    if dither not in DITHERS:
+        raise ValueError(f"unknown dither {dither!r} (expected one of {', '.join(DITHERS)})")
+    palette_lab = srgb_to_oklab(palette_rgb)
+    rows, cols = cells.shape[:2]
+
+    if dither == "ordered":
+        # Nudge each cell up or down by up to half the typical gap between
+        # palette colors, in a fixed pattern, before snapping
+        spread = _palette_spacing(palette_rgb)
+        tile = np.tile(BAYER_4, (-(-rows // 4), -(-cols // 4)))[:rows, :cols]
+        cells = np.clip(cells + tile[..., None] * spread, 0, 255)
+
+    lab = srgb_to_oklab(cells)
+    if dither != "floyd":
+        return _nearest(lab, palette_lab)
+
+    # Error diffusion is sequential by nature: each cell's error feeds its
+    # right and lower neighbours. Serpentine rows keep drift from streaking.
+    lab = lab.astype(np.float64)
+    palette = palette_lab.astype(np.float64)
+    out = np.empty((rows, cols), dtype=np.intp)
+    for y in range(rows):
+        forward = y % 2 == 0
+        step = 1 if forward else -1
+        for x in (range(cols) if forward else range(cols - 1, -1, -1)):
+            pixel = lab[y, x]
+            index = int(((palette - pixel) ** 2).sum(axis=1).argmin())
+            out[y, x] = index
+            error = pixel - palette[index]
+            if 0 <= x + step < cols:
+                lab[y, x + step] += error * (7 / 16)
+            if y + 1 < rows:
+                if 0 <= x - step < cols:
+                    lab[y + 1, x - step] += error * (3 / 16)
+                lab[y + 1, x] += error * (5 / 16)
+                if 0 <= x + step < cols:
+                    lab[y + 1, x + step] += error * (1 / 16)
+    return out
+
+
+def _nearest(lab: np.ndarray, palette_lab: np.ndarray) -> np.ndarray:
+    distances = ((lab[..., None, :] - palette_lab) ** 2).sum(axis=-1)
+    return distances.argmin(axis=-1)
+
+
+def _palette_spacing(palette_rgb: np.ndarray) -> float:
+    """Median RGB distance from each palette color to its nearest other."""
+    rgb = palette_rgb.astype(np.float32)
+    distances = np.sqrt(((rgb[:, None] - rgb[None]) ** 2).sum(axis=-1))
+    np.fill_diagonal(distances, np.inf)
+    return float(np.median(distances.min(axis=1)))
+
+
+def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    h = hex_color.lstrip("#")
+    return tuple(int(h[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _hex_grid(rgb: np.ndarray) -> list[list[str]]:
+    values = np.rint(rgb).astype(np.uint32)
+    packed = (values[..., 0] << 16) | (values[..., 1] << 8) | values[..., 2]
+    return [[f"#{v:06x}" for v in row] for row in packed.tolist()]
+
+
+# =============================================================================
+# CONVERSION
+# =============================================================================
+
+def convert_array(
+    image: np.ndarray,
+    palette: str = "none",
+    dither: str = "none",
+) -> tuple[list[tuple[int, int, str]], list[list[str]]]:
+    """Paint ops and the per-cell hex grid (for the preview) for an RGB array."""
+    if palette not in PALETTES:
+        raise ValueError(f"unknown palette {palette!r} (expected one of {', '.join(PALETTES)})")
+    if dither != "none" and palette == "none":
+        raise ValueError("dithering needs a palette to dither to (use --palette keys)")
+    height, width = image.shape[:2]
+    cols, rows = fit_to_canvas(width, height)
+    cells = downscale(image, cols, rows)
     x0 = (CANVAS_WIDTH - cols) // 2
     y0 = (CANVAS_HEIGHT - rows) // 2
 
-    ops: list[tuple[int, int, str]] = []
-    cells: list[list[str]] = []
-    for cy in range(rows):
-        row_hex: list[str] = []
-        for cx in range(cols):
-            hex_color = "#{:02x}{:02x}{:02x}".format(*small.getpixel((cx, cy)))
-            row_hex.append(hex_color)
-            ops.append((x0 + cx, y0 + cy, hex_color))
-        cells.append(row_hex)
-    return ops, cells
+    if palette == "keys":
+        keys, palette_rgb = key_palette()
+        indices = quantize(cells, palette_rgb, dither)
+        hex_cells = _hex_grid(palette_rgb[indices].astype(np.float32))
+        colors = [[keys[i] for i in row] for row in indices.tolist()]
+    else:
+        hex_cells = colors = _hex_grid(cells)
+
+    ops = [(x0 + cx, y0 + cy, color)
+           for cy, row in enumerate(colors) for cx, color in enumerate(row)]
+    return ops, hex_cells
+
+
+def convert(
+    photo_path: str,
+    palette: str = "none",
+    dither: str = "none",
+) -> tuple[list[tuple[int, int, str]], list[list[str]]]:
+    """Return paint ops and the per-cell hex grid (for the preview render)."""
+    return convert_array(load_photo(photo_path), palette, dither)
 
 
 def write_module(ops: list[tuple[int, int, str]], out_path: str, photo_name: str) -> None:
@@ -75,35 +246,78 @@ def write_module(ops: list[tuple[int, int, str]], out_path: str, photo_name: str
 
 
 def write_preview(cells: list[list[str]], preview_path: str) -> None:
-    cell_w, cell_h = PREVIEW_CELL_PX, PREVIEW_CELL_PX * CELL_ASPECT
-    image = Image.new(
-        "RGB", (CANVAS_WIDTH * cell_w, CANVAS_HEIGHT * cell_h),
-        _hex_to_rgb(DEFAULT_BG_DARK),
-    )
     x0 = (CANVAS_WIDTH - len(cells[0])) // 2
     y0 = (CANVAS_HEIGHT - len(cells)) // 2
-    for cy, row in enumerate(cells):
-        for cx, hex_color in enumerate(row):
-            image.paste(
-                _hex_to_rgb(hex_color),
-                ((x0 + cx) * cell_w, (y0 + cy) * cell_h,
-                 (x0 + cx + 1) * cell_w, (y0 + cy + 1) * cell_h),
-            )
-    image.save(preview_path)
+    grid = {(x0 + cx, y0 + cy): (BRUSH_CHAR, hex_color, hex_color)
+            for cy, row in enumerate(cells) for cx, hex_color in enumerate(row)}
+    image = rasterize(grid, CANVAS_WIDTH, CANVAS_HEIGHT, background=DEFAULT_BG_DARK,
+                      cell=(PREVIEW_CELL_PX, PREVIEW_CELL_PX * CELL_ASPECT), brush_char=BRUSH_CHAR)
+    with open(preview_path, "wb") as f:
+        f.write(encode_png(image))
+
+
+def convert_file(photo: str, out_path: str, preview_path: str, palette: str, dither: str) -> str:
+    """Convert one photo to a module and preview; returns a summary line."""
+    start = time.perf_counter()
+    ops, cells = convert(photo, palette, dither)
+    converted = time.perf_counter()
+    write_module(ops, out_path, os.path.basename(photo))
+    write_preview(cells, preview_path)
+    return (f"{len(ops)} ops ({len(cells[0])}x{len(cells)} cells, "
+            f"{(converted - start) * 1000:.0f} ms) {photo} -> {out_path}")
+
+
+def module_name(photo: Path) -> str:
+    """A Python module filename for a photo (letters, digits, underscores)."""
+    stem = "".join(c if c.isalnum() else "_" for c in photo.stem.lower()).strip("_") or "photo"
+    return f"photo_{stem}.py" if stem[0].isdigit() else f"{stem}.py"
+
+
+def convert_directory(photo_dir: str, out_dir: str, palette: str, dither: str,
+                      jobs: int | None = None) -> list[str]:
+    """Convert every photo in a directory, one process per photo."""
+    photos = sorted(p for p in Path(photo_dir).iterdir() if p.suffix.lower() in PHOTO_SUFFIXES)
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = []
+    for photo in photos:
+        out_path = Path(out_dir) / module_name(photo)
+        tasks.append((str(photo), str(out_path), str(out_path.with_suffix(".png")), palette, dither))
+    if not tasks:
+        return []
+    with ProcessPoolExecutor(max_workers=jobs or None) as pool:
+        return list(pool.map(convert_file, *zip(*tasks)))
 
 
 def main():
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("photo")
-    parser.add_argument("--out", default="purple_tui/secret_photo.py")
-    parser.add_argument("--preview", default="/tmp/screenshots/photo_to_art_preview.png")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("photo", help="A photo, or a directory of photos")
+    parser.add_argument("--out", default=None,
+                        help="Output module (default: purple_tui/secret_photo.py), "
+                             "or output directory for a directory of photos")
+    parser.add_argument("--preview", default="/tmp/screenshots/photo_to_art_preview.png",
+                        help="Preview PNG for a single photo (directories get one per module)")
+    parser.add_argument("--palette", choices=PALETTES, default="none",
+                        help="none: exact hex colors (default); keys: nearest Art room key colors")
+    parser.add_argument("--dither", choices=DITHERS, default="none",
+                        help="Dithering between key colors; needs --palette keys (default: none)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Parallel processes for a directory (default: one per CPU)")
     args = parser.parse_args()
+    if args.dither != "none" and args.palette == "none":
+        parser.error("--dither needs --palette keys (exact hex colors have nothing to dither)")
+
+    if os.path.isdir(args.photo):
+        start = time.perf_counter()
+        lines = convert_directory(args.photo, args.out or "/tmp/screenshots/photo_to_art",
+                                  args.palette, args.dither, args.jobs)
+        for line in lines:
+            print(line)
+        print(f"{len(lines)} photos in {time.perf_counter() - start:.2f}s")
+        return
 
-    ops, cells = convert(args.photo)
-    write_module(ops, args.out, os.path.basename(args.photo))
+    out = args.out or "purple_tui/secret_photo.py"
     os.makedirs(os.path.dirname(args.preview), exist_ok=True)
-    write_preview(cells, args.preview)
-    print(f"{len(ops)} ops ({len(cells[0])}x{len(cells)} cells) -> {args.out}")
+    print(convert_file(args.photo, out, args.preview, args.palette, args.dither))
     print(f"preview: {args.preview}")
 
 